@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+
+import path_util  # noqa: F401
+
+from hummingbot.core.api_throttler.rate_limit_coordinator import main
+
+if __name__ == "__main__":
+    main()
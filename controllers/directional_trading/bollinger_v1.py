@@ -79,6 +79,9 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
+        if not self.candles_changed(self.config.candles_connector, self.config.candles_trading_pair,
+                                    self.config.interval, self.max_records):
+            return
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
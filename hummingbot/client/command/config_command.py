@@ -75,6 +75,7 @@ client_configs_to_display = ["autofill_import",
                              "global_token_name",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "rate_limits_coordinator_path",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
@@ -94,6 +94,9 @@ class ExportCommand:
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
+        # The recorder writes the trade fills in the background, commit the pending ones before reading them
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush()
 
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
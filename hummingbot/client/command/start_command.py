@@ -245,7 +245,8 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size,
+                               timing_enabled=self.client_config_map.clock_timing_enabled)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -18,6 +18,7 @@ from hummingbot.client.settings import ethereum_wallet_required, required_exchan
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -77,6 +78,9 @@ class StatusCommand:
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        event_loop_monitor = EventLoopMonitor.get_instance()
+        if event_loop_monitor.started:
+            status += "\n\n" + event_loop_monitor.format_status()
         return status
 
     def application_warning(self):
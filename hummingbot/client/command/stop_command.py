@@ -57,6 +57,9 @@ class StopCommand:
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
+        if self.clock is not None and self.clock.timings is not None:
+            self.logger().info(self.clock.timings.report())
+
         self.strategy_task = None
         self.strategy = None
         self.market_pair = None
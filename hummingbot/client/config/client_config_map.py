@@ -4,9 +4,10 @@ import re
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, SecretStr, root_validator, validator
+from sqlalchemy.pool import QueuePool
 from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientConfigEnum, ClientFieldData
@@ -140,6 +141,11 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+class MarketDataStorageEnum(str, ClientConfigEnum):
+    FILES = "files"
+    DATABASE = "database"
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -167,11 +173,56 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_storage: MarketDataStorageEnum = Field(
+        default=MarketDataStorageEnum.DATABASE,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Where do you want to store the market data? ({'/'.join(list(MarketDataStorageEnum))}) "
+                "database: a MarketData row per trading pair and interval in the trades database, "
+                "files: compressed columnar files of order book snapshots and trades in data/market_data"
+            ),
+        ),
+    )
+    market_data_collection_flush_size: int = Field(
+        default=1000,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of order book snapshots or trades of a trading pair written to each market data file "
+                "(Default=1000)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class EventLoopMonitorConfigMap(BaseClientModel):
+    event_loop_monitor_enabled: bool = Field(
+        default=True,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the event loop monitor, reporting the event loop lag and the slow callbacks in the "
+                "status command and the logs"
+            ),
+        ),
+    )
+    event_loop_slow_callback_threshold: float = Field(
+        default=0.1,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time in seconds a callback can block the event loop before being reported as slow "
+                "(Default=0.1)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "event_loop_monitor"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -376,11 +427,30 @@ class AutofillImportEnum(str, ClientConfigEnum):
     disabled = "disabled"
 
 
+class SQLiteSynchronousEnum(str, ClientConfigEnum):
+    OFF = "OFF"
+    NORMAL = "NORMAL"
+    FULL = "FULL"
+    EXTRA = "EXTRA"
+
+
 class DBMode(BaseClientModel, ABC):
     @abstractmethod
     def get_url(self, db_path: str) -> str:
         ...
 
+    def get_engine_kwargs(self, db_path: str) -> Dict[str, Any]:
+        """
+        :return: the keyword arguments to create the SQLAlchemy engine of the database with
+        """
+        return {}
+
+    def get_pragmas(self) -> List[str]:
+        """
+        :return: the PRAGMA statements to run on every new connection of an SQLite database
+        """
+        return []
+
 
 class DBSqliteMode(DBMode):
     db_engine: str = Field(
@@ -393,12 +463,79 @@ class DBSqliteMode(DBMode):
         ),
     )
 
+    db_wal_mode: bool = Field(
+        default=True,
+        description="Write-ahead logging, readers do not block the writer (not supported on network file systems)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to use write-ahead logging for the database (Yes/No)?",
+        ),
+    )
+    db_synchronous: SQLiteSynchronousEnum = Field(
+        default=SQLiteSynchronousEnum.NORMAL,
+        description=("How often SQLite waits for the data to reach the disk, NORMAL with write-ahead logging keeps "
+                     "the database consistent but the last transactions can be lost on a power failure"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Please enter the database synchronous level ({'/'.join(list(SQLiteSynchronousEnum))})"
+            ),
+        ),
+    )
+    db_mmap_size_mb: int = Field(
+        default=256,
+        ge=0,
+        description="Size of the database memory-mapped for reads in MB, 0 to disable memory-mapped I/O",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the size of the database to memory-map in MB (0 to disable)",
+        ),
+    )
+    db_statement_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description="Number of prepared statements cached by each database connection",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the number of prepared statements to cache per connection",
+        ),
+    )
+
     class Config:
         title = "sqlite_db_engine"
 
     def get_url(self, db_path: str) -> str:
         return f"{self.db_engine}:///{db_path}"
 
+    def get_engine_kwargs(self, db_path: str) -> Dict[str, Any]:
+        connect_args: Dict[str, Any] = {"cached_statements": self.db_statement_cache_size}
+        if db_path in ("", ":memory:"):
+            # Every connection to an in-memory database has its own database, the default pool keeps one per thread
+            return {"connect_args": connect_args}
+        # The connections are kept open so that they keep their prepared statements (the default for SQLite files is
+        # to open a new connection for every session), the pool hands a connection to one thread at a time.
+        connect_args["check_same_thread"] = False
+        return {"poolclass": QueuePool, "connect_args": connect_args}
+
+    def get_pragmas(self) -> List[str]:
+        return [
+            f"PRAGMA journal_mode={'WAL' if self.db_wal_mode else 'DELETE'}",
+            f"PRAGMA synchronous={SQLiteSynchronousEnum(self.db_synchronous).value}",
+            f"PRAGMA mmap_size={self.db_mmap_size_mb * 1024 * 1024}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+
+    @validator("db_wal_mode", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    @validator("db_synchronous", pre=True)
+    def validate_db_synchronous(cls, v: Union[str, SQLiteSynchronousEnum]):
+        if isinstance(v, str) and v.upper() not in SQLiteSynchronousEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(SQLiteSynchronousEnum))}.")
+        return v.upper() if isinstance(v, str) else v
+
 
 class DBOtherMode(DBMode):
     db_engine: str = Field(
@@ -947,6 +1084,9 @@ class ClientConfigMap(BaseClientModel):
         description=("Advanced database options, currently supports SQLAlchemy's included dialects"
                      "\nReference: https://docs.sqlalchemy.org/en/13/dialects/"
                      "\nTo use an instance of SQLite DB the required configuration is \n  db_engine: sqlite"
+                     "\nand its performance profile can be tuned with"
+                     "\n  db_wal_mode: true\n  db_synchronous: NORMAL\n  db_mmap_size_mb: 256"
+                     "\n  db_statement_cache_size: 512"
                      "\nTo use a DBMS the required configuration is"
                      "\n  db_host: 127.0.0.1\n  db_port: 3306\n  db_username: username\n  db_password: password"
                      "\n  db_name: dbname"),
@@ -1036,6 +1176,17 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_coordinator_path: Optional[str] = Field(
+        default=None,
+        description=("Path of the Unix socket of a rate limit coordinator (bin/rate_limit_coordinator.py) shared by the"
+                     "\nbots using the same exchange account. The bots lease the API rate limits capacity from it and"
+                     "\nfall back to rate_limits_share_pct when it is not available. Leave empty to disable."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the path of the rate limit coordinator socket (leave empty to disable)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -1065,7 +1216,18 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    clock_timing_enabled: bool = Field(
+        default=False,
+        description="Whether to time the ticks of the connectors and the strategy, and to log a report of the tick"
+                    "\ntimings when the strategy stops.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to time the clock ticks of the connectors and the strategy? (Yes/No)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    event_loop_monitor: EventLoopMonitorConfigMap = Field(default=EventLoopMonitorConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -1088,7 +1250,7 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(f"The value must be one of {', '.join(list(AutofillImportEnum))}.")
         return v
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "clock_timing_enabled", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
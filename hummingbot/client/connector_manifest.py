@@ -0,0 +1,99 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+
+class ConnectorManifestContent(NamedTuple):
+    connectors: List[Dict[str, Any]]
+    # Directories of the connectors whose utils module could not be imported, e.g. for a missing dependency
+    skipped_connector_dirs: List[str]
+
+
+class ConnectorManifest:
+    """
+    On-disk cache of the connector metadata declared in the `<connector>_utils` modules (names, types, fee defaults,
+    example pairs and where the config keys are defined).
+
+    Reading that metadata requires importing the utils module of every connector, and with it most of the connector
+    packages, which dominates the client startup. The manifest keeps the metadata in a JSON file together with a
+    fingerprint of the connector sources (the path, size and modification time of their Python files) and of the
+    `schema` of the entries given by the caller, so the modules are only imported again when a connector is added,
+    removed or modified, or when the entries are read or written differently. The connectors skipped when the
+    manifest was generated are listed in it, so their import can be tried again on every start.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    VERSION = 2
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, path: Optional[str] = None, schema: Sequence[str] = ()):
+        """
+        :param path: path of the manifest file, data/connector_manifest.json by default
+        :param schema: descriptions of the format of the entries, the manifest is stale when any of them changes
+        """
+        self.path = path or os.path.join(data_path(), "connector_manifest.json")
+        self.schema = schema
+
+    def fingerprint(self, connector_dirs: List[str]) -> str:
+        """
+        Hashes the schema and the Python files directly under each connector package directory. Stat calls only, no
+        connector file is read.
+        """
+        digest = hashlib.sha1()
+        for description in self.schema:
+            digest.update(description.encode())
+        for connector_dir in sorted(connector_dirs):
+            digest.update(connector_dir.encode())
+            for entry in sorted(os.scandir(connector_dir), key=lambda e: e.name):
+                if entry.is_file() and entry.name.endswith(".py"):
+                    stat = entry.stat()
+                    digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def load(self, connector_dirs: List[str]) -> Optional[ConnectorManifestContent]:
+        """
+        Returns the cached connector entries and the skipped connectors, or None when there is no manifest or it was
+        generated from different connector sources.
+        """
+        try:
+            with open(self.path) as fd:
+                manifest = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(manifest, dict)
+                or manifest.get("version") != self.VERSION
+                or manifest.get("fingerprint") != self.fingerprint(connector_dirs)
+                or not isinstance(manifest.get("connectors"), list)
+                or not isinstance(manifest.get("skipped_connector_dirs"), list)):
+            return None
+        return ConnectorManifestContent(connectors=manifest["connectors"],
+                                        skipped_connector_dirs=manifest["skipped_connector_dirs"])
+
+    def save(self, connector_dirs: List[str], connectors: List[Dict[str, Any]],
+             skipped_connector_dirs: Sequence[str] = ()):
+        manifest = {
+            "version": self.VERSION,
+            "fingerprint": self.fingerprint(connector_dirs),
+            "connectors": connectors,
+            "skipped_connector_dirs": list(skipped_connector_dirs),
+        }
+        # Write to a temporary file and rename it, so another client starting up never reads a partial manifest
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temporary_path, "w") as fd:
+                json.dump(manifest, fd)
+            os.replace(temporary_path, self.path)
+        except OSError:
+            self.logger().warning(f"Could not write the connector manifest to {self.path}. The connector modules will "
+                                  f"be imported again on the next start.", exc_info=True)
@@ -32,6 +32,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -275,8 +276,16 @@ class HummingbotApplication(*commands):
         return success
 
     async def run(self):
+        self._start_event_loop_monitor()
         await self.app.run()
 
+    def _start_event_loop_monitor(self):
+        event_loop_monitor_config = self.client_config_map.event_loop_monitor
+        if event_loop_monitor_config.event_loop_monitor_enabled:
+            event_loop_monitor = EventLoopMonitor.get_instance()
+            event_loop_monitor.slow_callback_threshold = event_loop_monitor_config.event_loop_slow_callback_threshold
+            event_loop_monitor.start()
+
     def add_application_warning(self, app_warning: ApplicationWarning):
         self._expire_old_application_warnings()
         self._app_warnings.append(app_warning)
@@ -1,14 +1,19 @@
+import hashlib
 import importlib
+import inspect
 import json
+from dataclasses import fields
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
-from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from os.path import basename, dirname, exists, join, realpath
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import ConnectorManifest, ConnectorManifestContent
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if TYPE_CHECKING:
@@ -171,11 +176,26 @@ class ConnectorSetting(NamedTuple):
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+    # (utils module path, domain) where the config keys are defined, to import them on first use
+    config_keys_source: Optional[Tuple[str, Optional[str]]] = None
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
     """
 
+    def get_config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        """
+        Returns the config keys of the connector. The settings created from the connector manifest don't hold them, in
+        that case the connector utils module is imported the first time they are requested.
+        """
+        if self.config_keys is None and self.config_keys_source is not None:
+            util_module_path, domain = self.config_keys_source
+            util_module = importlib.import_module(util_module_path)
+            if domain is None:
+                return getattr(util_module, "KEYS")
+            return getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]
+        return self.config_keys
+
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
         return self.type not in non_gateway_connectors_types
@@ -242,10 +262,11 @@ class ConnectorSetting(NamedTuple):
     ) -> Dict[str, Any]:
         trading_pairs = trading_pairs or []
         api_keys = api_keys or {}
+        config_keys = self.get_config_keys()
         if self.uses_gateway_generic_connector():  # init parameters for gateway connectors
             params = {}
-            if self.config_keys is not None:
-                params: Dict[str, Any] = {k: v.value for k, v in self.config_keys.items()}
+            if config_keys is not None:
+                params: Dict[str, Any] = {k: v.value for k, v in config_keys.items()}
             connector_spec: Dict[str, str] = GatewayConnectionSetting.get_connector_spec_from_market_name(self.name)
             params.update(
                 connector_name=connector_spec["connector"],
@@ -269,11 +290,11 @@ class ConnectorSetting(NamedTuple):
         params["trading_pairs"] = trading_pairs
         params["trading_required"] = trading_required
         params["client_config_map"] = client_config_map
-        if (self.config_keys is not None
-                and type(self.config_keys) is not dict
-                and "receive_connector_configuration" in self.config_keys.__fields__
-                and self.config_keys.receive_connector_configuration):
-            params["connector_configuration"] = self.config_keys
+        if (config_keys is not None
+                and type(config_keys) is not dict
+                and "receive_connector_configuration" in config_keys.__fields__
+                and config_keys.receive_connector_configuration):
+            params["connector_configuration"] = config_keys
 
         return params
 
@@ -299,15 +320,16 @@ class ConnectorSetting(NamedTuple):
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
         kwargs = {}
-        if isinstance(self.config_keys, Dict):
-            kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
-        elif self.config_keys is not None:
+        config_keys = self.get_config_keys()
+        if isinstance(config_keys, Dict):
+            kwargs = {key: (config.value or "") for key, config in config_keys.items()}  # legacy
+        elif config_keys is not None:
             kwargs = {
                 traverse_item.attr: traverse_item.value.get_secret_value()
                 if isinstance(traverse_item.value, SecretStr)
                 else traverse_item.value or ""
                 for traverse_item
-                in ClientConfigAdapter(self.config_keys).traverse()
+                in ClientConfigAdapter(config_keys).traverse()
                 if traverse_item.attr != "connector"
             }
         kwargs = self.conn_init_parameters(
@@ -333,69 +355,44 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The metadata of the connectors is read from the connector manifest, and the connector utils modules are only
+        imported to regenerate it when the connector sources changed, or for the connectors that could not be imported
+        when it was generated.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        connector_dirs: List[DirEntry] = cls._connector_dirs()
+        connector_dir_paths: List[str] = [connector_dir.path for connector_dir in connector_dirs]
+        connector_manifest = ConnectorManifest(schema=cls._manifest_schema())
+        manifest_content: Optional[ConnectorManifestContent] = connector_manifest.load(connector_dir_paths)
+        connector_settings: Optional[List[ConnectorSetting]] = None
+        if manifest_content is not None:
+            try:
+                connector_settings = [cls._connector_setting_from_manifest_entry(entry)
+                                      for entry in manifest_content.connectors]
+            except (AttributeError, KeyError, TypeError, ValueError, ArithmeticError):
+                connector_manifest.logger().warning("Invalid connector manifest entries, the connector manifest will "
+                                                    "be generated again.", exc_info=True)
+        if connector_settings is not None:
+            for connector_setting in connector_settings:
+                cls.all_connector_settings[connector_setting.name] = connector_setting
+            # The connectors skipped for a missing dependency are imported again, like without a manifest
+            retried_connector_dirs: List[DirEntry] = [
+                connector_dir for connector_dir in connector_dirs
+                if connector_dir.path in manifest_content.skipped_connector_dirs]
+            skipped_connector_dirs: List[DirEntry] = [
+                connector_dir for connector_dir in retried_connector_dirs
+                if not cls._add_connector_settings_from_utils(connector_dir)]
+            save_manifest: bool = len(skipped_connector_dirs) < len(retried_connector_dirs)
+        else:
+            skipped_connector_dirs = [connector_dir for connector_dir in connector_dirs
+                                      if not cls._add_connector_settings_from_utils(connector_dir)]
+            save_manifest = True
+        if save_manifest:
+            connector_manifest.save(
+                connector_dir_paths,
+                [cls._manifest_entry(connector_setting) for connector_setting in cls.all_connector_settings.values()],
+                [connector_dir.path for connector_dir in skipped_connector_dirs],
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -420,6 +417,117 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @staticmethod
+    def _connector_dirs() -> List[DirEntry]:
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        connector_dirs: List[DirEntry] = []
+        connector_names: Set[str] = set()
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            for connector_dir in scandir(type_dir.path):
+                if not connector_dir.is_dir() or not exists(join(connector_dir.path, "__init__.py")):
+                    continue
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                if connector_dir.name in connector_names:
+                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+                connector_names.add(connector_dir.name)
+                connector_dirs.append(cast(DirEntry, connector_dir))
+        return connector_dirs
+
+    @classmethod
+    def _add_connector_settings_from_utils(cls, connector_dir: DirEntry) -> bool:
+        """
+        :return: False if the connector was skipped, its utils module could not be imported
+        """
+        type_dir_name: str = basename(dirname(connector_dir.path))
+        try:
+            util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                    f"{connector_dir.name}.{connector_dir.name}_utils"
+            util_module = importlib.import_module(util_module_path)
+        except ModuleNotFoundError:
+            return False
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+            connector_dir.name, trade_fee_settings
+        )
+        config_keys: Optional["BaseConnectorConfigMap"] = getattr(util_module, "KEYS", None)
+        cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
+            name=connector_dir.name,
+            type=ConnectorType[type_dir_name.capitalize()],
+            centralised=getattr(util_module, "CENTRALIZED", True),
+            example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+            use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            trade_fee_schema=trade_fee_schema,
+            config_keys=config_keys,
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            config_keys_source=(util_module_path, None) if config_keys is not None else None,
+        )
+        # Adds other domains of connector
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        for domain in other_domains:
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+            parent = cls.all_connector_settings[connector_dir.name]
+            config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]
+            cls.all_connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=config_keys,
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                config_keys_source=(util_module_path, domain) if config_keys is not None else None,
+            )
+        return True
+
+    @staticmethod
+    def _manifest_schema() -> List[str]:
+        """
+        The fields of the connector settings and of their trade fee schemas, and the sources converting them to and
+        from the manifest entries, so that a manifest written with other ones is generated again.
+        """
+        return [
+            ",".join(ConnectorSetting._fields),
+            ",".join(schema_field.name for schema_field in fields(TradeFeeSchema)),
+            hashlib.sha1(Path(__file__).read_bytes()).hexdigest(),
+            hashlib.sha1(Path(inspect.getfile(TradeFeeSchema)).read_bytes()).hexdigest(),
+        ]
+
+    @staticmethod
+    def _manifest_entry(connector_setting: ConnectorSetting) -> Dict[str, Any]:
+        entry = connector_setting._asdict()
+        del entry["config_keys"]
+        entry["type"] = connector_setting.type.name
+        entry["trade_fee_schema"] = connector_setting.trade_fee_schema.to_json()
+        return entry
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> ConnectorSetting:
+        config_keys_source = entry["config_keys_source"]
+        return ConnectorSetting(**{
+            **entry,
+            "type": ConnectorType[entry["type"]],
+            "trade_fee_schema": TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+            "config_keys": None,
+            "config_keys_source": tuple(config_keys_source) if config_keys_source is not None else None,
+        })
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
@@ -438,6 +546,7 @@ class AllConnectorSettings:
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
+                    config_keys_source=base_connector_settings.config_keys_source,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -449,12 +558,12 @@ class AllConnectorSettings:
 
     @classmethod
     def get_connector_config_keys(cls, connector: str) -> Optional["BaseConnectorConfigMap"]:
-        return cls.get_connector_settings()[connector].config_keys
+        return cls.get_connector_settings()[connector].get_config_keys()
 
     @classmethod
     def reset_connector_config_keys(cls, connector: str):
         current_settings = cls.get_connector_settings()[connector]
-        current_keys = current_settings.config_keys
+        current_keys = current_settings.get_config_keys()
         new_keys = (
             current_keys if current_keys is None else current_keys.__class__.construct()
         )
@@ -3,7 +3,7 @@ import logging
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple
 
 from cachetools import TTLCache
 
@@ -61,6 +61,9 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        # Ids of the orders whose tracking state might have changed since the last call to pop_tracking_state_changes,
+        # None until the changes are requested for the first time so that nothing is kept if nobody asks for them.
+        self._changed_order_ids: Optional[Set[str]] = None
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -142,14 +145,37 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._mark_changed(order.client_order_id)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            self._mark_changed(client_order_id)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
+    def pop_tracking_state_changes(self) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Returns the changes of the tracking states (the JSON representation of all the updatable orders) since the
+        previous call, only the orders that changed are serialized. The changes are only kept once this has been called,
+        the first call returns no changes.
+        :return: the serialized orders that were added or updated and the ids of the orders that were removed
+        """
+        changed_order_ids = self._changed_order_ids or set()
+        self._changed_order_ids = set()
+
+        updated_states: Dict[str, Any] = {}
+        removed_order_ids: Set[str] = set()
+        for client_order_id in changed_order_ids:
+            # Lost orders take precedence, as in all_updatable_orders
+            order = self._lost_orders.get(client_order_id) or self._in_flight_orders.get(client_order_id)
+            if order is None:
+                removed_order_ids.add(client_order_id)
+            else:
+                updated_states[client_order_id] = order.to_json()
+        return updated_states, removed_order_ids
+
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
         Restore in-flight orders from saved tracking states.
@@ -162,6 +188,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._mark_changed(order.client_order_id)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -210,6 +237,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
             if updated:
+                self._mark_changed(client_order_id)
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
                     prev_executed_amount_base=previous_executed_amount_base,
@@ -249,6 +277,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._mark_changed(client_order_id)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +320,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._mark_changed(tracked_order.client_order_id)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -301,9 +331,14 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._mark_changed(lost_order.client_order_id)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _mark_changed(self, client_order_id: str):
+        if self._changed_order_ids is not None:
+            self._changed_order_ids.add(client_order_id)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -209,6 +209,14 @@ cdef class ConnectorBase(NetworkIterator):
         """
         pass
 
+    def pop_tracking_state_changes(self) -> Optional[Tuple[Dict[str, any], Set[str]]]:
+        """
+        Returns the changes of the tracking states since the previous call, so that they can be saved incrementally.
+        :return: the tracking states added or updated and the keys of the ones removed, or None if the connector does
+        not report its changes (the whole `tracking_states` have to be saved then)
+        """
+        return None
+
     def tick(self, timestamp: float):
         """
         Is called automatically by the clock for each clock's tick (1 second by default).
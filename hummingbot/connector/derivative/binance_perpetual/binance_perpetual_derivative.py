@@ -66,6 +66,10 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.binance_perpetual_api_key
+
     @property
     def authenticator(self) -> BinancePerpetualAuth:
         return BinancePerpetualAuth(self.binance_perpetual_api_key, self.binance_perpetual_secret_key,
@@ -67,6 +67,10 @@ class BitgetPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.bitget_perpetual_api_key
+
     @property
     def authenticator(self) -> BitgetPerpetualAuth:
         return BitgetPerpetualAuth(
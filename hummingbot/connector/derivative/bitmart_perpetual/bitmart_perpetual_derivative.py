@@ -68,6 +68,10 @@ class BitmartPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.bitmart_perpetual_api_key
+
     @property
     def authenticator(self) -> BitmartPerpetualAuth:
         return BitmartPerpetualAuth(api_key=self.bitmart_perpetual_api_key,
@@ -65,6 +65,10 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.bybit_perpetual_api_key
+
     @property
     def authenticator(self) -> BybitPerpetualAuth:
         return BybitPerpetualAuth(self.bybit_perpetual_api_key, self.bybit_perpetual_secret_key, self._time_synchronizer)
@@ -72,6 +72,10 @@ class DerivePerpetualDerivative(PerpetualDerivativePyBase):
         # Note: domain here refers to the entire exchange name. i.e. derive_perpetual_ or derive_perpetual_testnet
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.derive_perpetual_api_key
+
     @staticmethod
     def derive_perpetual_order_type(order_type: OrderType) -> str:
         return order_type.name.lower()
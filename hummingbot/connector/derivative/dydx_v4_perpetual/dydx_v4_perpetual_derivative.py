@@ -68,6 +68,10 @@ class DydxV4PerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._dydx_v4_perpetual_chain_address
+
     @property
     def authenticator(self) -> AuthBase:
         return None
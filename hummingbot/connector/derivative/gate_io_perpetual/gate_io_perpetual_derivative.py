@@ -86,6 +86,10 @@ class GateIoPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return "gate_io_perpetual"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._gate_io_perpetual_api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
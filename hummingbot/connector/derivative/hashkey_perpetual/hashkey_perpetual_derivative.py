@@ -70,6 +70,10 @@ class HashkeyPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.hashkey_perpetual_api_key
+
     @property
     def authenticator(self) -> HashkeyPerpetualAuth:
         return HashkeyPerpetualAuth(self.hashkey_perpetual_api_key, self.hashkey_perpetual_secret_key,
@@ -70,6 +70,10 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         # Note: domain here refers to the entire exchange name. i.e. hyperliquid_perpetual or hyperliquid_perpetual_testnet
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.hyperliquid_perpetual_api_key
+
     @property
     def authenticator(self) -> Optional[HyperliquidPerpetualAuth]:
         if self._trading_required:
@@ -74,6 +74,10 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.okx_perpetual_api_key
+
     @property
     def rate_limits_rules(self) -> List[RateLimit]:
         return web_utils.build_rate_limits(self.trading_pairs)
@@ -78,6 +78,10 @@ class AscendExExchange(ExchangePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.ascend_ex_api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
@@ -73,6 +73,10 @@ class BinanceExchange(ExchangePyBase):
         else:
             return f"binance_{self._domain}"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
@@ -67,6 +67,10 @@ class BingXExchange(ExchangePyBase):
     def name(self) -> str:
         return "bing_x"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
@@ -48,6 +48,10 @@ class BitgetExchange(ExchangePyBase):
     @property
     def name(self) -> str:
         return "bitget"
+
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._bitget_api_key
     
     @property
     def rate_limits_rules(self):
@@ -75,6 +75,10 @@ class BitmartExchange(ExchangePyBase):
     def name(self) -> str:
         return "bitmart"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
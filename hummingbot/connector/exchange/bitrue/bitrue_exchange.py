@@ -80,6 +80,10 @@ class BitrueExchange(ExchangePyBase):
     def name(self) -> str:
         return "bitrue"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         # Default rate limits - will be updated from exchange info afterwards
@@ -75,6 +75,10 @@ class BitstampExchange(ExchangePyBase):
     def name(self) -> str:
         return "bitstamp"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
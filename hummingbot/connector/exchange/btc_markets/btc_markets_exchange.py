@@ -144,6 +144,10 @@ class BtcMarketsExchange(ExchangePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._api_key
+
     @staticmethod
     def btc_markets_order_type(order_type: OrderType) -> str:
         return order_type.name  # .upper()
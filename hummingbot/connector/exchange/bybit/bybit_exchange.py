@@ -75,6 +75,10 @@ class BybitExchange(ExchangePyBase):
         else:
             return f"bybit_{self._domain}"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
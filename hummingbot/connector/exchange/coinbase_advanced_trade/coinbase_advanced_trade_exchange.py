@@ -131,6 +131,10 @@ class CoinbaseAdvancedTradeExchange(ExchangePyBase):
         else:
             return f"coinbase_advanced_trade_{self._domain}"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._api_key
+
     @property
     def rate_limits_rules(self):
         return constants.RATE_LIMITS
@@ -81,6 +81,10 @@ class CubeExchange(ExchangePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
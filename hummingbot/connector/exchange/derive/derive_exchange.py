@@ -68,6 +68,10 @@ class DeriveExchange(ExchangePyBase):
         # Note: domain here refers to the entire exchange name. i.e. derive_ or derive_testnet
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.derive_api_key
+
     @staticmethod
     def derive_order_type(order_type: OrderType) -> str:
         return order_type.name.lower()
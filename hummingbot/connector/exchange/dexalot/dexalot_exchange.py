@@ -85,6 +85,10 @@ class DexalotExchange(ExchangePyBase):
     def name(self) -> str:
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
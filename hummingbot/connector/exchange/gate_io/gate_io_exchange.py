@@ -64,6 +64,10 @@ class GateIoExchange(ExchangePyBase):
     def name(self) -> str:
         return "gate_io"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._gate_io_api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
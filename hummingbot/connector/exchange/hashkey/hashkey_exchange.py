@@ -70,6 +70,10 @@ class HashkeyExchange(ExchangePyBase):
         else:
             return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
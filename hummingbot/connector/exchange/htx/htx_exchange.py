@@ -49,6 +49,10 @@ class HtxExchange(ExchangePyBase):
     def name(self) -> str:
         return "htx"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.htx_api_key
+
     @property
     def authenticator(self):
         return HtxAuth(
@@ -69,6 +69,10 @@ class HyperliquidExchange(ExchangePyBase):
         # Note: domain here refers to the entire exchange name. i.e. hyperliquid_ or hyperliquid_testnet
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.hyperliquid_api_key
+
     @property
     def authenticator(self) -> Optional[HyperliquidAuth]:
         if self._trading_required:
@@ -84,6 +84,10 @@ class KrakenExchange(ExchangePyBase):
     def name(self) -> str:
         return "kraken"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     # not used
     @property
     def rate_limits_rules(self):
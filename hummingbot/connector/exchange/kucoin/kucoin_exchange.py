@@ -61,6 +61,10 @@ class KucoinExchange(ExchangePyBase):
     def name(self) -> str:
         return "kucoin"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.kucoin_api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
@@ -1,5 +1,5 @@
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -42,6 +42,14 @@ class KucoinOrderBookMessage(OrderBookMessage):
             for price, amount, *trash in self.content.get("bids", [])
         ]
 
+    @property
+    def raw_asks(self) -> List[Any]:
+        return self.content.get("asks", [])
+
+    @property
+    def raw_bids(self) -> List[Any]:
+        return self.content.get("bids", [])
+
     @property
     def has_update_id(self) -> bool:
         return True
@@ -69,6 +69,10 @@ class MexcExchange(ExchangePyBase):
         else:
             return f"mexc_{self._domain}"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
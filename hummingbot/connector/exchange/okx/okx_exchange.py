@@ -56,6 +56,10 @@ class OkxExchange(ExchangePyBase):
     def name(self) -> str:
         return "okx"
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.okx_api_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
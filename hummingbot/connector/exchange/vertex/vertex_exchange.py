@@ -73,6 +73,10 @@ class VertexExchange(ExchangePyBase):
     def name(self) -> str:
         return self._domain
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self.sender_address
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
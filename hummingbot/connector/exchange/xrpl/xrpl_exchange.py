@@ -120,6 +120,10 @@ class XrplExchange(ExchangePyBase):
     def name(self) -> str:
         return CONSTANTS.EXCHANGE_NAME
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._xrpl_secret_key
+
     @property
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
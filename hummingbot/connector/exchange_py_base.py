@@ -1,10 +1,11 @@
 import asyncio
 import copy
+import hashlib
 import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Set, Tuple
 
 from async_timeout import timeout
 
@@ -15,7 +16,9 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_coordinator import CoordinatedAsyncThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -29,6 +32,7 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import order_requests
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
@@ -62,9 +66,16 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        if client_config_map.rate_limits_coordinator_path:
+            self._throttler = CoordinatedAsyncThrottler(
+                rate_limits=self.rate_limits_rules,
+                coordinator_path=client_config_map.rate_limits_coordinator_path,
+                account_id=self._rate_limits_account_id(),
+                limits_share_percentage=client_config_map.rate_limits_share_pct)
+        else:
+            self._throttler = AsyncThrottler(
+                rate_limits=self.rate_limits_rules,
+                limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -76,7 +87,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            concurrent_snapshots=True))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -104,6 +116,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def rate_limits_rules(self) -> List[RateLimit]:
         raise NotImplementedError
 
+    @property
+    def rate_limits_account_key(self) -> Optional[str]:
+        """
+        Credential identifying the exchange account (usually the API key) in the rate limit coordinator.
+        Connectors with credentials override it, the default None makes all the bots of the exchange share its limits.
+        """
+        return None
+
     @property
     @abstractmethod
     def domain(self) -> str:
@@ -153,6 +173,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True once the order book of the trading pair is initialized, even if other order books are still
+        loading and the connector is not ready yet.
+        """
+        return self.order_book_tracker.is_order_book_ready(trading_pair)
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._order_tracker.active_orders
@@ -194,6 +221,12 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def pop_tracking_state_changes(self) -> Optional[Tuple[Dict[str, Any], Set[str]]]:
+        """
+        Returns the tracking states added or updated and the ids of the ones removed since the previous call
+        """
+        return self._order_tracker.pop_tracking_state_changes()
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -466,15 +499,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.HIGH), order_requests():
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -537,7 +571,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.HIGH), order_requests():
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -674,6 +709,9 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            order_pool_profile = self._web_assistants_factory.order_pool_profile
+            if order_pool_profile is not None and order_pool_profile.warm_up_connections > 0:
+                safe_ensure_future(self._warm_up_order_connections(order_pool_profile.warm_up_connections))
 
     async def stop_network(self):
         """
@@ -687,13 +725,30 @@ class ExchangePyBase(ExchangeBase, ABC):
         Checks connectivity with the exchange using the API
         """
         try:
-            await self._make_network_check_request()
+            if self._web_assistants_factory.order_pool_profile is not None:
+                # Sent through the order requests pool, it keeps a connection of the pool open between orders
+                with order_requests():
+                    await self._make_network_check_request()
+            else:
+                await self._make_network_check_request()
         except asyncio.CancelledError:
             raise
         except Exception:
             return NetworkStatus.NOT_CONNECTED
         return NetworkStatus.CONNECTED
 
+    async def _warm_up_order_connections(self, connections: int):
+        """
+        Opens connections of the order requests pool before the first order, with concurrent network check requests,
+        so that the first orders don't pay for the DNS resolution and the TCP and TLS handshakes.
+        """
+        with order_requests():
+            results = await safe_gather(
+                *[self._make_network_check_request() for _ in range(connections)], return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if len(failures) > 0:
+            self.logger().debug(f"Could not open {len(failures)} order requests connections in advance ({failures[0]})")
+
     def _stop_network(self):
         # Resets timestamps and events for status_polling_loop
         self._last_poll_timestamp = 0
@@ -729,7 +784,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +805,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -777,7 +834,9 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                # polling requests leave the rate limits capacity to the order creations and cancellations first
+                with request_priority(RequestPriority.LOW):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +875,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.LOW):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -893,6 +953,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -912,6 +973,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
                     headers=headers,
+                    priority=priority,
                 )
 
                 return request_result
@@ -1068,6 +1130,16 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _rate_limits_account_id(self) -> str:
+        """
+        Identifies the exchange account in the rate limit coordinator, so only the bots using the same account share
+        the rate limits. The account key is hashed, it is never sent to the coordinator.
+        """
+        account_key = self.rate_limits_account_key
+        if not account_key:
+            return self.name
+        return f"{self.name}:{hashlib.sha256(account_key.encode()).hexdigest()[:16]}"
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
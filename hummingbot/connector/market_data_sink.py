@@ -0,0 +1,265 @@
+import glob
+import logging
+import os
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+ORDER_BOOK_SNAPSHOTS = "order_book_snapshots"
+TRADES = "trades"
+
+
+def default_market_data_path() -> str:
+    return os.path.join(data_path(), "market_data")
+
+
+class MarketDataChunk(NamedTuple):
+    """
+    Rows of one market and data type buffered for the same file. Order book rows are (timestamp, bids, asks), with
+    the bids and asks as [price, amount] arrays, trade rows are (timestamp, price, amount, is_buy).
+    """
+    exchange: str
+    trading_pair: str
+    data_type: str
+    date: str
+    rows: List[tuple]
+
+
+class MarketDataSink:
+    """
+    Appends the top of the order books and the public trades of markets to compressed columnar files, written by a
+    background thread.
+
+    The rows of every market and data type are buffered in memory, and handed to the writer thread when `flush_size`
+    rows are buffered, when the date of the rows changes and when the sink is flushed or stopped. Each chunk is written
+    to its own file, {exchange}_{trading_pair}_{order_book_snapshots|trades}_{date}_{first timestamp in ms}.npz,
+    with the arrays of the OrderBookUpdates and PublicTrades layouts of the order book replay backtesting, so the files
+    can be replayed and loaded with NumPy without any conversion. The files are renamed into place once written, so a
+    reader never sees a partial file.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, path: Optional[str] = None, flush_size: int = 1000):
+        """
+        :param path: directory of the files, data/market_data by default
+        :param flush_size: number of rows of a market and data type buffered before they are written
+        """
+        self._path = path or default_market_data_path()
+        self._flush_size = flush_size
+        self._buffers: Dict[Tuple[str, str, str], MarketDataChunk] = {}
+        self._queue: "queue.Queue[Union[MarketDataChunk, threading.Event, None]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def buffered_count(self) -> int:
+        return sum(len(chunk.rows) for chunk in self._buffers.values())
+
+    def start(self):
+        if self._thread is None:
+            os.makedirs(self._path, exist_ok=True)
+            self._thread = threading.Thread(target=self._write_loop, name="MarketDataSink", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Writes all the buffered rows and stops the writer thread.
+        """
+        self._flush_buffers()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Writes all the buffered rows and waits until their files are written.
+        :return: False if the timeout expired before that
+        """
+        self._flush_buffers()
+        if self._thread is None:
+            return True
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def append_order_book(self, exchange: str, trading_pair: str, timestamp: float, bids: np.ndarray,
+                          asks: np.ndarray):
+        """
+        :param bids: bid levels, best first, as rows starting with [price, amount] (e.g. OrderBook.depth_arrays())
+        :param asks: ask levels, best first, likewise
+        """
+        self._append(exchange, trading_pair, ORDER_BOOK_SNAPSHOTS, timestamp,
+                     (timestamp, np.array(bids[:, :2], dtype=np.float64), np.array(asks[:, :2], dtype=np.float64)))
+
+    def append_trade(self, exchange: str, trading_pair: str, timestamp: float, price: float, amount: float,
+                     is_buy: bool):
+        """
+        :param is_buy: whether the taker was the buyer
+        """
+        self._append(exchange, trading_pair, TRADES, timestamp, (timestamp, price, amount, is_buy))
+
+    def _append(self, exchange: str, trading_pair: str, data_type: str, timestamp: float, row: tuple):
+        key = (exchange, trading_pair, data_type)
+        date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+        chunk = self._buffers.get(key)
+        if chunk is not None and chunk.date != date:
+            # The files are rotated every day
+            self._write(chunk)
+            chunk = None
+        if chunk is None:
+            chunk = MarketDataChunk(exchange, trading_pair, data_type, date, [])
+            self._buffers[key] = chunk
+        chunk.rows.append(row)
+        if len(chunk.rows) >= self._flush_size:
+            del self._buffers[key]
+            self._write(chunk)
+
+    def _flush_buffers(self):
+        buffers, self._buffers = self._buffers, {}
+        for chunk in buffers.values():
+            self._write(chunk)
+
+    def _write(self, chunk: MarketDataChunk):
+        if self._thread is None:
+            self._write_chunk(chunk)
+        else:
+            self._queue.put(chunk)
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                self._write_chunk(item)
+
+    def _write_chunk(self, chunk: MarketDataChunk):
+        if chunk.data_type == ORDER_BOOK_SNAPSHOTS:
+            arrays = self.order_book_arrays(chunk.rows)
+        else:
+            arrays = self.trade_arrays(chunk.rows)
+        file_name = (f"{chunk.exchange}_{chunk.trading_pair}_{chunk.data_type}_{chunk.date}_"
+                     f"{int(chunk.rows[0][0] * 1e3)}.npz")
+        file_path = os.path.join(self._path, file_name)
+        temporary_path = f"{file_path}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                np.savez_compressed(file, **arrays)
+            os.replace(temporary_path, file_path)
+        except Exception:
+            self.logger().error(f"Unexpected error while writing the market data file {file_path}.", exc_info=True)
+
+    @staticmethod
+    def order_book_arrays(rows: List[tuple]) -> Dict[str, np.ndarray]:
+        bid_counts = np.fromiter((len(bids) for _, bids, _ in rows), dtype=np.int64, count=len(rows))
+        ask_counts = np.fromiter((len(asks) for _, _, asks in rows), dtype=np.int64, count=len(rows))
+        return {
+            "timestamps": np.fromiter((timestamp for timestamp, _, _ in rows), dtype=np.float64, count=len(rows)),
+            "bids": np.concatenate([bids for _, bids, _ in rows]).reshape(-1, 2),
+            "asks": np.concatenate([asks for _, _, asks in rows]).reshape(-1, 2),
+            "bid_offsets": np.concatenate([[0], np.cumsum(bid_counts)]),
+            "ask_offsets": np.concatenate([[0], np.cumsum(ask_counts)]),
+        }
+
+    @staticmethod
+    def trade_arrays(rows: List[tuple]) -> Dict[str, np.ndarray]:
+        timestamps, prices, amounts, is_buy = zip(*rows)
+        return {
+            "timestamps": np.array(timestamps, dtype=np.float64),
+            "prices": np.array(prices, dtype=np.float64),
+            "amounts": np.array(amounts, dtype=np.float64),
+            "is_buy": np.array(is_buy, dtype=np.bool_),
+        }
+
+
+class MarketDataReader:
+    """
+    Reads the files written by MarketDataSink into NumPy arrays.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path or default_market_data_path()
+
+    def read_order_book_snapshots(self, exchange: str, trading_pair: str, start_time: Optional[float] = None,
+                                  end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        :return: the arrays of the order book snapshots, with the fields of OrderBookUpdates: the bids of snapshot i
+        are bids[bid_offsets[i]:bid_offsets[i + 1]], as [price, amount] rows, and likewise for the asks.
+        """
+        files = self.read_files(exchange, trading_pair, ORDER_BOOK_SNAPSHOTS, start_time, end_time)
+        if len(files) == 0:
+            return {"timestamps": np.empty(0, dtype=np.float64), "bids": np.empty((0, 2), dtype=np.float64),
+                    "asks": np.empty((0, 2), dtype=np.float64), "bid_offsets": np.zeros(1, dtype=np.int64),
+                    "ask_offsets": np.zeros(1, dtype=np.int64)}
+        return {
+            "timestamps": np.concatenate([file["timestamps"] for file in files]),
+            "bids": np.concatenate([file["bids"] for file in files]),
+            "asks": np.concatenate([file["asks"] for file in files]),
+            "bid_offsets": self.concatenate_offsets([file["bid_offsets"] for file in files]),
+            "ask_offsets": self.concatenate_offsets([file["ask_offsets"] for file in files]),
+        }
+
+    def read_trades(self, exchange: str, trading_pair: str, start_time: Optional[float] = None,
+                    end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        :return: the arrays of the public trades, with the fields of PublicTrades
+        """
+        files = self.read_files(exchange, trading_pair, TRADES, start_time, end_time)
+        fields = {"timestamps": np.float64, "prices": np.float64, "amounts": np.float64, "is_buy": np.bool_}
+        return {field: (np.concatenate([file[field] for file in files]) if len(files) > 0 else np.empty(0, dtype))
+                for field, dtype in fields.items()}
+
+    def read_files(self, exchange: str, trading_pair: str, data_type: str, start_time: Optional[float] = None,
+                   end_time: Optional[float] = None) -> List[Dict[str, np.ndarray]]:
+        """
+        Reads the files of a market and data type in chronological order. When a time range is given, only the files
+        dated within it (one day of margin on each side, the dates are local ones) are read.
+        """
+        prefix = f"{exchange}_{trading_pair}_{data_type}_"
+        first_date = datetime.fromtimestamp(start_time) - timedelta(days=1) if start_time is not None else None
+        last_date = datetime.fromtimestamp(end_time) + timedelta(days=1) if end_time is not None else None
+        file_paths = glob.glob(os.path.join(glob.escape(self._path), f"{glob.escape(prefix)}*.npz"))
+        files = []
+        for file_path in sorted(file_paths, key=self._file_sort_key):
+            date = os.path.basename(file_path)[len(prefix):].split("_")[0]
+            if first_date is not None and date < first_date.strftime("%Y-%m-%d"):
+                continue
+            if last_date is not None and date > last_date.strftime("%Y-%m-%d"):
+                continue
+            with np.load(file_path) as file:
+                files.append({field: file[field] for field in file.files})
+        return files
+
+    @staticmethod
+    def concatenate_offsets(offsets: List[np.ndarray]) -> np.ndarray:
+        shifted = [offsets[0]]
+        for file_offsets in offsets[1:]:
+            shifted.append(file_offsets[1:] + shifted[-1][-1])
+        return np.concatenate(shifted)
+
+    @staticmethod
+    def _file_sort_key(file_path: str) -> int:
+        # The files are named after the timestamp of their first row
+        return int(os.path.basename(file_path)[:-len(".npz")].rsplit("_", 1)[1])
@@ -6,16 +6,18 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketDataStorageEnum
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_sink import MarketDataSink
 from hummingbot.connector.utils import TradeFillOrderDetails
-from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -23,6 +25,8 @@ from hummingbot.core.event.events import (
     FundingPaymentCompletedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -39,6 +43,7 @@ from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_order_state import MarketOrderState
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
@@ -47,6 +52,7 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.write_behind_queue import WriteBehindQueue
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -76,7 +82,10 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_flush_interval: float = 0.5,
+                 write_batch_size: int = 500,
+                 market_data_path: Optional[str] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +96,19 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_sink: Optional[MarketDataSink] = None
+        if (market_data_collection.market_data_collection_enabled and
+                market_data_collection.market_data_collection_storage == MarketDataStorageEnum.FILES):
+            self._market_data_sink = MarketDataSink(
+                path=market_data_path, flush_size=market_data_collection.market_data_collection_flush_size)
+        self._public_trade_forwarders: Dict[OrderBook, SourceInfoEventForwarder] = {}
+        # Markets whose tracking states have been saved order by order, only their changes are saved from then on
+        self._order_states_saved: Set[Tuple[str, str]] = set()
+        # The records are written behind by a writer thread while the recorder is started, in-memory databases are
+        # private to each thread so they are always written synchronously.
+        self._write_queue: WriteBehindQueue = WriteBehindQueue(sql,
+                                                               flush_interval=write_flush_interval,
+                                                               max_batch_size=write_batch_size)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -128,34 +150,18 @@ class MarketsRecorder:
         MarketsRecorder._shared_instance = self
 
     def _start_market_data_recording(self):
+        if self._market_data_sink is not None:
+            self._market_data_sink.start()
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_sink is not None:
+                        self._append_market_data_to_sink()
+                    else:
+                        self._save_market_data()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -163,6 +169,54 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _save_market_data(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        bids_array, asks_array = order_book.depth_arrays(depth)
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": [[price, amount, int(update_id)]
+                                        for price, amount, update_id in bids_array.tolist()],
+                                "ask": [[price, amount, int(update_id)]
+                                        for price, amount, update_id in asks_array.tolist()]}
+                        )
+                        session.add(market_data)
+
+    def _append_market_data_to_sink(self):
+        timestamp = time.time()
+        depth = self._market_data_collection_config.market_data_collection_depth
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                if order_book not in self._public_trade_forwarders:
+                    self._subscribe_to_public_trades(market.display_name, order_book)
+                bids_array, asks_array = order_book.depth_arrays(depth)
+                self._market_data_sink.append_order_book(market.display_name, trading_pair, timestamp,
+                                                         bids_array, asks_array)
+
+    def _subscribe_to_public_trades(self, exchange: str, order_book: OrderBook):
+        def did_public_trade(event_tag: int, source: OrderBook, event: OrderBookTradeEvent):
+            self._market_data_sink.append_trade(exchange, event.trading_pair, event.timestamp, float(event.price),
+                                                float(event.amount), event.type == TradeType.BUY)
+
+        forwarder = SourceInfoEventForwarder(did_public_trade)
+        order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+        self._public_trade_forwarders[order_book] = forwarder
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -179,7 +233,13 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue(self) -> WriteBehindQueue:
+        return self._write_queue
+
     def start(self):
+        if self._sql_manager.engine.url.database not in (None, "", ":memory:"):
+            self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -192,12 +252,25 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        for order_book, forwarder in self._public_trade_forwarders.items():
+            order_book.remove_listener(OrderBookEvent.TradeEvent, forwarder)
+        self._public_trade_forwarders.clear()
+        if self._market_data_sink is not None:
+            self._market_data_sink.stop()
+        self._write_queue.stop()
+
+    def flush(self):
+        """
+        Waits until all the records written so far are committed to the database.
+        """
+        self._write_queue.flush()
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
-            existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
-            serialized_config = executor.executor_info.json()
-            executor_dict = json.loads(serialized_config)
+        executor_id = executor.config.id
+        executor_dict = json.loads(executor.executor_info.json())
+
+        def write(session: Session):
+            existing_executor = session.query(Executors).filter(Executors.id == executor_id).one_or_none()
             if existing_executor:
                 # Update existing executor
                 for attr, value in executor_dict.items():
@@ -206,35 +279,35 @@ class MarketsRecorder:
                 # Insert new executor
                 new_executor = Executors(**executor_dict)
                 session.add(new_executor)
-            session.commit()
+
+        self._write_queue.put(write)
 
     def store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            session.add(position)
-            session.commit()
+        self._write_queue.put(lambda session: session.add(position))
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
-        with self._sql_manager.get_new_session() as session:
-            config = json.loads(controller_config.json())
-            base_columns = ["id", "timestamp", "type"]
-            controller = Controllers(id=config["id"],
-                                     timestamp=time.time(),
-                                     type=config["controller_type"],
-                                     config={k: v for k, v in config.items() if k not in base_columns})
-            session.add(controller)
-            session.commit()
+        config = json.loads(controller_config.json())
+        base_columns = ["id", "timestamp", "type"]
+        controller = Controllers(id=config["id"],
+                                 timestamp=time.time(),
+                                 type=config["controller_type"],
+                                 config={k: v for k, v in config.items() if k not in base_columns})
+        self._write_queue.put(lambda session: session.add(controller))
 
     def get_executors_by_ids(self, executor_ids: List[str]):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
     def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
@@ -242,6 +315,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -257,6 +331,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -268,25 +343,120 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        try:
+            self._market_states_writer(config_file_path, market)(session)
+        except Exception:
+            self._market_states_write_failed(config_file_path, market)()
+            raise
+
+    def _market_states_writer(self, config_file_path: str, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Captures the tracking states of the market now, and returns the mutation that saves them.
 
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
+        The tracking states of the connectors that report their changes are saved in a MarketOrderState row per order:
+        all of them the first time, and then only the ones that changed. The others are saved whole in MarketState.
+        """
+        market_name: str = market.display_name
+        timestamp: int = self.db_timestamp
+        changes: Optional[Tuple[Dict[str, Any], Set[str]]] = market.pop_tracking_state_changes()
+
+        if changes is None:
+            return self._full_market_states_writer(config_file_path, market_name, market.tracking_states, timestamp)
+        elif (config_file_path, market_name) not in self._order_states_saved:
+            self._order_states_saved.add((config_file_path, market_name))
+            return self._order_states_writer(config_file_path, market_name, market.tracking_states, set(), timestamp,
+                                             replace_all=True)
         else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
+            updated_states, removed_order_ids = changes
+            return self._order_states_writer(config_file_path, market_name, updated_states, removed_order_ids,
+                                             timestamp)
+
+    def _market_states_write_failed(self, config_file_path: str, market: ConnectorBase) -> Callable[[], None]:
+        """
+        Returns the error callback of the writes that save the market states. Once the changes of some orders are lost,
+        the saved order states don't match the market anymore, so they are all replaced on the next save.
+        """
+        order_states_key: Tuple[str, str] = (config_file_path, market.display_name)
+        return lambda: self._order_states_saved.discard(order_states_key)
+
+    @staticmethod
+    def _full_market_states_writer(config_file_path: str,
+                                   market_name: str,
+                                   tracking_states: Dict[str, Any],
+                                   timestamp: int) -> Callable[[Session], None]:
+        def write(session: Session):
+            market_states: Optional[MarketState] = (session
+                                                    .query(MarketState)
+                                                    .filter(MarketState.config_file_path == config_file_path,
+                                                            MarketState.market == market_name)
+                                                    .one_or_none())
+            if market_states is not None:
+                market_states.saved_state = tracking_states
+                market_states.timestamp = timestamp
+            else:
+                market_states = MarketState(config_file_path=config_file_path,
+                                            market=market_name,
+                                            timestamp=timestamp,
+                                            saved_state=tracking_states)
+                session.add(market_states)
+
+        return write
+
+    @staticmethod
+    def _order_states_writer(config_file_path: str,
+                             market_name: str,
+                             updated_states: Dict[str, Any],
+                             removed_order_ids: Set[str],
+                             timestamp: int,
+                             replace_all: bool = False) -> Callable[[Session], None]:
+        def write(session: Session):
+            order_states_query: Query = session.query(MarketOrderState).filter(
+                MarketOrderState.config_file_path == config_file_path,
+                MarketOrderState.market == market_name)
+            if replace_all:
+                order_states_query.delete()
+                session.query(MarketState).filter(MarketState.config_file_path == config_file_path,
+                                                  MarketState.market == market_name).delete()
+            elif removed_order_ids:
+                order_states_query.filter(
+                    MarketOrderState.client_order_id.in_(removed_order_ids)).delete()
+
+            existing_order_states: Dict[str, MarketOrderState] = {}
+            if updated_states and not replace_all:
+                existing_order_states = {
+                    order_state.client_order_id: order_state
+                    for order_state in order_states_query.filter(
+                        MarketOrderState.client_order_id.in_(list(updated_states)))}
+
+            for client_order_id, saved_state in updated_states.items():
+                order_state: Optional[MarketOrderState] = existing_order_states.get(client_order_id)
+                if order_state is not None:
+                    order_state.saved_state = saved_state
+                    order_state.timestamp = timestamp
+                else:
+                    session.add(MarketOrderState(config_file_path=config_file_path,
+                                                 market=market_name,
+                                                 client_order_id=client_order_id,
+                                                 timestamp=timestamp,
+                                                 saved_state=saved_state))
+
+        return write
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            order_states: List[MarketOrderState] = (session
+                                                    .query(MarketOrderState)
+                                                    .filter(MarketOrderState.config_file_path == config_file_path,
+                                                            MarketOrderState.market == market.display_name)
+                                                    .all())
+
+            if market_states is not None or len(order_states) > 0:
+                saved_states: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+                saved_states.update({order_state.client_order_id: order_state.saved_state
+                                     for order_state in order_states})
+                market.restore_tracking_states(saved_states)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -311,31 +481,34 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        save_market_states = self._market_states_writer(self._config_file_path, market)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+            save_market_states(session)
+
+        self._write_queue.put(write, on_error=self._market_states_write_failed(self._config_file_path, market))
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -350,56 +523,57 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        save_market_states = self._market_states_writer(self._config_file_path, market)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            save_market_states(session)
+
+        self._write_queue.put(write, on_error=self._market_states_write_failed(self._config_file_path, market))
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -410,20 +584,21 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write_queue.put(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -468,19 +643,22 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        save_market_states = self._market_states_writer(self._config_file_path, market)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            # The changes of the tracking states have been taken from the market, they are saved in any case
+            save_market_states(session)
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        self._write_queue.put(write, on_error=self._market_states_write_failed(self._config_file_path, market))
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -515,16 +693,18 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        save_market_states = self._market_states_writer(self._config_file_path, connector)
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._write_queue.put(write, on_error=self._market_states_write_failed(self._config_file_path, connector))
 
     def _did_close_position(self,
                             event_tag: int,
@@ -534,17 +714,20 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        save_market_states = self._market_states_writer(self._config_file_path, connector)
+
+        def write(session: Session):
+            session.add(rp_fees)
+            save_market_states(session)
+
+        self._write_queue.put(write, on_error=self._market_states_write_failed(self._config_file_path, connector))
 
     @staticmethod
     async def _sleep(delay):
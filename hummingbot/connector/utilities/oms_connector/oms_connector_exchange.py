@@ -79,6 +79,10 @@ class OMSExchange(ExchangePyBase):
             self._auth = OMSConnectorAuth(self._api_key, self._secret_key, self._user_id)
         return self._auth
 
+    @property
+    def rate_limits_account_key(self) -> str:
+        return self._api_key
+
     @property
     def rate_limits_rules(self) -> List[RateLimit]:
         return CONSTANTS.RATE_LIMITS
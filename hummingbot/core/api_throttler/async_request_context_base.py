@@ -2,10 +2,10 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
 from typing import List, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.task_logs import TaskLogs
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -15,7 +15,10 @@ MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
-    It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+    Requests for the same limit id and priority wait in FIFO order, only the first one in the queue is active and it
+    sleeps until the time its capacity is freed. While waiting, requests reserve their weights on their limits so lower
+    priority requests don't take that capacity. It uses an async lock to prevent multiple instances of this class from updating the
+    task logs at the same time.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -28,12 +31,13 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogs,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.NORMAL,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -41,51 +45,85 @@ class AsyncRequestContextBase(ABC):
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check when the request can't fit in its limits
+        :param priority: The priority of this API Request when waiting for capacity
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogs = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        self._task_logs.flush(self._time(), self._safety_margin_pct)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def time_until_capacity(self) -> float:
+        """
+        :return: the time in seconds until all the limits of the request have capacity for it
+        """
+        raise NotImplementedError
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        waiters = self._task_logs.waiters(self._rate_limit.limit_id, self._priority)
+        if not waiters and await self._try_acquire():
+            self._task_logs.wait_time_stats[self._priority].add(0.0)
+            return
+        start = self._time()
+        limits_and_weights = self._limits_and_weights()
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        self._task_logs.reserve(limits_and_weights, self._priority)
+        try:
+            if waiters[0] is not waiter:
+                # Wait for the requests ahead for the same limit to acquire their capacity first
+                await waiter
+            while not await self._try_acquire():
+                delay = self.time_until_capacity()
+                await asyncio.sleep(delay if delay != float("inf") else self._retry_interval)
+        finally:
+            self._task_logs.release(limits_and_weights, self._priority)
+            is_first = waiters[0] is waiter
+            waiters.remove(waiter)
+            if is_first and waiters and not waiters[0].done():
+                waiters[0].set_result(None)
+        self._task_logs.wait_time_stats[self._priority].add(self._time() - start)
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+    async def _try_acquire(self) -> bool:
         async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
+            if not self.within_capacity():
+                return False
+            self._log_task()
+            return True
+
+    def _log_task(self):
+        now = self._time()
+        # Each related limit is represented as it own individual TaskLog
+
+        # Log the acquired rate limit into the tasks log
+        self._task_logs.append(TaskLog(timestamp=now,
+                                       rate_limit=self._rate_limit,
+                                       weight=self._rate_limit.weight))
+
+        # Log its related limits into the tasks log as individual tasks
+        for limit, weight in self._related_limits:
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
-            # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
+    def _limits_and_weights(self) -> List[Tuple[RateLimit, int]]:
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
 
-            # Log its related limits into the tasks log as individual tasks
-            for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+    def _time(self) -> float:
+        return time.time()
 
     async def __aenter__(self):
         await self.acquire()
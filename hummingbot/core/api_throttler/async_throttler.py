@@ -1,13 +1,11 @@
-import time
-from decimal import Decimal
-from typing import List, Tuple
+from typing import Optional
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
-from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, current_request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -20,17 +18,13 @@ class AsyncRequestContext(AsyncRequestContextBase):
         """
         Checks if an additional task within the defined RateLimit(s). Logs a warning message if the limit is about to be reached.
         Note: A task can be associated to one or more RateLimit.
+        Note: The capacity reserved by waiting tasks with a higher priority isn't available to the task.
         :return: True if it is within capacity to add a new task
         """
         if self._rate_limit is not None:
-            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
-                                                            self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
-            for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+            for rate_limit, weight in self._limits_and_weights():
+                capacity_used: int = self._task_logs.capacity_used(rate_limit, now, self._safety_margin_pct)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -38,20 +32,39 @@ class AsyncRequestContext(AsyncRequestContextBase):
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
                               f"is {capacity_used} in the last " \
                               f"{rate_limit.time_interval} seconds"
-                        self.logger().notify(msg)
+                        self._notify(msg)
                         AsyncRequestContextBase._last_max_cap_warning_ts = now
                     return False
+                if capacity_used + weight + self._task_logs.reserved_above(rate_limit.limit_id,
+                                                                           self._priority) > rate_limit.limit:
+                    return False
         return True
 
-    def _time(self):
-        return time.time()
+    def _notify(self, msg: str):
+        self.logger().notify(msg)
+
+    def time_until_capacity(self) -> float:
+        """
+        Calculates when the task logs that keep the task from being within capacity expire.
+        :return: the time in seconds until the task fits in all its RateLimit(s), inf if it can never fit in them
+        """
+        if self._rate_limit is None:
+            return 0.0
+        now: float = self._time()
+        return max(self._task_logs.time_until_capacity(
+            rate_limit=rate_limit,
+            weight=weight + self._task_logs.reserved_above(rate_limit.limit_id, self._priority),
+            now=now,
+            safety_margin_pct=self._safety_margin_pct)
+            for rate_limit, weight in self._limits_and_weights())
 
 
 class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO)
+    within their priority. Higher priority tasks get the capacity first.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -59,19 +72,23 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    _request_context_class = AsyncRequestContext
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the API request, defaults to the one set with `request_priority`
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
-        return AsyncRequestContext(
+        return self._request_context_class(
             task_logs=self._task_logs,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=priority if priority is not None else current_request_priority(),
         )
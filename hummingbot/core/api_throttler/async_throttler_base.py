@@ -3,13 +3,37 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, WaitTimeStats
+from hummingbot.core.api_throttler.task_logs import TaskLogs
 from hummingbot.logger.logger import HummingbotLogger
 
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=RequestPriority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the throttled requests made within the context (and the tasks created from it) that don't
+    specify one. i.e.
+        with request_priority(RequestPriority.HIGH):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -34,7 +58,7 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between every capacity check of a task that doesn't fit in its limits.
         :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
@@ -46,14 +70,14 @@ class AsyncThrottlerBase(ABC):
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # TaskLog(s) used to determine the API requests within a set time window, kept by rate limit.
+        self._task_logs: TaskLogs = TaskLogs()
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
+        # Shared asyncio.Lock instance to prevent multiple async ContextManager from updating the _task_logs variable
         self._lock = asyncio.Lock()
 
     def set_rate_limits(self, rate_limits: List[RateLimit]):
@@ -85,6 +109,12 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def wait_time_stats(self) -> Dict[RequestPriority, WaitTimeStats]:
+        """
+        :return: the time the requests waited for capacity, by priority
+        """
+        return self._task_logs.wait_time_stats
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -1,9 +1,13 @@
+from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
 )
 
+import numpy as np
+
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
 
@@ -13,6 +17,16 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority of a throttled request. Requests waiting for capacity are served by priority, a request only takes the
+    capacity of its limits left over by the higher priority requests waiting on them.
+    """
+    LOW = 0  # Background polling (balances, order status, trading rules and fees)
+    NORMAL = 1
+    HIGH = 2  # Order creation and cancellation
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -54,3 +68,38 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class WaitTimeStats:
+    """
+    Time spent by the requests of a priority waiting for rate limit capacity.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        """
+        :param max_samples: number of most recent wait times kept to calculate percentiles
+        """
+        self.count: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+        self._recent_times = deque(maxlen=max_samples)
+
+    def __repr__(self):
+        return f"count: {self.count}, average: {self.average:.6f}s, p99: {self.percentile(99):.6f}s, " \
+               f"max: {self.max_time:.6f}s"
+
+    def add(self, wait_time: float):
+        self.count += 1
+        self.total_time += wait_time
+        self.max_time = max(self.max_time, wait_time)
+        self._recent_times.append(wait_time)
+
+    @property
+    def average(self) -> float:
+        return self.total_time / self.count if self.count > 0 else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :return: the percentile of the most recent wait times
+        """
+        return float(np.percentile(self._recent_times, percentile)) if self._recent_times else 0.0
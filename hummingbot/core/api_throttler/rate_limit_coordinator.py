@@ -0,0 +1,424 @@
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import current_request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger.logger import HummingbotLogger
+
+rlc_logger = None
+
+
+class CoordinatorUnavailableError(ConnectionError):
+    pass
+
+
+def rate_limit_to_json(rate_limit: RateLimit) -> Dict[str, Any]:
+    return {
+        "limit_id": rate_limit.limit_id,
+        "limit": int(rate_limit.limit),
+        "time_interval": float(rate_limit.time_interval),
+        "weight": rate_limit.weight,
+        "linked_limits": [[linked_limit.limit_id, linked_limit.weight] for linked_limit in rate_limit.linked_limits],
+    }
+
+
+def rate_limit_from_json(data: Dict[str, Any]) -> RateLimit:
+    return RateLimit(
+        limit_id=data["limit_id"],
+        limit=data["limit"],
+        time_interval=data["time_interval"],
+        weight=data["weight"],
+        linked_limits=[LinkedLimitWeightPair(limit_id, weight) for limit_id, weight in data["linked_limits"]],
+    )
+
+
+class CoordinatorRequestContext(AsyncRequestContext):
+
+    def _notify(self, msg: str):
+        # The coordinator runs without a client application to notify
+        self.logger().warning(msg)
+
+
+class CoordinatorThrottler(AsyncThrottler):
+    """
+    The AsyncThrottler the coordinator uses for the full rate limits of an account.
+    """
+    _request_context_class = CoordinatorRequestContext
+
+
+class RateLimitCoordinator:
+    """
+    Local daemon that owns the rate limit windows of the accounts used by several bots of the same host, so they share
+    the whole capacity of the account instead of a static percentage of it each.
+
+    Bots connect through a Unix socket and exchange one JSON message per line:
+        {"op": "register", "account": ..., "rate_limits": [...], "safety_margin_pct": ...}
+        {"op": "acquire", "id": ..., "limit_id": ..., "priority": ...} answered with {"id": ...} once granted
+        {"op": "cancel", "id": ...} to drop a pending acquire
+        {"op": "ping"} answered with {"op": "pong"}, sent by the bots waiting for a grant to detect a hung coordinator
+    Each account is throttled by an AsyncThrottler with the full limits, so requests of all the bots are served by
+    priority and in FIFO order as if they were made by a single one.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global rlc_logger
+        if rlc_logger is None:
+            rlc_logger = logging.getLogger(__name__)
+        return rlc_logger
+
+    def __init__(self, socket_path: str):
+        """
+        :param socket_path: path of the Unix socket the coordinator listens on
+        """
+        self._socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._rate_limits: Dict[str, Dict[str, RateLimit]] = {}
+        self._throttlers: Dict[str, CoordinatorThrottler] = {}
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Left over by a coordinator that didn't stop cleanly
+            os.remove(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self._socket_path)
+        self.logger().info(f"Rate limit coordinator listening on {self._socket_path}")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        connection_tasks = list(self._connections.values())
+        for writer in list(self._connections):
+            # Closing the connections makes their handlers finish
+            writer.close()
+        await asyncio.gather(*connection_tasks, return_exceptions=True)
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def register(self, account: str, rate_limits: List[RateLimit], safety_margin_pct: float):
+        """
+        Registers the rate limits of an account, limits already known from another bot are kept as they are.
+        """
+        account_limits = self._rate_limits.setdefault(account, {})
+        new_limits = [rate_limit for rate_limit in rate_limits if rate_limit.limit_id not in account_limits]
+        for rate_limit in new_limits:
+            account_limits[rate_limit.limit_id] = rate_limit
+        if account not in self._throttlers:
+            self._throttlers[account] = CoordinatorThrottler(rate_limits=list(account_limits.values()),
+                                                             safety_margin_pct=safety_margin_pct)
+        elif len(new_limits) > 0:
+            self._throttlers[account].set_rate_limits(list(account_limits.values()))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections[writer] = asyncio.current_task()
+        pending: Dict[int, asyncio.Task] = {}
+        throttler: Optional[CoordinatorThrottler] = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if message["op"] == "register":
+                    self.register(account=message["account"],
+                                  rate_limits=[rate_limit_from_json(data) for data in message["rate_limits"]],
+                                  safety_margin_pct=message["safety_margin_pct"])
+                    throttler = self._throttlers[message["account"]]
+                elif message["op"] == "acquire":
+                    pending[message["id"]] = safe_ensure_future(self._grant(throttler, message, writer, pending))
+                elif message["op"] == "cancel":
+                    task = pending.pop(message["id"], None)
+                    if task is not None:
+                        task.cancel()
+                elif message["op"] == "ping":
+                    writer.write(json.dumps({"op": "pong"}).encode() + b"\n")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception("Unexpected error processing a rate limit coordinator request. Disconnecting.")
+        finally:
+            for task in pending.values():
+                task.cancel()
+            self._connections.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    async def _grant(throttler: Optional[CoordinatorThrottler],
+                     message: Dict[str, Any],
+                     writer: asyncio.StreamWriter,
+                     pending: Dict[int, asyncio.Task]):
+        try:
+            if throttler is None or throttler.get_related_limits(message["limit_id"])[0] is None:
+                response = {"id": message["id"], "error": f"Unknown limit id {message['limit_id']}"}
+            else:
+                async with throttler.execute_task(limit_id=message["limit_id"],
+                                                  priority=RequestPriority(message["priority"])):
+                    response = {"id": message["id"]}
+            writer.write(json.dumps(response).encode() + b"\n")
+        finally:
+            pending.pop(message["id"], None)
+
+
+class RateLimitCoordinatorClient:
+    """
+    Connection of a throttler to the RateLimitCoordinator. It connects on the first request and, after losing the
+    connection, it is unavailable for reconnect_interval seconds before trying to connect again.
+    While requests are waiting for a grant, the coordinator is pinged when it has been silent for a fraction of the
+    response_timeout. A coordinator that doesn't answer within the response_timeout is considered hung, the connection
+    is dropped and the waiting requests fall back to the local limits.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global rlc_logger
+        if rlc_logger is None:
+            rlc_logger = logging.getLogger(__name__)
+        return rlc_logger
+
+    def __init__(self,
+                 socket_path: str,
+                 account_id: str,
+                 rate_limits: List[RateLimit],
+                 safety_margin_pct: float,
+                 reconnect_interval: float = 5.0,
+                 response_timeout: float = 5.0):
+        self._socket_path = socket_path
+        self._account_id = account_id
+        self._rate_limits = rate_limits
+        self._safety_margin_pct = safety_margin_pct
+        self._reconnect_interval = reconnect_interval
+        self._response_timeout = response_timeout
+        self._heartbeat_interval = response_timeout / 5
+        self._last_message_timestamp = 0.0
+        self._request_ids = itertools.count()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+        self._unavailable_since: Optional[float] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def is_available(self) -> bool:
+        return (self._unavailable_since is None
+                or time.time() - self._unavailable_since >= self._reconnect_interval)
+
+    async def acquire(self, limit_id: str, priority: RequestPriority):
+        """
+        Waits until the coordinator grants capacity for a request.
+        :raises CoordinatorUnavailableError: if the coordinator can't be reached, stops responding or can't throttle the
+        request
+        """
+        await self._ensure_connected()
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._send({"op": "acquire", "id": request_id, "limit_id": limit_id, "priority": int(priority)})
+            await self._wait_for_grant(future)
+        except asyncio.CancelledError:
+            if self._writer is not None:
+                # Drops the request from the coordinator queue, it's ignored if it was already granted
+                self._send({"op": "cancel", "id": request_id})
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _wait_for_grant(self, future: asyncio.Future):
+        while True:
+            try:
+                await asyncio.wait_for(asyncio.shield(future), self._heartbeat_interval)
+                return
+            except asyncio.TimeoutError:
+                silence = time.time() - self._last_message_timestamp
+                if silence >= self._response_timeout:
+                    self.logger().warning(f"The rate limit coordinator at {self._socket_path} did not respond for "
+                                          f"{silence:.1f} seconds. Falling back to the configured share of the rate "
+                                          f"limits.")
+                    # Fails all the waiting requests, this one included
+                    self.stop()
+                    await future
+                elif silence >= self._heartbeat_interval:
+                    self._send({"op": "ping"})
+
+    def stop(self):
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+        self._disconnect()
+
+    async def _ensure_connected(self):
+        if self._writer is not None:
+            return
+        async with self._connect_lock:
+            if self._writer is not None:
+                return
+            try:
+                reader, writer = await asyncio.open_unix_connection(self._socket_path)
+            except OSError as exception:
+                self._unavailable_since = time.time()
+                raise CoordinatorUnavailableError(
+                    f"Rate limit coordinator not reachable at {self._socket_path}") from exception
+            self._writer = writer
+            self._unavailable_since = None
+            self._last_message_timestamp = time.time()
+            self._send({"op": "register",
+                        "account": self._account_id,
+                        "rate_limits": [rate_limit_to_json(rate_limit) for rate_limit in self._rate_limits],
+                        "safety_margin_pct": self._safety_margin_pct})
+            self._read_task = safe_ensure_future(self._read_loop(reader))
+            self.logger().info(f"Connected to the rate limit coordinator at {self._socket_path} for "
+                               f"{self._account_id}.")
+
+    async def _read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self._last_message_timestamp = time.time()
+                message = json.loads(line)
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    if "error" in message:
+                        future.set_exception(CoordinatorUnavailableError(message["error"]))
+                    else:
+                        future.set_result(None)
+        except asyncio.CancelledError:
+            self._disconnect()
+            raise
+        except Exception:
+            self.logger().exception("Unexpected error reading from the rate limit coordinator.")
+        self.logger().warning(f"Lost the connection to the rate limit coordinator at {self._socket_path}. "
+                              f"Falling back to the configured share of the rate limits.")
+        self._disconnect()
+
+    def _disconnect(self):
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+            self._unavailable_since = time.time()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(CoordinatorUnavailableError("Lost the connection to the rate limit coordinator"))
+
+    def _send(self, message: Dict[str, Any]):
+        self._writer.write(json.dumps(message).encode() + b"\n")
+
+
+class CoordinatedRequestContext(AsyncRequestContext):
+    """
+    Request context that gets its capacity from the rate limit coordinator, or from the local (static share) limits
+    while the coordinator is unavailable.
+    """
+
+    def __init__(self, coordinator: RateLimitCoordinatorClient, **kwargs):
+        super().__init__(**kwargs)
+        self._coordinator = coordinator
+
+    async def acquire(self):
+        if self._rate_limit is not None and self._coordinator.is_available:
+            start = self._time()
+            try:
+                await self._coordinator.acquire(limit_id=self._rate_limit.limit_id, priority=self._priority)
+            except CoordinatorUnavailableError:
+                pass
+            else:
+                # Logged locally too, so the local limits account for it if the coordinator becomes unavailable
+                self._log_task()
+                self._task_logs.wait_time_stats[self._priority].add(self._time() - start)
+                return
+        await super().acquire()
+
+
+class CoordinatedAsyncThrottler(AsyncThrottler):
+    """
+    AsyncThrottler of a bot sharing the rate limits of an account with other bots through a RateLimitCoordinator.
+    The limits_share_percentage is only applied when the coordinator is not available.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 coordinator_path: str,
+                 account_id: str,
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 reconnect_interval: float = 5.0,
+                 coordinator_timeout: float = 5.0,
+                 ):
+        """
+        :param coordinator_path: path of the Unix socket of the coordinator
+        :param account_id: identifier of the account the rate limits belong to in the coordinator
+        :param reconnect_interval: time to wait before trying to reconnect to the coordinator after losing it
+        :param coordinator_timeout: time without any response after which the coordinator is considered hung
+        """
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage)
+        self._coordinator = RateLimitCoordinatorClient(socket_path=coordinator_path,
+                                                       account_id=account_id,
+                                                       rate_limits=rate_limits,
+                                                       safety_margin_pct=safety_margin_pct,
+                                                       reconnect_interval=reconnect_interval,
+                                                       response_timeout=coordinator_timeout)
+
+    @property
+    def coordinator(self) -> RateLimitCoordinatorClient:
+        return self._coordinator
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> CoordinatedRequestContext:
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return CoordinatedRequestContext(
+            coordinator=self._coordinator,
+            task_logs=self._task_logs,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            priority=priority if priority is not None else current_request_priority(),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shares the API rate limits of accounts among the bots of a host.")
+    parser.add_argument("--socket", "-s", type=str, required=True,
+                        help="Path of the Unix socket to listen on (rate_limits_coordinator_path in the bots config)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    coordinator = RateLimitCoordinator(socket_path=args.socket)
+    try:
+        asyncio.run(coordinator.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import asyncio
+from collections import deque
+from itertools import chain
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple
+
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog, WaitTimeStats
+
+# Tolerance used when comparing float timestamps, a task is only considered expired once it is older than its window
+# by more than this. It keeps the boundary of the window inclusive (what the Decimal based comparison used to do) while
+# time.time() has a resolution close to 1e-7 seconds at current epochs.
+TIMESTAMP_TOLERANCE = 1e-6
+
+
+class TaskLogs:
+    """
+    The task logs shared by all the requests of a throttler, kept as one sliding window per rate limit.
+
+    Each window is the FIFO of the TaskLog(s) logged against its limit and the sum of their weights, so the capacity
+    used by a limit is known without going through the logs of every other limit, and expired logs are dropped from the
+    front of the window. It also keeps the queues of the requests waiting for capacity, by limit id and priority, the
+    weight they reserve on their limits while waiting and the time they waited.
+    """
+
+    def __init__(self, task_logs: Iterable[TaskLog] = ()):
+        self._windows: Dict[str, Deque[TaskLog]] = {}
+        self._capacity_used: Dict[str, int] = {}
+        self._waiters: Dict[Tuple[str, RequestPriority], Deque[asyncio.Future]] = {}
+        self._reserved: Dict[str, Dict[RequestPriority, int]] = {}
+        self.wait_time_stats: Dict[RequestPriority, WaitTimeStats] = {
+            priority: WaitTimeStats() for priority in RequestPriority}
+        for task_log in task_logs:
+            self.append(task_log)
+
+    def __len__(self) -> int:
+        return sum(len(window) for window in self._windows.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        return chain.from_iterable(self._windows.values())
+
+    def append(self, task_log: TaskLog):
+        limit_id = task_log.rate_limit.limit_id
+        window = self._windows.get(limit_id)
+        if window is None:
+            window = self._windows[limit_id] = deque()
+            self._capacity_used[limit_id] = 0
+        window.append(task_log)
+        self._capacity_used[limit_id] += task_log.weight
+
+    def flush(self, now: float, safety_margin_pct: float):
+        """
+        Removes the task logs that have passed their rate limit periods
+        :param now: the current timestamp
+        :param safety_margin_pct: percentage of the limit time interval added to it before a task log expires
+        """
+        for limit_id in self._windows:
+            self._flush_window(limit_id, now, safety_margin_pct)
+
+    def capacity_used(self, rate_limit: RateLimit, now: float, safety_margin_pct: float) -> int:
+        """
+        :return: the sum of the weights logged against the rate limit within its time interval (plus safety margin)
+        """
+        if rate_limit.limit_id not in self._windows:
+            return 0
+        self._flush_window(rate_limit.limit_id, now, safety_margin_pct)
+        return self._capacity_used[rate_limit.limit_id]
+
+    def time_until_capacity(self, rate_limit: RateLimit, weight: int, now: float, safety_margin_pct: float) -> float:
+        """
+        Calculates how long it will take for enough task logs to expire for the rate limit to have capacity for weight.
+        :return: the time in seconds, 0 if there is capacity already and inf if the weight is over the limit
+        """
+        if weight > rate_limit.limit:
+            return float("inf")
+        excess = self.capacity_used(rate_limit, now, safety_margin_pct) + weight - rate_limit.limit
+        if excess <= 0:
+            return 0.0
+        freed = 0
+        for task_log in self._windows[rate_limit.limit_id]:
+            freed += task_log.weight
+            if freed >= excess:
+                expiry = task_log.rate_limit.time_interval * (1 + safety_margin_pct)
+                return max(0.0, task_log.timestamp + expiry + TIMESTAMP_TOLERANCE - now)
+        return 0.0
+
+    def waiters(self, limit_id: str, priority: RequestPriority = RequestPriority.NORMAL) -> Deque[asyncio.Future]:
+        """
+        :return: the FIFO of the requests for the limit id and priority waiting for capacity, the first one is the only
+            one active
+        """
+        key = (limit_id, priority)
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            waiters = self._waiters[key] = deque()
+        return waiters
+
+    def reserve(self, limits_and_weights: List[Tuple[RateLimit, int]], priority: RequestPriority):
+        """
+        Reserves the weights of a waiting request on its limits, lower priority requests leave that capacity to it.
+        """
+        for rate_limit, weight in limits_and_weights:
+            reserved = self._reserved.setdefault(rate_limit.limit_id, {})
+            reserved[priority] = reserved.get(priority, 0) + weight
+
+    def release(self, limits_and_weights: List[Tuple[RateLimit, int]], priority: RequestPriority):
+        for rate_limit, weight in limits_and_weights:
+            self._reserved[rate_limit.limit_id][priority] -= weight
+
+    def reserved_above(self, limit_id: str, priority: RequestPriority) -> int:
+        """
+        :return: the weight reserved on the limit by the waiting requests with a higher priority
+        """
+        reserved = self._reserved.get(limit_id)
+        if not reserved:
+            return 0
+        return sum(weight for reserved_priority, weight in reserved.items() if reserved_priority > priority)
+
+    def _flush_window(self, limit_id: str, now: float, safety_margin_pct: float):
+        window = self._windows[limit_id]
+        while window:
+            task_log = window[0]
+            expiry = task_log.rate_limit.time_interval * (1 + safety_margin_pct)
+            if now - task_log.timestamp - expiry <= TIMESTAMP_TOLERANCE:
+                break
+            window.popleft()
+            self._capacity_used[limit_id] -= task_log.weight
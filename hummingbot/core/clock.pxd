@@ -1,5 +1,38 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
+
+cdef class TimingHistogram:
+    cdef:
+        public str name
+        int64_t _buckets[32]  # TIMING_HISTOGRAM_BUCKETS
+        int64_t _count
+        int64_t _overruns
+        double _total
+        double _max
+        double _overrun_threshold
+
+    cdef c_add(self, double duration)
+
+
+cdef class ClockTimings:
+    cdef:
+        object _clock_mode
+        double _tick_size
+        dict _iterators
+        TimingHistogram _ticks
+        TimingHistogram _drift
+        int64_t _skipped_ticks
+        double _wall_start
+        double _simulated_start
+        double _simulated_end
+
+    cdef c_add_iterator_duration(self, object iterator, double duration)
+    cdef c_add_tick_duration(self, double timestamp, double duration)
+    cdef c_add_drift(self, double drift, int64_t skipped_ticks)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +43,5 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _timing_enabled
+        ClockTimings _timings
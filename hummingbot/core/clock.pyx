@@ -2,8 +2,13 @@
 
 import asyncio
 import logging
+import math
 import time
-from typing import List
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from libc.math cimport log2
+from libc.stdint cimport int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -11,6 +16,198 @@ from hummingbot.core.clock_mode import ClockMode
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+cdef int TIMING_HISTOGRAM_BUCKETS = 32
+
+
+cdef class TimingHistogram:
+    """
+    Histogram of durations in power of two buckets: the bucket i counts the durations from 2^i to 2^(i + 1)
+    microseconds, the first bucket also counts the durations below 1 microsecond and the last one the longer durations.
+    """
+    def __init__(self, name: str, overrun_threshold: float = math.inf):
+        """
+        :param name: name of what is timed
+        :param overrun_threshold: durations above it are counted as overruns
+        """
+        self.name = name
+        self._overrun_threshold = overrun_threshold
+
+    cdef c_add(self, double duration):
+        cdef:
+            int bucket = 0
+            double microseconds = duration * 1e6
+
+        if microseconds >= 2:
+            bucket = min(<int>log2(microseconds), TIMING_HISTOGRAM_BUCKETS - 1)
+        self._buckets[bucket] += 1
+        self._count += 1
+        self._total += duration
+        if duration > self._max:
+            self._max = duration
+        if duration > self._overrun_threshold:
+            self._overruns += 1
+
+    def add(self, duration: float):
+        self.c_add(duration)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def buckets(self) -> List[int]:
+        return [self._buckets[index] for index in range(TIMING_HISTOGRAM_BUCKETS)]
+
+    def percentile(self, pct: float) -> float:
+        """
+        Returns the upper bound of the bucket of the percentile (from 0 to 100), capped by the longest duration.
+        """
+        cdef:
+            int64_t rank = <int64_t>math.ceil(pct / 100 * self._count)
+            int64_t cumulative = 0
+            int bucket
+
+        if self._count == 0:
+            return 0.0
+        for bucket in range(TIMING_HISTOGRAM_BUCKETS - 1):
+            cumulative += self._buckets[bucket]
+            if cumulative >= rank:
+                return min(2.0 ** (bucket + 1) / 1e6, self._max)
+        return self._max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "overruns": self.overruns,
+            "buckets": self.buckets,
+        }
+
+
+cdef class ClockTimings:
+    """
+    Timings of the clock ticks collected when the clock timing is enabled: the duration of each child iterator tick,
+    of the whole ticks (the ticks longer than the tick size are the overruns) and, in real time mode, the delay of the
+    tick starts and the ticks skipped because a tick overran the next one.
+    """
+    def __init__(self, clock_mode: ClockMode, tick_size: float):
+        self._clock_mode = clock_mode
+        self._tick_size = tick_size
+        self._iterators = {}
+        self._ticks = TimingHistogram("tick", overrun_threshold=tick_size)
+        self._drift = TimingHistogram("drift")
+        self._wall_start = perf_counter()
+        self._simulated_start = math.nan
+        self._simulated_end = math.nan
+
+    cdef c_add_iterator_duration(self, object iterator, double duration):
+        entry = self._iterators.get(id(iterator))
+        if entry is None:
+            # The iterator is kept with its histogram so that its id is not reused
+            entry = (iterator, TimingHistogram(self._iterator_name(iterator), overrun_threshold=self._tick_size))
+            self._iterators[id(iterator)] = entry
+        (<TimingHistogram>entry[1]).c_add(duration)
+
+    cdef c_add_tick_duration(self, double timestamp, double duration):
+        if self._ticks._count == 0:
+            self._simulated_start = timestamp
+        self._simulated_end = timestamp
+        self._ticks.c_add(duration)
+
+    cdef c_add_drift(self, double drift, int64_t skipped_ticks):
+        self._drift.c_add(max(drift, 0.0))
+        self._skipped_ticks += skipped_ticks
+
+    @property
+    def clock_mode(self) -> ClockMode:
+        return self._clock_mode
+
+    @property
+    def iterators(self) -> List[TimingHistogram]:
+        """The timings of the child iterators, the longest total first."""
+        return sorted([entry[1] for entry in self._iterators.values()], key=lambda histogram: -histogram.total)
+
+    @property
+    def ticks(self) -> TimingHistogram:
+        return self._ticks
+
+    @property
+    def drift(self) -> TimingHistogram:
+        """Delays between the scheduled start of the ticks and their actual start, only timed in real time mode."""
+        return self._drift
+
+    @property
+    def overruns(self) -> int:
+        return self._ticks.overruns
+
+    @property
+    def skipped_ticks(self) -> int:
+        return self._skipped_ticks
+
+    @property
+    def wall_time(self) -> float:
+        return perf_counter() - self._wall_start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "clock_mode": self._clock_mode.name,
+            "tick_size": self._tick_size,
+            "wall_time": self.wall_time,
+            "simulated_time": self._simulated_end - self._simulated_start if self._ticks._count > 0 else 0.0,
+            "overruns": self.overruns,
+            "skipped_ticks": self.skipped_ticks,
+            "ticks": self._ticks.to_dict(),
+            "drift": self._drift.to_dict(),
+            "iterators": [histogram.to_dict() for histogram in self.iterators],
+        }
+
+    def report(self) -> str:
+        lines = [f"Clock timings ({self._clock_mode.name.lower()} mode, tick size {self._tick_size} s): "
+                 f"{self._ticks.count} ticks in {self.wall_time:.1f} s, {self.overruns} longer than the tick size"
+                 + (f", {self.skipped_ticks} skipped" if self._clock_mode is ClockMode.REALTIME else "")]
+        if self._clock_mode is ClockMode.REALTIME:
+            lines.append(f"  Tick start delay: mean {self._drift.mean * 1e3:.3f} ms, "
+                         f"p99 {self._drift.percentile(99) * 1e3:.3f} ms, max {self._drift.max * 1e3:.3f} ms")
+        rows = [self._ticks] + self.iterators
+        name_width = max(len(histogram.name) for histogram in rows)
+        lines.append(f"  {'':<{name_width}} {'ticks':>9} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+                     f"{'total s':>9} {'overruns':>9}")
+        for histogram in rows:
+            lines.append(f"  {histogram.name:<{name_width}} {histogram.count:>9} {histogram.mean * 1e3:>9.3f} "
+                         f"{histogram.percentile(50) * 1e3:>9.3f} {histogram.percentile(99) * 1e3:>9.3f} "
+                         f"{histogram.max * 1e3:>9.3f} {histogram.total:>9.3f} {histogram.overruns:>9}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _iterator_name(iterator: TimeIterator) -> str:
+        class_name = type(iterator).__name__
+        try:
+            name = iterator.name
+        except Exception:
+            name = None
+        return f"{class_name} ({name})" if isinstance(name, str) and name != class_name else class_name
 
 
 cdef class Clock:
@@ -21,12 +218,14 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0,
+                 timing_enabled: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param timing_enabled: whether to time the ticks of the child iterators, see `timings`
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +235,9 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._timings = None
+        self._timing_enabled = False
+        self.timing_enabled = timing_enabled
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +259,22 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def timing_enabled(self) -> bool:
+        return self._timing_enabled
+
+    @timing_enabled.setter
+    def timing_enabled(self, value: bool):
+        # The timings collected so far are kept when the timing is disabled
+        if value and self._timings is None:
+            self._timings = ClockTimings(self._clock_mode, self._tick_size)
+        self._timing_enabled = value
+
+    @property
+    def timings(self) -> Optional[ClockTimings]:
+        """The timings of the ticks, None when the timing has never been enabled."""
+        return self._timings
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +308,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            bint timing
+            double tick_start = 0
+            double iterator_start = 0
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -110,11 +331,18 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                timing = self._timing_enabled
+                if timing:
+                    self._timings.c_add_drift(time.time() - next_tick_time,
+                                              <int64_t>round((next_tick_time - self._current_tick) / self._tick_size) - 1)
+                    tick_start = perf_counter()
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if timing:
+                        iterator_start = perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +350,21 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if timing:
+                        self._timings.c_add_iterator_duration(child_iterator, perf_counter() - iterator_start)
+                if timing:
+                    self._timings.c_add_tick_duration(self._current_tick, perf_counter() - tick_start)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            bint timing
+            double tick_start = 0
+            double iterator_start = 0
 
         if not self._started:
             for ci in self._child_iterators:
@@ -139,14 +375,23 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
+                timing = self._timing_enabled
+                if timing:
+                    tick_start = perf_counter()
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if timing:
+                        iterator_start = perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if timing:
+                        self._timings.c_add_iterator_duration(child_iterator, perf_counter() - iterator_start)
+                if timing:
+                    self._timings.c_add_tick_duration(self._current_tick, perf_counter() - tick_start)
         except StopIteration:
             return
         finally:
@@ -20,6 +20,18 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    # Cumulative depth index, ordered from the top of each book. Only the leading levels that are known to match the
+    # C++ sets are kept; the rest is rebuilt lazily on the next query.
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_amounts
+    cdef vector[double] _bid_depth_base
+    cdef vector[double] _bid_depth_quote
+    cdef bint _bid_depth_complete
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_amounts
+    cdef vector[double] _ask_depth_base
+    cdef vector[double] _ask_depth_quote
+    cdef bint _ask_depth_complete
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +42,10 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_reset_depth_index(self)
+    cdef c_truncate_depth_index(self, bint is_buy, double changed_price)
+    cdef c_update_depth_index(self, bint is_buy)
+    cdef size_t c_fill_depth_array(self, bint is_buy, double[:, ::1] out, size_t levels)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
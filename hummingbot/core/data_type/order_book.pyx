@@ -8,7 +8,9 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
+    Union,
 )
 
 import numpy as np
@@ -18,6 +20,7 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -30,12 +33,76 @@ from hummingbot.core.event.events import (
     OrderBookTradeEvent
 )
 
+from libc.math cimport INFINITY
+
 cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
 
 
+# Binary searches over the depth index vectors. Each returns the first position at which the predicate holds, or the
+# vector size if it never does.
+cdef inline size_t _first_at_least(vector[double] *values, double target):
+    cdef size_t low = 0, high = deref(values).size(), mid
+    while low < high:
+        mid = (low + high) >> 1
+        if deref(values)[mid] >= target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t _first_at_most(vector[double] *values, double target):
+    cdef size_t low = 0, high = deref(values).size(), mid
+    while low < high:
+        mid = (low + high) >> 1
+        if deref(values)[mid] <= target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t _first_greater_than(vector[double] *values, double target):
+    cdef size_t low = 0, high = deref(values).size(), mid
+    while low < high:
+        mid = (low + high) >> 1
+        if deref(values)[mid] > target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t _first_less_than(vector[double] *values, double target):
+    cdef size_t low = 0, high = deref(values).size(), mid
+    while low < high:
+        mid = (low + high) >> 1
+        if deref(values)[mid] < target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef _fill_order_book_entries(vector[OrderBookEntry] *entries, object rows, int64_t update_id):
+    cdef:
+        const double[:, :] rows_view
+        Py_ssize_t index
+
+    if isinstance(rows, np.ndarray) and rows.dtype == np.float64 and rows.ndim == 2:
+        rows_view = rows
+        deref(entries).reserve(rows_view.shape[0])
+        for index in range(rows_view.shape[0]):
+            deref(entries).push_back(OrderBookEntry(rows_view[index, 0], rows_view[index, 1], update_id))
+    else:
+        deref(entries).reserve(len(rows))
+        for row in rows:
+            deref(entries).push_back(OrderBookEntry(float(row[0]), float(row[1]), update_id))
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -65,6 +132,10 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double highest_bid_change = -INFINITY
+            double lowest_ask_change = INFINITY
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,15 +144,31 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if not (bid.getPrice() <= highest_bid_change):
+                highest_bid_change = bid.getPrice()
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if not (ask.getPrice() >= lowest_ask_change):
+                lowest_ask_change = ask.getPrice()
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if self._bid_book.size() != bid_book_size:
+            highest_bid_change = INFINITY
+        if self._ask_book.size() != ask_book_size:
+            lowest_ask_change = -INFINITY
+
+        # Only the depth index levels above the topmost change are still valid.
+        if highest_bid_change != -INFINITY:
+            self.c_truncate_depth_index(False, highest_bid_change)
+        if lowest_ask_change != INFINITY:
+            self.c_truncate_depth_index(True, lowest_ask_change)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -108,6 +195,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self.c_reset_depth_index()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -136,6 +224,91 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_reset_depth_index(self):
+        self._bid_depth_prices.clear()
+        self._bid_depth_amounts.clear()
+        self._bid_depth_base.clear()
+        self._bid_depth_quote.clear()
+        self._bid_depth_complete = False
+        self._ask_depth_prices.clear()
+        self._ask_depth_amounts.clear()
+        self._ask_depth_base.clear()
+        self._ask_depth_quote.clear()
+        self._ask_depth_complete = False
+
+    cdef c_truncate_depth_index(self, bint is_buy, double changed_price):
+        """
+        Drops the depth index levels at or below the given price on one side of the book. The levels above it are
+        untouched by the change, and their cumulative sums remain valid.
+        """
+        cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            size_t valid_levels = 0
+
+        if changed_price == changed_price:
+            valid_levels = _first_at_least(prices, changed_price) if is_buy else _first_at_most(prices, changed_price)
+        if is_buy:
+            self._ask_depth_prices.resize(valid_levels)
+            self._ask_depth_amounts.resize(valid_levels)
+            self._ask_depth_base.resize(valid_levels)
+            self._ask_depth_quote.resize(valid_levels)
+            self._ask_depth_complete = False
+        else:
+            self._bid_depth_prices.resize(valid_levels)
+            self._bid_depth_amounts.resize(valid_levels)
+            self._bid_depth_base.resize(valid_levels)
+            self._bid_depth_quote.resize(valid_levels)
+            self._bid_depth_complete = False
+
+    cdef c_update_depth_index(self, bint is_buy):
+        """
+        Extends the depth index of one side of the book from its last valid level down to the bottom of the book.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+            double cumulative_base = 0
+            double cumulative_quote = 0
+
+        if is_buy:
+            if self._ask_depth_complete:
+                return
+            if self._ask_depth_prices.size() > 0:
+                cumulative_base = self._ask_depth_base.back()
+                cumulative_quote = self._ask_depth_quote.back()
+                it = self._ask_book.upper_bound(OrderBookEntry(self._ask_depth_prices.back(), 0, 0))
+            else:
+                it = self._ask_book.begin()
+            while it != self._ask_book.end():
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                self._ask_depth_prices.push_back(entry.getPrice())
+                self._ask_depth_amounts.push_back(entry.getAmount())
+                self._ask_depth_base.push_back(cumulative_base)
+                self._ask_depth_quote.push_back(cumulative_quote)
+                inc(it)
+            self._ask_depth_complete = True
+        else:
+            if self._bid_depth_complete:
+                return
+            if self._bid_depth_prices.size() > 0:
+                cumulative_base = self._bid_depth_base.back()
+                cumulative_quote = self._bid_depth_quote.back()
+                it = self._bid_book.lower_bound(OrderBookEntry(self._bid_depth_prices.back(), 0, 0))
+            else:
+                it = self._bid_book.end()
+            while it != self._bid_book.begin():
+                dec(it)
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                self._bid_depth_prices.push_back(entry.getPrice())
+                self._bid_depth_amounts.push_back(entry.getAmount())
+                self._bid_depth_base.push_back(cumulative_base)
+                self._bid_depth_quote.push_back(cumulative_quote)
+            self._bid_depth_complete = True
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -171,12 +344,61 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.depth_arrays(max(self._bid_book.size(), self._ask_book.size()))
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def depth_arrays(self,
+                     levels: int,
+                     bids_out: Optional[np.ndarray] = None,
+                     asks_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the top levels of the book into float64 arrays with 3 columns, [price, amount, update_id], bids from the
+        highest price and asks from the lowest.
+
+        :param levels: the maximum number of levels to copy per side
+        :param bids_out: optional C-contiguous float64 buffer of shape (>= levels, 3) to fill with the bids
+        :param asks_out: optional C-contiguous float64 buffer of shape (>= levels, 3) to fill with the asks
+        :return: views over the filled rows of the bid and ask buffers
+        """
+        if levels < 0:
+            raise ValueError(f"The number of levels must not be negative ({levels}).")
+        if bids_out is None:
+            bids_out = np.empty((levels, 3), dtype=np.float64)
+        if asks_out is None:
+            asks_out = np.empty((levels, 3), dtype=np.float64)
+        for buffer in (bids_out, asks_out):
+            if buffer.ndim != 2 or buffer.shape[0] < levels or buffer.shape[1] != 3:
+                raise ValueError(f"Depth buffers must have shape ({levels}, 3) or more rows, got {buffer.shape}.")
+        bids_count = self.c_fill_depth_array(False, bids_out, levels)
+        asks_count = self.c_fill_depth_array(True, asks_out, levels)
+        return bids_out[:bids_count], asks_out[:asks_count]
+
+    cdef size_t c_fill_depth_array(self, bint is_buy, double[:, ::1] out, size_t levels):
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            size_t count = 0
+
+        while count < levels:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            out[count, 0] = entry.getPrice()
+            out[count, 1] = entry.getAmount()
+            out[count, 2] = entry.getUpdateId()
+            count += 1
+        return count
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -187,6 +409,20 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Union[Sequence, np.ndarray], asks: Union[Sequence, np.ndarray], update_id: int):
+        """
+        Applies diffs given in the exchange message layout, without building OrderBookRow objects first.
+
+        Each side is either a float64 NumPy array whose first two columns are price and amount, or a sequence of
+        [price, amount, ...] rows whose values are numbers or numeric strings. All entries take the given update id.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _fill_order_book_entries(ref(cpp_bids), bids, update_id)
+        _fill_order_book_entries(ref(cpp_asks), asks, update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +433,19 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_snapshot(self, bids: Union[Sequence, np.ndarray], asks: Union[Sequence, np.ndarray], update_id: int):
+        """
+        Applies a snapshot given in the exchange message layout, without building OrderBookRow objects first.
+
+        The sides take the same layouts as in apply_raw_diffs. All entries take the given update id.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _fill_order_book_entries(ref(cpp_bids), bids, update_id)
+        _fill_order_book_entries(ref(cpp_asks), asks, update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -320,140 +569,134 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_update_depth_index(is_buy)
+        index = _first_at_least(cumulative_base, volume)
+        if index < deref(cumulative_base).size():
+            cumulative_volume = deref(cumulative_base)[index]
+            result_price = deref(prices)[index]
+        elif deref(cumulative_base).size() > 0:
+            cumulative_volume = deref(cumulative_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *amounts = ref(self._ask_depth_amounts) if is_buy else ref(self._bid_depth_amounts)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            size_t index
+            double price
+            double amount
+            double incremental_amount
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_update_depth_index(is_buy)
+        index = _first_at_least(cumulative_base, volume)
+        if index < deref(cumulative_base).size():
+            # Replay the arithmetic of a level by level walk, so the result is identical to it.
+            price = deref(prices)[index]
+            amount = deref(amounts)[index]
+            total_cost = deref(cumulative_quote)[index] - amount * price
+            total_volume = deref(cumulative_base)[index] - amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * price
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif deref(cumulative_base).size() > 0:
+            total_volume = deref(cumulative_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_update_depth_index(is_buy)
+        index = _first_at_least(cumulative_quote, quote_volume)
+        if index < deref(cumulative_quote).size():
+            cumulative_volume = deref(cumulative_quote)[index]
+            result_price = deref(prices)[index]
+        elif deref(cumulative_quote).size() > 0:
+            cumulative_volume = deref(cumulative_quote).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *amounts = ref(self._ask_depth_amounts) if is_buy else ref(self._bid_depth_amounts)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            size_t index
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        self.c_update_depth_index(is_buy)
+        index = _first_at_least(cumulative_base, base_amount)
+        if index >= deref(cumulative_base).size():
+            if index > 0:
+                cumulative_volume = deref(cumulative_quote).back()
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+        if index > 0:
+            cumulative_base_amount = deref(cumulative_base)[index - 1]
+            cumulative_volume = deref(cumulative_quote)[index - 1]
+        # The clamped level usually fills the amount exactly, but rounding can leave a residue for the next levels.
+        while index < deref(amounts).size():
+            row_amount = deref(amounts)[index]
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * deref(prices)[index]
+            if cumulative_base_amount >= base_amount:
+                break
+            index += 1
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_update_depth_index(is_buy)
+        levels = _first_greater_than(prices, price) if is_buy else _first_less_than(prices, price)
+        if levels > 0:
+            cumulative_volume = deref(cumulative_base)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+            size_t levels
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_update_depth_index(is_buy)
+        levels = _first_greater_than(prices, price) if is_buy else _first_less_than(prices, price)
+        if levels > 0:
+            cumulative_volume = deref(cumulative_quote)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -480,4 +723,4 @@ cdef class OrderBook(PubSub):
         replay_diffs = diffs[replay_position:]
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_raw_diffs(diff.raw_bids, diff.raw_asks, diff.update_id)
@@ -23,6 +23,7 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +32,25 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 concurrent_snapshots: bool = False):
+        """
+        :param data_source: the data source providing the order book snapshots and updates
+        :param trading_pairs: the trading pairs to track
+        :param domain: the domain of the exchange
+        :param concurrent_snapshots: set it when the data source requests are paced by a throttler. The initial
+            snapshots are then requested concurrently, MAX_CONCURRENT_SNAPSHOT_REQUESTS at most, instead of one per
+            second.
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._concurrent_snapshots: bool = concurrent_snapshots
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -68,6 +83,18 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Tells if the order book of a single trading pair is initialized, even if other pairs are still loading
+        """
+        ready_event = self._order_book_ready_events.get(trading_pair)
+        return ready_event is not None and ready_event.is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        if trading_pair not in (self._trading_pairs or []):
+            raise ValueError(f"The order book of {trading_pair} is not tracked.")
+        await self._order_book_ready_events.setdefault(trading_pair, asyncio.Event()).wait()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,6 +165,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -176,15 +205,40 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if not self._concurrent_snapshots:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair)
+                await self._sleep(delay=1)
+        else:
+            # The data source throttler paces the snapshot requests, the semaphore only caps the requests in flight.
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+            init_tasks = [safe_ensure_future(self._init_order_book(trading_pair, semaphore))
+                          for trading_pair in self._trading_pairs]
+            try:
+                await asyncio.gather(*init_tasks)
+            except BaseException:
+                for task in init_tasks:
+                    task.cancel()
+                raise
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, semaphore: Optional[asyncio.Semaphore] = None):
+        """
+        Fetches the initial order book of a trading pair and starts tracking it right away
+        """
+        if semaphore is None:
+            order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+        else:
+            async with semaphore:
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events.setdefault(trading_pair, asyncio.Event()).set()
+        initialized_count = sum(1 for pair in self._trading_pairs if self.is_order_book_ready(pair))
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -272,7 +326,7 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_raw_diffs(message.raw_bids, message.raw_asks, message.update_id)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -0,0 +1,223 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from hummingbot.logger import HummingbotLogger
+
+ASYNCIO_EVENTS_FILE = asyncio.events.__file__
+
+
+@dataclass
+class SlowCallback:
+    timestamp: float  # when the event loop got blocked
+    duration: float  # seconds the event loop could not run the other callbacks
+    task_name: Optional[str]  # None when the blocking callback is not running a task
+    coroutine_name: Optional[str]
+    stack: List[str] = field(default_factory=list)  # frames of the event loop thread when it was found blocked
+    checks: int = 1  # times the watchdog found the event loop still blocked, one every slow callback threshold
+
+
+@dataclass
+class EventLoopStats:
+    samples: int  # lag measurements in the window
+    lag_p50: float  # seconds between a callback being scheduled and its execution
+    lag_p90: float
+    lag_p99: float
+    lag_max: float
+    slow_callbacks_count: int  # since the monitor started
+    slow_callbacks: List[SlowCallback]  # the last ones, oldest first
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class EventLoopMonitor:
+    """
+    Measures the health of the event loop shared by the connectors, the data feeds and the strategy.
+
+    A watchdog thread schedules a callback in the event loop every `interval` seconds and measures how long the loop
+    takes to run it (the scheduling lag). When the loop doesn't run it within `slow_callback_threshold` seconds, a
+    synchronous callback is blocking the loop, the watchdog samples the stack of the loop thread and the task it is
+    running, and reports it as a slow callback. The overhead is one callback per interval, with no instrumentation of
+    the other callbacks, so the monitor is meant to be always on (unlike the asyncio debug mode).
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["EventLoopMonitor"] = None
+
+    MAX_STACK_FRAMES = 20
+    SLOW_CALLBACKS_LOG_INTERVAL = 10.0
+    STATS_LOG_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "EventLoopMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = EventLoopMonitor()
+        return cls._shared_instance
+
+    def __init__(self,
+                 interval: float = 0.25,
+                 slow_callback_threshold: float = 0.1,
+                 lag_samples: int = 1200,
+                 slow_callbacks_kept: int = 20):
+        self._interval = interval
+        self._slow_callback_threshold = slow_callback_threshold
+        self._lags: Deque[float] = deque(maxlen=lag_samples)
+        self._slow_callbacks: Deque[SlowCallback] = deque(maxlen=slow_callbacks_kept)
+        self._slow_callbacks_count = 0
+        self._unlogged_slow_callbacks = 0
+        self._last_slow_callback_log = 0.0
+        self._last_stats_log = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def started(self) -> bool:
+        return self._watchdog is not None
+
+    @property
+    def slow_callback_threshold(self) -> float:
+        return self._slow_callback_threshold
+
+    @slow_callback_threshold.setter
+    def slow_callback_threshold(self, value: float):
+        self._slow_callback_threshold = value
+
+    def start(self):
+        """Starts monitoring the running event loop, it must be called from a coroutine running in that loop."""
+        if self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_stats_log = time.perf_counter()
+        self._stop_event.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="EventLoopMonitor", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        if self._watchdog is not None:
+            self._stop_event.set()
+            self._watchdog.join(timeout=self._interval + self._slow_callback_threshold)
+            self._watchdog = None
+
+    def stats(self) -> EventLoopStats:
+        lags = sorted(self._lags)
+
+        def percentile(pct: float) -> float:
+            return lags[min(len(lags) - 1, int(pct * len(lags)))] if len(lags) > 0 else 0.0
+
+        return EventLoopStats(
+            samples=len(lags),
+            lag_p50=percentile(0.5),
+            lag_p90=percentile(0.9),
+            lag_p99=percentile(0.99),
+            lag_max=lags[-1] if len(lags) > 0 else 0.0,
+            slow_callbacks_count=self._slow_callbacks_count,
+            slow_callbacks=list(self._slow_callbacks),
+        )
+
+    def format_status(self) -> str:
+        stats = self.stats()
+        lines = [f"  Event loop: lag p50 {stats.lag_p50 * 1e3:.1f} ms, p90 {stats.lag_p90 * 1e3:.1f} ms, "
+                 f"p99 {stats.lag_p99 * 1e3:.1f} ms, max {stats.lag_max * 1e3:.1f} ms "
+                 f"({stats.samples} samples), {stats.slow_callbacks_count} slow callbacks"]
+        if len(stats.slow_callbacks) > 0:
+            slow_callback = stats.slow_callbacks[-1]
+            lines.append(f"    Last slow callback: {self._describe(slow_callback)}")
+        return "\n".join(lines)
+
+    def _watch(self):
+        while not self._stop_event.is_set():
+            if not self._loop.is_running():
+                self._stop_event.wait(self._interval)
+                continue
+            executed = threading.Event()
+            scheduled = time.perf_counter()
+            try:
+                self._loop.call_soon_threadsafe(self._on_beat, scheduled, executed)
+            except RuntimeError:
+                # The event loop is closed
+                break
+            if not executed.wait(self._slow_callback_threshold):
+                self._watch_blocked_loop(scheduled, executed)
+            self._stop_event.wait(self._interval)
+
+    def _watch_blocked_loop(self, scheduled: float, executed: threading.Event):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = asyncio.current_task(self._loop)
+        slow_callback = SlowCallback(
+            timestamp=time.time() - (time.perf_counter() - scheduled),
+            duration=0.0,
+            task_name=task.get_name() if task is not None else None,
+            coroutine_name=self._coroutine_name(task) if task is not None else None,
+            stack=self._format_stack(frame) if frame is not None else [],
+        )
+        del frame
+        while not executed.wait(self._slow_callback_threshold):
+            if self._stop_event.is_set() or not self._loop.is_running():
+                return
+            slow_callback.checks += 1
+        slow_callback.duration = time.perf_counter() - scheduled
+        self._loop.call_soon_threadsafe(self._on_slow_callback, slow_callback)
+
+    def _on_beat(self, scheduled: float, executed: threading.Event):
+        now = time.perf_counter()
+        self._lags.append(now - scheduled)
+        executed.set()
+        if now - self._last_stats_log >= self.STATS_LOG_INTERVAL:
+            self._last_stats_log = now
+            stats = self.stats().to_dict()
+            del stats["slow_callbacks"]
+            self.logger().event_log({"event_type": "event_loop_health", **stats})
+
+    def _on_slow_callback(self, slow_callback: SlowCallback):
+        self._slow_callbacks.append(slow_callback)
+        self._slow_callbacks_count += 1
+        self._unlogged_slow_callbacks += 1
+        # A loop blocked repeatedly is reported once per interval
+        now = time.perf_counter()
+        if now - self._last_slow_callback_log >= self.SLOW_CALLBACKS_LOG_INTERVAL:
+            others = self._unlogged_slow_callbacks - 1
+            self.logger().warning(
+                f"The event loop was blocked by {self._describe(slow_callback)}"
+                + (f" ({others} other slow callbacks since the last report)" if others > 0 else "")
+                + ("\n" + "".join(slow_callback.stack) if len(slow_callback.stack) > 0 else ""))
+            self._last_slow_callback_log = now
+            self._unlogged_slow_callbacks = 0
+
+    @staticmethod
+    def _coroutine_name(task: asyncio.Task) -> str:
+        coroutine = task.get_coro()
+        return getattr(coroutine, "__qualname__", repr(coroutine))
+
+    def _format_stack(self, frame) -> List[str]:
+        stack = traceback.extract_stack(frame)
+        # Skips the frames of the event loop itself, up to the handle running the callback or the task step
+        handle_frames = [index for index, summary in enumerate(stack)
+                         if summary.filename == ASYNCIO_EVENTS_FILE and summary.name == "_run"]
+        if len(handle_frames) > 0:
+            stack = stack[handle_frames[0] + 1:]
+        return traceback.format_list(stack[-self.MAX_STACK_FRAMES:])
+
+    @staticmethod
+    def _describe(slow_callback: SlowCallback) -> str:
+        if slow_callback.coroutine_name is not None:
+            blocker = f"{slow_callback.coroutine_name} (task {slow_callback.task_name})"
+        elif len(slow_callback.stack) > 0:
+            blocker = f"a callback at {slow_callback.stack[0].strip().splitlines()[0]}"
+        else:
+            blocker = "a callback"
+        return f"{blocker} for {slow_callback.duration * 1e3:.0f} ms"
@@ -0,0 +1,159 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+
+_order_requests: ContextVar[bool] = ContextVar("order_requests", default=False)
+
+
+@contextmanager
+def order_requests():
+    """
+    Sends the REST requests made within the context (and the tasks created from it) through the order requests pool,
+    when the web assistants have one. It doesn't change the priority of the requests in the throttler. i.e.
+        with request_priority(RequestPriority.HIGH), order_requests():
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _order_requests.set(True)
+    try:
+        yield
+    finally:
+        _order_requests.reset(token)
+
+
+def is_order_request() -> bool:
+    return _order_requests.get()
+
+
+@dataclass(frozen=True)
+class ConnectionPoolProfile:
+    """Configuration of a pool of HTTP connections, the defaults are the aiohttp ones.
+
+    aiohttp sets TCP_NODELAY on all its connections, so small requests are never delayed by Nagle's algorithm.
+    """
+    limit: int = 100  # connections open at the same time, 0 for no limit
+    limit_per_host: int = 0  # connections open at the same time to a host, 0 for no limit
+    keepalive_timeout: float = 15.0  # seconds an idle connection is kept open to be reused
+    ttl_dns_cache: Optional[int] = 10  # seconds a DNS resolution is reused, None to keep it forever
+    warm_up_connections: int = 0  # connections opened when the connector starts, before they are needed
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+# A small pool for the order creation and cancellation requests, separated from the polling requests so that orders
+# never queue behind them, with connections and DNS resolutions kept longer between orders
+ORDER_REQUESTS_POOL_PROFILE = ConnectionPoolProfile(
+    limit=10,
+    limit_per_host=10,
+    keepalive_timeout=60.0,
+    ttl_dns_cache=300,
+    warm_up_connections=2,
+)
+
+
+@dataclass
+class ConnectionPoolStats:
+    in_use: int  # requests holding a connection, until their response headers are received
+    idle: int  # connections open and waiting to be reused
+    waiting: int  # requests currently waiting for a connection because the pool is full
+    waits: int  # requests that waited for a connection since the pool was created
+    wait_time: float  # total seconds the requests waited for a connection
+    created: int  # connections opened
+    reused: int  # requests sent through an idle connection
+
+
+class ConnectionPool:
+    """A `aiohttp.ClientSession` with the connections pool of a profile, and the statistics of its usage.
+
+    The statistics are counted from the request tracing events of aiohttp, except the idle connections, which aiohttp
+    only keeps in a private attribute of its connector (`BaseConnector._conns`, up to aiohttp 3.9 at least). They are
+    reported as 0 if that attribute isn't found.
+    """
+
+    def __init__(self, profile: Optional[ConnectionPoolProfile] = None):
+        self._profile = profile
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_use = 0
+        self._waiting = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._created = 0
+        self._reused = 0
+
+    @property
+    def profile(self) -> Optional[ConnectionPoolProfile]:
+        return self._profile
+
+    def get_session(self) -> aiohttp.ClientSession:
+        # The session is created on first use, it must be created within the event loop
+        if self._session is None:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_end.append(self._on_request_done)
+            trace_config.on_request_exception.append(self._on_request_done)
+            trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+            trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+            trace_config.on_connection_create_end.append(self._on_connection_create_end)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+            connector = self._profile.create_connector() if self._profile is not None else None
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+        return self._session
+
+    def stats(self) -> ConnectionPoolStats:
+        connector = self._session.connector if self._session is not None else None
+        idle_connections = getattr(connector, "_conns", None) or {}
+        return ConnectionPoolStats(
+            in_use=self._in_use,
+            idle=sum(len(connections) for connections in idle_connections.values()),
+            waiting=self._waiting,
+            waits=self._waits,
+            wait_time=self._wait_time,
+            created=self._created,
+            reused=self._reused,
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _on_request_done(self, _, trace_config_ctx, __):
+        # Sent on the response and on any error, including a cancellation while waiting for a connection
+        if getattr(trace_config_ctx, "queued_start", None) is not None:
+            self._waiting -= 1
+            trace_config_ctx.queued_start = None
+        if getattr(trace_config_ctx, "connected", False):
+            self._in_use -= 1
+            trace_config_ctx.connected = False
+
+    async def _on_connection_queued_start(self, _, trace_config_ctx, __):
+        self._waits += 1
+        self._waiting += 1
+        trace_config_ctx.queued_start = time.perf_counter()
+
+    async def _on_connection_queued_end(self, _, trace_config_ctx, __):
+        self._waiting -= 1
+        self._wait_time += time.perf_counter() - trace_config_ctx.queued_start
+        trace_config_ctx.queued_start = None
+
+    async def _on_connection_create_end(self, _, trace_config_ctx, __):
+        self._created += 1
+        self._on_connection_acquired(trace_config_ctx)
+
+    async def _on_connection_reuseconn(self, _, trace_config_ctx, __):
+        self._reused += 1
+        self._on_connection_acquired(trace_config_ctx)
+
+    def _on_connection_acquired(self, trace_config_ctx):
+        # A request following redirects acquires a connection for each of them
+        if not getattr(trace_config_ctx, "connected", False):
+            self._in_use += 1
+            trace_config_ctx.connected = True
@@ -1,9 +1,15 @@
-from typing import Optional
+from typing import Dict, Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPool,
+    ConnectionPoolProfile,
+    ConnectionPoolStats,
+)
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec
 
 
 class ConnectionsFactory:
@@ -16,24 +22,59 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The connections share a pool of HTTP connections, configured by `pool_profile`. With an `order_pool_profile`, the
+    order requests get connections of their own, from a separate pool.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        json_codec: Optional[JSONCodec] = None,
+        ws_raw_messages: bool = False,
+        pool_profile: Optional[ConnectionPoolProfile] = None,
+        order_pool_profile: Optional[ConnectionPoolProfile] = None,
+    ):
+        self._json_codec = json_codec
+        self._ws_raw_messages = ws_raw_messages
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
-        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._shared_pool = ConnectionPool(profile=pool_profile)
+        self._order_pool = ConnectionPool(profile=order_pool_profile) if order_pool_profile is not None else None
+
+    @property
+    def order_pool_profile(self) -> Optional[ConnectionPoolProfile]:
+        return self._order_pool.profile if self._order_pool is not None else None
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
+        return connection
+
+    async def get_order_rest_connection(self) -> Optional[RESTConnection]:
+        """Returns a connection of the order requests pool, or None if there is no such pool."""
+        if self._order_pool is None:
+            return None
+        connection = RESTConnection(aiohttp_client_session=self._order_pool.get_session(), json_codec=self._json_codec)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(
+            aiohttp_client_session=shared_client, json_codec=self._json_codec, raw_messages=self._ws_raw_messages
+        )
         return connection
 
+    def connection_pool_stats(self) -> Dict[str, ConnectionPoolStats]:
+        stats = {"shared": self._shared_pool.stats()}
+        if self._order_pool is not None:
+            stats["orders"] = self._order_pool.stats()
+        return stats
+
+    async def close(self):
+        await self._shared_pool.close()
+        if self._order_pool is not None:
+            await self._order_pool.close()
+
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
-        return self._shared_client
+        return self._shared_pool.get_session()
@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -7,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.json_codec import DEFAULT_JSON_CODEC, JSONCodec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -86,8 +87,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional[JSONCodec] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec or DEFAULT_JSON_CODEC
 
     @property
     def url(self) -> str:
@@ -114,13 +116,17 @@ class RESTResponse:
             byte_string = await self._aiohttp_response.read()
             if isinstance(byte_string, bytes):
                 decoded_string = byte_string.decode('utf-8')
-                json_ = json.loads(decoded_string)
+                json_ = self._json_codec.loads(decoded_string)
             else:
-                json_ = await self._aiohttp_response.json()
+                json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         else:
-            json_ = await self._aiohttp_response.json()
+            json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
+    async def read(self) -> bytes:
+        body = await self._aiohttp_response.read()
+        return body
+
     async def text(self) -> str:
         text_ = await self._aiohttp_response.text()
         return text_
@@ -7,13 +7,26 @@ import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(
+        self,
+        aiohttp_client_session: aiohttp.ClientSession,
+        json_codec: Optional[JSONCodec] = None,
+        raw_messages: bool = False,
+    ):
+        """
+        :param json_codec: the codec decoding the text messages, the standard library `json` one by default
+        :param raw_messages: if True, the messages are not decoded, the responses data are the text or bytes received,
+            for the data sources parsing only the fields they need
+        """
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or DEFAULT_JSON_CODEC
+        self._raw_messages = raw_messages
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -141,13 +154,12 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
-        if msg.type == aiohttp.WSMsgType.BINARY:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
+        if msg.type == aiohttp.WSMsgType.BINARY or self._raw_messages:
             data = msg.data
         else:
             try:
-                data = msg.json()
+                data = self._json_codec.loads(msg.data)
             except JSONDecodeError:
                 data = msg.data
         response = WSResponse(data)
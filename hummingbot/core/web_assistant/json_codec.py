@@ -0,0 +1,50 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes the REST request bodies and decodes the REST and WebSocket messages of the web assistants.
+
+    This default codec uses the standard library `json` module. `WebAssistantsFactory` can be given a faster codec, like
+    the one returned by `fastest_json_codec()`. The codecs raise a `json.JSONDecodeError` (or a subclass of it) when the
+    decoded data is not valid JSON.
+    """
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on `orjson`, only available when the library is installed.
+
+    Unlike the standard library codec, it encodes without spaces between the items, and rejects integers that do not
+    fit in 64 bits and dictionary keys that are not strings.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson JSON codec requires the orjson package.")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+
+def fastest_json_codec() -> JSONCodec:
+    """Returns the fastest codec that can be used with the installed libraries."""
+    return OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+DEFAULT_JSON_CODEC = JSONCodec()
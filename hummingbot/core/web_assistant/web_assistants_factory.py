@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import ConnectionPoolProfile, ConnectionPoolStats
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +21,14 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The JSON codec used by the assistants can be replaced by a faster one, like the one returned by
+    `fastest_json_codec()`, and a connector can get the WebSocket messages undecoded (`ws_raw_messages`) to parse
+    only the fields it needs.
+
+    The REST requests share a pool of HTTP connections configured by `pool_profile`. With an `order_pool_profile`,
+    the order creation and cancellation requests (the ones made within the `order_requests()` context) use a separate
+    pool, so they never wait behind the polling requests to the same host.
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,8 +39,18 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
+        ws_raw_messages: bool = False,
+        pool_profile: Optional[ConnectionPoolProfile] = None,
+        order_pool_profile: Optional[ConnectionPoolProfile] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(
+            json_codec=json_codec,
+            ws_raw_messages=ws_raw_messages,
+            pool_profile=pool_profile,
+            order_pool_profile=order_pool_profile,
+        )
+        self._json_codec = json_codec
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,14 +66,25 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def order_pool_profile(self) -> Optional[ConnectionPoolProfile]:
+        return self._connections_factory.order_pool_profile
+
+    def connection_pool_stats(self) -> Dict[str, ConnectionPoolStats]:
+        """Returns the usage of the HTTP connection pools, by pool ("shared" and, if any, "orders")."""
+        return self._connections_factory.connection_pool_stats()
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
+        order_connection = await self._connections_factory.get_order_rest_connection()
         assistant = RESTAssistant(
             connection=connection,
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self._json_codec,
+            order_connection=order_connection,
         )
         return assistant
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -107,6 +107,20 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    def ws_multiplexed_subscription_payloads(self, feeds: List[CandlesBase]) -> List[Dict[str, Any]]:
+        return [{
+            "method": "SUBSCRIBE",
+            "params": [param for feed in feeds for param in feed.ws_subscription_payload()["params"]],
+            "id": 1
+        }]
+
+    def _ws_subscription_key(self) -> Optional[Hashable]:
+        return self._ex_trading_pair.upper(), self.interval
+
+    def _ws_message_subscription_key(self, data: Dict[str, Any]) -> Optional[Hashable]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
@@ -25,6 +25,8 @@ INTERVALS = bidict({
 })
 
 MAX_RESULTS_PER_CANDLESTICK_REST_REQUEST = 1000
+# Topics per websocket subscription request
+WS_MAX_ARGS_PER_SUBSCRIPTION = 10
 
 RATE_LIMITS = [
     RateLimit(CANDLES_ENDPOINT, limit=20000, time_interval=60, linked_limits=[LinkedLimitWeightPair("raw", 1)]),
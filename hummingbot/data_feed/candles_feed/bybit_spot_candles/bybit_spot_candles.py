@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.bybit_spot_candles import constants as CONSTANTS
@@ -112,6 +112,18 @@ class BybitSpotCandles(CandlesBase):
         }
         return payload
 
+    def ws_multiplexed_subscription_payloads(self, feeds: List[CandlesBase]) -> List[Dict[str, Any]]:
+        args = [arg for feed in feeds for arg in feed.ws_subscription_payload()["args"]]
+        return [{"op": "subscribe", "args": args[start:start + CONSTANTS.WS_MAX_ARGS_PER_SUBSCRIPTION]}
+                for start in range(0, len(args), CONSTANTS.WS_MAX_ARGS_PER_SUBSCRIPTION)]
+
+    def _ws_subscription_key(self) -> Optional[Hashable]:
+        return self.ws_subscription_payload()["args"][0]
+
+    def _ws_message_subscription_key(self, data: Dict[str, Any]) -> Optional[Hashable]:
+        if data is not None and data.get("data") is not None:
+            return data.get("topic")
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("data") is not None:
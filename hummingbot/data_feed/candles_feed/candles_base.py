@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -15,8 +14,13 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_ws_multiplexer import CandlesWSMultiplexer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+
 
 class CandlesBase(NetworkBase):
     """
@@ -45,14 +49,19 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Candles streams subscribed through a websocket connection shared by feeds, for the exchanges supporting it
+    ws_max_subscriptions_per_connection = 100
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._ws_multiplexer: Optional[CandlesWSMultiplexer] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
@@ -70,15 +79,23 @@ class CandlesBase(NetworkBase):
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._ws_subscription_key() is not None:
+            self._ws_multiplexer = CandlesWSMultiplexer.get_instance(self)
+            await self._ws_multiplexer.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task, or unsubscribing from the websocket
+        connection shared with the other feeds of the exchange.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._ws_multiplexer is not None:
+            await self._ws_multiplexer.unsubscribe(self)
+            self._ws_multiplexer = None
 
     async def initialize_exchange_data(self):
         """
@@ -91,7 +108,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +158,29 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. The DataFrame is only
+        built again when the candles change, every access returns a copy of it that the caller can modify.
+        """
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.array, columns=self.columns, dtype=float, copy=True)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy()
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only view of the candles, one row per candle with the columns of the feed,
+        without copying them. The view is only valid until the next candle is received.
+        """
+        return self._candles.array
+
+    @property
+    def candles_version(self) -> int:
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        This property returns a number that changes every time a candle is received or the candles are reset, so the
+        values computed from the candles only need to be updated when it changes.
+        """
+        return self._candles.version
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -161,12 +198,24 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
-    async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+    async def get_historical_candles(self, config: HistoricalCandlesConfig,
+                                     candles_cache: Optional["CandlesCache"] = None):
+        """
+        This method fetches the candles between the start and end time of the config from the exchange, paging back
+        from the end time.
+        :param config: the historical candles config
+        :param candles_cache: when provided, the candles are served from this on-disk cache and only the time ranges
+        missing in it are fetched from the exchange
+        :return: a DataFrame with the candles
+        """
+        if candles_cache is not None:
+            return await candles_cache.get_historical_candles(self, config)
+        candles_df = pd.DataFrame(columns=self.columns, dtype=float)
         try:
             await self.initialize_exchange_data()
             current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
             current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            pages = []
             while current_end_time >= current_start_time:
                 missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
                 candles = await self.fetch_candles(start_time=current_start_time,
@@ -176,10 +225,12 @@ class CandlesBase(NetworkBase):
                     break
                 candles = candles[candles[:, 0] <= current_end_time]
                 current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
+                pages.append(candles)
+            if len(pages) > 0:
+                # Pages are fetched from the most recent backwards, consecutive pages share their boundary candle
+                candles = np.concatenate(pages[::-1])
+                _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+                candles_df = pd.DataFrame(candles[unique_indexes], columns=self.columns)
                 self.check_candles_sorted_and_equidistant(candles_df.values)
             candles_df = candles_df[
                 (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
@@ -320,7 +371,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -398,6 +449,33 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    def ws_multiplexed_subscription_payloads(self, feeds: List["CandlesBase"]) -> List[Dict[str, Any]]:
+        """
+        This method returns the payloads subscribing a websocket connection shared by feeds of the exchange to the
+        candles of all of them. By default, every feed sends its own subscription payload. Exchanges accepting several
+        streams in a request should combine them, to stay within the messages rate limits on reconnection.
+
+        :param feeds: the feeds sharing the connection, all of them of the same class
+        """
+        return [feed.ws_subscription_payload() for feed in feeds]
+
+    def _ws_subscription_key(self) -> Optional[Hashable]:
+        """
+        This method returns the key identifying the candles stream of the feed in the websocket messages, or None if
+        the exchange does not support sharing a websocket connection between feeds. In that case, every feed opens its
+        own connection. Exchanges supporting it must also implement _ws_message_subscription_key.
+        """
+        return None
+
+    def _ws_message_subscription_key(self, data: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        This method returns the key of the candles stream a websocket message belongs to, the same as the one returned
+        by _ws_subscription_key for the feed subscribed to it, or None if the message is not a candle update.
+
+        :param data: the websocket message data
+        """
+        return None
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -407,27 +485,35 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_websocket_candle(parsed_message)
+
+    def _process_websocket_candle(self, parsed_message: Dict[str, Any]):
+        """
+        Stores a candle received through the websocket, either a new candle or an update of the last one.
+
+        :param parsed_message: the candlestick data returned by _parse_websocket_message
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
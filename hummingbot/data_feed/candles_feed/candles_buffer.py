@@ -0,0 +1,106 @@
+import itertools
+from typing import Iterable, Iterator
+
+import numpy as np
+
+# Shared by all the buffers, so a version also tells apart the rows of a buffer from those of any other one
+_versions = itertools.count()
+
+
+class CandlesBuffer:
+    """
+    Bounded store of candle rows in a preallocated 2-D float64 array, with the deque(maxlen=...) interface the candle
+    feeds used before: appending to one end drops the row at the other end once `maxlen` rows are stored.
+
+    The rows are kept contiguous in a buffer of twice the capacity, so `array` is always a view of them without copies.
+    An append past the end of the buffer moves the stored rows to its front, and a prepend before its start moves them
+    to its back, which happens at most once every `maxlen` appends. Every change gives a new `version`, unique across
+    all the buffers, so the values derived from the rows can be cached until it changes, even if the buffer they were
+    derived from is replaced by another one.
+    """
+
+    def __init__(self, maxlen: int, columns: int):
+        self._maxlen = maxlen
+        self._capacity = 2 * max(maxlen, 1)
+        self._buffer = np.zeros((self._capacity, columns), dtype=np.float64)
+        self._start = self._end = self._capacity // 2
+        self._version = next(_versions)
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Read-only view of the stored rows, oldest first. It is only valid until the next change of the buffer.
+        """
+        view = self._buffer[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def append(self, row):
+        if self._maxlen == 0:
+            return
+        if self._end - self._start == self._maxlen:
+            self._start += 1
+        if self._end == self._capacity:
+            length = self._end - self._start
+            self._buffer[:length] = self._buffer[self._start:self._end]
+            self._start, self._end = 0, length
+        self._buffer[self._end] = row
+        self._end += 1
+        self._version = next(_versions)
+
+    def appendleft(self, row):
+        if self._maxlen == 0:
+            return
+        if self._end - self._start == self._maxlen:
+            self._end -= 1
+        if self._start == 0:
+            length = self._end - self._start
+            self._buffer[self._capacity - length:] = self._buffer[self._start:self._end]
+            self._start, self._end = self._capacity - length, self._capacity
+        self._start -= 1
+        self._buffer[self._start] = row
+        self._version = next(_versions)
+
+    def extend(self, rows: Iterable):
+        for row in rows:
+            self.append(row)
+
+    def extendleft(self, rows: Iterable):
+        """
+        Prepends the rows one at a time, like deque.extendleft, so they end up in reverse order.
+        """
+        for row in rows:
+            self.appendleft(row)
+
+    def clear(self):
+        self._start = self._end = self._capacity // 2
+        self._version = next(_versions)
+
+    def _position(self, index: int) -> int:
+        length = self._end - self._start
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("CandlesBuffer index out of range")
+        return self._start + index
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._buffer[self._position(index)].copy()
+
+    def __setitem__(self, index: int, row):
+        self._buffer[self._position(index)] = row
+        self._version = next(_versions)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.array.copy())
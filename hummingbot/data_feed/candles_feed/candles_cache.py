@@ -0,0 +1,206 @@
+import logging
+import os
+import re
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesCache:
+    """
+    On-disk store of historical candles, kept per connector, trading pair and interval.
+
+    The candles of a key are stored sorted by timestamp in a NumPy .npy file that is memory-mapped on reads, next to a
+    second file with the time ranges already fetched from the exchange. Each store writes the new candles as a chunk
+    file merged with the others on load, the chunks are compacted into the candles file every MAX_CANDLES_CHUNKS
+    stores. A request only goes to the exchange for the
+    parts of its time range that are not covered yet, so a backtest over cached data doesn't use the network at all.
+    With offline set, the exchange is never queried and only the cached candles are returned.
+    """
+    MAX_CANDLES_CHUNKS: int = 16
+    _CHUNK_FILE_NAME = re.compile(r"^\d{20}-\d+\.npy$")
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, cache_dir: Optional[str] = None, offline: bool = False):
+        self.cache_dir = cache_dir or os.path.join(data_path(), "candles_cache")
+        self.offline = offline
+
+    async def get_historical_candles(self, candle_feed: "CandlesBase", config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Returns the candles of the config time range, fetching from the candle feed only the missing ranges.
+        :param candle_feed: the candle feed of the connector, trading pair and interval of the config
+        :param config: the historical candles config
+        :return: a DataFrame with the candles
+        """
+        interval_in_seconds = candle_feed.interval_in_seconds
+        start_time = config.start_time - config.start_time % interval_in_seconds
+        # Only closed candles are cached, the last one can still change
+        last_closed_candle = int(time.time()) // interval_in_seconds * interval_in_seconds - interval_in_seconds
+        end_time = min(config.end_time - config.end_time % interval_in_seconds, last_closed_candle)
+        missing_ranges = self.missing_ranges(config.connector_name, config.trading_pair, config.interval,
+                                             start_time, end_time, interval_in_seconds)
+        if len(missing_ranges) > 0 and self.offline:
+            self.logger().warning(f"Candles of {config.connector_name} {config.trading_pair} {config.interval} "
+                                  f"missing in the cache for {missing_ranges}.")
+        elif len(missing_ranges) > 0:
+            fetched_candles = []
+            for range_start, range_end in missing_ranges:
+                # The candle feed needs at least two candles in the range to return any
+                fetch_end = min(max(range_end, range_start + 2 * interval_in_seconds), last_closed_candle)
+                fetch_start = min(range_start, fetch_end - 2 * interval_in_seconds)
+                candles_df = await candle_feed.get_historical_candles(HistoricalCandlesConfig(
+                    connector_name=config.connector_name,
+                    trading_pair=config.trading_pair,
+                    interval=config.interval,
+                    start_time=fetch_start,
+                    end_time=fetch_end,
+                ))
+                fetched_candles.append(candles_df[candle_feed.columns].to_numpy(dtype=np.float64))
+            candles = np.concatenate(fetched_candles)
+            self.store(config.connector_name, config.trading_pair, config.interval,
+                       candles[candles[:, 0] <= last_closed_candle], missing_ranges, interval_in_seconds)
+        return self.get_candles(config.connector_name, config.trading_pair, config.interval,
+                                config.start_time, config.end_time, candle_feed.columns)
+
+    def get_candles(self, connector_name: str, trading_pair: str, interval: str, start_time: int, end_time: int,
+                    columns: List[str]) -> pd.DataFrame:
+        candles = self._load_candles(connector_name, trading_pair, interval)
+        if candles is None:
+            return pd.DataFrame(columns=columns, dtype=float)
+        start_index = np.searchsorted(candles[:, 0], start_time, side="left")
+        end_index = np.searchsorted(candles[:, 0], end_time, side="right")
+        return pd.DataFrame(np.array(candles[start_index:end_index]), columns=columns)
+
+    def missing_ranges(self, connector_name: str, trading_pair: str, interval: str,
+                       start_time: int, end_time: int, interval_in_seconds: int) -> List[Tuple[int, int]]:
+        """
+        Returns the (start, end) candle timestamps of the ranges between start_time and end_time never fetched.
+        """
+        missing = []
+        current_start = start_time
+        for covered_start, covered_end in self._load_ranges(connector_name, trading_pair, interval):
+            if covered_end < current_start:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > current_start:
+                missing.append((current_start, min(int(covered_start) - interval_in_seconds, end_time)))
+            current_start = max(current_start, int(covered_end) + interval_in_seconds)
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    def store(self, connector_name: str, trading_pair: str, interval: str, candles: np.ndarray,
+              fetched_ranges: List[Tuple[int, int]], interval_in_seconds: int):
+        """
+        Adds the candles to the store as a new chunk and marks the fetched ranges as covered, even where the exchange
+        had no candles, so they are not requested again.
+        """
+        if len(candles) > 0:
+            _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+            chunks_path = self._chunks_path(connector_name, trading_pair, interval)
+            self._save(os.path.join(chunks_path, f"{time.time_ns():020d}-{os.getpid()}.npy"), candles[unique_indexes])
+            if len(self._chunk_files(chunks_path)) >= self.MAX_CANDLES_CHUNKS:
+                self._compact_candles(connector_name, trading_pair, interval)
+
+        ranges = sorted([tuple(covered) for covered in self._load_ranges(connector_name, trading_pair, interval)] +
+                        list(fetched_ranges))
+        merged_ranges = [list(ranges[0])]
+        for range_start, range_end in ranges[1:]:
+            if range_start <= merged_ranges[-1][1] + interval_in_seconds:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], range_end)
+            else:
+                merged_ranges.append([range_start, range_end])
+        self._save(self._ranges_path(connector_name, trading_pair, interval), np.array(merged_ranges, dtype=np.int64))
+
+    def _key_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self.cache_dir, connector_name, trading_pair, interval)
+
+    def _candles_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return f"{self._key_path(connector_name, trading_pair, interval)}_candles.npy"
+
+    def _ranges_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return f"{self._key_path(connector_name, trading_pair, interval)}_ranges.npy"
+
+    def _chunks_path(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return f"{self._key_path(connector_name, trading_pair, interval)}_chunks"
+
+    def _chunk_files(self, chunks_path: str) -> List[str]:
+        """
+        Returns the chunk files of a key, the newest first.
+        """
+        if not os.path.isdir(chunks_path):
+            return []
+        return [os.path.join(chunks_path, file_name)
+                for file_name in sorted(os.listdir(chunks_path), reverse=True)
+                if self._CHUNK_FILE_NAME.match(file_name)]
+
+    def _load_candles(self, connector_name: str, trading_pair: str, interval: str) -> Optional[np.ndarray]:
+        return self._load_candles_and_chunks(connector_name, trading_pair, interval)[0]
+
+    def _load_candles_and_chunks(self, connector_name: str, trading_pair: str,
+                                 interval: str) -> Tuple[Optional[np.ndarray], List[str]]:
+        """
+        Returns the candles of the candles file merged with the chunks, and the chunk files merged.
+        Without chunks, the candles file is returned memory-mapped.
+        """
+        path = self._candles_path(connector_name, trading_pair, interval)
+        while True:
+            chunk_files = self._chunk_files(self._chunks_path(connector_name, trading_pair, interval))
+            try:
+                # The chunks are read before the candles file, a chunk removed by a compaction in the meantime is
+                # then already in the candles file read next
+                parts = [np.load(chunk_file) for chunk_file in chunk_files]
+                if os.path.exists(path):
+                    parts.append(np.load(path, mmap_mode="r"))
+            except FileNotFoundError:
+                continue
+            break
+        if len(parts) == 0:
+            return None, chunk_files
+        if len(parts) == 1:
+            return parts[0], chunk_files
+        # Newest chunks first, so they replace the older candles with the same timestamp
+        candles = np.concatenate(parts)
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        return candles[unique_indexes], chunk_files
+
+    def _compact_candles(self, connector_name: str, trading_pair: str, interval: str):
+        """
+        Rewrites the candles file with the chunks merged and removes the merged chunks.
+        """
+        candles, chunk_files = self._load_candles_and_chunks(connector_name, trading_pair, interval)
+        self._save(self._candles_path(connector_name, trading_pair, interval), candles)
+        for chunk_file in chunk_files:
+            try:
+                os.remove(chunk_file)
+            except FileNotFoundError:
+                # Already merged by another process compacting at the same time
+                pass
+
+    def _load_ranges(self, connector_name: str, trading_pair: str, interval: str) -> np.ndarray:
+        path = self._ranges_path(connector_name, trading_pair, interval)
+        return np.load(path) if os.path.exists(path) else np.empty((0, 2), dtype=np.int64)
+
+    @staticmethod
+    def _save(path: str, array: np.ndarray):
+        # Write to a temporary file and rename it, so readers never map a partially written file
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(temporary_path, array, allow_pickle=False)
+        os.replace(temporary_path, path)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple, Type
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesWSConnection:
+    """
+    A websocket connection streaming the candles of several feeds of an exchange. The messages are routed to the feeds
+    by the key of their candles stream, and all the streams are subscribed again every time the connection is
+    reestablished.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._feeds: Dict[Hashable, List["CandlesBase"]] = {}
+        # Any of the feeds of the connection, used for the exchange specific behavior (connection, parsing, pings)
+        self._exchange_feed: Optional["CandlesBase"] = None
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriptions_count(self) -> int:
+        """
+        Number of candles streams subscribed through the connection.
+        """
+        return len(self._feeds)
+
+    def is_subscribed(self, feed: "CandlesBase") -> bool:
+        return feed in self._feeds.get(feed._ws_subscription_key(), [])
+
+    async def subscribe(self, feed: "CandlesBase"):
+        """
+        Starts streaming the candles of the feed, subscribing to them right away if the connection is open.
+        """
+        key = feed._ws_subscription_key()
+        self._exchange_feed = self._exchange_feed or feed
+        feeds = self._feeds.setdefault(key, [])
+        feeds.append(feed)
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+        elif self._ws is not None and len(feeds) == 1:
+            try:
+                await self._subscribe_channels(self._ws, [feed])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # The connection is reestablished, and the stream subscribed with all the others, by the listen task
+                pass
+
+    async def unsubscribe(self, feed: "CandlesBase"):
+        """
+        Stops routing the candles of the stream to the feed, and closes the connection if no stream is left. The
+        exchange keeps sending the messages of the stream until the next reconnection, they are ignored.
+        """
+        key = feed._ws_subscription_key()
+        feeds = self._feeds.get(key, [])
+        if feed in feeds:
+            feeds.remove(feed)
+            if len(feeds) == 0:
+                del self._feeds[key]
+            if feed is self._exchange_feed:
+                # The stopped feed isn't used for the connection anymore, any other one of the connection is
+                self._exchange_feed = next((feeds[0] for feeds in self._feeds.values()), None)
+            await feed._on_order_stream_interruption()
+        if len(self._feeds) == 0 and self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the candlestick websocket endpoint, subscribes to the candles of all the feeds and listens to the
+        messages sent by the exchange.
+        """
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await self._exchange_feed._connected_websocket_assistant()
+                self._ws = ws
+                await self._subscribe_channels(ws, [feeds[0] for feeds in self._feeds.values()])
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._exchange_feed._sleep(1.0)
+            finally:
+                self._ws = None
+                ws and await ws.disconnect()
+                for feeds in list(self._feeds.values()):
+                    for feed in feeds:
+                        await feed._on_order_stream_interruption()
+
+    async def _subscribe_channels(self, ws: WSAssistant, feeds: List["CandlesBase"]):
+        for payload in self._exchange_feed.ws_multiplexed_subscription_payloads(feeds):
+            await ws.send(WSJSONRequest(payload=payload))
+        self.logger().info(f"Subscribed to public klines of {len(feeds)} candles streams...")
+
+    async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data = ws_response.data
+            key = self._exchange_feed._ws_message_subscription_key(data)
+            if key is None:
+                # messages other than candles may be ping or pong messages
+                parsed_message = self._exchange_feed._parse_websocket_message(data)
+                if isinstance(parsed_message, WSJSONRequest):
+                    await websocket_assistant.send(request=parsed_message)
+            else:
+                for feed in self._feeds.get(key, []):
+                    parsed_message = feed._parse_websocket_message(data)
+                    if isinstance(parsed_message, dict):
+                        feed._process_websocket_candle(parsed_message)
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        ping_timeout = self._exchange_feed._ping_timeout
+        while True:
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(websocket_assistant=websocket_assistant),
+                                       timeout=ping_timeout)
+            except asyncio.TimeoutError:
+                if ping_timeout is not None:
+                    ping_request = WSJSONRequest(payload=self._exchange_feed._ping_payload)
+                    await websocket_assistant.send(request=ping_request)
+
+
+class CandlesWSMultiplexer:
+    """
+    Shares websocket connections between the candles feeds of an exchange, instead of opening one per trading pair and
+    interval. The feeds are spread over as few connections as the exchange limit of streams per connection allows.
+    There is one multiplexer per feed class and websocket url, shared by all the feeds.
+    """
+    _shared_instances: Dict[Tuple[Type["CandlesBase"], str], "CandlesWSMultiplexer"] = {}
+
+    @classmethod
+    def get_instance(cls, feed: "CandlesBase") -> "CandlesWSMultiplexer":
+        key = (type(feed), feed.wss_url)
+        if key not in cls._shared_instances:
+            cls._shared_instances[key] = CandlesWSMultiplexer(feed.ws_max_subscriptions_per_connection)
+        return cls._shared_instances[key]
+
+    def __init__(self, max_subscriptions_per_connection: int = 100):
+        self._max_subscriptions_per_connection = max_subscriptions_per_connection
+        self._connections: List[CandlesWSConnection] = []
+
+    @property
+    def connections(self) -> List[CandlesWSConnection]:
+        return self._connections
+
+    async def subscribe(self, feed: "CandlesBase"):
+        key = feed._ws_subscription_key()
+        connection = next((connection for connection in self._connections if key in connection._feeds), None)
+        if connection is None:
+            connection = next(
+                (connection for connection in self._connections
+                 if connection.subscriptions_count < self._max_subscriptions_per_connection),
+                None)
+        if connection is None:
+            connection = CandlesWSConnection()
+            self._connections.append(connection)
+        await connection.subscribe(feed)
+
+    async def unsubscribe(self, feed: "CandlesBase"):
+        for connection in self._connections:
+            if connection.is_subscribed(feed):
+                await connection.unsubscribe(feed)
+                if connection.subscriptions_count == 0:
+                    self._connections.remove(connection)
+                break
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
@@ -102,6 +102,19 @@ class OKXSpotCandles(CandlesBase):
             "args": candle_args
         }
 
+    def ws_multiplexed_subscription_payloads(self, feeds: List[CandlesBase]) -> List[Dict[str, Any]]:
+        return [{
+            "op": "subscribe",
+            "args": [arg for feed in feeds for arg in feed.ws_subscription_payload()["args"]]
+        }]
+
+    def _ws_subscription_key(self) -> Optional[Hashable]:
+        return f"candle{CONSTANTS.INTERVALS[self.interval]}", self._ex_trading_pair
+
+    def _ws_message_subscription_key(self, data: Dict[str, Any]) -> Optional[Hashable]:
+        if data is not None and "data" in data and "arg" in data:
+            return data["arg"]["channel"], data["arg"]["instId"]
+
     def _parse_websocket_message(self, data: dict):
         candles_row_dict = {}
         if data is not None and "data" in data:  # data will be None when the websocket is disconnected
@@ -12,6 +12,7 @@ from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -236,7 +237,27 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
-        return candles.candles_df.iloc[-max_records:]
+        # The feed returns a copy of its cached candles, it's only sliced when it has more records than requested
+        candles_df = candles.candles_df
+        return candles_df if len(candles_df) <= max_records else candles_df.iloc[-max_records:]
+
+    def get_candles_version(self, connector_name: str, trading_pair: str, interval: str,
+                            max_records: int = 500) -> Optional[int]:
+        """
+        Retrieves the version of the candles returned by get_candles_df, which changes every time they change.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param max_records: int
+        :return: Candles version, None if it isn't known.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.candles_version
 
     def get_trading_pairs(self, connector_name: str):
         """
@@ -279,16 +300,23 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
         DataFrame format.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: Maximum number of levels per side, or None for the whole book.
         :return: Tuple of bid and ask in DataFrame format.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.snapshot
+        if depth is None:
+            return order_book.snapshot
+        bids_array, asks_array = order_book.depth_arrays(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
+        return bids_df, asks_df
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
@@ -28,10 +28,10 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        self._checkpoint(db_handle)
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
 
-        db_handle.engine.dispose()
         new_db_handle = SQLConnectionManager(
             client_config_map, SQLConnectionType.TRADE_FILLS, new_db_path, original_db_name, True
         )
@@ -54,11 +54,26 @@ class Migrator:
                                       exc_info=True)
         finally:
             try:
-                new_db_handle.engine.dispose()
+                self._checkpoint(new_db_handle)
                 if migration_successful:
+                    # The logs of the original database were emptied by the checkpoint, none can be left next to the
+                    # migrated one
+                    SQLConnectionManager.remove_sidecar_files(original_db_path)
                     move(new_db_path, original_db_path)
-                db_handle.__init__(SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True)
+                SQLConnectionManager.remove_sidecar_files(new_db_path)
+                db_handle.__init__(client_config_map, SQLConnectionType.TRADE_FILLS, original_db_path,
+                                   original_db_name, True)
             except Exception as e:
                 logging.getLogger().error(f"Fatal error migrating DB {original_db_path}")
                 raise e
         return migration_successful
+
+    @staticmethod
+    def _checkpoint(db_handle: SQLConnectionManager):
+        """
+        Moves the content of the write-ahead log into the database file and empties the log, so that the file can be
+        copied or replaced, and closes the connections to the database.
+        """
+        with db_handle.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        db_handle.engine.dispose()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text
+from sqlalchemy import Column, Integer, Text, inspect
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
@@ -149,3 +149,44 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddRecorderQueryIndexes(DatabaseTransformation):
+    # Indexes for the queries of the markets recorder, by table
+    index_queries = {
+        "Order": ('create index if not exists o_config_market_timestamp_index '
+                  'on "Order" (config_file_path, market, creation_timestamp);'),
+        "TradeFill": 'create index if not exists tf_order_id_index on TradeFill (order_id);',
+        "MarketState": ('create unique index if not exists ms_config_market_index '
+                        'on MarketState (config_file_path, market);'),
+        "Executors": ('create index if not exists ex_controller_id_timestamp '
+                      'on Executors (controller_id, timestamp);'),
+    }
+
+    # The MarketState index is unique but it was never created before, so the tables can have several states per
+    # market. Only the latest one, the one the markets recorder reads, is kept.
+    deduplication_queries = {
+        "MarketState": ('delete from MarketState where exists (select 1 from MarketState latest '
+                        'where latest.config_file_path = MarketState.config_file_path '
+                        'and latest.market = MarketState.market '
+                        'and (latest.timestamp > MarketState.timestamp '
+                        'or (latest.timestamp = MarketState.timestamp and latest.id > MarketState.id)));'),
+    }
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        inspector = inspect(db_handle.engine)
+        for table_name, query in self.index_queries.items():
+            # The tables that do not exist yet are created with their indexes
+            if inspector.has_table(table_name):
+                if table_name in self.deduplication_queries:
+                    db_handle.engine.execute(self.deduplication_queries[table_name])
+                db_handle.engine.execute(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddRecorderQueryIndexes"
+
+    @property
+    def to_version(self):
+        return 20261017
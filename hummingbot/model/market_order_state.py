@@ -0,0 +1,25 @@
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketOrderState(HummingbotBase):
+    """
+    The saved tracking state of one order of a market, connectors that report the changes of their tracking states
+    have them saved order by order instead of in a single MarketState row.
+    """
+    __tablename__ = "MarketOrderState"
+    __table_args__ = (Index("mos_config_market_order_index",
+                            "config_file_path", "market", "client_order_id", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    client_order_id = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    saved_state = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketOrderState(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', client_order_id='{self.client_order_id}', timestamp={self.timestamp}, " \
+            f"saved_state={self.saved_state})"
@@ -1,9 +1,10 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -27,7 +28,9 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20261017"
+    # Files SQLite keeps next to a database: the write-ahead log, its shared memory index and the rollback journal
+    SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -62,6 +65,20 @@ class SQLConnectionManager(TransactionBase):
         else:
             return join(data_path(), "hummingbot_trades.sqlite")
 
+    @classmethod
+    def remove_sidecar_files(cls, db_path: str):
+        """
+        Removes the write-ahead log and the other files SQLite keeps next to a database. They must be removed along with
+        the database, or replaced with it, since SQLite would apply a stale log to another database at the same path.
+        """
+        for suffix in cls.SQLITE_SIDECAR_SUFFIXES:
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    @classmethod
+    def remove_db_files(cls, db_path: str):
+        Path(db_path).unlink(missing_ok=True)
+        cls.remove_sidecar_files(db_path)
+
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
                  connection_type: SQLConnectionType,
@@ -72,7 +89,11 @@ class SQLConnectionManager(TransactionBase):
         self.db_path = db_path
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
-            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            db_mode = client_config_map.db_mode
+            self._engine: Engine = create_engine(db_mode.get_url(self.db_path),
+                                                 **db_mode.get_engine_kwargs(self.db_path))
+            if self._engine.dialect.name == "sqlite":
+                self._set_sqlite_pragmas_on_connect(self._engine, db_mode.get_pragmas())
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -103,6 +124,19 @@ class SQLConnectionManager(TransactionBase):
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    @staticmethod
+    def _set_sqlite_pragmas_on_connect(engine: Engine, pragmas: List[str]):
+        if len(pragmas) == 0:
+            return
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        event.listen(engine, "connect", set_pragmas)
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
@@ -118,15 +152,15 @@ class SQLConnectionManager(TransactionBase):
                     version_info: LocalMetadata = LocalMetadata(key=self.LOCAL_DB_VERSION_KEY,
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
-                    session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                local_db_version_value = local_db_version.value
+
+        if local_db_version_value < self.LOCAL_DB_VERSION_VALUE:
+            # The migrator replaces the database file, no connection can be open on it meanwhile
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(local_db_version_value), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
@@ -0,0 +1,129 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.transaction_base import TransactionBase
+
+Mutation = Callable[[Session], None]
+ErrorCallback = Callable[[], None]
+Write = Tuple[Mutation, Optional[ErrorCallback]]
+
+
+class WriteBehindQueue:
+    """
+    Applies database mutations on a dedicated writer thread, in batched transactions.
+
+    A mutation is a callable that receives the session of the transaction it is applied in. The writer thread waits for
+    the first mutation of a batch and then collects the following ones until `max_batch_size` mutations are pending or
+    `flush_interval` seconds have passed since the first one, so a mutation is committed at most `flush_interval`
+    seconds (plus the time to write the batch) after it is enqueued. If a batch fails, its mutations are applied again
+    one transaction each, so that only the failing ones are lost. The error callback of a lost mutation is called on the
+    writer thread, so its producer can make up for it.
+
+    Mutations must not touch objects owned by other threads, anything they need has to be captured when they are
+    created.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: TransactionBase, flush_interval: float = 0.5, max_batch_size: int = 500):
+        self._sql = sql
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Union[Write, threading.Event, None]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def pending_count(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, name="WriteBehindQueue", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Commits all the mutations enqueued so far and stops the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def put(self, mutation: Mutation, on_error: Optional[ErrorCallback] = None):
+        """
+        Enqueues the mutation, it is applied right away in its own transaction if the writer thread is not running.
+        :param on_error: called if the mutation can't be committed
+        """
+        if self._thread is None:
+            self._apply([(mutation, on_error)])
+        else:
+            self._queue.put((mutation, on_error))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the mutations enqueued so far have been committed.
+        :return: False if the timeout expired before that
+        """
+        if self._thread is None:
+            return True
+        flushed = threading.Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def _write_loop(self):
+        running = True
+        while running:
+            batch: List[Write] = []
+            flush_events: List[threading.Event] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    # Everything before a flush request is written right away
+                    flush_events.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self._max_batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                self._apply(batch)
+            for flush_event in flush_events:
+                flush_event.set()
+
+    def _apply(self, batch: List[Write]):
+        try:
+            with self._sql.begin() as session:
+                for mutation, _ in batch:
+                    mutation(session)
+        except Exception:
+            if len(batch) == 1:
+                self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+                on_error = batch[0][1]
+                if on_error is not None:
+                    on_error()
+            else:
+                for write in batch:
+                    self._apply([write])
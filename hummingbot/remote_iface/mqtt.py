@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -290,6 +291,9 @@ class MQTTCommands:
                 response.status = MQTT_STATUS_CODE.ERROR
                 response.msg = 'No strategy is currently running!'
                 return response
+            event_loop_monitor = EventLoopMonitor.get_instance()
+            if event_loop_monitor.started:
+                response.data = {"event_loop": event_loop_monitor.stats().to_dict()}
             if msg.async_backend:
                 self._ev_loop.call_soon_threadsafe(
                     self._hb_app.status
@@ -1,15 +1,21 @@
+import json
 import logging
+import os
+import time
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
+from hummingbot import data_path
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings, ConnectorType
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
@@ -25,18 +31,43 @@ class BacktestingDataProvider(MarketDataProvider):
     EXCLUDED_CONNECTORS = ["hyperliquid_perpetual", "dydx_perpetual", "cube",
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid"]
-
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    TRADING_RULES_DECIMAL_FIELDS = ["min_order_size", "max_order_size", "min_price_increment",
+                                    "min_base_amount_increment", "min_quote_amount_increment", "min_notional_size",
+                                    "min_order_value", "max_price_significant_digits"]
+    TRADING_RULES_FIELDS = ["trading_pair", "supports_limit_orders", "supports_market_orders",
+                            "buy_order_collateral_token", "sell_order_collateral_token"] + TRADING_RULES_DECIMAL_FIELDS
+    TRADING_RULES_CACHE_TTL = 60 * 60 * 24
+
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_cache: Optional[CandlesCache] = None,
+                 trading_rules_cache_dir: Optional[str] = None):
+        """
+        Connectors are only created when a backtest needs their trading rules and those are not in the trading rules
+        cache, which is a JSON file per connector that is refreshed after TRADING_RULES_CACHE_TTL seconds.
+        """
         super().__init__(connectors)
+        self.candles_cache = candles_cache or CandlesCache()
+        self.trading_rules_cache_dir = trading_rules_cache_dir or os.path.join(data_path(), "trading_rules_cache")
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
         self.conn_settings = AllConnectorSettings.get_connector_settings()
-        self.connectors = {name: self.get_connector(name) for name, settings in self.conn_settings.items()
-                           if settings.type in self.CONNECTOR_TYPES and name not in self.EXCLUDED_CONNECTORS and
-                           "testnet" not in name}
+
+    def get_backtesting_connector(self, connector_name: str) -> ConnectorBase:
+        """
+        Returns the non trading instance of the connector, creating it on first use.
+        :param connector_name: str
+        :return: Connector instance.
+        """
+        if connector_name not in self.connectors:
+            conn_setting = self.conn_settings.get(connector_name)
+            if conn_setting is not None and (conn_setting.type not in self.CONNECTOR_TYPES or
+                                             connector_name in self.EXCLUDED_CONNECTORS or
+                                             "testnet" in connector_name):
+                raise ValueError(f"Connector {connector_name} is not supported for backtesting")
+            self.connectors[connector_name] = self.get_connector(connector_name)
+        return self.connectors[connector_name]
 
     def get_connector(self, connector_name: str):
         conn_setting = self.conn_settings.get(connector_name)
@@ -72,10 +103,47 @@ class BacktestingDataProvider(MarketDataProvider):
         return self._time
 
     async def initialize_trading_rules(self, connector_name: str):
-        if len(self.trading_rules.get(connector_name, {})) == 0:
-            connector = self.connectors.get(connector_name)
+        if len(self.trading_rules.get(connector_name, {})) > 0:
+            return
+        cache_path = os.path.join(self.trading_rules_cache_dir, f"{connector_name}.json")
+        cache_exists = os.path.exists(cache_path)
+        if cache_exists and time.time() - os.path.getmtime(cache_path) < self.TRADING_RULES_CACHE_TTL:
+            self.trading_rules[connector_name] = self.load_trading_rules(cache_path)
+            return
+        try:
+            connector = self.get_backtesting_connector(connector_name)
             await connector._update_trading_rules()
-            self.trading_rules[connector_name] = connector.trading_rules
+        except Exception:
+            if not cache_exists:
+                raise
+            logger.warning(f"Error updating the trading rules of {connector_name}, using the cached ones.",
+                           exc_info=True)
+            self.trading_rules[connector_name] = self.load_trading_rules(cache_path)
+            return
+        self.trading_rules[connector_name] = connector.trading_rules
+        self.save_trading_rules(cache_path, connector.trading_rules)
+
+    @classmethod
+    def load_trading_rules(cls, path: str) -> Dict[str, TradingRule]:
+        with open(path, "r") as file:
+            rules = json.load(file)
+        return {trading_pair: TradingRule(**{
+                    field: Decimal(value) if field in cls.TRADING_RULES_DECIMAL_FIELDS else value
+                    for field, value in rule.items()})
+                for trading_pair, rule in rules.items()}
+
+    @classmethod
+    def save_trading_rules(cls, path: str, trading_rules: Dict[str, TradingRule]):
+        rules = {trading_pair: {field: str(getattr(rule, field)) if field in cls.TRADING_RULES_DECIMAL_FIELDS
+                                else getattr(rule, field)
+                                for field in cls.TRADING_RULES_FIELDS}
+                 for trading_pair, rule in trading_rules.items()}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file and rename it, so a parallel backtest never reads a partially written file
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(rules, file)
+        os.replace(temporary_path, path)
 
     async def initialize_candles_feed(self, config: CandlesConfig):
         await self.get_candles_feed(config)
@@ -109,7 +177,7 @@ class BacktestingDataProvider(MarketDataProvider):
             interval=config.interval,
             start_time=self.start_time - candles_buffer,
             end_time=self.end_time,
-        ))
+        ), candles_cache=self.candles_cache)
         self.candles_feeds[key] = candles_df
         return candles_df
 
@@ -125,6 +193,14 @@ class BacktestingDataProvider(MarketDataProvider):
         candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
         return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
 
+    def get_candles_version(self, connector_name: str, trading_pair: str, interval: str,
+                            max_records: int = 500) -> Optional[int]:
+        """
+        The candles are cut at the backtesting time, which the version of the loaded candles doesn't follow.
+        :return: None, so the candles are always processed again.
+        """
+        return None
+
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
         Retrieves the price for a trading pair from the specified connector based on the price type.
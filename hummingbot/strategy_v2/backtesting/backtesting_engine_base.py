@@ -14,15 +14,25 @@ from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executors_simulator.arbitrage_executor_simulator import (
+    ArbitrageExecutorSimulator,
+)
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import GridExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.twap_executor_simulator import TWAPExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.xemm_executor_simulator import XEMMExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
+from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
 from hummingbot.strategy_v2.models.executors import CloseType
@@ -36,6 +46,10 @@ class BacktestingEngineBase:
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.grid_executor_simulator = GridExecutorSimulator()
+        self.twap_executor_simulator = TWAPExecutorSimulator()
+        self.xemm_executor_simulator = XEMMExecutorSimulator()
+        self.arbitrage_executor_simulator = ArbitrageExecutorSimulator()
 
     @classmethod
     def load_controller_config(cls,
@@ -194,13 +208,16 @@ class BacktestingEngineBase:
         self.controller.processed_data["features"] = backtesting_candles
         return backtesting_candles
 
-    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
+    def simulate_executor(self,
+                          config: Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig,
+                                        TWAPExecutorConfig, XEMMExecutorConfig, ArbitrageExecutorConfig],
+                          df: pd.DataFrame,
                           trade_cost: float) -> Optional[ExecutorSimulation]:
         """
         Simulates the execution of a trading strategy given a configuration.
 
         Args:
-            config (PositionExecutorConfig): The configuration of the executor.
+            config: The configuration of the executor.
             df (pd.DataFrame): DataFrame containing the market data from the start time.
             trade_cost (float): The cost per trade.
 
@@ -211,6 +228,14 @@ class BacktestingEngineBase:
             return self.dca_executor_simulator.simulate(df, config, trade_cost)
         elif isinstance(config, PositionExecutorConfig):
             return self.position_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, GridExecutorConfig):
+            return self.grid_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, TWAPExecutorConfig):
+            return self.twap_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, XEMMExecutorConfig):
+            return self.xemm_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, ArbitrageExecutorConfig):
+            return self.arbitrage_executor_simulator.simulate(df, config, trade_cost)
         return None
 
     def manage_active_executors(self, simulation: ExecutorSimulation):
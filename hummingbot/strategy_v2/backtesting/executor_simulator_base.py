@@ -1,18 +1,26 @@
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, validator
 
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class ExecutorSimulation(BaseModel):
-    config: Union[PositionExecutorConfig, DCAExecutorConfig]
+    config: Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig, TWAPExecutorConfig, XEMMExecutorConfig,
+                  ArbitrageExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
 
@@ -25,6 +33,14 @@ class ExecutorSimulation(BaseModel):
             raise ValueError("executor_simulation must be a pandas DataFrame")
         return v
 
+    @property
+    def side(self) -> Optional[TradeType]:
+        return getattr(self.config, "side", getattr(self.config, "maker_side", None))
+
+    @property
+    def level_id(self) -> Optional[str]:
+        return getattr(self.config, "level_id", None)
+
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
         # Filter the DataFrame up to the specified timestamp
         df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
@@ -67,15 +83,95 @@ class ExecutorSimulation(BaseModel):
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
-            "level_id": self.config.level_id,
-            "side": self.config.side,
+            "level_id": self.level_id,
+            "side": self.side,
             "current_position_average_price": current_position_average_price
         }
 
 
+class ExecutorSimulationState:
+    """
+    Read-only view of an ExecutorSimulation laid out in a structured NumPy array, so the executor info at a given
+    timestamp is found with a binary search instead of filtering the simulation DataFrame.
+    """
+    STATE_FIELDS = ("timestamp", "net_pnl_pct", "net_pnl_quote", "cum_fees_quote", "filled_amount_quote", "close",
+                    "current_position_average_price")
+    STATE_DTYPE = np.dtype([(field, np.float64) for field in STATE_FIELDS])
+
+    def __init__(self, simulation: ExecutorSimulation):
+        df = simulation.executor_simulation
+        self.simulation = simulation
+        self.has_position_average_price = "current_position_average_price" in df.columns
+        self.states = np.empty(len(df), dtype=self.STATE_DTYPE)
+        for field in self.STATE_FIELDS:
+            if field == "current_position_average_price" and not self.has_position_average_price:
+                self.states[field] = np.nan
+            else:
+                self.states[field] = df[field].to_numpy(dtype=np.float64)
+        self.last_timestamp = self.states["timestamp"].max() if len(df) > 0 else np.nan
+
+    @property
+    def config(self):
+        return self.simulation.config
+
+    def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
+        config = self.simulation.config
+        index = int(np.searchsorted(self.states["timestamp"], timestamp, side="right"))
+        if index == 0:
+            return ExecutorInfo(
+                id=config.id,
+                timestamp=config.timestamp,
+                type=config.type,
+                status=RunnableStatus.TERMINATED,
+                config=config,
+                net_pnl_pct=Decimal(0),
+                net_pnl_quote=Decimal(0),
+                cum_fees_quote=Decimal(0),
+                filled_amount_quote=Decimal(0),
+                is_active=False,
+                is_trading=False,
+                custom_info={}
+            )
+
+        last_entry = self.states[index - 1]
+        is_active = last_entry["timestamp"] < self.last_timestamp
+        return ExecutorInfo(
+            id=config.id,
+            timestamp=config.timestamp,
+            type=config.type,
+            close_timestamp=None if is_active else float(last_entry["timestamp"]),
+            close_type=None if is_active else self.simulation.close_type,
+            status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+            config=config,
+            net_pnl_pct=Decimal(last_entry["net_pnl_pct"]),
+            net_pnl_quote=Decimal(last_entry["net_pnl_quote"]),
+            cum_fees_quote=Decimal(last_entry["cum_fees_quote"]),
+            filled_amount_quote=Decimal(last_entry["filled_amount_quote"]),
+            is_active=is_active,
+            is_trading=last_entry["filled_amount_quote"] > 0 and is_active,
+            custom_info={
+                "close_price": last_entry["close"],
+                "level_id": self.simulation.level_id,
+                "side": self.simulation.side,
+                "current_position_average_price":
+                    last_entry["current_position_average_price"] if self.has_position_average_price else None,
+            }
+        )
+
+
 class ExecutorSimulatorBase:
     """Base class for trading simulators."""
     def simulate(self, df: pd.DataFrame, config, trade_cost: float) -> ExecutorSimulation:
         """Simulates trading based on provided configuration and market data."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+    @staticmethod
+    def get_market_column(df: pd.DataFrame, market: ConnectorPair, column: str) -> np.ndarray:
+        """
+        Returns a price column of a market for the simulators that trade on two markets. The processed features can
+        carry the candles of each market as {column}_{connector_name}_{trading_pair}, e.g. close_binance_BTC-USDT,
+        otherwise the backtesting candles are used for both markets.
+        """
+        market_column = f"{column}_{market.connector_name}_{market.trading_pair}"
+        return df[market_column if market_column in df.columns else column].to_numpy(dtype=np.float64)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ArbitrageExecutorSimulator(ExecutorSimulatorBase):
+    """
+    Simulates an arbitrage executor buying and selling order_amount at the close of both markets on the first candle
+    where the spread between them, net of the trade cost of both legs, reaches min_profitability. The market prices are
+    read with get_market_column, so the features need the candles of both markets for any arbitrage to be found.
+    """
+
+    def simulate(self, df: pd.DataFrame, config: ArbitrageExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        buy_close = self.get_market_column(df, config.buying_market, "close")
+        sell_close = self.get_market_column(df, config.selling_market, "close")
+        order_amount = float(config.order_amount)
+
+        df_filtered = df.copy()
+        df_filtered['net_pnl_pct'] = 0.0
+        df_filtered['net_pnl_quote'] = 0.0
+        df_filtered['cum_fees_quote'] = 0.0
+        df_filtered['filled_amount_quote'] = 0.0
+
+        profitability = (sell_close - buy_close) / buy_close - 2 * trade_cost
+        profitable = profitability >= float(config.min_profitability)
+        if not profitable.any():
+            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+
+        fill_index = int(np.argmax(profitable))
+        filled_amount_quote = order_amount * (buy_close[fill_index] + sell_close[fill_index])
+        net_pnl_quote = order_amount * (sell_close[fill_index] - buy_close[fill_index]) - trade_cost * filled_amount_quote
+
+        df_filtered = df_filtered.iloc[:fill_index + 1].copy()
+        df_filtered.iloc[-1, df_filtered.columns.get_indexer(
+            ['net_pnl_pct', 'net_pnl_quote', 'cum_fees_quote', 'filled_amount_quote'])] = [
+            net_pnl_quote / filled_amount_quote, net_pnl_quote, trade_cost * filled_amount_quote, filled_amount_quote]
+        return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.COMPLETED)
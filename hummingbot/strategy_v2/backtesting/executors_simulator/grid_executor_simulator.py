@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class GridExecutorSimulator(ExecutorSimulatorBase):
+    """
+    Simulates a grid executor over the close prices of the candles.
+
+    The levels are built like GridExecutor does, using min_order_amount_quote as the minimum notional. Each level
+    toggles between waiting to open, when the close crosses the level price, and waiting to take profit, when the close
+    crosses the take profit price, so the state of all the levels on every candle is computed at once from the last
+    candle each crossing happened. Open orders are filled at their level price, or at the first close for the levels
+    already crossed when the grid starts, and close orders at their take profit price. max_open_orders,
+    max_orders_per_batch, order_frequency and activation_bounds are not simulated.
+    """
+
+    @staticmethod
+    def get_grid_levels(config: GridExecutorConfig):
+        """
+        Returns the level prices, the quote amount per level and the take profit of the grid.
+        """
+        start_price = float(config.start_price)
+        end_price = float(config.end_price)
+        min_quote_amount = float(config.min_order_amount_quote) * 1.05
+        grid_range = (end_price - start_price) / start_price
+        min_step_size = float(config.min_spread_between_orders)
+        total_amount_quote = float(config.total_amount_quote)
+        max_possible_levels = int(total_amount_quote / min_quote_amount)
+        if max_possible_levels == 0:
+            n_levels = 1
+            quote_amount_per_level = min_quote_amount
+        else:
+            n_levels = max(1, min(max_possible_levels, int(grid_range / min_step_size)))
+            quote_amount_per_level = max(min_quote_amount, total_amount_quote / n_levels)
+            n_levels = max(1, min(n_levels, int(total_amount_quote / quote_amount_per_level)))
+        if n_levels > 1:
+            prices = np.linspace(start_price, end_price, n_levels)
+            step = grid_range / (n_levels - 1)
+        else:
+            prices = np.array([(start_price + end_price) / 2])
+            step = grid_range
+        take_profit = float(config.triple_barrier_config.take_profit or step)
+        if config.coerce_tp_to_step:
+            take_profit = max(step, take_profit)
+        return prices, quote_amount_per_level, take_profit
+
+    def simulate(self, df: pd.DataFrame, config: GridExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        last_timestamp = df['timestamp'].max()
+        tl = config.triple_barrier_config.time_limit if config.triple_barrier_config.time_limit else None
+        tl_timestamp = config.timestamp + tl if tl else last_timestamp
+
+        df_filtered = df[df['timestamp'] <= tl_timestamp].copy()
+        df_filtered['net_pnl_pct'] = 0.0
+        df_filtered['net_pnl_quote'] = 0.0
+        df_filtered['cum_fees_quote'] = 0.0
+        df_filtered['filled_amount_quote'] = 0.0
+        df_filtered['current_position_average_price'] = np.nan
+        if df_filtered.empty:
+            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+
+        close = df_filtered['close'].to_numpy(dtype=np.float64)
+        prices, amount_quote, take_profit = self.get_grid_levels(config)
+        side_multiplier = 1 if config.side == TradeType.BUY else -1
+
+        # Levels x candles matrices with the last candle where each level crossed its open and take profit prices
+        candle_index = np.arange(len(close), dtype=np.int32)
+        if config.side == TradeType.BUY:
+            open_crossed = close[None, :] <= prices[:, None]
+            take_profit_crossed = close[None, :] >= prices[:, None] * (1 + take_profit)
+        else:
+            open_crossed = close[None, :] >= prices[:, None]
+            take_profit_crossed = close[None, :] <= prices[:, None] * (1 - take_profit)
+        last_open = np.maximum.accumulate(np.where(open_crossed, candle_index, -1), axis=1)
+        last_take_profit = np.maximum.accumulate(np.where(take_profit_crossed, candle_index, -1), axis=1)
+        holding = last_open > last_take_profit
+        previous_holding = np.zeros_like(holding)
+        previous_holding[:, 1:] = holding[:, :-1]
+        opened_levels = holding & ~previous_holding
+        completed_levels = previous_holding & ~holding
+
+        # Levels already crossed when the grid starts are placed at the current price, as GridExecutor does, the rest
+        # are filled at their price
+        start_price = np.minimum(prices, close[0]) if config.side == TradeType.BUY else np.maximum(prices, close[0])
+        first_cycle = holding[:, :1] & (np.cumsum(completed_levels, axis=1) == 0)
+        entry_price = np.where(first_cycle, start_price[:, None], prices[:, None])
+        take_profit_prices = prices * (1 + side_multiplier * take_profit)
+        previous_entry_price = np.ones_like(entry_price)
+        previous_entry_price[:, 1:] = entry_price[:, :-1]
+        close_order_quote = np.where(completed_levels, amount_quote * take_profit_prices[:, None] / previous_entry_price, 0)
+
+        # Position and realized metrics of every candle
+        position_size_quote = holding.sum(axis=0) * amount_quote
+        position_size_base = np.where(holding, amount_quote / entry_price, 0).sum(axis=0)
+        position_pnl_quote = side_multiplier * (close * position_size_base - position_size_quote)
+        position_fees_quote = trade_cost * position_size_quote
+        position_pnl_pct = np.divide(position_pnl_quote - position_fees_quote, position_size_quote,
+                                     out=np.zeros_like(close), where=position_size_quote > 0)
+        completed_open_quote = np.cumsum(completed_levels.sum(axis=0)) * amount_quote
+        completed_close_quote = np.cumsum(close_order_quote.sum(axis=0))
+        realized_pnl_quote = side_multiplier * (completed_close_quote - completed_open_quote)
+        matched_volume_quote = completed_open_quote + completed_close_quote
+        filled_amount_quote = np.cumsum(opened_levels.sum(axis=0)) * amount_quote + completed_close_quote
+        break_even_price = np.divide(position_size_quote, position_size_base, out=np.full_like(close, np.nan),
+                                     where=position_size_base > 0)
+
+        # Barriers in the priority order of GridExecutor.control_triple_barrier
+        barriers = []
+        if config.triple_barrier_config.stop_loss:
+            barriers.append((position_pnl_pct <= -float(config.triple_barrier_config.stop_loss), CloseType.STOP_LOSS))
+        limit_price = float(config.limit_price)
+        limit_price_condition = close <= limit_price if config.side == TradeType.BUY else close >= limit_price
+        barriers.append((limit_price_condition,
+                         CloseType.POSITION_HOLD if config.keep_position else CloseType.STOP_LOSS))
+        if config.triple_barrier_config.trailing_stop:
+            activation_pct = float(config.triple_barrier_config.trailing_stop.activation_price)
+            trailing_delta = float(config.triple_barrier_config.trailing_stop.trailing_delta)
+            activated = np.maximum.accumulate(position_pnl_pct > activation_pct)
+            trigger_pct = np.maximum.accumulate(np.where(activated, position_pnl_pct - trailing_delta, -np.inf))
+            barriers.append((activated & (position_pnl_pct < trigger_pct), CloseType.TRAILING_STOP))
+        take_profit_condition = close > float(config.end_price) if config.side == TradeType.BUY else close < float(config.start_price)
+        barriers.append((take_profit_condition, CloseType.TAKE_PROFIT))
+
+        close_index = len(close) - 1
+        close_type = CloseType.TIME_LIMIT
+        for condition, barrier_close_type in barriers:
+            barrier_index = int(condition.argmax()) if condition.any() else len(close)
+            if barrier_index < close_index or (barrier_index == close_index and close_type == CloseType.TIME_LIMIT):
+                close_index = barrier_index
+                close_type = barrier_close_type
+
+        # The open position is closed at market, unless it's kept when the limit price is reached
+        net_pnl_quote = realized_pnl_quote + position_pnl_quote - trade_cost * filled_amount_quote
+        if close_type == CloseType.POSITION_HOLD:
+            filled_amount_quote[close_index] = matched_volume_quote[close_index]
+            net_pnl_quote[close_index] = realized_pnl_quote[close_index] - trade_cost * matched_volume_quote[close_index]
+        else:
+            filled_amount_quote[close_index] += position_size_quote[close_index]
+            net_pnl_quote[close_index] -= trade_cost * position_size_quote[close_index]
+
+        df_filtered = df_filtered.iloc[:close_index + 1].copy()
+        filled_amount_quote = filled_amount_quote[:close_index + 1]
+        net_pnl_quote = net_pnl_quote[:close_index + 1]
+        df_filtered['filled_amount_quote'] = filled_amount_quote
+        df_filtered['net_pnl_quote'] = net_pnl_quote
+        df_filtered['cum_fees_quote'] = trade_cost * filled_amount_quote
+        df_filtered['net_pnl_pct'] = np.divide(net_pnl_quote, filled_amount_quote, out=np.zeros_like(net_pnl_quote),
+                                               where=filled_amount_quote > 0)
+        df_filtered['current_position_average_price'] = break_even_price[:close_index + 1]
+
+        return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=close_type)
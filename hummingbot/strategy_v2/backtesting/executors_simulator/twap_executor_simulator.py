@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TWAPExecutorSimulator(ExecutorSimulatorBase):
+    """
+    Simulates a TWAP executor placing one order every order_interval from the first candle.
+
+    In taker mode each order is filled at the close of the candle it is placed on. In maker mode the order is placed
+    limit_order_buffer away from that close, re-priced from the close every order_resubmission_time, and filled on the
+    first later candle whose low (buy) or high (sell) crosses it. The fills of all the orders are found at once on an
+    orders x candles matrix spanning total_duration after each order is placed, maker orders not filled in that window
+    are left unfilled.
+    """
+
+    def simulate(self, df: pd.DataFrame, config: TWAPExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        timestamps = df['timestamp'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        n_orders = config.number_of_orders
+        order_amount_quote = float(config.order_amount_quote)
+        side_multiplier = 1 if config.side == TradeType.BUY else -1
+
+        df_filtered = df.copy()
+        df_filtered['net_pnl_pct'] = 0.0
+        df_filtered['net_pnl_quote'] = 0.0
+        df_filtered['cum_fees_quote'] = 0.0
+        df_filtered['filled_amount_quote'] = 0.0
+        df_filtered['current_position_average_price'] = np.nan
+        if df_filtered.empty:
+            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+
+        order_timestamps = timestamps[0] + np.arange(n_orders) * config.order_interval
+        placement_index = np.searchsorted(timestamps, order_timestamps, side="left")
+        placed = placement_index < len(timestamps)
+        order_timestamps = order_timestamps[placed]
+        placement_index = placement_index[placed]
+
+        if config.is_maker:
+            fill_index, fill_price = self.get_maker_fills(df, config, order_timestamps, placement_index)
+        else:
+            fill_index, fill_price = placement_index, close[placement_index]
+        filled = fill_index >= 0
+        fill_index = fill_index[filled]
+        fill_price = fill_price[filled]
+
+        filled_amount_quote = np.cumsum(np.bincount(fill_index, minlength=len(close)) * order_amount_quote)
+        filled_amount_base = np.cumsum(np.bincount(fill_index, weights=order_amount_quote / fill_price,
+                                                   minlength=len(close)))
+        average_price = np.divide(filled_amount_quote, filled_amount_base, out=np.full_like(close, np.nan),
+                                  where=filled_amount_base > 0)
+        trade_pnl_quote = side_multiplier * (close * filled_amount_base - filled_amount_quote)
+        net_pnl_quote = trade_pnl_quote - trade_cost * filled_amount_quote
+
+        if filled.sum() == n_orders:
+            close_index = int(fill_index.max())
+            close_type = CloseType.COMPLETED
+        else:
+            close_index = len(close) - 1
+            close_type = CloseType.TIME_LIMIT
+
+        df_filtered = df_filtered.iloc[:close_index + 1].copy()
+        filled_amount_quote = filled_amount_quote[:close_index + 1]
+        net_pnl_quote = net_pnl_quote[:close_index + 1]
+        df_filtered['filled_amount_quote'] = filled_amount_quote
+        df_filtered['net_pnl_quote'] = net_pnl_quote
+        df_filtered['cum_fees_quote'] = trade_cost * filled_amount_quote
+        df_filtered['net_pnl_pct'] = np.divide(net_pnl_quote, filled_amount_quote, out=np.zeros_like(net_pnl_quote),
+                                               where=filled_amount_quote > 0)
+        df_filtered['current_position_average_price'] = average_price[:close_index + 1]
+
+        return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=close_type)
+
+    @staticmethod
+    def get_maker_fills(df: pd.DataFrame, config: TWAPExecutorConfig, order_timestamps: np.ndarray,
+                        placement_index: np.ndarray):
+        """
+        Returns the candle index where each maker order is filled, -1 if it isn't, and its fill price.
+        """
+        timestamps = df['timestamp'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        window_end = np.searchsorted(timestamps, order_timestamps[-1] + config.total_duration, side="right")
+        window = np.arange(window_end)
+        buffer = float(config.limit_order_buffer)
+
+        # Candle whose close prices the order resting on each candle, the order is re-priced every resubmission time
+        if config.order_resubmission_time:
+            previous_timestamps = timestamps[np.maximum(window - 1, 0)]
+            elapsed = np.maximum(previous_timestamps[None, :] - order_timestamps[:, None], 0)
+            refresh_timestamps = order_timestamps[:, None] + (
+                elapsed // config.order_resubmission_time) * config.order_resubmission_time
+            price_index = np.searchsorted(timestamps, refresh_timestamps, side="left")
+        else:
+            price_index = np.broadcast_to(placement_index[:, None], (len(placement_index), window_end))
+        if config.side == TradeType.BUY:
+            order_price = close[price_index] * (1 - buffer)
+            crossed = df['low'].to_numpy(dtype=np.float64)[None, :window_end] <= order_price
+        else:
+            order_price = close[price_index] * (1 + buffer)
+            crossed = df['high'].to_numpy(dtype=np.float64)[None, :window_end] >= order_price
+        crossed &= (window[None, :] > placement_index[:, None]) & (
+            timestamps[None, :window_end] <= order_timestamps[:, None] + config.total_duration)
+
+        has_fill = crossed.any(axis=1)
+        fill_index = np.where(has_fill, crossed.argmax(axis=1), -1)
+        fill_price = order_price[np.arange(len(fill_index)), np.maximum(fill_index, 0)]
+        return fill_index, fill_price
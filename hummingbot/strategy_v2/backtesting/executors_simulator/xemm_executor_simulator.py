@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulatorBase
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class XEMMExecutorSimulator(ExecutorSimulatorBase):
+    """
+    Simulates a cross exchange market making executor.
+
+    On every candle the maker order rests at target_profitability from the previous close of the taker market, as the
+    executor keeps it between min and max profitability. It is filled on the first candle whose low (buy) or high (sell)
+    of the maker market crosses it, and hedged at the close of the taker market on that candle. The market prices are
+    read with get_market_column, so without the candles of both markets in the features the spread captured is the
+    target profitability against the backtesting candles.
+    """
+
+    def simulate(self, df: pd.DataFrame, config: XEMMExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        if config.maker_side == TradeType.BUY:
+            maker_market, taker_market = config.buying_market, config.selling_market
+        else:
+            maker_market, taker_market = config.selling_market, config.buying_market
+        taker_close = self.get_market_column(df, taker_market, "close")
+        target_profitability = float(config.target_profitability)
+        order_amount = float(config.order_amount)
+
+        df_filtered = df.copy()
+        df_filtered['net_pnl_pct'] = 0.0
+        df_filtered['net_pnl_quote'] = 0.0
+        df_filtered['cum_fees_quote'] = 0.0
+        df_filtered['filled_amount_quote'] = 0.0
+
+        maker_price = np.full_like(taker_close, np.nan)
+        if config.maker_side == TradeType.BUY:
+            maker_price[1:] = taker_close[:-1] * (1 - target_profitability)
+            filled = self.get_market_column(df, maker_market, "low") <= maker_price
+        else:
+            maker_price[1:] = taker_close[:-1] * (1 + target_profitability)
+            filled = self.get_market_column(df, maker_market, "high") >= maker_price
+        if not filled.any():
+            return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.TIME_LIMIT)
+
+        fill_index = int(filled.argmax())
+        buy_price, sell_price = maker_price[fill_index], taker_close[fill_index]
+        if config.maker_side == TradeType.SELL:
+            buy_price, sell_price = sell_price, buy_price
+        filled_amount_quote = order_amount * (buy_price + sell_price)
+        net_pnl_quote = order_amount * (sell_price - buy_price) - trade_cost * filled_amount_quote
+
+        df_filtered = df_filtered.iloc[:fill_index + 1].copy()
+        df_filtered.iloc[-1, df_filtered.columns.get_indexer(
+            ['net_pnl_pct', 'net_pnl_quote', 'cum_fees_quote', 'filled_amount_quote'])] = [
+            net_pnl_quote / filled_amount_quote, net_pnl_quote, trade_cost * filled_amount_quote, filled_amount_quote]
+        return ExecutorSimulation(config=config, executor_simulation=df_filtered, close_type=CloseType.COMPLETED)
@@ -0,0 +1,452 @@
+import glob
+import itertools
+import json
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.connector.market_data_sink import MarketDataReader
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class OrderBookUpdates(NamedTuple):
+    """
+    Order book messages (snapshots or diffs) of one market laid out in flat arrays. The bids of message i are
+    bids[bid_offsets[i]:bid_offsets[i + 1]], as [price, amount] rows, and likewise for the asks. Consecutive messages
+    are contiguous, so any range of them is a single slice.
+    """
+    timestamps: np.ndarray
+    bids: np.ndarray
+    asks: np.ndarray
+    bid_offsets: np.ndarray
+    ask_offsets: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "OrderBookUpdates":
+        return cls.from_messages([])
+
+    @classmethod
+    def from_messages(cls, messages: List[dict]) -> "OrderBookUpdates":
+        """
+        Builds the arrays from messages with the layout written by download_order_book_and_trades.py:
+        {"ts": timestamp, "bids": [[price, amount], ...], "asks": [[price, amount], ...]}
+        Prices and amounts can be numbers or numeric strings. The messages are sorted by timestamp.
+        """
+        messages = sorted(messages, key=lambda message: message["ts"])
+        bid_counts = np.fromiter((len(message["bids"]) for message in messages), dtype=np.int64, count=len(messages))
+        ask_counts = np.fromiter((len(message["asks"]) for message in messages), dtype=np.int64, count=len(messages))
+        return cls(
+            timestamps=np.fromiter((message["ts"] for message in messages), dtype=np.float64, count=len(messages)),
+            bids=cls._rows_array(itertools.chain.from_iterable(message["bids"] for message in messages)),
+            asks=cls._rows_array(itertools.chain.from_iterable(message["asks"] for message in messages)),
+            bid_offsets=np.concatenate([[0], np.cumsum(bid_counts)]),
+            ask_offsets=np.concatenate([[0], np.cumsum(ask_counts)]),
+        )
+
+    @staticmethod
+    def _rows_array(rows) -> np.ndarray:
+        rows = list(rows)
+        try:
+            array = np.array(rows, dtype=np.float64)
+        except ValueError:
+            # Rows with extra fields of different lengths, e.g. the order count of some exchanges
+            array = np.array([row[:2] for row in rows], dtype=np.float64)
+        return np.ascontiguousarray(array.reshape(len(rows), -1)[:, :2]) if len(rows) > 0 else array.reshape(0, 2)
+
+    @classmethod
+    def concatenate(cls, updates: List["OrderBookUpdates"]) -> "OrderBookUpdates":
+        """
+        Joins the messages of several sources, sorted by timestamp.
+        """
+        updates = [update for update in updates if len(update) > 0]
+        if len(updates) == 0:
+            return cls.empty()
+        if len(updates) == 1:
+            return updates[0]
+        joined = cls(
+            timestamps=np.concatenate([update.timestamps for update in updates]),
+            bids=np.concatenate([update.bids for update in updates]),
+            asks=np.concatenate([update.asks for update in updates]),
+            bid_offsets=MarketDataReader.concatenate_offsets([update.bid_offsets for update in updates]),
+            ask_offsets=MarketDataReader.concatenate_offsets([update.ask_offsets for update in updates]),
+        )
+        return joined.take(np.argsort(joined.timestamps, kind="stable"))
+
+    def take(self, indices: np.ndarray) -> "OrderBookUpdates":
+        """
+        Returns the messages at the given indices, in that order.
+        """
+        bids, bid_offsets = self._take_rows(self.bids, self.bid_offsets, indices)
+        asks, ask_offsets = self._take_rows(self.asks, self.ask_offsets, indices)
+        return OrderBookUpdates(self.timestamps[indices], bids, asks, bid_offsets, ask_offsets)
+
+    @staticmethod
+    def _take_rows(rows: np.ndarray, offsets: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        starts = offsets[:-1][indices]
+        counts = np.diff(offsets)[indices]
+        new_offsets = np.concatenate([[0], np.cumsum(counts)])
+        row_indices = np.repeat(starts - new_offsets[:-1], counts) + np.arange(new_offsets[-1])
+        return rows[row_indices], new_offsets
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+class PublicTrades(NamedTuple):
+    """
+    Public trades of one market in columnar arrays. is_buy tells whether the taker was the buyer.
+    """
+    timestamps: np.ndarray
+    prices: np.ndarray
+    amounts: np.ndarray
+    is_buy: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "PublicTrades":
+        return cls.from_messages([])
+
+    @classmethod
+    def from_messages(cls, messages: List[dict]) -> "PublicTrades":
+        """
+        Builds the arrays from messages with the layout written by download_order_book_and_trades.py:
+        {"ts": timestamp, "price": price, "q_base": amount, "side": "buy" | "sell"}
+        """
+        messages = sorted(messages, key=lambda message: message["ts"])
+        count = len(messages)
+        return cls(
+            timestamps=np.fromiter((message["ts"] for message in messages), dtype=np.float64, count=count),
+            prices=np.fromiter((message["price"] for message in messages), dtype=np.float64, count=count),
+            amounts=np.fromiter((message["q_base"] for message in messages), dtype=np.float64, count=count),
+            is_buy=np.fromiter((message["side"] == "buy" for message in messages), dtype=np.bool_, count=count),
+        )
+
+    @classmethod
+    def concatenate(cls, trades: List["PublicTrades"]) -> "PublicTrades":
+        """
+        Joins the trades of several sources, sorted by timestamp.
+        """
+        trades = [market_trades for market_trades in trades if len(market_trades) > 0]
+        if len(trades) == 0:
+            return cls.empty()
+        if len(trades) == 1:
+            return trades[0]
+        joined = cls(*(np.concatenate(columns) for columns in zip(*trades)))
+        order = np.argsort(joined.timestamps, kind="stable")
+        return cls(*(column[order] for column in joined))
+
+    def slice(self, start: int, end: int) -> "PublicTrades":
+        return PublicTrades(self.timestamps[start:end], self.prices[start:end], self.amounts[start:end],
+                            self.is_buy[start:end])
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+class OrderBookReplayData(NamedTuple):
+    """
+    Recorded market data of one market: order book snapshots, order book diffs and public trades.
+    """
+    snapshots: OrderBookUpdates
+    diffs: OrderBookUpdates
+    trades: PublicTrades
+
+    @classmethod
+    def load(cls,
+             exchange: str,
+             trading_pair: str,
+             start_time: Optional[float] = None,
+             end_time: Optional[float] = None,
+             path: Optional[str] = None) -> "OrderBookReplayData":
+        """
+        Loads the files written by download_order_book_and_trades.py, named
+        {exchange}_{trading_pair}_{order_book_snapshots|order_book_diffs|trades}_{date}.txt, with one JSON message
+        per line, and the columnar files of the market data recorded by MarketDataSink. Both are read from the given
+        path, by default the text files from the data folder and the columnar files from data/market_data. The diff
+        files are optional, the script only records snapshots. When a time range is given, only the files dated within
+        it (one day of margin on each side, the dates are local ones) are read.
+        """
+        reader = MarketDataReader(path)
+        path = path or data_path()
+        return cls(
+            snapshots=OrderBookUpdates.concatenate([
+                OrderBookUpdates.from_messages(
+                    cls.read_messages(path, exchange, trading_pair, "order_book_snapshots", start_time, end_time)),
+                OrderBookUpdates(**reader.read_order_book_snapshots(exchange, trading_pair, start_time, end_time))]),
+            diffs=OrderBookUpdates.from_messages(
+                cls.read_messages(path, exchange, trading_pair, "order_book_diffs", start_time, end_time)),
+            trades=PublicTrades.concatenate([
+                PublicTrades.from_messages(
+                    cls.read_messages(path, exchange, trading_pair, "trades", start_time, end_time)),
+                PublicTrades(**reader.read_trades(exchange, trading_pair, start_time, end_time))]),
+        )
+
+    @staticmethod
+    def read_messages(path: str,
+                      exchange: str,
+                      trading_pair: str,
+                      source_type: str,
+                      start_time: Optional[float] = None,
+                      end_time: Optional[float] = None) -> List[dict]:
+        prefix = f"{exchange}_{trading_pair}_{source_type}_"
+        first_date = datetime.fromtimestamp(start_time) - timedelta(days=1) if start_time is not None else None
+        last_date = datetime.fromtimestamp(end_time) + timedelta(days=1) if end_time is not None else None
+        messages = []
+        for file_path in sorted(glob.glob(os.path.join(glob.escape(path), f"{glob.escape(prefix)}*.txt"))):
+            date = os.path.basename(file_path)[len(prefix):-len(".txt")]
+            if first_date is not None and date < first_date.strftime("%Y-%m-%d"):
+                continue
+            if last_date is not None and date > last_date.strftime("%Y-%m-%d"):
+                continue
+            with open(file_path, "r") as file:
+                # The script writes every batch with a leading line break, so the files have empty lines
+                messages.extend(json.loads(line) for line in file if not line.isspace())
+        return messages
+
+
+def get_best_price(order_book: OrderBook, is_buy: bool) -> float:
+    """
+    Returns the best ask for a buy, the best bid for a sell, or NaN if that side of the book is empty.
+    """
+    try:
+        return order_book.get_price(is_buy)
+    except EnvironmentError:
+        return float("nan")
+
+
+class OrderBookReplayFeed(PyTimeIterator):
+    """
+    Time iterator that replays recorded market data into OrderBook instances. On every tick, all the messages up to
+    the tick timestamp are applied: the last snapshot received since the previous tick, then the diffs that came after
+    it in a single apply_raw_diffs call, and the last public trade. The trades of the tick are kept for the matching
+    engine.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[Tuple[str, str], OrderBookReplayData] = {}
+        self._order_books: Dict[Tuple[str, str], OrderBook] = {}
+        self._positions: Dict[Tuple[str, str], List[int]] = {}
+        self._last_trades: Dict[Tuple[str, str], PublicTrades] = {}
+        self._update_ids: Dict[Tuple[str, str], int] = {}
+        self._events_processed = 0
+
+    @property
+    def markets(self) -> List[Tuple[str, str]]:
+        return list(self._data.keys())
+
+    @property
+    def events_processed(self) -> int:
+        """
+        Number of recorded messages (snapshots, diffs and trades) consumed so far.
+        """
+        return self._events_processed
+
+    def add_market(self, connector_name: str, trading_pair: str, data: OrderBookReplayData):
+        market = (connector_name, trading_pair)
+        self._data[market] = data
+        self._order_books[market] = OrderBook()
+        self._positions[market] = [0, 0, 0]
+        self._last_trades[market] = PublicTrades.empty()
+        self._update_ids[market] = 0
+
+    def get_order_book(self, connector_name: str, trading_pair: str) -> OrderBook:
+        return self._order_books[(connector_name, trading_pair)]
+
+    def get_last_trades(self, connector_name: str, trading_pair: str) -> PublicTrades:
+        """
+        Returns the public trades applied on the last tick.
+        """
+        return self._last_trades[(connector_name, trading_pair)]
+
+    def tick(self, timestamp: float):
+        for market, data in self._data.items():
+            self._replay_market(market, data, timestamp)
+
+    def _replay_market(self, market: Tuple[str, str], data: OrderBookReplayData, timestamp: float):
+        order_book = self._order_books[market]
+        positions = self._positions[market]
+        snapshot_position, diff_position, trade_position = positions
+
+        snapshots = data.snapshots
+        snapshot_end = int(np.searchsorted(snapshots.timestamps, timestamp, side="right"))
+        if snapshot_end > snapshot_position:
+            last_snapshot = snapshot_end - 1
+            self._update_ids[market] += 1
+            order_book.apply_raw_snapshot(
+                snapshots.bids[snapshots.bid_offsets[last_snapshot]:snapshots.bid_offsets[snapshot_end]],
+                snapshots.asks[snapshots.ask_offsets[last_snapshot]:snapshots.ask_offsets[snapshot_end]],
+                self._update_ids[market])
+            # The diffs received before the snapshot are already part of it
+            diff_position = max(diff_position, int(np.searchsorted(data.diffs.timestamps,
+                                                                   snapshots.timestamps[last_snapshot], side="left")))
+
+        diffs = data.diffs
+        diff_end = int(np.searchsorted(diffs.timestamps, timestamp, side="right"))
+        if diff_end > diff_position:
+            self._update_ids[market] += 1
+            order_book.apply_raw_diffs(
+                diffs.bids[diffs.bid_offsets[diff_position]:diffs.bid_offsets[diff_end]],
+                diffs.asks[diffs.ask_offsets[diff_position]:diffs.ask_offsets[diff_end]],
+                self._update_ids[market])
+        diff_position = max(diff_position, diff_end)
+
+        trades = data.trades
+        trade_end = int(np.searchsorted(trades.timestamps, timestamp, side="right"))
+        self._last_trades[market] = trades.slice(trade_position, trade_end)
+        if trade_end > trade_position:
+            last_trade = trade_end - 1
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=market[1],
+                timestamp=float(trades.timestamps[last_trade]),
+                type=TradeType.BUY if trades.is_buy[last_trade] else TradeType.SELL,
+                price=Decimal(float(trades.prices[last_trade])),
+                amount=Decimal(float(trades.amounts[last_trade])),
+            ))
+
+        self._events_processed += ((snapshot_end - positions[0]) + (diff_position - positions[1]) +
+                                   (trade_end - positions[2]))
+        positions[0], positions[1], positions[2] = snapshot_end, diff_position, trade_end
+
+
+class ReplayOrder:
+    """
+    Order placed on the matching engine. Limit orders keep the base amount resting ahead of them at their price level,
+    which is consumed by the public trades at that price before the order gets any fill.
+    """
+    __slots__ = ("order_id", "connector_name", "trading_pair", "is_buy", "price", "amount", "executed_amount",
+                 "executed_amount_quote", "queue_ahead", "is_cancelled")
+
+    def __init__(self, order_id: str, connector_name: str, trading_pair: str, is_buy: bool, price: float,
+                 amount: float):
+        self.order_id = order_id
+        self.connector_name = connector_name
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.amount = amount
+        self.executed_amount = 0.0
+        self.executed_amount_quote = 0.0
+        self.queue_ahead = 0.0
+        self.is_cancelled = False
+
+    @property
+    def remaining_amount(self) -> float:
+        return self.amount - self.executed_amount
+
+    @property
+    def is_filled(self) -> bool:
+        return self.remaining_amount <= 0
+
+    @property
+    def is_open(self) -> bool:
+        return not self.is_cancelled and not self.is_filled
+
+    @property
+    def average_executed_price(self) -> float:
+        return self.executed_amount_quote / self.executed_amount if self.executed_amount > 0 else float("nan")
+
+    def fill(self, amount: float, price: float):
+        amount = min(amount, self.remaining_amount)
+        if amount > 0:
+            self.executed_amount += amount
+            self.executed_amount_quote += amount * price
+
+
+class OrderBookReplayMatchingEngine(PyTimeIterator):
+    """
+    Fills orders against the books of an OrderBookReplayFeed, with the matching rules of PaperTradeExchange:
+    - a limit order is filled at its price once the opposite side of the book crosses it
+    - a limit order is filled at its price when a public trade prints through it
+    - a market order walks the book and is filled at the volume weighted average price
+    On top of that, a limit order joins the back of the queue of its price level, so the taker trades at exactly its
+    price fill it only after the base amount that was ahead of it is consumed. Cancellations at that level shrink the
+    queue ahead. The orders don't change the replayed books, so the simulated trading has no market impact.
+    Added to the clock after the feed, it matches on every tick once the books are updated.
+    """
+
+    def __init__(self, feed: OrderBookReplayFeed):
+        super().__init__()
+        self._feed = feed
+        self._open_orders: Dict[Tuple[str, str], List[ReplayOrder]] = {}
+        self._order_ids = itertools.count(1)
+
+    def open_orders(self, connector_name: str, trading_pair: str) -> List[ReplayOrder]:
+        return self._open_orders.get((connector_name, trading_pair), [])
+
+    def place_limit_order(self, connector_name: str, trading_pair: str, is_buy: bool, price: float,
+                          amount: float) -> ReplayOrder:
+        order = ReplayOrder(f"replay-{next(self._order_ids)}", connector_name, trading_pair, is_buy, price, amount)
+        order.queue_ahead = self.get_volume_at_price(self._feed.get_order_book(connector_name, trading_pair),
+                                                     is_buy, price)
+        self._open_orders.setdefault((connector_name, trading_pair), []).append(order)
+        return order
+
+    def execute_market_order(self, connector_name: str, trading_pair: str, is_buy: bool,
+                             amount: float) -> ReplayOrder:
+        order_book = self._feed.get_order_book(connector_name, trading_pair)
+        result = order_book.get_vwap_for_volume(is_buy, amount)
+        price = result.result_price
+        if np.isnan(price) and result.result_volume > 0:
+            # Not enough recorded depth, the whole amount is filled at the price of the available depth
+            price = order_book.get_vwap_for_volume(is_buy, result.result_volume).result_price
+        order = ReplayOrder(f"replay-{next(self._order_ids)}", connector_name, trading_pair, is_buy, price, amount)
+        if not np.isnan(price):
+            order.fill(amount, price)
+        return order
+
+    def cancel_order(self, order: ReplayOrder):
+        order.is_cancelled = True
+        orders = self._open_orders.get((order.connector_name, order.trading_pair), [])
+        if order in orders:
+            orders.remove(order)
+
+    @staticmethod
+    def crosses_book(order_book: OrderBook, is_buy: bool, price: float) -> bool:
+        return price >= get_best_price(order_book, True) if is_buy else price <= get_best_price(order_book, False)
+
+    @staticmethod
+    def get_volume_at_price(order_book: OrderBook, is_buy: bool, price: float) -> float:
+        """
+        Base amount resting on the book at exactly the given price, on the side of an order of the given direction.
+        """
+        if is_buy:
+            return (order_book.get_volume_for_price(False, price).result_volume -
+                    order_book.get_volume_for_price(False, np.nextafter(price, np.inf)).result_volume)
+        return (order_book.get_volume_for_price(True, price).result_volume -
+                order_book.get_volume_for_price(True, np.nextafter(price, -np.inf)).result_volume)
+
+    def tick(self, timestamp: float):
+        for (connector_name, trading_pair), orders in self._open_orders.items():
+            if len(orders) > 0:
+                self.match_orders(orders, self._feed.get_order_book(connector_name, trading_pair),
+                                  self._feed.get_last_trades(connector_name, trading_pair))
+                orders[:] = [order for order in orders if order.is_open]
+
+    def match_orders(self, orders: List[ReplayOrder], order_book: OrderBook, trades: PublicTrades):
+        for order in orders:
+            if self.crosses_book(order_book, order.is_buy, order.price):
+                order.fill(order.remaining_amount, order.price)
+                continue
+            if len(trades) > 0:
+                if order.is_buy:
+                    crossed = (trades.prices < order.price).any()
+                    at_price = (trades.prices == order.price) & ~trades.is_buy
+                else:
+                    crossed = (trades.prices > order.price).any()
+                    at_price = (trades.prices == order.price) & trades.is_buy
+                if crossed:
+                    order.fill(order.remaining_amount, order.price)
+                    continue
+                traded_amount = float(trades.amounts[at_price].sum())
+                if traded_amount > 0:
+                    order.fill(traded_amount - order.queue_ahead, order.price)
+                    order.queue_ahead = max(order.queue_ahead - traded_amount, 0.0)
+            order.queue_ahead = min(order.queue_ahead, self.get_volume_at_price(order_book, order.is_buy,
+                                                                                order.price))
@@ -0,0 +1,362 @@
+import logging
+import math
+from decimal import Decimal
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.order_book_replay import (
+    OrderBookReplayMatchingEngine,
+    ReplayOrder,
+    get_best_price,
+)
+from hummingbot.strategy_v2.backtesting.order_book_replay_data_provider import OrderBookReplayDataProvider
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBookExecutorSimulation:
+    """
+    Runs a position or DCA executor on the order book replay, tick by tick. The entry orders are placed on the
+    matching engine, and once there is a position the barriers are checked against the best price of the closing side,
+    as the executors do. A limit take profit rests on the matching engine, the other barriers close the position with a
+    market order that walks the book.
+    """
+
+    def __init__(self,
+                 config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                 matching_engine: OrderBookReplayMatchingEngine,
+                 data_provider: OrderBookReplayDataProvider,
+                 trade_cost: float):
+        self.config = config
+        self.matching_engine = matching_engine
+        self.order_book = data_provider.get_order_book(config.connector_name, config.trading_pair)
+        self.trade_cost = trade_cost
+        self.is_buy = config.side == TradeType.BUY
+        self.close_type: Optional[CloseType] = None
+        self.close_timestamp: Optional[float] = None
+        self.entry_orders: List[ReplayOrder] = []
+        self.exit_orders: List[ReplayOrder] = []
+        self.take_profit_order: Optional[ReplayOrder] = None
+        self.pending_taker_levels: List[Tuple[float, float]] = []
+        self.trailing_stop_trigger_pct: Optional[float] = None
+
+        if isinstance(config, DCAExecutorConfig):
+            self.take_profit = config.take_profit
+            self.stop_loss = config.stop_loss
+            self.time_limit = config.time_limit
+            self.trailing_stop = config.trailing_stop
+            self.take_profit_order_type = OrderType.MARKET
+            levels = [(float(price), float(amount_quote / price))
+                      for price, amount_quote in zip(config.prices, config.amounts_quote)]
+            if config.mode == DCAMode.TAKER:
+                self.pending_taker_levels = levels
+            else:
+                for price, amount in levels:
+                    self.place_entry_order(OrderType.LIMIT, price, amount)
+        else:
+            triple_barrier_config = config.triple_barrier_config
+            self.take_profit = triple_barrier_config.take_profit
+            self.stop_loss = triple_barrier_config.stop_loss
+            self.time_limit = triple_barrier_config.time_limit
+            self.trailing_stop = triple_barrier_config.trailing_stop
+            self.take_profit_order_type = triple_barrier_config.take_profit_order_type
+            price = float(config.entry_price) if config.entry_price is not None else get_best_price(self.order_book,
+                                                                                                    self.is_buy)
+            self.place_entry_order(triple_barrier_config.open_order_type, price, float(config.amount))
+
+    @property
+    def is_done(self) -> bool:
+        return self.close_type is not None
+
+    @property
+    def entry_amount(self) -> float:
+        return sum(order.executed_amount for order in self.entry_orders)
+
+    @property
+    def entry_amount_quote(self) -> float:
+        return sum(order.executed_amount_quote for order in self.entry_orders)
+
+    @property
+    def exit_amount(self) -> float:
+        return sum(order.executed_amount for order in self.exit_orders)
+
+    @property
+    def exit_amount_quote(self) -> float:
+        return sum(order.executed_amount_quote for order in self.exit_orders)
+
+    @property
+    def position_amount(self) -> float:
+        return self.entry_amount - self.exit_amount
+
+    @property
+    def current_market_price(self) -> float:
+        return get_best_price(self.order_book, not self.is_buy)
+
+    def place_entry_order(self, order_type: OrderType, price: float, amount: float):
+        if order_type == OrderType.MARKET:
+            order = self.matching_engine.execute_market_order(self.config.connector_name, self.config.trading_pair,
+                                                              self.is_buy, amount)
+        else:
+            if order_type == OrderType.LIMIT_MAKER:
+                # Like the position executor, a maker order is never placed through the other side of the book
+                best_price = get_best_price(self.order_book, not self.is_buy)
+                price = min(price, best_price) if self.is_buy else max(price, best_price)
+            order = self.matching_engine.place_limit_order(self.config.connector_name, self.config.trading_pair,
+                                                           self.is_buy, price, amount)
+        self.entry_orders.append(order)
+
+    def update(self, timestamp: float):
+        if self.is_done:
+            return
+        self.execute_taker_levels()
+        if self.take_profit_order is not None and self.take_profit_order.is_filled:
+            self.stop(timestamp, CloseType.TAKE_PROFIT)
+            return
+        if self.position_amount > 0:
+            if self.take_profit is not None and self.take_profit_order_type != OrderType.MARKET:
+                self.update_take_profit_order()
+            close_type = self.get_barrier_close_type()
+            if close_type is not None:
+                self.stop(timestamp, close_type)
+                return
+        if self.time_limit is not None and timestamp >= self.config.timestamp + self.time_limit:
+            self.stop(timestamp, CloseType.TIME_LIMIT)
+
+    def execute_taker_levels(self):
+        market_price = get_best_price(self.order_book, self.is_buy)
+        for price, amount in list(self.pending_taker_levels):
+            if (market_price <= price) if self.is_buy else (market_price >= price):
+                self.place_entry_order(OrderType.MARKET, price, amount)
+                self.pending_taker_levels.remove((price, amount))
+
+    def update_take_profit_order(self):
+        position_amount = self.position_amount
+        if self.take_profit_order is not None and math.isclose(self.take_profit_order.remaining_amount, position_amount,
+                                                               rel_tol=1e-9):
+            return
+        if self.take_profit_order is not None:
+            self.matching_engine.cancel_order(self.take_profit_order)
+        average_price = self.entry_amount_quote / self.entry_amount
+        take_profit = float(self.take_profit)
+        price = average_price * (1 + take_profit) if self.is_buy else average_price * (1 - take_profit)
+        self.take_profit_order = self.matching_engine.place_limit_order(
+            self.config.connector_name, self.config.trading_pair, not self.is_buy, price, position_amount)
+        self.exit_orders.append(self.take_profit_order)
+
+    def get_barrier_close_type(self) -> Optional[CloseType]:
+        average_price = self.entry_amount_quote / self.entry_amount
+        pnl_pct = self.current_market_price / average_price - 1
+        if not self.is_buy:
+            pnl_pct = -pnl_pct
+        if self.stop_loss is not None and pnl_pct <= -float(self.stop_loss):
+            return CloseType.STOP_LOSS
+        if self.take_profit is not None and self.take_profit_order_type == OrderType.MARKET and \
+                pnl_pct >= float(self.take_profit):
+            return CloseType.TAKE_PROFIT
+        if self.trailing_stop is not None:
+            if self.trailing_stop_trigger_pct is None:
+                if pnl_pct > float(self.trailing_stop.activation_price):
+                    self.trailing_stop_trigger_pct = pnl_pct - float(self.trailing_stop.trailing_delta)
+            elif pnl_pct < self.trailing_stop_trigger_pct:
+                return CloseType.TRAILING_STOP
+            else:
+                self.trailing_stop_trigger_pct = max(self.trailing_stop_trigger_pct,
+                                                     pnl_pct - float(self.trailing_stop.trailing_delta))
+        return None
+
+    def stop(self, timestamp: float, close_type: CloseType):
+        """
+        Cancels the open orders and closes the position at market.
+        """
+        for order in self.entry_orders + self.exit_orders:
+            if order.is_open:
+                self.matching_engine.cancel_order(order)
+        self.pending_taker_levels = []
+        position_amount = self.position_amount
+        if position_amount > 0:
+            self.exit_orders.append(self.matching_engine.execute_market_order(
+                self.config.connector_name, self.config.trading_pair, not self.is_buy, position_amount))
+        self.close_type = close_type
+        self.close_timestamp = timestamp
+
+    def get_executor_info(self) -> ExecutorInfo:
+        entry_amount = self.entry_amount
+        entry_amount_quote = self.entry_amount_quote
+        exit_amount_quote = self.exit_amount_quote
+        position_amount = entry_amount - self.exit_amount
+        close_price = self.current_market_price
+        pnl_quote = exit_amount_quote - entry_amount_quote
+        if position_amount > 0:
+            pnl_quote += position_amount * close_price
+        if not self.is_buy:
+            pnl_quote = -pnl_quote
+        filled_amount_quote = entry_amount_quote + exit_amount_quote
+        cum_fees_quote = self.trade_cost * filled_amount_quote
+        net_pnl_quote = pnl_quote - cum_fees_quote if entry_amount > 0 else 0.0
+        return ExecutorInfo(
+            id=self.config.id,
+            timestamp=self.config.timestamp,
+            type=self.config.type,
+            close_timestamp=self.close_timestamp,
+            close_type=self.close_type,
+            status=RunnableStatus.TERMINATED if self.is_done else RunnableStatus.RUNNING,
+            config=self.config,
+            net_pnl_pct=Decimal(net_pnl_quote / entry_amount_quote if entry_amount_quote > 0 else 0.0),
+            net_pnl_quote=Decimal(net_pnl_quote),
+            cum_fees_quote=Decimal(cum_fees_quote),
+            filled_amount_quote=Decimal(filled_amount_quote),
+            is_active=not self.is_done,
+            is_trading=entry_amount > 0 and not self.is_done,
+            custom_info={
+                "close_price": close_price,
+                "level_id": self.config.level_id,
+                "side": self.config.side,
+                "current_position_average_price": entry_amount_quote / entry_amount if entry_amount > 0 else None,
+            }
+        )
+
+
+class OrderBookReplayBacktestingEngine(BacktestingEngineBase):
+    """
+    Backtesting engine that replays recorded order book snapshots, diffs and public trades instead of candles, so the
+    market making controllers are backtested with queue position, spread capture and taker slippage. The recorded
+    data is replayed into OrderBook instances by a feed on a backtesting Clock, which also ticks a matching engine with
+    the PaperTradeExchange matching rules. The controller runs on every tick with the same MarketDataProvider
+    interface, and its position and DCA executors are simulated with orders on the matching engine.
+    """
+
+    def __init__(self, replay_data_path: Optional[str] = None):
+        super().__init__()
+        self.backtesting_data_provider = OrderBookReplayDataProvider(connectors={},
+                                                                     replay_data_path=replay_data_path)
+        self.matching_engine = OrderBookReplayMatchingEngine(self.backtesting_data_provider.order_book_feed)
+
+    async def run_backtesting(self,
+                              controller_config: ControllerConfigBase,
+                              start: int, end: int,
+                              backtesting_resolution: str = "1s",
+                              trade_cost=0.0006):
+        controller_class = controller_config.get_controller_class()
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+        self.backtesting_data_provider.initialize_order_book_replay(controller_config.connector_name,
+                                                                    controller_config.trading_pair)
+        self.controller = controller_class(config=controller_config,
+                                           market_data_provider=self.backtesting_data_provider,
+                                           actions_queue=None)
+        self.backtesting_resolution = backtesting_resolution
+        await self.initialize_backtesting_data_provider()
+        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        return {
+            "executors": executors_info,
+            "results": results,
+            "processed_data": self.controller.processed_data,
+        }
+
+    async def initialize_backtesting_data_provider(self):
+        for config in self.controller.config.candles_config:
+            await self.controller.market_data_provider.initialize_candles_feed(config)
+
+    async def simulate_execution(self, trade_cost: float) -> list:
+        """
+        Replays the market data with a tick every backtesting resolution, running the controller and the executors on
+        each tick once the order book of the controller market has both sides.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        data_provider = self.controller.market_data_provider
+        tick_size = CandlesBase.interval_to_seconds[self.backtesting_resolution]
+        clock = Clock(ClockMode.BACKTEST, tick_size=tick_size, start_time=data_provider.start_time,
+                      end_time=data_provider.end_time)
+        clock.add_iterator(data_provider.order_book_feed)
+        clock.add_iterator(self.matching_engine)
+        order_book = data_provider.get_order_book(self.controller.config.connector_name,
+                                                  self.controller.config.trading_pair)
+        self.active_executor_simulations: List[OrderBookExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        for timestamp in np.arange(data_provider.start_time + tick_size, data_provider.end_time + tick_size / 2,
+                                   tick_size).tolist():
+            clock.backtest_til(timestamp)
+            if np.isnan(get_best_price(order_book, True)) or np.isnan(get_best_price(order_book, False)):
+                continue
+            await self.update_state(timestamp)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.create_executor_simulation(action.executor_config, trade_cost)
+                    if executor_simulation is not None:
+                        self.active_executor_simulations.append(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, timestamp)
+        # Like stopping the strategy, the executors still running at the end of the replay are early stopped
+        for executor_simulation in self.active_executor_simulations:
+            executor_simulation.stop(data_provider.time(), CloseType.EARLY_STOP)
+        self.update_executors_info(data_provider.time())
+        return self.controller.executors_info
+
+    async def update_state(self, timestamp: float):
+        self.controller.market_data_provider._time = timestamp
+        for executor_simulation in self.active_executor_simulations:
+            executor_simulation.update(timestamp)
+        await self.controller.update_processed_data()
+        self.update_executors_info(timestamp)
+
+    def update_executors_info(self, timestamp: float):
+        active_executors_info = []
+        active_executor_simulations = []
+        for executor_simulation in self.active_executor_simulations:
+            executor_info = executor_simulation.get_executor_info()
+            if executor_simulation.is_done:
+                self.stopped_executors_info.append(executor_info)
+            else:
+                active_executors_info.append(executor_info)
+                active_executor_simulations.append(executor_simulation)
+        self.active_executor_simulations = active_executor_simulations
+        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+
+    def create_executor_simulation(self,
+                                   config: Union[PositionExecutorConfig, DCAExecutorConfig],
+                                   trade_cost: float) -> Optional[OrderBookExecutorSimulation]:
+        """
+        Starts the simulation of an executor on the order book replay.
+
+        Args:
+            config: The configuration of the executor.
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            OrderBookExecutorSimulation: The running simulation, or None if the executor type is not supported.
+        """
+        if isinstance(config, (PositionExecutorConfig, DCAExecutorConfig)):
+            return OrderBookExecutorSimulation(config, self.matching_engine, self.controller.market_data_provider,
+                                               trade_cost)
+        logger.warning(f"The order book replay doesn't simulate {config.type} executors, skipping it.")
+        return None
+
+    def handle_stop_action(self, action: StopExecutorAction, timestamp: float):
+        """
+        Stops an executor, cancelling its orders and closing its position at market.
+
+        Args:
+            action (StopExecutorAction): The action indicating which executor to stop.
+            timestamp (float): The current timestamp.
+        """
+        for executor_simulation in self.active_executor_simulations:
+            if executor_simulation.config.id == action.executor_id and not executor_simulation.is_done:
+                executor_simulation.stop(timestamp, CloseType.EARLY_STOP)
@@ -0,0 +1,81 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.order_book_replay import OrderBookReplayData, OrderBookReplayFeed
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+
+
+class OrderBookReplayDataProvider(BacktestingDataProvider):
+    """
+    Backtesting data provider that serves the order books replayed by an OrderBookReplayFeed, so the controllers get
+    prices and order book queries from the recorded market data as they would from the connectors. The candles are
+    cut at the current backtesting time.
+    """
+
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_cache: Optional[CandlesCache] = None,
+                 trading_rules_cache_dir: Optional[str] = None, replay_data_path: Optional[str] = None):
+        """
+        :param replay_data_path: directory of the files written by download_order_book_and_trades.py, data_path() by
+        default.
+        """
+        super().__init__(connectors, candles_cache=candles_cache, trading_rules_cache_dir=trading_rules_cache_dir)
+        self.replay_data_path = replay_data_path
+        self.order_book_feed = OrderBookReplayFeed()
+
+    def initialize_order_book_replay(self, connector_name: str, trading_pair: str,
+                                     data: Optional[OrderBookReplayData] = None):
+        """
+        Adds a market to the replay, loading its recorded data for the backtesting time range unless it's given.
+        """
+        if (connector_name, trading_pair) in self.order_book_feed.markets:
+            return
+        if data is None:
+            data = OrderBookReplayData.load(connector_name, trading_pair, self.start_time, self.end_time,
+                                            path=self.replay_data_path)
+        self.order_book_feed.add_market(connector_name, trading_pair, data)
+
+    def initialize_rate_sources(self, connector_pairs: List[ConnectorPair]):
+        """
+        The prices of the replayed markets come from their order books, so there are no rate sources to initialize.
+        """
+        pass
+
+    def get_order_book(self, connector_name: str, trading_pair: str) -> OrderBook:
+        return self.order_book_feed.get_order_book(connector_name, trading_pair)
+
+    def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
+        """
+        Retrieves the price for a trading pair from its replayed order book based on the price type.
+        :param connector_name: str
+        :param trading_pair: str
+        :param price_type: PriceType
+        :return: Price.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        if price_type == PriceType.BestBid:
+            return Decimal(order_book.get_price(False))
+        elif price_type == PriceType.BestAsk:
+            return Decimal(order_book.get_price(True))
+        elif price_type == PriceType.LastTrade:
+            return Decimal(order_book.last_trade_price)
+        return (Decimal(order_book.get_price(False)) + Decimal(order_book.get_price(True))) / Decimal("2")
+
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+        """
+        Retrieves the candles closed at the current backtesting time, so the controllers don't see the close of the
+        candle in progress.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param max_records: int
+        :return: Candles dataframe.
+        """
+        candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
+        last_open_time = self._time - CandlesBase.interval_to_seconds[interval]
+        return candles_df[candles_df["timestamp"] <= last_open_time].iloc[-max_records:]
@@ -0,0 +1,211 @@
+import asyncio
+import itertools
+import logging
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.client import settings
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.vectorized_backtesting_engine import VectorizedBacktestingEngine
+
+logger = logging.getLogger(__name__)
+
+# Engine built once per worker process by _init_sweep_worker and reused for every config the worker runs
+_sweep_engine: Optional[BacktestingEngineBase] = None
+_sweep_settings: Dict[str, Any] = {}
+
+
+class ParameterSweep:
+    """
+    Runs the backtest of many variations of a controller config and collects their summaries in a DataFrame.
+
+    The candles and trading rules are loaded once in the calling process. The candles are written column by column to
+    memory-mapped .npy files that the worker processes map read-only, so each worker builds its market data without
+    downloading or unpickling it again. Every config is run with random and numpy.random seeded from the sweep seed and
+    the config position, so the results don't depend on the number of processes or the order they finish in.
+    """
+
+    def __init__(self,
+                 engine_class: Type[BacktestingEngineBase] = VectorizedBacktestingEngine,
+                 controllers_module: str = settings.CONTROLLERS_MODULE):
+        self.engine_class = engine_class
+        self.controllers_module = controllers_module
+
+    @staticmethod
+    def grid(base_config: Dict, param_grid: Dict[str, Sequence]) -> List[Dict]:
+        """
+        Builds a config for every combination of the parameter values.
+
+        :param base_config: config dict with the values shared by all the variations.
+        :param param_grid: candidate values for each parameter to vary.
+        :return: list of config dicts.
+        """
+        keys = list(param_grid.keys())
+        return [{**base_config, **dict(zip(keys, values))}
+                for values in itertools.product(*(param_grid[key] for key in keys))]
+
+    @staticmethod
+    def random_sample(base_config: Dict, param_space: Dict[str, Sequence], n_samples: int, seed: int = 0) -> List[Dict]:
+        """
+        Builds n_samples configs picking each parameter value at random from its candidates.
+
+        :param base_config: config dict with the values shared by all the variations.
+        :param param_space: candidate values for each parameter to vary.
+        :param n_samples: number of configs to build.
+        :param seed: seed of the sampling, the same seed always returns the same configs.
+        :return: list of config dicts.
+        """
+        rng = random.Random(seed)
+        return [{**base_config, **{key: rng.choice(list(values)) for key, values in param_space.items()}}
+                for _ in range(n_samples)]
+
+    async def run(self,
+                  configs: List[Dict],
+                  start: int, end: int,
+                  backtesting_resolution: str = "1m",
+                  trade_cost: float = 0.0006,
+                  processes: Optional[int] = None,
+                  seed: int = 0,
+                  progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
+        """
+        Backtests every config and returns one row per config with the parameters that vary across the sweep and the
+        output of summarize_results.
+
+        :param configs: controller config dicts, e.g. built with grid or random_sample.
+        :param start: start timestamp of the backtest.
+        :param end: end timestamp of the backtest.
+        :param backtesting_resolution: interval of the candles used to simulate the executors.
+        :param trade_cost: the cost per trade.
+        :param processes: number of worker processes, defaults to the number of CPUs. With 1 the configs are run in
+        the calling process.
+        :param seed: base seed of each backtest.
+        :param progress_callback: called with the number of finished configs and the total after each config.
+        :return: results DataFrame ordered as configs.
+        """
+        processes = processes or os.cpu_count() or 1
+        engine = self.engine_class()
+        await self.load_market_data(engine, configs, start, end, backtesting_resolution)
+        run_settings = {"start": start, "end": end, "backtesting_resolution": backtesting_resolution,
+                        "trade_cost": trade_cost, "seed": seed, "controllers_module": self.controllers_module}
+        tasks = list(enumerate(configs))
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        completed = 0
+
+        def report_progress(index: int, result: Dict):
+            nonlocal completed
+            results[index] = result
+            completed += 1
+            if progress_callback is not None:
+                progress_callback(completed, len(tasks))
+            logger.info(f"Parameter sweep progress: {completed}/{len(tasks)} configs backtested.")
+
+        if processes == 1:
+            for index, config in tasks:
+                report_progress(index, await _run_sweep_task_async(engine, index, config, run_settings))
+        else:
+            with tempfile.TemporaryDirectory() as data_dir:
+                candles_files = self.dump_candles(engine.backtesting_data_provider.candles_feeds, data_dir)
+                trading_rules = engine.backtesting_data_provider.trading_rules
+                loop = asyncio.get_running_loop()
+                with ProcessPoolExecutor(max_workers=min(processes, len(tasks)) or 1,
+                                         initializer=_init_sweep_worker,
+                                         initargs=(self.engine_class, candles_files, trading_rules,
+                                                   run_settings)) as pool:
+                    futures = [loop.run_in_executor(pool, _run_sweep_task, index, config) for index, config in tasks]
+                    for future in asyncio.as_completed(futures):
+                        index, result = await future
+                        report_progress(index, result)
+        return self.build_results_df(configs, results)
+
+    async def load_market_data(self, engine: BacktestingEngineBase, configs: List[Dict], start: int, end: int,
+                               backtesting_resolution: str):
+        """
+        Loads into the engine's data provider the candles and trading rules required by all the configs.
+        """
+        provider = engine.backtesting_data_provider
+        provider.update_backtesting_time(start, end)
+        for config_data in configs:
+            controller_config = engine.get_controller_config_instance_from_dict(config_data, self.controllers_module)
+            await provider.initialize_trading_rules(controller_config.connector_name)
+            await provider.initialize_candles_feed(CandlesConfig(
+                connector=controller_config.connector_name,
+                trading_pair=controller_config.trading_pair,
+                interval=backtesting_resolution
+            ))
+            for candles_config in controller_config.candles_config:
+                await provider.initialize_candles_feed(candles_config)
+
+    @staticmethod
+    def dump_candles(candles_feeds: Dict[str, pd.DataFrame], data_dir: str) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Writes every candles column to its own .npy file, keeping the column dtype.
+
+        :return: the (column, file path) pairs of each candles feed key.
+        """
+        candles_files = {}
+        for feed_index, (key, candles_df) in enumerate(candles_feeds.items()):
+            columns = []
+            for column_index, column in enumerate(candles_df.columns):
+                path = os.path.join(data_dir, f"{feed_index}_{column_index}.npy")
+                np.save(path, candles_df[column].to_numpy(), allow_pickle=False)
+                columns.append((column, path))
+            candles_files[key] = columns
+        return candles_files
+
+    @staticmethod
+    def load_candles(candles_files: Dict[str, List[Tuple[str, str]]]) -> Dict[str, pd.DataFrame]:
+        """
+        Maps read-only the candles written by dump_candles.
+        """
+        return {key: pd.DataFrame({column: np.load(path, mmap_mode="r") for column, path in columns}, copy=False)
+                for key, columns in candles_files.items()}
+
+    @staticmethod
+    def build_results_df(configs: List[Dict], results: List[Dict]) -> pd.DataFrame:
+        varying_keys = [key for key in dict.fromkeys(itertools.chain.from_iterable(configs))
+                        if any(config.get(key) != configs[0].get(key) for config in configs)]
+        rows = [{**{key: config.get(key) for key in varying_keys}, **result}
+                for config, result in zip(configs, results)]
+        return pd.DataFrame(rows)
+
+
+def _init_sweep_worker(engine_class: Type[BacktestingEngineBase],
+                       candles_files: Dict[str, List[Tuple[str, str]]],
+                       trading_rules: Dict,
+                       run_settings: Dict[str, Any]):
+    global _sweep_engine, _sweep_settings
+    _sweep_engine = engine_class()
+    _sweep_engine.backtesting_data_provider.candles_feeds.update(ParameterSweep.load_candles(candles_files))
+    _sweep_engine.backtesting_data_provider.trading_rules.update(trading_rules)
+    _sweep_settings = run_settings
+
+
+def _run_sweep_task(index: int, config_data: Dict) -> Tuple[int, Dict]:
+    return index, asyncio.run(_run_sweep_task_async(_sweep_engine, index, config_data, _sweep_settings))
+
+
+async def _run_sweep_task_async(engine: BacktestingEngineBase, index: int, config_data: Dict,
+                                run_settings: Dict[str, Any]) -> Dict:
+    random.seed(run_settings["seed"] + index)
+    np.random.seed(run_settings["seed"] + index)
+    try:
+        controller_config = engine.get_controller_config_instance_from_dict(config_data,
+                                                                            run_settings["controllers_module"])
+        backtesting_result = await engine.run_backtesting(
+            controller_config=controller_config,
+            start=run_settings["start"],
+            end=run_settings["end"],
+            backtesting_resolution=run_settings["backtesting_resolution"],
+            trade_cost=run_settings["trade_cost"],
+        )
+        return {**backtesting_result["results"], "error": None}
+    except Exception as e:
+        logger.error(f"Error backtesting config {config_data}: {e}", exc_info=True)
+        return {"error": str(e)}
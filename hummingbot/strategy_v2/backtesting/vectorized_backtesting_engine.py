@@ -0,0 +1,63 @@
+from decimal import Decimal
+from typing import List
+
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulationState
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class VectorizedBacktestingEngine(BacktestingEngineBase):
+    """
+    Backtesting engine that produces the same results as BacktestingEngineBase without iterating the market data
+    with DataFrame.iterrows. The processed features are read once as a NumPy array, and every active executor
+    simulation is kept as an ExecutorSimulationState, so updating the executors info on each row is a binary
+    search per executor instead of a DataFrame filter.
+    """
+
+    async def simulate_execution(self, trade_cost: float) -> list:
+        """
+        Simulates market making strategy over historical data, considering trading costs.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[ExecutorSimulationState] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        columns = processed_features.columns.tolist()
+        values = processed_features.values
+        for position in range(len(values)):
+            row = dict(zip(columns, values[position].tolist()))
+            await self.update_state(row)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor(action.executor_config,
+                                                                 processed_features.iloc[position:], trade_cost)
+                    if executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, row["timestamp"])
+
+        return self.controller.executors_info
+
+    async def update_state(self, row: dict):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
+        self.controller.market_data_provider._time = row["timestamp"]
+        self.controller.processed_data.update(row)
+        self.update_executors_info(row["timestamp"])
+
+    def manage_active_executors(self, simulation: ExecutorSimulation):
+        """
+        Manages the list of active executors based on the simulation results, keeping each one as a state array.
+
+        Args:
+            simulation (ExecutorSimulation): The simulation results of the current executor.
+        """
+        if not simulation.executor_simulation.empty:
+            self.active_executor_simulations.append(ExecutorSimulationState(simulation))
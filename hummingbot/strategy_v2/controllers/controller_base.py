@@ -4,7 +4,7 @@ import asyncio
 import importlib
 import inspect
 from decimal import Decimal
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from pydantic import Field, validator
 
@@ -131,6 +131,7 @@ class ControllerBase(RunnableBase):
         self.market_data_provider: MarketDataProvider = market_data_provider
         self.actions_queue: asyncio.Queue = actions_queue
         self.processed_data = {}
+        self._candles_versions: Dict[str, Optional[int]] = {}
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
 
@@ -182,6 +183,19 @@ class ControllerBase(RunnableBase):
     def filter_executors(executors: List[ExecutorInfo], filter_func: Callable[[ExecutorInfo], bool]) -> List[ExecutorInfo]:
         return [executor for executor in executors if filter_func(executor)]
 
+    def candles_changed(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500) -> bool:
+        """
+        Whether the candles changed since the previous call, so the data processed from them doesn't have to be
+        computed again on every tick. Always True when the market data provider doesn't know the candles version.
+        """
+        candles_version = self.market_data_provider.get_candles_version(connector_name, trading_pair, interval,
+                                                                         max_records)
+        key = f"{connector_name}_{trading_pair}_{interval}"
+        if candles_version is not None and self._candles_versions.get(key) == candles_version:
+            return False
+        self._candles_versions[key] = candles_version
+        return True
+
     async def update_processed_data(self):
         """
         This method should be overridden by the derived classes to implement the logic to update the market data
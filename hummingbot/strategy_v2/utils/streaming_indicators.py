@@ -0,0 +1,468 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+NaN = float("nan")
+
+
+def _non_zero(value: float) -> float:
+    # Same as the non_zero_range of pandas_ta, a zero range (e.g. high == low in crypto data) becomes epsilon
+    return value if value != 0 else value + sys.float_info.epsilon
+
+
+class StreamingIndicator(ABC):
+    """
+    Technical indicator updated one candle at a time, in O(1) per candle.
+
+    A candle is either a new one, passed to add(), or a new version of the last candle while it is still open, passed
+    to replace(). The indicators keep their state as of the previous candle, so the last candle can be replaced any
+    number of times. Once enough candles are added, the values are those of pandas_ta over all the candles added since
+    the last reset().
+    """
+    inputs: Tuple[str, ...] = ("close",)
+
+    def __init__(self):
+        self.reset()
+
+    @abstractmethod
+    def reset(self):
+        ...
+
+    @abstractmethod
+    def add(self, *values: float):
+        ...
+
+    @abstractmethod
+    def replace(self, *values: float):
+        ...
+
+
+class SMA(StreamingIndicator):
+    """
+    Simple moving average, with the rolling variance of the same window.
+    """
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__()
+
+    def reset(self):
+        self._window: deque = deque()
+        # The sums are kept relative to the first value, to avoid cancellation errors in the variance
+        self._anchor = NaN
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+        self._adds_since_recompute = 0
+
+    @property
+    def value(self) -> float:
+        return self._sum / self.length + self._anchor if len(self._window) == self.length else NaN
+
+    def variance(self, ddof: int = 1) -> float:
+        count = len(self._window)
+        if count < self.length or count <= ddof:
+            return NaN
+        return max(self._sum_of_squares - self._sum * self._sum / count, 0.0) / (count - ddof)
+
+    def add(self, value: float):
+        if len(self._window) == 0:
+            self._anchor = value
+        self._window.append(value)
+        self._accumulate(value, 1)
+        if len(self._window) > self.length:
+            self._accumulate(self._window.popleft(), -1)
+        self._adds_since_recompute += 1
+        if self._adds_since_recompute >= self.length:
+            # Gets rid of the rounding errors accumulated by the running sums, once every length candles
+            self._recompute()
+
+    def replace(self, value: float):
+        if len(self._window) == 0:
+            self.add(value)
+            return
+        self._accumulate(self._window[-1], -1)
+        self._window[-1] = value
+        self._accumulate(value, 1)
+
+    def _accumulate(self, value: float, sign: int):
+        deviation = value - self._anchor
+        self._sum += sign * deviation
+        self._sum_of_squares += sign * deviation * deviation
+
+    def _recompute(self):
+        self._anchor = self._window[0]
+        self._sum = self._sum_of_squares = 0.0
+        for value in self._window:
+            self._accumulate(value, 1)
+        self._adds_since_recompute = 0
+
+
+class RecursiveAverage(StreamingIndicator):
+    """
+    Average that starts with the simple average of the first seed_length values and then follows
+    value = alpha * x + (1 - alpha) * previous value. This is the EMA of pandas_ta (the TA Lib one, with presma) with
+    alpha = 2 / (length + 1) and seed_length = length, and its Wilder's moving average (RMA) with alpha = 1 / length
+    and seed_length = 1.
+    """
+
+    def __init__(self, alpha: float, seed_length: int):
+        self.alpha = alpha
+        self.seed_length = seed_length
+        super().__init__()
+
+    def reset(self):
+        self._count = 0
+        self._seed_sum = 0.0
+        self._previous_value = NaN
+        self.value = NaN
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, value: float):
+        if self._count > 0:
+            self._previous_value = self.value
+            if self._count < self.seed_length:
+                self._seed_sum += self._last_input
+        self._count += 1
+        self._apply(value)
+
+    def replace(self, value: float):
+        if self._count == 0:
+            self.add(value)
+        else:
+            self._apply(value)
+
+    def _apply(self, value: float):
+        self._last_input = value
+        if self._count < self.seed_length:
+            self.value = NaN
+        elif self._count == self.seed_length:
+            self.value = (self._seed_sum + value) / self.seed_length
+        else:
+            self.value = self.alpha * value + (1 - self.alpha) * self._previous_value
+
+
+class EMA(RecursiveAverage):
+    """
+    Exponential moving average, seeded with the simple average of the first length values like pandas_ta ema().
+    """
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__(alpha=2 / (length + 1), seed_length=length)
+
+
+class RMA(RecursiveAverage):
+    """
+    Wilder's moving average, like pandas_ta rma().
+    """
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__(alpha=1 / length, seed_length=1)
+
+
+class BollingerBands(StreamingIndicator):
+    """
+    Bollinger bands over the simple moving average, like pandas_ta bbands(). The standard deviation uses ddof, the
+    degrees of freedom (0 in pandas_ta 0.3.14b, 1 in later versions).
+    """
+
+    def __init__(self, length: int = 5, std: float = 2.0, ddof: int = 0):
+        self.length = length
+        self.std = std
+        self.ddof = ddof
+        super().__init__()
+
+    def reset(self):
+        self._sma = SMA(self.length)
+        self.lower = self.mid = self.upper = self.bandwidth = self.percent = NaN
+
+    def add(self, close: float):
+        self._sma.add(close)
+        self._update(close)
+
+    def replace(self, close: float):
+        self._sma.replace(close)
+        self._update(close)
+
+    def _update(self, close: float):
+        self.mid = self._sma.value
+        deviations = self.std * math.sqrt(self._sma.variance(self.ddof))
+        self.lower = self.mid - deviations
+        self.upper = self.mid + deviations
+        band_range = _non_zero(self.upper - self.lower)
+        self.bandwidth = 100 * band_range / self.mid
+        self.percent = _non_zero(close - self.lower) / band_range
+
+
+class MACD(StreamingIndicator):
+    """
+    Moving average convergence divergence, like pandas_ta macd(): the difference of the fast and slow EMAs, its signal
+    EMA and the histogram between them.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast, self.slow = (slow, fast) if slow < fast else (fast, slow)
+        self.signal = signal
+        super().__init__()
+
+    def reset(self):
+        self._fast_ema = EMA(self.fast)
+        self._slow_ema = EMA(self.slow)
+        self._signal_ema = EMA(self.signal)
+        self.macd = self.signal_value = self.histogram = NaN
+
+    def add(self, close: float):
+        self._fast_ema.add(close)
+        self._slow_ema.add(close)
+        self._update(self._signal_ema.add)
+
+    def replace(self, close: float):
+        self._fast_ema.replace(close)
+        self._slow_ema.replace(close)
+        self._update(self._signal_ema.replace)
+
+    def _update(self, update_signal):
+        self.macd = self._fast_ema.value - self._slow_ema.value
+        # The signal starts with the first MACD value
+        if not math.isnan(self.macd):
+            update_signal(self.macd)
+        self.signal_value = self._signal_ema.value
+        self.histogram = self.macd - self.signal_value
+
+
+class RSI(StreamingIndicator):
+    """
+    Relative strength index with Wilder's moving averages of the gains and losses, like pandas_ta rsi().
+    """
+
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self.length = length
+        self.scalar = scalar
+        super().__init__()
+
+    def reset(self):
+        self._gains = RMA(self.length)
+        self._losses = RMA(self.length)
+        self._previous_close = NaN
+        self._close = NaN
+        self._count = 0
+        self.value = NaN
+
+    def add(self, close: float):
+        if self._count > 0:
+            self._previous_close = self._close
+        self._count += 1
+        self._update(close, self._gains.add, self._losses.add)
+
+    def replace(self, close: float):
+        if self._count == 0:
+            self.add(close)
+        else:
+            self._update(close, self._gains.replace, self._losses.replace)
+
+    def _update(self, close: float, update_gains, update_losses):
+        self._close = close
+        if self._count < 2:
+            return
+        change = close - self._previous_close
+        update_gains(max(change, 0.0))
+        update_losses(min(change, 0.0))
+        total = self._gains.value + abs(self._losses.value)
+        self.value = self.scalar * self._gains.value / total if total != 0 else NaN
+
+
+class ATR(StreamingIndicator):
+    """
+    Average true range, like pandas_ta atr(): the true range averaged with mamode ("rma" or "ema"), seeded with the
+    simple average of its first length values. With percent, it's given as a percentage of the close.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = 14, mamode: str = "rma", percent: bool = False):
+        if mamode not in ("rma", "ema"):
+            raise ValueError(f"Unsupported mamode {mamode}, it must be rma or ema.")
+        self.length = length
+        self.mamode = mamode
+        self.percent = percent
+        super().__init__()
+
+    def reset(self):
+        alpha = 1 / self.length if self.mamode == "rma" else 2 / (self.length + 1)
+        self._average = RecursiveAverage(alpha=alpha, seed_length=self.length)
+        self._previous_close = NaN
+        self._close = NaN
+        self._count = 0
+        self.true_range = NaN
+        self.value = NaN
+
+    def add(self, high: float, low: float, close: float):
+        if self._count > 0:
+            self._previous_close = self._close
+        self._count += 1
+        self._update(high, low, close, self._average.add)
+
+    def replace(self, high: float, low: float, close: float):
+        if self._count == 0:
+            self.add(high, low, close)
+        else:
+            self._update(high, low, close, self._average.replace)
+
+    def _update(self, high: float, low: float, close: float, update_average):
+        self._close = close
+        self.true_range = _non_zero(high - low)
+        if self._count > 1:
+            self.true_range = max(self.true_range, abs(high - self._previous_close), abs(self._previous_close - low))
+        update_average(self.true_range)
+        self.value = self._average.value * 100 / close if self.percent else self._average.value
+
+
+class NATR(ATR):
+    """
+    Normalized average true range, like pandas_ta natr(): the ATR as a percentage of the close, averaged with an EMA
+    by default.
+    """
+
+    def __init__(self, length: int = 14, mamode: str = "ema", scalar: float = 100):
+        self.scalar = scalar
+        super().__init__(length=length, mamode=mamode)
+
+    def _update(self, high: float, low: float, close: float, update_average):
+        super()._update(high, low, close, update_average)
+        self.value = self.scalar / close * self.value
+
+
+class Supertrend(StreamingIndicator):
+    """
+    Supertrend, like pandas_ta supertrend(): bands of multiplier ATRs around the (high + low) / 2 of the candle that
+    only tighten while the trend goes on, and flip the direction when the close crosses them.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = 7, multiplier: float = 3.0, atr_length: Optional[int] = None):
+        self.length = length
+        self.multiplier = multiplier
+        self.atr_length = atr_length or length
+        super().__init__()
+
+    def reset(self):
+        self._atr = ATR(self.atr_length, mamode="rma")
+        self._count = 0
+        self._previous = (NaN, NaN, 1)
+        self._current = (NaN, NaN, 1)
+        self.trend = self.direction = self.long = self.short = NaN
+
+    def add(self, high: float, low: float, close: float):
+        if self._count > 0:
+            self._previous = self._current
+        self._count += 1
+        self._atr.add(high, low, close)
+        self._update(high, low, close)
+
+    def replace(self, high: float, low: float, close: float):
+        if self._count == 0:
+            self.add(high, low, close)
+        else:
+            self._atr.replace(high, low, close)
+            self._update(high, low, close)
+
+    def _update(self, high: float, low: float, close: float):
+        median = (high + low) / 2
+        band = self.multiplier * self._atr.value
+        lower, upper = median - band, median + band
+        direction = 1
+        if self._count > 1:
+            previous_lower, previous_upper, previous_direction = self._previous
+            if close > previous_upper:
+                direction = 1
+            elif close < previous_lower:
+                direction = -1
+            else:
+                direction = previous_direction
+                if direction > 0 and lower < previous_lower:
+                    lower = previous_lower
+                if direction < 0 and upper > previous_upper:
+                    upper = previous_upper
+        self._current = (lower, upper, direction)
+        self.long = lower if direction > 0 else NaN
+        self.short = upper if direction < 0 else NaN
+        self.trend = NaN if self._count == 1 else (lower if direction > 0 else upper)
+        self.direction = direction if self._count > self.length else NaN
+
+
+class StreamingIndicators:
+    """
+    Streaming indicators kept up to date with a candles feed. Every update() only feeds the indicators with the candles
+    received since the previous one, replacing the last candle it saw with its latest version, and does nothing at all
+    if the feed didn't receive any candle. If that last candle isn't in the feed anymore (the candles were reset), the
+    indicators start over from the candles of the feed.
+
+    Usage, e.g. in a controller:
+        indicators = StreamingIndicators(candles_feed, {"bb": BollingerBands(20, 2), "natr": NATR(14)})
+        indicators.update()
+        indicators["bb"].percent, indicators["natr"].value
+    """
+
+    def __init__(self, candles_feed: "CandlesBase", indicators: Dict[str, StreamingIndicator]):
+        self._candles_feed = candles_feed
+        self._indicators = indicators
+        self._columns = {indicator: [candles_feed.columns.index(column) for column in indicator.inputs]
+                         for indicator in indicators.values()}
+        self._candles_version: Optional[int] = None
+        self._last_timestamp: Optional[float] = None
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """
+        Timestamp of the last candle the indicators were updated with.
+        """
+        return self._last_timestamp
+
+    def __getitem__(self, name: str) -> StreamingIndicator:
+        return self._indicators[name]
+
+    def update(self) -> bool:
+        """
+        :return: True if the indicators changed
+        """
+        candles_version = self._candles_feed.candles_version
+        if candles_version == self._candles_version:
+            return False
+        self._candles_version = candles_version
+        candles = self._candles_feed.candles_array
+        start = 0
+        if self._last_timestamp is not None:
+            position = int(np.searchsorted(candles[:, 0], self._last_timestamp))
+            if position < len(candles) and candles[position, 0] == self._last_timestamp:
+                self._apply(candles[position], replace=True)
+                start = position + 1
+            else:
+                self.reset()
+        for candle in candles[start:]:
+            self._apply(candle, replace=False)
+        if len(candles) > 0:
+            self._last_timestamp = float(candles[-1, 0])
+        return True
+
+    def reset(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
+        self._last_timestamp = None
+
+    def _apply(self, candle: np.ndarray, replace: bool):
+        for indicator, columns in self._columns.items():
+            values = [float(candle[column]) for column in columns]
+            if replace:
+                indicator.replace(*values)
+            else:
+                indicator.add(*values)
@@ -0,0 +1,11 @@
+import atexit
+import shutil
+import tempfile
+
+from hummingbot import set_data_path
+
+# The tests write their files (databases, caches and the connector manifest built when the connector settings are
+# first used) to a temporary data folder, never to the data folder of the repository
+_test_data_path = tempfile.mkdtemp(prefix="hummingbot_test_data_")
+set_data_path(_test_data_path)
+atexit.register(shutil.rmtree, _test_data_path, ignore_errors=True)
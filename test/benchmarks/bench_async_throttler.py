@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark of the AsyncThrottler acquire latency under load.
+
+Starts a number of concurrent requests (1k by default) against a rate limit linked to a shared pool, with a capacity
+well under the number of requests so most of them have to wait. Reports the time it took for all of them to acquire
+their capacity against the ideal time given by the limit, the acquire latency percentiles and the CPU time used by
+the event loop while waiting. Then it replays the same load of low priority polling requests with high priority
+cancels arriving while the limit is saturated, and reports the wait times by priority.
+
+Usage: python -m test.benchmarks.bench_async_throttler [concurrent_requests]
+"""
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+
+LIMIT = 100
+TIME_INTERVAL = 0.1
+
+
+async def run_requests(throttler: AsyncThrottler, requests: int) -> np.ndarray:
+    latencies = np.zeros(requests)
+    # All the requests are issued at the same time, their latency is measured from there
+    start = time.perf_counter()
+
+    async def request(index: int):
+        async with throttler.execute_task(limit_id="/endpoint"):
+            latencies[index] = time.perf_counter() - start
+
+    await asyncio.gather(*[request(index) for index in range(requests)])
+    return latencies
+
+
+async def run_prioritized_requests(throttler: AsyncThrottler, requests: int):
+    async def request(limit_id: str, priority: RequestPriority):
+        async with throttler.execute_task(limit_id=limit_id, priority=priority):
+            pass
+
+    polls = [asyncio.ensure_future(request("/endpoint", RequestPriority.LOW)) for _ in range(requests)]
+    cancels = []
+    for _ in range(requests // 100):
+        await asyncio.sleep(TIME_INTERVAL / 2)
+        cancels.append(asyncio.ensure_future(request("/cancel", RequestPriority.HIGH)))
+    await asyncio.gather(*polls, *cancels)
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rate_limits = [
+        RateLimit(limit_id="POOL", limit=10 * LIMIT, time_interval=TIME_INTERVAL),
+        RateLimit(limit_id="/endpoint", limit=LIMIT, time_interval=TIME_INTERVAL,
+                  linked_limits=[LinkedLimitWeightPair("POOL", 1)]),
+        RateLimit(limit_id="/cancel", limit=LIMIT, time_interval=TIME_INTERVAL,
+                  linked_limits=[LinkedLimitWeightPair("POOL", 1), LinkedLimitWeightPair("/endpoint", 1)]),
+    ]
+    # The limit reached warning is notified through the client application, keep it out of the measurement
+    AsyncRequestContextBase._last_max_cap_warning_ts = time.time()
+    throttler = AsyncThrottler(rate_limits=rate_limits, safety_margin_pct=0)
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    latencies = asyncio.run(run_requests(throttler, requests))
+    elapsed, cpu_time = time.perf_counter() - start, time.process_time() - cpu_start
+
+    ideal = (requests - 1) // LIMIT * TIME_INTERVAL
+    print(f"{requests:,} concurrent requests acquired in {elapsed:.3f} s (ideal {ideal:.3f} s), "
+          f"CPU time {cpu_time:.3f} s")
+    print(f"acquire latency p50 {1000 * np.percentile(latencies, 50):.1f} ms, "
+          f"p99 {1000 * np.percentile(latencies, 99):.1f} ms, max {1000 * latencies.max():.1f} ms")
+
+    throttler = AsyncThrottler(rate_limits=rate_limits, safety_margin_pct=0)
+    asyncio.run(run_prioritized_requests(throttler, requests))
+    for priority, stats in throttler.wait_time_stats().items():
+        if stats.count > 0:
+            print(f"{priority.name} priority wait: {stats.count:,} requests, average {1000 * stats.average:.1f} ms, "
+                  f"p99 {1000 * stats.percentile(99):.1f} ms, max {1000 * stats.max_time:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark of the candles reads of the controllers.
+
+Simulates a number of controllers (20 by default) sharing a candles feed of 150 records, each reading its candles
+through MarketDataProvider.get_candles_df on every 1s control tick, with a websocket candle update every tick. Compares
+the DataFrame built from the deque of rows on every read, as the feeds used to do, with the DataFrame cached by the
+feeds until a candle arrives.
+
+Usage: python -m test.benchmarks.bench_candles_df [controllers] [ticks]
+"""
+import asyncio
+import sys
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+
+MAX_RECORDS = 150
+
+
+def candle(timestamp: float) -> np.ndarray:
+    return np.array([timestamp, 100, 101, 99, 100.5, 10, 1000, 50, 5, 500], dtype=np.float64)
+
+
+def run_deque(controllers: int, ticks: int) -> float:
+    candles = deque((candle(60 * index) for index in range(MAX_RECORDS)), maxlen=MAX_RECORDS)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        candles[-1] = candle(60 * MAX_RECORDS)
+        for _ in range(controllers):
+            pd.DataFrame(candles, columns=BinanceSpotCandles.columns, dtype=float).iloc[-MAX_RECORDS:]
+    return time.perf_counter() - start
+
+
+def run_feed(controllers: int, ticks: int) -> float:
+    feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+    feed._candles.extend(candle(60 * index) for index in range(MAX_RECORDS))
+    provider = MarketDataProvider(connectors={})
+    config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+    provider.candles_feeds[provider._generate_candle_feed_key(config)] = feed
+    start = time.perf_counter()
+    for tick in range(ticks):
+        feed._candles[-1] = candle(60 * MAX_RECORDS)
+        for _ in range(controllers):
+            provider.get_candles_df("binance", "BTC-USDT", "1m", MAX_RECORDS)
+    return time.perf_counter() - start
+
+
+def main():
+    controllers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    reads = controllers * ticks
+    for name, run in (("deque rebuild", run_deque), ("cached", run_feed)):
+        elapsed = run(controllers, ticks)
+        print(f"{name:>14}: {reads:,} reads in {elapsed:.3f} s ({1e6 * elapsed / reads:.0f} us/read)")
+
+
+if __name__ == "__main__":
+    main()
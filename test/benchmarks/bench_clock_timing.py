@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+Benchmark of the clock tick timing.
+
+Runs a backtesting clock with child iterators doing nothing, so that the time measured is the clock loop itself, with
+the tick timing disabled and enabled.
+
+Usage: python -m test.benchmarks.bench_clock_timing [ticks] [iterators]
+"""
+import sys
+import time
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+def run(ticks: int, iterators: int, timing_enabled: bool) -> float:
+    clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=0, end_time=ticks, timing_enabled=timing_enabled)
+    for _ in range(iterators):
+        clock.add_iterator(TimeIterator())
+    start = time.perf_counter()
+    clock.backtest()
+    return time.perf_counter() - start
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    iterators = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    for timing_enabled in (False, True, False, True):
+        elapsed = run(ticks, iterators, timing_enabled)
+        print(f"timing {'enabled ' if timing_enabled else 'disabled'}: {ticks:,} ticks of {iterators} iterators in "
+              f"{elapsed:.3f} s ({1e9 * elapsed / ticks:.0f} ns/tick)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Benchmark of the connector settings creation at startup.
+
+Creates the connector settings in a fresh interpreter, once without a connector manifest (the utils module of every
+connector is imported to generate it) and once from the manifest generated by the previous run, then requests the
+config keys of a single connector, which imports its utils module on first use.
+
+Usage: python -m test.benchmarks.bench_connector_settings_startup [runs] [connector]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+CHILD_SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+from hummingbot.client import connector_manifest
+from hummingbot.client.settings import AllConnectorSettings
+
+# Keeps the manifest of the benchmark away from the one of the client
+connector_manifest.data_path = lambda: sys.argv[1]
+
+modules = len(sys.modules)
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+settings = AllConnectorSettings.get_connector_settings()
+elapsed = time.perf_counter() - start
+result = {
+    "connectors": len(settings),
+    "elapsed": elapsed,
+    "modules": len(sys.modules) - modules,
+    "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - max_rss,
+}
+start = time.perf_counter()
+settings[sys.argv[2]].get_config_keys()
+result["config_keys_elapsed"] = time.perf_counter() - start
+print(json.dumps(result))
+"""
+
+
+def run(data_dir: str, connector: str) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", CHILD_SCRIPT, data_dir, connector],
+                                     cwd=os.getcwd(), env={**os.environ, "PYTHONPATH": os.getcwd()})
+    return json.loads(output.splitlines()[-1])
+
+
+def report(label: str, result: dict, connector: str):
+    print(f"{label}: {result['connectors']} connectors in {result['elapsed'] * 1e3:.1f} ms, "
+          f"{result['modules']} modules imported, max RSS +{result['max_rss'] / 1024:.1f} MB, "
+          f"{connector} config keys in {result['config_keys_elapsed'] * 1e3:.1f} ms")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    connector = sys.argv[2] if len(sys.argv) > 2 else "binance"
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as data_dir:
+            report("without manifest", run(data_dir, connector), connector)
+            report("from manifest   ", run(data_dir, connector), connector)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Benchmark of the JSON codecs of the web assistants.
+
+Decodes WebSocket depth frames with the layout of the Binance diff depth stream and of the OKX books channel (100
+levels per side by default) through WSConnection._build_resp, with every codec available, and with the raw messages
+passthrough that leaves the decoding to the data source.
+
+Usage: python -m test.benchmarks.bench_json_codec [levels] [frames]
+"""
+import json
+import random
+import sys
+import time
+
+import aiohttp
+
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec, OrjsonCodec, fastest_json_codec
+
+
+def levels(count: int, mid: float, side: int):
+    return [[f"{mid + side * 0.01 * (index + 1):.2f}", f"{random.uniform(0.001, 5):.8f}"] for index in range(count)]
+
+
+def binance_frame(count: int) -> str:
+    return json.dumps({
+        "e": "depthUpdate", "E": 1718667728540, "s": "BTCUSDT", "U": 157, "u": 160,
+        "b": levels(count, 66470, -1), "a": levels(count, 66470, 1),
+    })
+
+
+def okx_frame(count: int) -> str:
+    return json.dumps({
+        "arg": {"channel": "books", "instId": "BTC-USDT"}, "action": "update",
+        "data": [{"asks": [level + ["0", "3"] for level in levels(count, 66470, 1)],
+                  "bids": [level + ["0", "2"] for level in levels(count, 66470, -1)],
+                  "ts": "1718667728540", "checksum": -855196043, "prevSeqId": 123456, "seqId": 123457}],
+    })
+
+
+def run(connection: WSConnection, message: aiohttp.WSMessage, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        connection._build_resp(message)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    random.seed(0)
+    codecs = [JSONCodec()] + ([OrjsonCodec()] if isinstance(fastest_json_codec(), OrjsonCodec) else [])
+    for name, frame in (("binance", binance_frame(count)), ("okx", okx_frame(count))):
+        message = aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, frame, None)
+        print(f"{name} depth frame of {len(frame):,} bytes")
+        connections = [(codec.name, WSConnection(None, json_codec=codec)) for codec in codecs]
+        connections.append(("raw", WSConnection(None, raw_messages=True)))
+        for codec_name, connection in connections:
+            elapsed = run(connection, message, frames)
+            print(f"{codec_name:>8}: {frames:,} frames in {elapsed:.3f} s ({1e6 * elapsed / frames:.1f} us/frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark of the market data collection storages.
+
+Records a number of order book snapshots (10k by default) of 20 levels per side, as the MarketsRecorder does every
+collection interval, first as MarketData rows with the order book as JSON in a SQLite database and then with the
+MarketDataSink into compressed columnar files. Reports the time the snapshots took on the calling thread, the size on
+disk, and the time to load all of them back as NumPy arrays for research or replay.
+
+Usage: python -m test.benchmarks.bench_market_data_sink [snapshots]
+"""
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.market_data_sink import MarketDataReader, MarketDataSink
+from hummingbot.model.market_data import MarketData
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+DEPTH = 20
+START = 1_700_000_000
+
+
+def order_books(snapshots: int) -> List[Tuple[float, np.ndarray, np.ndarray]]:
+    # Rows of OrderBook.depth_arrays(), [price, amount, update_id]
+    random = np.random.default_rng(0)
+    books = []
+    for index in range(snapshots):
+        mid_price = 100 + index * 0.01
+        bids = np.column_stack([mid_price - 0.01 * np.arange(1, DEPTH + 1), random.random(DEPTH), np.full(DEPTH, index)])
+        asks = np.column_stack([mid_price + 0.01 * np.arange(1, DEPTH + 1), random.random(DEPTH), np.full(DEPTH, index)])
+        books.append((START + index, bids, asks))
+    return books
+
+
+def directory_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(path, file_name)) for file_name in os.listdir(path))
+
+
+def run_database(directory: str, books: List[Tuple[float, np.ndarray, np.ndarray]]):
+    snapshots = len(books)
+    db_path = os.path.join(directory, "market_data.sqlite")
+    sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    start = time.perf_counter()
+    for timestamp, bids, asks in books:
+        with sql.get_new_session() as session:
+            with session.begin():
+                session.add(MarketData(
+                    timestamp=timestamp * 1000, exchange="binance", trading_pair="ETH-USDT",
+                    mid_price=Decimal(str((bids[0, 0] + asks[0, 0]) / 2)), best_bid=Decimal(str(bids[0, 0])),
+                    best_ask=Decimal(str(asks[0, 0])),
+                    order_book={"bid": [[price, amount, int(update_id)] for price, amount, update_id in bids.tolist()],
+                                "ask": [[price, amount, int(update_id)] for price, amount, update_id in asks.tolist()]}))
+    record_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with sql.get_new_session() as session:
+        rows = session.query(MarketData).filter(MarketData.exchange == "binance",
+                                                MarketData.trading_pair == "ETH-USDT").all()
+        bids = np.array([[level[:2] for level in row.order_book["bid"]] for row in rows], dtype=np.float64)
+    load_time = time.perf_counter() - start
+    assert bids.shape == (snapshots, DEPTH, 2)
+    sql.engine.dispose()
+    print(f"{'database rows':>14}: {1e6 * record_time / snapshots:7.0f} us/snapshot recorded, "
+          f"{os.path.getsize(db_path) / 1e6:7.2f} MB, loaded in {load_time:.3f} s")
+
+
+def run_files(directory: str, books: List[Tuple[float, np.ndarray, np.ndarray]]):
+    snapshots = len(books)
+    path = os.path.join(directory, "files")
+    os.makedirs(path)
+    sink = MarketDataSink(path=path)
+    sink.start()
+    start = time.perf_counter()
+    for timestamp, bids, asks in books:
+        sink.append_order_book("binance", "ETH-USDT", timestamp, bids, asks)
+    record_time = time.perf_counter() - start
+    sink.stop()
+
+    start = time.perf_counter()
+    arrays = MarketDataReader(path).read_order_book_snapshots("binance", "ETH-USDT")
+    load_time = time.perf_counter() - start
+    assert arrays["bids"].shape == (snapshots * DEPTH, 2)
+    print(f"{'columnar files':>14}: {1e6 * record_time / snapshots:7.0f} us/snapshot recorded, "
+          f"{directory_size(path) / 1e6:7.2f} MB, loaded in {load_time:.3f} s")
+
+
+def main():
+    snapshots = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with tempfile.TemporaryDirectory() as directory:
+        books = order_books(snapshots)
+        run_database(directory, books)
+        run_files(directory, books)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Benchmark of the MarketsRecorder event handlers.
+
+Records a number of order created, filled and completed events (1k orders by default) in a SQLite database for a
+market with 200 other open orders, first with every event written in its own transaction on the calling thread (the
+recorder is not started) and then with the write-behind queue of a started recorder. Both are run saving the whole
+tracking states of the market on every event and saving only the orders that changed. Reports the time the events took
+on the calling thread, which is the time the event loop is blocked, and the time until all the records were committed.
+
+Usage: python -m test.benchmarks.bench_markets_recorder [orders] [open_orders]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from typing import Any, Dict, Optional, Set, Tuple
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCompletedEvent, BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+def create_order(order_id: str) -> InFlightOrder:
+    return InFlightOrder(client_order_id=order_id, exchange_order_id=f"E{order_id}", trading_pair="BTC-USDT",
+                         order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal(1), price=Decimal(100),
+                         creation_timestamp=0, initial_state=OrderState.OPEN)
+
+
+class BenchmarkMarket:
+    display_name = "binance"
+    current_timestamp = 0
+
+    def __init__(self, open_orders: int, incremental: bool):
+        self.order_tracker = ClientOrderTracker(connector=self)
+        self.incremental = incremental
+        for index in range(open_orders):
+            self.order_tracker.start_tracking_order(create_order(f"GRID{index}"))
+
+    @property
+    def tracking_states(self) -> Dict[str, Any]:
+        return {key: value.to_json() for key, value in self.order_tracker.all_updatable_orders.items()}
+
+    def pop_tracking_state_changes(self) -> Optional[Tuple[Dict[str, Any], Set[str]]]:
+        return self.order_tracker.pop_tracking_state_changes() if self.incremental else None
+
+    def trigger_event(self, event_tag, event):
+        pass
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
+def record_events(recorder: MarketsRecorder, market: BenchmarkMarket, orders: int):
+    for index in range(orders):
+        order_id = f"OID{index}"
+        market.order_tracker.start_tracking_order(create_order(order_id))
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, BuyOrderCreatedEvent(
+            timestamp=index, type=OrderType.LIMIT, trading_pair="BTC-USDT", amount=Decimal(1), price=Decimal(100),
+            order_id=order_id, creation_timestamp=index, exchange_order_id=f"EOID{index}"))
+        market.order_tracker.process_trade_update(TradeUpdate(
+            trade_id=f"TID{index}", client_order_id=order_id, exchange_order_id=f"EOID{index}",
+            trading_pair="BTC-USDT", fill_timestamp=index, fill_price=Decimal(100), fill_base_amount=Decimal(1),
+            fill_quote_amount=Decimal(100), fee=AddedToCostTradeFee()))
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, OrderFilledEvent(
+            timestamp=index, order_id=order_id, trading_pair="BTC-USDT", trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT, price=Decimal(100), amount=Decimal(1), trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"TID{index}"))
+        market.order_tracker.stop_tracking_order(order_id)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, market, BuyOrderCompletedEvent(
+            timestamp=index, order_id=order_id, base_asset="BTC", quote_asset="USDT", base_asset_amount=Decimal(1),
+            quote_asset_amount=Decimal(100), order_type=OrderType.LIMIT))
+
+
+def run(directory: str, orders: int, open_orders: int, write_behind: bool, incremental: bool):
+    sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                               db_path=os.path.join(directory, f"bench_{write_behind}_{incremental}.sqlite"))
+    market = BenchmarkMarket(open_orders, incremental)
+    recorder = MarketsRecorder(sql=sql, markets=[market], config_file_path="bench.yml", strategy_name="bench",
+                               market_data_collection=MarketDataCollectionConfigMap())
+    if write_behind:
+        recorder.start()
+
+    start = time.perf_counter()
+    record_events(recorder, market, orders)
+    events_time = time.perf_counter() - start
+    recorder.stop()
+    total_time = time.perf_counter() - start
+
+    with sql.get_new_session() as session:
+        assert session.query(TradeFill).count() == orders
+    sql.engine.dispose()
+    mode = f"{'write-behind' if write_behind else 'synchronous'}, {'changed' if incremental else 'all'} orders"
+    print(f"{mode:>27}: {3 * orders:,} events handled in {events_time:.3f} s "
+          f"({1e6 * events_time / (3 * orders):.0f} us/event), all committed after {total_time:.3f} s")
+
+
+def main():
+    orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    open_orders = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    with tempfile.TemporaryDirectory() as directory:
+        for write_behind in (False, True):
+            for incremental in (False, True):
+                run(directory, orders, open_orders, write_behind=write_behind, incremental=incremental)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of order book diff ingestion.
+
+Compares the OrderBookRow based path (OrderBookMessage.bids/asks + OrderBook.apply_diffs) with
+OrderBook.apply_raw_diffs on Binance style string pairs and on pre-parsed NumPy arrays.
+
+Usage: python -m test.benchmarks.bench_order_book_diffs [number_of_diffs]
+"""
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+def build_diff_messages(count: int, levels_per_side: int = 20, seed: int = 42) -> List[OrderBookMessage]:
+    rng = np.random.default_rng(seed)
+    messages = []
+    for update_id in range(2, count + 2):
+        bid_prices = np.round(rng.uniform(29000, 30000, levels_per_side), 2)
+        ask_prices = np.round(rng.uniform(30000.01, 31000, levels_per_side), 2)
+        amounts = np.round(rng.choice([0, 0.01, 0.5, 1.25, 3], levels_per_side * 2), 8)
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "update_id": update_id,
+            "bids": [[f"{price:.2f}", f"{amount:.8f}"] for price, amount in zip(bid_prices, amounts[:levels_per_side])],
+            "asks": [[f"{price:.2f}", f"{amount:.8f}"] for price, amount in zip(ask_prices, amounts[levels_per_side:])],
+        }, timestamp=float(update_id)))
+    return messages
+
+
+def new_order_book() -> OrderBook:
+    order_book = OrderBook()
+    bids = np.column_stack([np.linspace(29999.99, 29000, 1000), np.ones(1000), np.ones(1000)])
+    asks = np.column_stack([np.linspace(30000.01, 31000, 1000), np.ones(1000), np.ones(1000)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def measure(name: str, messages: List[OrderBookMessage], apply: Callable[[OrderBook, OrderBookMessage], None]):
+    order_book = new_order_book()
+    start = time.perf_counter()
+    for message in messages:
+        apply(order_book, message)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {len(messages) / elapsed:>12,.0f} diffs/sec")
+    return order_book
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    messages = build_diff_messages(count)
+    parsed_messages = [
+        OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": message.trading_pair,
+            "update_id": message.update_id,
+            "bids": np.array(message.content["bids"], dtype=np.float64),
+            "asks": np.array(message.content["asks"], dtype=np.float64),
+        }, timestamp=message.timestamp)
+        for message in messages
+    ]
+
+    row_book = measure("OrderBookRow (apply_diffs)", messages,
+                       lambda book, msg: book.apply_diffs(msg.bids, msg.asks, msg.update_id))
+    raw_book = measure("raw string pairs (apply_raw_diffs)", messages,
+                       lambda book, msg: book.apply_raw_diffs(msg.raw_bids, msg.raw_asks, msg.update_id))
+    array_book = measure("NumPy arrays (apply_raw_diffs)", parsed_messages,
+                         lambda book, msg: book.apply_raw_diffs(msg.raw_bids, msg.raw_asks, msg.update_id))
+
+    assert list(row_book.bid_entries()) == list(raw_book.bid_entries()) == list(array_book.bid_entries())
+    assert list(row_book.ask_entries()) == list(raw_book.ask_entries()) == list(array_book.ask_entries())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Benchmark of the order book replay used by the L2 backtesting engine.
+
+Replays synthetic recorded data (a snapshot per minute, diffs and public trades several times per second) through
+OrderBookReplayFeed and OrderBookReplayMatchingEngine on a backtesting Clock with a 1 second tick, with resting limit
+orders on both sides of the book, and reports the number of recorded events replayed per minute of wall time.
+
+Usage: python -m test.benchmarks.bench_order_book_replay [seconds_of_data]
+"""
+import sys
+import time
+
+import numpy as np
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy_v2.backtesting.order_book_replay import (
+    OrderBookReplayData,
+    OrderBookReplayFeed,
+    OrderBookReplayMatchingEngine,
+    OrderBookUpdates,
+    PublicTrades,
+)
+
+START = 1_700_000_000
+
+
+def build_replay_data(seconds: int, diffs_per_second: int = 20, trades_per_second: int = 20,
+                      levels: int = 50, seed: int = 42) -> OrderBookReplayData:
+    rng = np.random.default_rng(seed)
+    mid = np.round(30000 + np.cumsum(rng.normal(0, 2, seconds)), 1)
+    snapshots = [{"ts": START + second,
+                  "bids": np.column_stack([mid[second] - 0.1 * np.arange(1, levels + 1), np.ones(levels)]).tolist(),
+                  "asks": np.column_stack([mid[second] + 0.1 * np.arange(1, levels + 1), np.ones(levels)]).tolist()}
+                 for second in range(0, seconds, 60)]
+    diff_count = seconds * diffs_per_second
+    diff_seconds = np.repeat(np.arange(seconds), diffs_per_second)
+    diff_timestamps = START + diff_seconds + rng.uniform(0, 1, diff_count)
+    offsets = 0.1 * rng.integers(1, levels, (diff_count, 2))
+    amounts = rng.choice([0, 0.5, 1, 2], (diff_count, 2))
+    diffs = [{"ts": timestamp,
+              "bids": [[mid[second] - offsets[index, 0], amounts[index, 0]]],
+              "asks": [[mid[second] + offsets[index, 1], amounts[index, 1]]]}
+             for index, (timestamp, second) in enumerate(zip(diff_timestamps, diff_seconds))]
+    trade_count = seconds * trades_per_second
+    trade_seconds = np.repeat(np.arange(seconds), trades_per_second)
+    is_buy = rng.random(trade_count) < 0.5
+    trades = [{"ts": START + second + rng.uniform(0, 1), "price": mid[second] + (0.1 if buy else -0.1),
+               "q_base": 0.1, "side": "buy" if buy else "sell"}
+              for second, buy in zip(trade_seconds, is_buy)]
+    return OrderBookReplayData(snapshots=OrderBookUpdates.from_messages(snapshots),
+                               diffs=OrderBookUpdates.from_messages(diffs),
+                               trades=PublicTrades.from_messages(trades))
+
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    data = build_replay_data(seconds)
+    feed = OrderBookReplayFeed()
+    feed.add_market("binance", "BTC-USDT", data)
+    matching_engine = OrderBookReplayMatchingEngine(feed)
+    clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=START - 1, end_time=START + seconds)
+    clock.add_iterator(feed)
+    clock.add_iterator(matching_engine)
+    clock.backtest_til(START)
+    order_book = feed.get_order_book("binance", "BTC-USDT")
+
+    start = time.perf_counter()
+    for second in range(1, seconds + 1):
+        clock.backtest_til(START + second)
+        if len(matching_engine.open_orders("binance", "BTC-USDT")) < 4:
+            mid = (order_book.get_price(True) + order_book.get_price(False)) / 2
+            for spread in (0.2, 0.5):
+                matching_engine.place_limit_order("binance", "BTC-USDT", True, round(mid - spread, 1), 0.5)
+                matching_engine.place_limit_order("binance", "BTC-USDT", False, round(mid + spread, 1), 0.5)
+    elapsed = time.perf_counter() - start
+
+    events = feed.events_processed
+    print(f"{events:,} events replayed in {elapsed:.2f} s: {60 * events / elapsed:,.0f} events/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Benchmark of the technical indicators of the controllers.
+
+Simulates a controller computing Bollinger bands, MACD, NATR and Supertrend over a candles feed of 1000 records on
+every 1s control tick, with a websocket candle update every tick. Compares the indicators recomputed by pandas_ta over
+the candles DataFrame on every tick, as the controllers do, with the streaming indicators only updated with the changed
+candle.
+
+Usage: python -m test.benchmarks.bench_streaming_indicators [ticks]
+"""
+import asyncio
+import sys
+import time
+
+import numpy as np
+import pandas_ta as ta  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles.binance_spot_candles import BinanceSpotCandles
+from hummingbot.strategy_v2.utils.streaming_indicators import (
+    MACD,
+    NATR,
+    BollingerBands,
+    StreamingIndicators,
+    Supertrend,
+)
+
+MAX_RECORDS = 1000
+
+
+def candle(timestamp: float, close: float) -> np.ndarray:
+    return np.array([timestamp, close, close + 1, close - 1, close, 10, 1000, 50, 5, 500], dtype=np.float64)
+
+
+def make_feed() -> BinanceSpotCandles:
+    feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=MAX_RECORDS)
+    closes = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, MAX_RECORDS))
+    feed._candles.extend(candle(60 * index, close) for index, close in enumerate(closes))
+    return feed
+
+
+def receive_candle(feed: BinanceSpotCandles, tick: int):
+    feed._candles[-1] = candle(60 * (MAX_RECORDS - 1), 100 + tick % 10)
+
+
+def run_pandas_ta(ticks: int) -> float:
+    feed = make_feed()
+    start = time.perf_counter()
+    for tick in range(ticks):
+        receive_candle(feed, tick)
+        df = feed.candles_df
+        df.ta.bbands(length=100, std=2, append=True)
+        df.ta.macd(fast=21, slow=42, signal=9, append=True)
+        df.ta.natr(length=14, append=True)
+        df.ta.supertrend(length=20, multiplier=4, append=True)
+    return time.perf_counter() - start
+
+
+def run_streaming(ticks: int) -> float:
+    feed = make_feed()
+    indicators = StreamingIndicators(feed, {"bbands": BollingerBands(100, 2), "macd": MACD(21, 42, 9),
+                                            "natr": NATR(14), "supertrend": Supertrend(20, 4)})
+    indicators.update()
+    start = time.perf_counter()
+    for tick in range(ticks):
+        receive_candle(feed, tick)
+        indicators.update()
+    return time.perf_counter() - start
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    for name, run in (("pandas_ta", run_pandas_ta), ("streaming", run_streaming)):
+        elapsed = run(ticks)
+        print(f"{name:>10}: {ticks:,} ticks in {elapsed:.3f} s ({1e6 * elapsed / ticks:.0f} us/tick)")
+
+
+if __name__ == "__main__":
+    main()
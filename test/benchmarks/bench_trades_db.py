@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+"""
+Benchmark of the trades database with the query and insert mix of the MarketsRecorder.
+
+Fills a SQLite database with 1M trade fills by default (two per order, spread over 100 strategy configurations) and
+20k executors, then runs the queries of the recorder against it: its startup for a configuration, the trades of a
+configuration, the fills of orders, the executors of controllers, the restore of the market states and the writes of
+1k orders created, filled and completed. It is run with the SQLite defaults the database used to be opened with and
+without the indexes of the recorder queries, and then with the tuned profile (write-ahead logging, synchronous NORMAL,
+memory-mapped I/O, larger statement cache) and the indexes.
+
+Usage: python -m test.benchmarks.bench_trades_db [fills]
+"""
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCompletedEvent, BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.model.db_migration.transformations import AddRecorderQueryIndexes
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+CONFIGS = 100
+CONTROLLERS = 100
+EXECUTORS = 20000
+MARKET = "binance"
+
+
+class BenchmarkMarket:
+    display_name = MARKET
+    tracking_states = {}
+
+    def pop_tracking_state_changes(self):
+        return None
+
+    def restore_tracking_states(self, saved_states):
+        pass
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
+def executor_json() -> Dict:
+    config = PositionExecutorConfig(
+        id="0", timestamp=0, trading_pair="BTC-USDT", connector_name=MARKET, side=TradeType.BUY,
+        entry_price=Decimal("100"), amount=Decimal("1"),
+        triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.1"), stop_loss=Decimal("0.2")))
+    return json.loads(ExecutorInfo(
+        id="0", timestamp=0, type="position_executor", status=RunnableStatus.TERMINATED, config=config,
+        net_pnl_pct=Decimal("0"), net_pnl_quote=Decimal("0"), cum_fees_quote=Decimal("0"),
+        filled_amount_quote=Decimal("0"), is_active=False, is_trading=False, custom_info={}).json())
+
+
+def populate(db_path: str, fills: int):
+    # The schema is created by the connection manager, the rows are inserted in bulk
+    SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                         db_path=db_path).engine.dispose()
+    connection = sqlite3.connect(db_path)
+    orders = fills // 2
+    fee = json.dumps(AddedToCostTradeFee().to_json())
+    connection.executemany(
+        'INSERT INTO "Order" (id, config_file_path, strategy, market, symbol, base_asset, quote_asset, '
+        'creation_timestamp, order_type, amount, leverage, price, last_status, last_update_timestamp, '
+        'exchange_order_id, position) VALUES (?, ?, "bench", ?, "BTC-USDT", "BTC", "USDT", ?, "LIMIT", 1000000, 1, '
+        '100000000, "BuyOrderCompleted", ?, ?, "NIL")',
+        ((f"OID{i}", f"config_{i % CONFIGS}.yml", MARKET, i, i, f"EOID{i}") for i in range(orders)))
+    connection.executemany(
+        'INSERT INTO TradeFill (config_file_path, strategy, market, symbol, base_asset, quote_asset, timestamp, '
+        'order_id, trade_type, order_type, price, amount, leverage, trade_fee, trade_fee_in_quote, exchange_trade_id, '
+        'position) VALUES (?, "bench", ?, "BTC-USDT", "BTC", "USDT", ?, ?, "BUY", "LIMIT", 100000000, 500000, 1, ?, 0, '
+        '?, "NIL")',
+        ((f"config_{(i // 2) % CONFIGS}.yml", MARKET, i, f"OID{i // 2}", fee, f"TID{i}") for i in range(fills)))
+    executor = executor_json()
+    connection.executemany(
+        'INSERT INTO Executors (id, timestamp, type, close_type, close_timestamp, status, config, net_pnl_pct, '
+        'net_pnl_quote, cum_fees_quote, filled_amount_quote, is_active, is_trading, custom_info, controller_id) '
+        'VALUES (?, ?, ?, NULL, NULL, ?, ?, 0, 0, 0, 0, 0, 0, "{}", ?)',
+        ((f"EX{i}", i, executor["type"], executor["status"], json.dumps(executor["config"]),
+          f"controller_{i % CONTROLLERS}") for i in range(EXECUTORS)))
+    connection.executemany(
+        'INSERT INTO MarketState (config_file_path, market, timestamp, saved_state) VALUES (?, ?, 0, "{}")',
+        ((f"config_{i}.yml", MARKET) for i in range(CONFIGS)))
+    connection.commit()
+    connection.close()
+
+
+def drop_recorder_indexes(db_path: str):
+    connection = sqlite3.connect(db_path)
+    for query in AddRecorderQueryIndexes.index_queries.values():
+        index_name = query.split(" on ")[0].split()[-1]
+        connection.execute(f"DROP INDEX {index_name}")
+    connection.commit()
+    connection.close()
+
+
+def record_events(recorder: MarketsRecorder, market: BenchmarkMarket, orders: int):
+    for index in range(orders):
+        order_id = f"NEW{index}"
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, BuyOrderCreatedEvent(
+            timestamp=index, type=OrderType.LIMIT, trading_pair="BTC-USDT", amount=Decimal(1), price=Decimal(100),
+            order_id=order_id, creation_timestamp=index, exchange_order_id=f"ENEW{index}"))
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, market, OrderFilledEvent(
+            timestamp=index, order_id=order_id, trading_pair="BTC-USDT", trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT, price=Decimal(100), amount=Decimal(1), trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"TNEW{index}"))
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, market, BuyOrderCompletedEvent(
+            timestamp=index, order_id=order_id, base_asset="BTC", quote_asset="USDT", base_asset_amount=Decimal(1),
+            quote_asset_amount=Decimal(100), order_type=OrderType.LIMIT))
+
+
+def run(db_path: str, db_mode: DBSqliteMode, fills: int) -> Dict[str, float]:
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    client_config_map.db_mode = db_mode
+    sql = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    market = BenchmarkMarket()
+    timings: Dict[str, float] = {}
+
+    @contextmanager
+    def timed(label: str):
+        start = time.perf_counter()
+        yield
+        timings[label] = time.perf_counter() - start
+
+    with timed("recorder startup"):
+        recorder = MarketsRecorder(sql=sql, markets=[market], config_file_path="config_0.yml", strategy_name="bench",
+                                   market_data_collection=MarketDataCollectionConfigMap())
+    with timed("trades of 10 configs"):
+        for index in range(10):
+            recorder.get_trades_for_config(f"config_{index}.yml")
+    with timed("fills of 1k orders"):
+        with sql.get_new_session() as session:
+            for index in range(0, fills // 2, fills // 2000):
+                session.query(TradeFill).filter(TradeFill.order_id == f"OID{index}").all()
+    with timed("executors of 100 controllers"):
+        for index in range(CONTROLLERS):
+            recorder.get_executors_by_controller(f"controller_{index}")
+    with timed("100 market states restores"):
+        for index in range(CONFIGS):
+            recorder.restore_market_states(f"config_{index}.yml", market)
+    with timed("1k orders recorded"):
+        record_events(recorder, market, 1000)
+    sql.engine.dispose()
+    return timings
+
+
+def main():
+    fills = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    with tempfile.TemporaryDirectory() as directory:
+        populated_path = os.path.join(directory, "populated.sqlite")
+        start = time.perf_counter()
+        populate(populated_path, fills)
+        print(f"Database with {fills:,} fills created in {time.perf_counter() - start:.1f} s")
+
+        results: List[Dict[str, float]] = []
+        for name, db_mode, with_indexes in (
+                ("defaults", DBSqliteMode(db_wal_mode=False, db_synchronous="FULL", db_mmap_size_mb=0,
+                                          db_statement_cache_size=128), False),
+                ("tuned", DBSqliteMode(), True)):
+            db_path = os.path.join(directory, f"{name}.sqlite")
+            shutil.copyfile(populated_path, db_path)
+            if not with_indexes:
+                drop_recorder_indexes(db_path)
+            results.append(run(db_path, db_mode, fills))
+
+        print(f"{'':>30} {'defaults':>10} {'tuned':>10}")
+        for label in results[0]:
+            print(f"{label:>30} {results[0][label]:>9.3f}s {results[1][label]:>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
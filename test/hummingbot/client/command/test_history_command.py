@@ -3,7 +3,6 @@ import datetime
 import time
 import unittest
 from decimal import Decimal
-from pathlib import Path
 from test.mock.mock_cli import CLIMockingAssistant
 from typing import Awaitable, List
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -35,8 +34,7 @@ class HistoryCommandTest(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.cli_mock_assistant.stop()
-        db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
-        db_path.unlink(missing_ok=True)
+        SQLConnectionManager.remove_db_files(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
         super().tearDown()
 
     @staticmethod
@@ -172,3 +170,12 @@ class HistoryCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_list_trades_flushes_the_recorded_trades(self, _: MagicMock):
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.markets_recorder = MagicMock()
+
+        self.app.list_trades(start_time=0)
+
+        self.app.markets_recorder.flush.assert_called_once()
@@ -74,3 +74,14 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    @patch("hummingbot.client.command.status_command.EventLoopMonitor.get_instance")
+    def test_strategy_status_includes_the_event_loop_health(self, event_loop_monitor_mock: MagicMock):
+        event_loop_monitor_mock.return_value.started = True
+        event_loop_monitor_mock.return_value.format_status.return_value = "  Event loop: lag p50 0.1 ms"
+        self.app.strategy = MagicMock()
+        self.app.strategy.format_status.return_value = "Strategy status"
+
+        status = self.async_run_with_timeout(self.app.strategy_status())
+
+        self.assertEqual("\nStrategy status\n\n  Event loop: lag p50 0.1 ms", status)
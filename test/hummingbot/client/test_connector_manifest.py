@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+
+from hummingbot.client.connector_manifest import ConnectorManifest, ConnectorManifestContent
+
+
+class ConnectorManifestTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.connector_dir = os.path.join(self.temp_dir.name, "connector", "exchange", "some_exchange")
+        os.makedirs(self.connector_dir)
+        self.write_source("some_exchange_utils.py", "EXAMPLE_PAIR = 'BTC-USDT'\n")
+        self.manifest = ConnectorManifest(path=os.path.join(self.temp_dir.name, "data", "connector_manifest.json"))
+        self.connectors = [{"name": "some_exchange", "example_pair": "BTC-USDT"}]
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def write_source(self, file_name: str, content: str):
+        with open(os.path.join(self.connector_dir, file_name), "w") as fd:
+            fd.write(content)
+
+    def test_load_without_manifest(self):
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_save_and_load(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+
+        self.assertEqual(ConnectorManifestContent(connectors=self.connectors, skipped_connector_dirs=[]),
+                         self.manifest.load([self.connector_dir]))
+        self.assertEqual([], [name for name in os.listdir(os.path.dirname(self.manifest.path)) if ".tmp" in name])
+
+    def test_save_and_load_skipped_connectors(self):
+        self.manifest.save([self.connector_dir], self.connectors, [self.connector_dir])
+
+        self.assertEqual([self.connector_dir], self.manifest.load([self.connector_dir]).skipped_connector_dirs)
+
+    def test_manifest_is_stale_when_a_connector_source_changes(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+
+        self.write_source("some_exchange_utils.py", "EXAMPLE_PAIR = 'WETH-USDT'\n")
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_manifest_is_stale_when_a_connector_source_is_added(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+
+        self.write_source("some_exchange_constants.py", "DEFAULT_DOMAIN = 'com'\n")
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_manifest_is_stale_when_a_connector_is_removed(self):
+        other_connector_dir = os.path.join(self.temp_dir.name, "connector", "exchange", "other_exchange")
+        os.makedirs(other_connector_dir)
+        self.manifest.save([self.connector_dir, other_connector_dir], self.connectors)
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_manifest_is_stale_when_the_schema_changes(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+
+        self.manifest.schema = ["name,example_pair,new_field"]
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_load_manifest_without_connectors(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+        with open(self.manifest.path) as fd:
+            manifest = json.load(fd)
+        del manifest["connectors"]
+        with open(self.manifest.path, "w") as fd:
+            json.dump(manifest, fd)
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_fingerprint_ignores_non_python_files(self):
+        fingerprint = self.manifest.fingerprint([self.connector_dir])
+
+        self.write_source("README.md", "Some exchange connector\n")
+
+        self.assertEqual(fingerprint, self.manifest.fingerprint([self.connector_dir]))
+
+    def test_load_corrupted_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest.path))
+        with open(self.manifest.path, "w") as fd:
+            fd.write("{\"version\": ")
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
+
+    def test_load_manifest_of_another_version(self):
+        self.manifest.save([self.connector_dir], self.connectors)
+        self.manifest.VERSION = ConnectorManifest.VERSION + 1
+
+        self.assertIsNone(self.manifest.load([self.connector_dir]))
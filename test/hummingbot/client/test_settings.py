@@ -1,8 +1,15 @@
+import importlib
+import json
+import os
+import tempfile
 import unittest
+from typing import List
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -61,3 +68,114 @@ class SettingsTest(unittest.TestCase):
         }
 
         self.assertEqual(expected_params, params)
+
+
+class AllConnectorSettingsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        data_path_patch = patch("hummingbot.client.connector_manifest.data_path", return_value=self.temp_dir.name)
+        data_path_patch.start()
+        self.addCleanup(data_path_patch.stop)
+        self.original_settings = AllConnectorSettings.all_connector_settings
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.original_settings
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def skipped_utils_modules(self) -> List[str]:
+        with open(os.path.join(self.temp_dir.name, "connector_manifest.json")) as fd:
+            skipped_connector_dirs = json.load(fd)["skipped_connector_dirs"]
+        return [f"hummingbot.connector.{os.path.basename(os.path.dirname(path))}.{os.path.basename(path)}."
+                f"{os.path.basename(path)}_utils" for path in skipped_connector_dirs]
+
+    def test_connector_manifest_is_generated_from_the_connector_utils(self):
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, "connector_manifest.json")))
+        self.assertIs(binance_utils.KEYS, settings["binance"].config_keys)
+        self.assertEqual(("hummingbot.connector.exchange.binance.binance_utils", None),
+                         settings["binance"].config_keys_source)
+        self.assertEqual(("hummingbot.connector.exchange.binance.binance_utils", "binance_us"),
+                         settings["binance_us"].config_keys_source)
+
+    def test_settings_from_connector_manifest_do_not_import_the_connector_utils(self):
+        generated_settings = dict(AllConnectorSettings.create_connector_settings())
+
+        with patch("hummingbot.client.settings.importlib.import_module",
+                   side_effect=ModuleNotFoundError) as import_module_mock:
+            settings = AllConnectorSettings.create_connector_settings()
+        # Only the connectors that couldn't be imported (missing dependencies) are tried again
+        self.assertEqual(self.skipped_utils_modules(),
+                         [call.args[0] for call in import_module_mock.call_args_list])
+
+        self.assertEqual(list(generated_settings), list(settings))
+        for name, generated_setting in generated_settings.items():
+            self.assertEqual(generated_setting._replace(config_keys=None), settings[name])
+
+        self.assertIsNone(settings["binance"].config_keys)
+        self.assertIs(binance_utils.KEYS, settings["binance"].get_config_keys())
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], settings["binance_us"].get_config_keys())
+        self.assertEqual("us", settings["binance_us"].domain_parameter)
+        self.assertEqual(binance_utils.DEFAULT_FEES, settings["binance"].trade_fee_schema)
+
+    def test_connector_manifest_with_invalid_entries_is_generated_again(self):
+        AllConnectorSettings.create_connector_settings()
+        manifest_path = os.path.join(self.temp_dir.name, "connector_manifest.json")
+        with open(manifest_path) as fd:
+            manifest = json.load(fd)
+        # An entry written by settings with other fields
+        manifest["connectors"][0]["removed_field"] = True
+        with open(manifest_path, "w") as fd:
+            json.dump(manifest, fd)
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIs(binance_utils.KEYS, settings["binance"].config_keys)
+        with open(manifest_path) as fd:
+            self.assertNotIn("removed_field", json.load(fd)["connectors"][0])
+
+    def test_connector_manifest_is_stale_when_the_settings_fields_change(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with patch.object(AllConnectorSettings, "_manifest_schema", return_value=["name,type"]):
+            with patch("hummingbot.client.settings.importlib.import_module",
+                       side_effect=importlib.import_module) as import_module_mock:
+                AllConnectorSettings.create_connector_settings()
+        import_module_mock.assert_called()
+
+    def test_connectors_skipped_for_a_missing_module_are_imported_again(self):
+        import_module = importlib.import_module
+
+        def import_module_without_binance(name: str):
+            if name.endswith(".binance_utils"):
+                raise ModuleNotFoundError(f"No module named '{name}'")
+            return import_module(name)
+
+        with patch("hummingbot.client.settings.importlib.import_module", side_effect=import_module_without_binance):
+            settings = AllConnectorSettings.create_connector_settings()
+        self.assertNotIn("binance", settings)
+
+        self.assertIn("hummingbot.connector.exchange.binance.binance_utils", self.skipped_utils_modules())
+
+        settings = AllConnectorSettings.create_connector_settings()
+        self.assertIs(binance_utils.KEYS, settings["binance"].config_keys)
+        self.assertIn("binance_us", settings)
+
+        # The manifest was saved again with the connector, it isn't imported anymore
+        self.assertNotIn("hummingbot.connector.exchange.binance.binance_utils", self.skipped_utils_modules())
+        with patch("hummingbot.client.settings.importlib.import_module",
+                   side_effect=ModuleNotFoundError) as import_module_mock:
+            settings = AllConnectorSettings.create_connector_settings()
+        self.assertNotIn("hummingbot.connector.exchange.binance.binance_utils",
+                         [call.args[0] for call in import_module_mock.call_args_list])
+        self.assertIn("binance", settings)
+
+    def test_paper_trade_settings_from_connector_manifest(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        self.assertIs(binance_utils.KEYS, AllConnectorSettings.get_connector_config_keys("binance_paper_trade"))
@@ -15,6 +15,11 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.api_throttler.async_throttler_base import current_request_priority
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.api_throttler.rate_limit_coordinator import CoordinatedAsyncThrottler
+from hummingbot.core.web_assistant.connections.connection_pool import is_order_request
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
@@ -1227,6 +1232,88 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
 
         self.assertEqual(result[0].min_notional_size, Decimal("10"))
 
+    def test_order_requests_have_priority_over_polling_requests(self):
+        priorities = {}
+        order_requests = {}
+
+        async def record_priority(name: str, result=None):
+            priorities[name] = current_request_priority()
+            order_requests[name] = is_order_request()
+            return result
+
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+        self.exchange._place_order = lambda **kwargs: record_priority("create", ("EOID1", 1640780000))
+        self.exchange._place_cancel = lambda order_id, tracked_order: record_priority("cancel", True)
+        self.exchange._update_time_synchronizer = AsyncMock()
+        self.exchange._status_polling_loop_fetch_updates = lambda: record_priority("status_polling")
+
+        self.async_run_with_timeout(self.exchange._place_order_and_process_update(order))
+        self.async_run_with_timeout(self.exchange._execute_order_cancel_and_process_update(order))
+        self.exchange._poll_notifier.set()
+        polling_task = asyncio.get_event_loop().create_task(self.exchange._status_polling_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        polling_task.cancel()
+
+        self.assertEqual(RequestPriority.HIGH, priorities["create"])
+        self.assertEqual(RequestPriority.HIGH, priorities["cancel"])
+        self.assertEqual(RequestPriority.LOW, priorities["status_polling"])
+        self.assertEqual(RequestPriority.NORMAL, current_request_priority())
+        self.assertEqual({"create": True, "cancel": True, "status_polling": False}, order_requests)
+        self.assertFalse(is_order_request())
+
+    def test_order_connections_warm_up_and_network_check_use_the_order_requests_pool(self):
+        priorities = []
+        order_requests = []
+
+        async def record_priority():
+            priorities.append(current_request_priority())
+            order_requests.append(is_order_request())
+
+        self.exchange._make_network_check_request = record_priority
+        warm_up_connections = self.exchange._web_assistants_factory.order_pool_profile.warm_up_connections
+
+        self.async_run_with_timeout(self.exchange._warm_up_order_connections(warm_up_connections))
+        self.async_run_with_timeout(self.exchange.check_network())
+
+        self.assertEqual([True] * (warm_up_connections + 1), order_requests)
+        self.assertEqual([RequestPriority.NORMAL] * (warm_up_connections + 1), priorities)
+        self.assertFalse(is_order_request())
+
+    def test_throttler_uses_the_rate_limits_coordinator_when_configured(self):
+        self.assertIs(AsyncThrottler, type(self.exchange._throttler))
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.rate_limits_coordinator_path = "/tmp/coordinator.sock"
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+
+        self.assertIsInstance(exchange._throttler, CoordinatedAsyncThrottler)
+        account_id = exchange._throttler.coordinator._account_id
+        self.assertTrue(account_id.startswith("binance:"))
+        self.assertNotIn("testAPIKey", account_id)
+
+        other_account_exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="otherAPIKey",
+            binance_api_secret="otherSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.assertNotEqual(account_id, other_account_exchange._throttler.coordinator._account_id)
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
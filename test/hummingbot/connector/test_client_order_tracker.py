@@ -1132,3 +1132,75 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_open_order(self, client_order_id: str) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=f"E{client_order_id}",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+    def test_tracking_state_changes_are_kept_once_requested(self):
+        self.tracker.start_tracking_order(self._create_open_order("OID1"))
+
+        self.assertEqual(({}, set()), self.tracker.pop_tracking_state_changes())
+
+        order = self._create_open_order("OID2")
+        self.tracker.start_tracking_order(order)
+
+        self.assertEqual(({"OID2": order.to_json()}, set()), self.tracker.pop_tracking_state_changes())
+        self.assertEqual(({}, set()), self.tracker.pop_tracking_state_changes())
+
+    def test_tracking_state_changes_replay_the_tracking_states(self):
+        orders = [self._create_open_order(f"OID{i}") for i in range(3)]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        self.tracker.pop_tracking_state_changes()
+        saved_states = {key: order.to_json() for key, order in self.tracker.all_updatable_orders.items()}
+
+        self.tracker.process_trade_update(TradeUpdate(
+            trade_id="1",
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            fill_price=Decimal("1.0"),
+            fill_base_amount=Decimal("100.0"),
+            fill_quote_amount=Decimal("100.0"),
+            fee=AddedToCostTradeFee(),
+            fill_timestamp=1,
+        ))
+        self.async_run_with_timeout(self.tracker.process_order_update(OrderUpdate(
+            client_order_id="OID2",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )))
+
+        updated_states, removed_order_ids = self.tracker.pop_tracking_state_changes()
+
+        self.assertEqual({"OID1"}, set(updated_states))
+        self.assertEqual({"OID2"}, removed_order_ids)
+        saved_states.update(updated_states)
+        for client_order_id in removed_order_ids:
+            del saved_states[client_order_id]
+        self.assertEqual({key: order.to_json() for key, order in self.tracker.all_updatable_orders.items()},
+                         saved_states)
+
+    def test_tracking_state_changes_include_lost_orders(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        order = self._create_open_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.tracker.pop_tracking_state_changes()
+
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+
+        updated_states, removed_order_ids = self.tracker.pop_tracking_state_changes()
+        self.assertEqual({"OID1": order.to_json()}, updated_states)
+        self.assertEqual(str(OrderState.FAILED.value), updated_states["OID1"]["last_state"])
+        self.assertEqual(set(), removed_order_ids)
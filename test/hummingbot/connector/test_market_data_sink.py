@@ -0,0 +1,106 @@
+import glob
+import os
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.connector.market_data_sink import MarketDataReader, MarketDataSink
+
+START = 1_700_000_000
+DAY = 24 * 60 * 60
+
+
+def levels(best_price: float, count: int, step: float) -> np.ndarray:
+    # Rows of OrderBook.depth_arrays(), [price, amount, update_id]
+    return np.array([[best_price + level * step, level + 1, 7] for level in range(count)], dtype=np.float64)
+
+
+class MarketDataSinkTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = self.temporary_directory.name
+        self.sink = MarketDataSink(path=self.path, flush_size=3)
+        self.reader = MarketDataReader(path=self.path)
+
+    def tearDown(self) -> None:
+        self.sink.stop()
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def files(self, data_type: str):
+        return sorted(os.path.basename(file_path)
+                      for file_path in glob.glob(os.path.join(self.path, f"binance_ETH-USDT_{data_type}_*.npz")))
+
+    def test_order_book_snapshots_are_written_every_flush_size_rows(self):
+        for index in range(4):
+            self.sink.append_order_book("binance", "ETH-USDT", START + index, levels(100 - index, 2, -1),
+                                        levels(101 + index, 3, 1))
+
+        self.assertEqual(1, len(self.files("order_book_snapshots")))
+        self.assertEqual(1, self.sink.buffered_count)
+        self.sink.flush()
+        self.assertEqual(2, len(self.files("order_book_snapshots")))
+        self.assertEqual(0, self.sink.buffered_count)
+
+        snapshots = self.reader.read_order_book_snapshots("binance", "ETH-USDT")
+        np.testing.assert_array_equal([START, START + 1, START + 2, START + 3], snapshots["timestamps"])
+        np.testing.assert_array_equal([0, 2, 4, 6, 8], snapshots["bid_offsets"])
+        np.testing.assert_array_equal([0, 3, 6, 9, 12], snapshots["ask_offsets"])
+        np.testing.assert_array_equal([[97, 1], [96, 2]], snapshots["bids"][6:8])
+        np.testing.assert_array_equal([[104, 1], [105, 2], [106, 3]], snapshots["asks"][9:12])
+
+    def test_trades_are_written_by_the_writer_thread(self):
+        self.sink.start()
+        self.sink.append_trade("binance", "ETH-USDT", START, 100, 1, True)
+        self.sink.append_trade("binance", "ETH-USDT", START + 1, 99, 2, False)
+
+        self.assertTrue(self.sink.flush(timeout=5))
+        trades = self.reader.read_trades("binance", "ETH-USDT")
+
+        np.testing.assert_array_equal([START, START + 1], trades["timestamps"])
+        np.testing.assert_array_equal([100, 99], trades["prices"])
+        np.testing.assert_array_equal([1, 2], trades["amounts"])
+        np.testing.assert_array_equal([True, False], trades["is_buy"])
+        self.assertEqual([], glob.glob(os.path.join(self.path, "*.tmp")))
+
+    def test_files_are_rotated_every_day(self):
+        self.sink.append_trade("binance", "ETH-USDT", START, 100, 1, True)
+        self.sink.append_trade("binance", "ETH-USDT", START + 3 * DAY, 101, 1, True)
+        self.sink.append_trade("binance", "BTC-USDT", START, 30000, 1, True)
+        self.sink.stop()
+
+        dates = [datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d") for timestamp in (START, START + 3 * DAY)]
+        self.assertEqual([f"binance_ETH-USDT_trades_{date}_{timestamp * 1000}.npz"
+                          for date, timestamp in zip(dates, (START, START + 3 * DAY))], self.files("trades"))
+        np.testing.assert_array_equal([100], self.reader.read_trades("binance", "ETH-USDT", START, START)["prices"])
+        np.testing.assert_array_equal([100, 101], self.reader.read_trades("binance", "ETH-USDT")["prices"])
+        np.testing.assert_array_equal([30000], self.reader.read_trades("binance", "BTC-USDT")["prices"])
+
+    def test_files_are_written_to_the_market_data_folder_by_default(self):
+        with patch("hummingbot.connector.market_data_sink.data_path", return_value=self.path):
+            sink = MarketDataSink(flush_size=1)
+            reader = MarketDataReader()
+        sink.start()
+        sink.append_trade("binance", "ETH-USDT", START, 100, 1, True)
+        sink.stop()
+
+        market_data_path = os.path.join(self.path, "market_data")
+        self.assertEqual(market_data_path, sink.path)
+        self.assertEqual(1, len(glob.glob(os.path.join(market_data_path, "*.npz"))))
+        self.assertEqual([], glob.glob(os.path.join(self.path, "*.npz")))
+        self.assertEqual(1, len(reader.read_trades("binance", "ETH-USDT")["timestamps"]))
+
+    def test_read_without_files(self):
+        snapshots = self.reader.read_order_book_snapshots("binance", "ETH-USDT")
+        trades = self.reader.read_trades("binance", "ETH-USDT")
+
+        self.assertEqual(0, len(snapshots["timestamps"]))
+        self.assertEqual((0, 2), snapshots["bids"].shape)
+        np.testing.assert_array_equal([0], snapshots["bid_offsets"])
+        self.assertEqual(0, len(trades["prices"]))
+        self.assertEqual(np.bool_, trades["is_buy"].dtype)
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -8,8 +10,13 @@ from unittest.mock import MagicMock, PropertyMock, patch
 import numpy as np
 from sqlalchemy import create_engine
 
-from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    MarketDataCollectionConfigMap,
+    MarketDataStorageEnum,
+)
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.market_data_sink import MarketDataReader
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -18,16 +25,20 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_order_state import MarketOrderState
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.write_behind_queue import WriteBehindQueue
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -85,6 +96,8 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.tracking_state_changes = None
+        self.restored_states = None
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
         pass
@@ -92,6 +105,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def pop_tracking_state_changes(self):
+        return self.tracking_state_changes
+
+    def restore_tracking_states(self, saved_states):
+        self.restored_states = saved_states
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -413,6 +432,7 @@ class MarketsRecorderTests(TestCase):
                 market_data_collection_enabled=True,
                 market_data_collection_interval=1,
                 market_data_collection_depth=20,
+                market_data_collection_storage=MarketDataStorageEnum.DATABASE,
             ),
         )
         with patch.object(self, "get_price_by_type") as get_price_by_type:
@@ -442,6 +462,48 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_to_files(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_collection_storage=MarketDataStorageEnum.FILES,
+            ),
+            market_data_path=temporary_directory.name,
+        )
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3]], dtype=np.float64))
+        with patch.object(self, "get_order_book") as get_order_book:
+            get_order_book.return_value = order_book
+            with self.assertRaises(asyncio.CancelledError):
+                self.async_run_with_timeout(recorder._record_market_data())
+        order_book.apply_trade(OrderBookTradeEvent(trading_pair=self.trading_pair, timestamp=1_700_000_000,
+                                                   type=TradeType.SELL, price=Decimal("3"), amount=Decimal("0.5")))
+        recorder.stop()
+
+        reader = MarketDataReader(temporary_directory.name)
+        snapshots = reader.read_order_book_snapshots(self.display_name, self.trading_pair)
+        # A snapshot before the first sleep and another one before the cancelled one
+        self.assertEqual(2, len(snapshots["timestamps"]))
+        np.testing.assert_array_equal([[3, 1], [2, 1]], snapshots["bids"][:2])
+        np.testing.assert_array_equal([[4, 1], [5, 1]], snapshots["asks"][:2])
+        trades = reader.read_trades(self.display_name, self.trading_pair)
+        np.testing.assert_array_equal([1_700_000_000], trades["timestamps"])
+        np.testing.assert_array_equal([3], trades["prices"])
+        np.testing.assert_array_equal([False], trades["is_buy"])
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+
     def test_store_position(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -495,3 +557,206 @@ class MarketsRecorderTests(TestCase):
             query = session.query(Executors)
             executors = query.all()
         self.assertEqual(1, len(executors))
+
+    def create_file_recorder(self, temporary_directory: str) -> MarketsRecorder:
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(temporary_directory, "test.sqlite"),
+        )
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_flush_interval=10,
+        )
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def test_started_recorder_writes_behind_with_read_your_writes(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            recorder = self.create_file_recorder(temporary_directory)
+            recorder.start()
+            self.assertTrue(recorder.write_queue.is_running)
+
+            create_event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=create_event.order_id,
+                trading_pair=create_event.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=create_event.type,
+                price=Decimal(1010),
+                amount=create_event.amount,
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            # The records are pending until the flush interval, but the recorder queries see them
+            with self.manager.get_new_session() as session:
+                self.assertEqual(0, session.query(Order).count())
+            trades = recorder.get_trades_for_config(self.config_file_path)
+            self.assertEqual(1, len(trades))
+            self.assertEqual("TradeId1", trades[0].exchange_trade_id)
+            with self.manager.get_new_session() as session:
+                order = session.query(Order).one()
+                self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+                self.assertEqual(2, len(order.status))
+
+            recorder.stop()
+            self.manager.engine.dispose()
+
+    def test_stop_flushes_pending_executors(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            recorder = self.create_file_recorder(temporary_directory)
+            recorder.start()
+            executor_config = PositionExecutorConfig(
+                id="123", timestamp=1234, trading_pair="ETH-USDT", connector_name="binance", side=TradeType.BUY,
+                entry_price=Decimal("1000"), amount=Decimal("1"), leverage=1,
+                triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.1"), stop_loss=Decimal("0.2")),
+            )
+            executor = MagicMock(spec=PositionExecutor)
+            executor.config = executor_config
+            for status in (RunnableStatus.RUNNING, RunnableStatus.TERMINATED):
+                executor.executor_info = ExecutorInfo(
+                    id="123", timestamp=1234, type="position_executor", close_timestamp=None, close_type=None,
+                    status=status, controller_id="test_controller", custom_info={},
+                    config=executor_config, net_pnl_pct=Decimal("0.1"), net_pnl_quote=Decimal("10"),
+                    cum_fees_quote=Decimal("0.1"), filled_amount_quote=Decimal("1"), is_active=False,
+                    is_trading=False)
+                recorder.store_or_update_executor(executor)
+
+            recorder.stop()
+
+            self.assertFalse(recorder.write_queue.is_running)
+            with self.manager.get_new_session() as session:
+                executors = session.query(Executors).all()
+                self.assertEqual(1, len(executors))
+                self.assertEqual(RunnableStatus.TERMINATED.value, executors[0].status)
+            self.manager.engine.dispose()
+
+    def test_in_memory_database_is_written_synchronously(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        recorder.start()
+
+        self.assertFalse(recorder.write_queue.is_running)
+        recorder.stop()
+
+    def create_order(self, recorder: MarketsRecorder, order_id: str):
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        ))
+
+    def test_tracking_states_saved_whole_when_the_connector_does_not_report_changes(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(),
+        )
+        self.tracking_states = {"OID1": {"last_state": "1"}}
+
+        self.create_order(recorder, "OID1")
+        recorder.restore_market_states(self.config_file_path, self)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+            self.assertEqual(0, session.query(MarketOrderState).count())
+        self.assertEqual(self.tracking_states, self.restored_states)
+
+    def test_tracking_states_saved_incrementally(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(),
+        )
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(MarketState(config_file_path=self.config_file_path, market=self.display_name,
+                                        timestamp=1, saved_state={"OID0": {"last_state": "1"}}))
+
+        # The first time all the tracking states are saved, replacing the previous ones
+        self.tracking_states = {"OID0": {"last_state": "1"}, "OID1": {"last_state": "1"}}
+        self.tracking_state_changes = ({}, set())
+        self.create_order(recorder, "OID1")
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketState).count())
+            self.assertEqual(self.tracking_states, {order_state.client_order_id: order_state.saved_state
+                                                    for order_state in session.query(MarketOrderState)})
+
+        # Then only the changes are written
+        self.tracking_states = None
+        self.tracking_state_changes = ({"OID1": {"last_state": "2"}, "OID2": {"last_state": "1"}}, {"OID0"})
+        self.create_order(recorder, "OID2")
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual({"OID1": {"last_state": "2"}, "OID2": {"last_state": "1"}}, self.restored_states)
+
+    def test_tracking_states_saved_whole_after_a_failed_write(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(),
+        )
+        self.tracking_states = {"OID1": {"last_state": "1"}}
+        self.tracking_state_changes = ({}, set())
+        self.create_order(recorder, "OID1")
+
+        # The order record is a duplicate, so the changes of the tracking states are not saved either
+        self.tracking_states = {"OID1": {"last_state": "1"}, "OID2": {"last_state": "1"}}
+        self.tracking_state_changes = ({"OID2": {"last_state": "1"}}, set())
+        with self.assertLogs(WriteBehindQueue.logger().name, level="ERROR"):
+            self.create_order(recorder, "OID1")
+
+        # The next save replaces all the tracking states, including the ones of the failed write
+        self.tracking_states = {"OID1": {"last_state": "2"}, "OID2": {"last_state": "1"}, "OID3": {"last_state": "1"}}
+        self.tracking_state_changes = ({"OID1": {"last_state": "2"}, "OID3": {"last_state": "1"}}, set())
+        self.create_order(recorder, "OID3")
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(self.tracking_states, self.restored_states)
@@ -11,7 +11,9 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.task_logs import TaskLogs
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -105,10 +107,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
+        self.throttler._task_logs = TaskLogs([
             TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        ])
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -240,7 +242,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
+        tasks_log = TaskLogs()
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
@@ -275,3 +277,113 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_waiting_tasks_acquire_in_order_when_capacity_is_freed(self):
+        # The retry interval is way longer than the limit interval, waiting tasks are woken up by the freed capacity
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="fast", limit=2, time_interval=0.2)],
+                                   retry_interval=10.0, safety_margin_pct=0)
+        acquired = []
+
+        async def task(task_id: int):
+            async with throttler.execute_task(limit_id="fast"):
+                acquired.append((task_id, time.time()))
+
+        async def run_tasks():
+            await asyncio.gather(*[task(task_id) for task_id in range(5)])
+
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_tasks(), 2.0))
+
+        self.assertEqual(list(range(5)), [task_id for task_id, _ in acquired])
+        acquired_times = [timestamp - start for _, timestamp in acquired]
+        self.assertLess(acquired_times[1], 0.1)
+        self.assertGreaterEqual(acquired_times[2], 0.2)
+        self.assertGreaterEqual(acquired_times[4], 0.4)
+        self.assertLess(acquired_times[4], 0.8)
+        self.assertEqual(0, len(throttler._task_logs.waiters("fast")))
+
+    def test_cancelled_waiting_task_lets_the_next_one_acquire(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="fast", limit=1, time_interval=0.2)],
+                                   safety_margin_pct=0)
+        acquired = []
+
+        async def task(task_id: int):
+            async with throttler.execute_task(limit_id="fast"):
+                acquired.append(task_id)
+
+        async def run_tasks():
+            await task(0)
+            first_waiting = asyncio.ensure_future(task(1))
+            second_waiting = asyncio.ensure_future(task(2))
+            await asyncio.sleep(0.05)
+            first_waiting.cancel()
+            await asyncio.wait_for(second_waiting, 1.0)
+
+        self.ev_loop.run_until_complete(run_tasks())
+
+        self.assertEqual([0, 2], acquired)
+        self.assertEqual(0, len(throttler._task_logs.waiters("fast")))
+
+    def test_execute_task_priority(self):
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(limit_id=TEST_POOL_ID)._priority)
+        self.assertEqual(RequestPriority.HIGH,
+                         self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.HIGH)._priority)
+
+        with request_priority(RequestPriority.LOW):
+            self.assertEqual(RequestPriority.LOW, self.throttler.execute_task(limit_id=TEST_POOL_ID)._priority)
+            self.assertEqual(RequestPriority.HIGH, self.throttler.execute_task(
+                limit_id=TEST_POOL_ID, priority=RequestPriority.HIGH)._priority)
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(limit_id=TEST_POOL_ID)._priority)
+
+    def test_higher_priority_tasks_get_the_shared_capacity_first(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id="pool", limit=2, time_interval=0.2),
+            RateLimit(limit_id="cancel", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool")]),
+            RateLimit(limit_id="balance", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool")]),
+        ], safety_margin_pct=0)
+        acquired = []
+
+        async def task(limit_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                acquired.append(limit_id)
+
+        async def run_tasks():
+            # The balance polls use up the capacity and queue up before the cancels
+            tasks = [asyncio.ensure_future(task("balance", RequestPriority.LOW)) for _ in range(4)]
+            await asyncio.sleep(0.01)
+            tasks.extend(asyncio.ensure_future(task("cancel", RequestPriority.HIGH)) for _ in range(2))
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_tasks(), 2.0))
+
+        self.assertEqual(["balance", "balance", "cancel", "cancel", "balance", "balance"], acquired)
+        wait_time_stats = throttler.wait_time_stats()
+        self.assertEqual(4, wait_time_stats[RequestPriority.LOW].count)
+        self.assertEqual(2, wait_time_stats[RequestPriority.HIGH].count)
+        self.assertEqual(0, wait_time_stats[RequestPriority.NORMAL].count)
+        self.assertGreaterEqual(wait_time_stats[RequestPriority.LOW].max_time, 0.4)
+        self.assertLess(wait_time_stats[RequestPriority.HIGH].max_time, 0.4)
+
+    def test_lower_priority_tasks_use_the_capacity_not_reserved_by_higher_priority_ones(self):
+        throttler = AsyncThrottler(rate_limits=[
+            RateLimit(limit_id="pool", limit=10, time_interval=0.5),
+            RateLimit(limit_id="cancel", limit=1, time_interval=0.5, linked_limits=[LinkedLimitWeightPair("pool")]),
+            RateLimit(limit_id="balance", limit=10, time_interval=0.5, linked_limits=[LinkedLimitWeightPair("pool")]),
+        ], safety_margin_pct=0)
+
+        async def run_tasks():
+            async with throttler.execute_task(limit_id="cancel", priority=RequestPriority.HIGH):
+                pass
+            # The second cancel waits for its own limit, it only reserves 1 of the pool capacity
+            waiting_cancel = asyncio.ensure_future(throttler.execute_task(
+                limit_id="cancel", priority=RequestPriority.HIGH).acquire())
+            await asyncio.sleep(0.01)
+            for _ in range(8):
+                await asyncio.wait_for(throttler.execute_task(limit_id="balance", priority=RequestPriority.LOW).acquire(),
+                                       0.1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(throttler.execute_task(limit_id="balance", priority=RequestPriority.LOW).acquire(),
+                                       0.1)
+            await asyncio.wait_for(waiting_cancel, 1.0)
+
+        self.ev_loop.run_until_complete(run_tasks())
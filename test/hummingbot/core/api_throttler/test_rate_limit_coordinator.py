@@ -0,0 +1,195 @@
+import asyncio
+import os
+import tempfile
+from decimal import Decimal
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_coordinator import (
+    CoordinatedAsyncThrottler,
+    RateLimitCoordinator,
+    rate_limit_from_json,
+    rate_limit_to_json,
+)
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+ACCOUNT = "binance"
+
+
+class RateLimitCoordinatorTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temporary_directory.name, "coordinator.sock")
+        self.rate_limits = [
+            RateLimit(limit_id="pool", limit=10, time_interval=0.5),
+            RateLimit(limit_id="/order", limit=10, time_interval=0.5, linked_limits=[LinkedLimitWeightPair("pool")]),
+            RateLimit(limit_id="/balance", limit=10, time_interval=0.5, linked_limits=[LinkedLimitWeightPair("pool")]),
+        ]
+        self.coordinator = RateLimitCoordinator(socket_path=self.socket_path)
+        await self.coordinator.start()
+        self.throttlers = []
+
+    async def asyncTearDown(self) -> None:
+        for throttler in self.throttlers:
+            throttler.coordinator.stop()
+        await self.coordinator.stop()
+        self.temporary_directory.cleanup()
+        await super().asyncTearDown()
+
+    def create_throttler(self, share_pct: Decimal = Decimal("50"), account: str = ACCOUNT,
+                         coordinator_timeout: float = 5.0):
+        throttler = CoordinatedAsyncThrottler(rate_limits=self.rate_limits,
+                                              coordinator_path=self.socket_path,
+                                              account_id=account,
+                                              safety_margin_pct=0,
+                                              limits_share_percentage=share_pct,
+                                              reconnect_interval=0.2,
+                                              coordinator_timeout=coordinator_timeout)
+        self.throttlers.append(throttler)
+        return throttler
+
+    async def acquire(self, throttler: CoordinatedAsyncThrottler, requests: int, limit_id: str = "/order",
+                      timeout: float = 1.0):
+        for _ in range(requests):
+            await asyncio.wait_for(throttler.execute_task(limit_id=limit_id).acquire(), timeout)
+
+    def test_rate_limit_json(self):
+        rate_limit = rate_limit_from_json(rate_limit_to_json(self.rate_limits[1]))
+
+        self.assertEqual("/order", rate_limit.limit_id)
+        self.assertEqual(10, rate_limit.limit)
+        self.assertEqual(0.5, rate_limit.time_interval)
+        self.assertEqual(1, rate_limit.weight)
+        self.assertEqual([LinkedLimitWeightPair("pool", 1)], rate_limit.linked_limits)
+
+    async def test_single_bot_uses_the_whole_account_limit(self):
+        throttler = self.create_throttler()
+
+        await self.acquire(throttler, 10)
+
+        self.assertTrue(throttler.coordinator.is_connected)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(throttler, 1, limit_id="/balance", timeout=0.1)
+
+    async def test_bots_share_the_account_limit(self):
+        first_throttler = self.create_throttler()
+        second_throttler = self.create_throttler()
+
+        await self.acquire(first_throttler, 7)
+        await self.acquire(second_throttler, 3, limit_id="/balance")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(first_throttler, 1, timeout=0.1)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(second_throttler, 1, timeout=0.1)
+        # The capacity is granted again once the account window has moved on
+        await self.acquire(second_throttler, 10)
+
+    async def test_accounts_have_their_own_limits(self):
+        await self.acquire(self.create_throttler(account="binance"), 10)
+        await self.acquire(self.create_throttler(account="kucoin"), 10)
+
+    async def test_higher_priority_requests_of_any_bot_are_granted_first(self):
+        polling_throttler = self.create_throttler()
+        trading_throttler = self.create_throttler()
+        granted = []
+
+        async def request(throttler: CoordinatedAsyncThrottler, limit_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                granted.append(limit_id)
+
+        await self.acquire(polling_throttler, 10, limit_id="/balance")
+        polls = [asyncio.ensure_future(request(polling_throttler, "/balance", RequestPriority.LOW)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        orders = [asyncio.ensure_future(request(trading_throttler, "/order", RequestPriority.HIGH)) for _ in range(2)]
+        await asyncio.wait_for(asyncio.gather(*polls, *orders), 2.0)
+
+        self.assertEqual(["/order", "/order", "/balance", "/balance"], granted)
+        self.assertEqual(2, trading_throttler.wait_time_stats()[RequestPriority.HIGH].count)
+
+    async def test_cancelled_request_releases_its_place(self):
+        first_throttler = self.create_throttler()
+        second_throttler = self.create_throttler()
+        await self.acquire(first_throttler, 10)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(second_throttler, 1, timeout=0.05)
+        await asyncio.sleep(0.01)
+
+        coordinator_throttler = self.coordinator._throttlers[ACCOUNT]
+        self.assertEqual(0, len(coordinator_throttler._task_logs.waiters("/order")))
+
+    async def test_fallback_to_the_share_percentage_when_the_coordinator_is_not_available(self):
+        await self.coordinator.stop()
+        throttler = self.create_throttler()
+
+        await self.acquire(throttler, 5)
+
+        self.assertFalse(throttler.coordinator.is_connected)
+        self.assertFalse(throttler.coordinator.is_available)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(throttler, 1, timeout=0.1)
+
+    async def test_fallback_when_the_coordinator_dies_and_reconnection(self):
+        throttler = self.create_throttler()
+        await self.acquire(throttler, 2)
+
+        await self.coordinator.stop()
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(throttler.coordinator.is_connected)
+        # The requests granted by the coordinator count against the local share of the limits
+        await self.acquire(throttler, 3)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.acquire(throttler, 1, timeout=0.1)
+
+        self.coordinator = RateLimitCoordinator(socket_path=self.socket_path)
+        await self.coordinator.start()
+        await asyncio.sleep(0.5)
+        await self.acquire(throttler, 10)
+
+        self.assertTrue(throttler.coordinator.is_connected)
+
+    async def test_register_adds_new_limits_of_an_account(self):
+        self.coordinator.register(ACCOUNT, self.rate_limits[:2], safety_margin_pct=0)
+        self.coordinator.register(ACCOUNT, [RateLimit(limit_id="pool", limit=1, time_interval=1)] + self.rate_limits[2:],
+                                  safety_margin_pct=0)
+
+        throttler = self.coordinator._throttlers[ACCOUNT]
+        rate_limit, related_limits = throttler.get_related_limits("/balance")
+        self.assertEqual("/balance", rate_limit.limit_id)
+        self.assertEqual(10, related_limits[0][0].limit)
+
+    async def test_waiting_requests_ping_the_coordinator(self):
+        first_throttler = self.create_throttler()
+        second_throttler = self.create_throttler(coordinator_timeout=0.2)
+        await self.acquire(first_throttler, 10)
+
+        # Waits longer than the coordinator timeout for the account window to move on, the pings keep it alive
+        await self.acquire(second_throttler, 1)
+
+        self.assertTrue(second_throttler.coordinator.is_connected)
+
+    async def test_fallback_when_the_coordinator_hangs(self):
+        await self.coordinator.stop()
+        connections = []
+
+        async def accept_and_never_respond(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            connections.append(writer)
+
+        hung_server = await asyncio.start_unix_server(accept_and_never_respond, path=self.socket_path)
+        throttler = self.create_throttler(coordinator_timeout=0.2)
+        try:
+            await self.acquire(throttler, 1)
+
+            self.assertEqual(1, len(connections))
+            self.assertFalse(throttler.coordinator.is_connected)
+            self.assertFalse(throttler.coordinator.is_available)
+            # The following requests go straight to the local share of the limits
+            await self.acquire(throttler, 4)
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.acquire(throttler, 1, timeout=0.1)
+        finally:
+            hung_server.close()
+            await hung_server.wait_closed()
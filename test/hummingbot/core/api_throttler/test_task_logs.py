@@ -0,0 +1,66 @@
+import unittest
+
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.task_logs import TaskLogs
+
+
+class TaskLogsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = RateLimit(limit_id="POOL", limit=10, time_interval=1.0)
+        self.other = RateLimit(limit_id="OTHER", limit=2, time_interval=10.0)
+        self.task_logs = TaskLogs()
+
+    def test_capacity_used_by_limit(self):
+        self.task_logs.append(TaskLog(timestamp=100.0, rate_limit=self.pool, weight=3))
+        self.task_logs.append(TaskLog(timestamp=100.5, rate_limit=self.pool, weight=2))
+        self.task_logs.append(TaskLog(timestamp=100.5, rate_limit=self.other, weight=1))
+
+        self.assertEqual(3, len(self.task_logs))
+        self.assertEqual(5, self.task_logs.capacity_used(self.pool, now=101.0, safety_margin_pct=0))
+        self.assertEqual(1, self.task_logs.capacity_used(self.other, now=101.0, safety_margin_pct=0))
+        self.assertEqual(0, self.task_logs.capacity_used(RateLimit("UNUSED", 1, 1.0), now=101.0, safety_margin_pct=0))
+
+    def test_capacity_used_drops_expired_task_logs(self):
+        self.task_logs.append(TaskLog(timestamp=100.0, rate_limit=self.pool, weight=3))
+        self.task_logs.append(TaskLog(timestamp=100.5, rate_limit=self.pool, weight=2))
+
+        # The end of the time interval is still within it
+        self.assertEqual(5, self.task_logs.capacity_used(self.pool, now=101.0, safety_margin_pct=0))
+        self.assertEqual(2, self.task_logs.capacity_used(self.pool, now=101.01, safety_margin_pct=0))
+        self.assertEqual(1, len(self.task_logs))
+        # The safety margin extends the time interval
+        self.assertEqual(2, self.task_logs.capacity_used(self.pool, now=101.59, safety_margin_pct=0.1))
+        self.assertEqual(0, self.task_logs.capacity_used(self.pool, now=101.61, safety_margin_pct=0.1))
+
+    def test_flush_all_limits(self):
+        self.task_logs.append(TaskLog(timestamp=100.0, rate_limit=self.pool, weight=1))
+        self.task_logs.append(TaskLog(timestamp=100.0, rate_limit=self.other, weight=1))
+        self.task_logs.append(TaskLog(timestamp=105.0, rate_limit=self.other, weight=1))
+
+        self.task_logs.flush(now=110.5, safety_margin_pct=0)
+
+        self.assertEqual([105.0], [task_log.timestamp for task_log in self.task_logs])
+
+    def test_time_until_capacity(self):
+        self.task_logs.append(TaskLog(timestamp=100.0, rate_limit=self.pool, weight=4))
+        self.task_logs.append(TaskLog(timestamp=100.2, rate_limit=self.pool, weight=4))
+        self.task_logs.append(TaskLog(timestamp=100.4, rate_limit=self.pool, weight=2))
+
+        self.assertAlmostEqual(0.5, self.task_logs.time_until_capacity(self.pool, 1, now=100.5, safety_margin_pct=0),
+                               places=5)
+        # Two task logs have to expire to free a weight of 5
+        self.assertAlmostEqual(0.7, self.task_logs.time_until_capacity(self.pool, 5, now=100.5, safety_margin_pct=0),
+                               places=5)
+        self.assertAlmostEqual(0.8, self.task_logs.time_until_capacity(self.pool, 5, now=100.5, safety_margin_pct=0.1),
+                               places=5)
+        self.assertEqual(0, self.task_logs.time_until_capacity(self.other, 2, now=100.5, safety_margin_pct=0))
+        self.assertEqual(float("inf"), self.task_logs.time_until_capacity(self.other, 3, now=100.5, safety_margin_pct=0))
+
+    def test_waiters_by_limit_id(self):
+        waiters = self.task_logs.waiters("POOL")
+
+        self.assertIs(waiters, self.task_logs.waiters("POOL"))
+        self.assertIsNot(waiters, self.task_logs.waiters("OTHER"))
+        self.assertEqual(0, len(waiters))
@@ -1,11 +1,78 @@
 #!/usr/bin/env python
 
 import logging
+import math
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
+def walk_price_for_volume(entries, volume):
+    cumulative_volume = 0.0
+    result_price = math.nan
+    for row in entries:
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            result_price = row.price
+            break
+    return result_price, min(cumulative_volume, volume)
+
+
+def walk_vwap_for_volume(entries, volume):
+    total_cost = 0.0
+    total_volume = 0.0
+    result_vwap = math.nan
+    for row in entries:
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+        if total_volume >= volume:
+            total_cost -= row.amount * row.price
+            total_volume -= row.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * row.price
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+            break
+    return result_vwap, min(total_volume, volume)
+
+
+def walk_price_for_quote_volume(entries, quote_volume):
+    cumulative_volume = 0.0
+    result_price = math.nan
+    for row in entries:
+        cumulative_volume += row.amount * row.price
+        if cumulative_volume >= quote_volume:
+            result_price = row.price
+            break
+    return result_price, min(cumulative_volume, quote_volume)
+
+
+def walk_quote_volume_for_base_amount(entries, base_amount):
+    cumulative_volume = 0.0
+    cumulative_base_amount = 0.0
+    for row in entries:
+        row_amount = row.amount
+        if row_amount + cumulative_base_amount >= base_amount:
+            row_amount = base_amount - cumulative_base_amount
+        cumulative_base_amount += row_amount
+        cumulative_volume += row_amount * row.price
+        if cumulative_base_amount >= base_amount:
+            break
+    return cumulative_volume
+
+
+def walk_volume_for_price(entries, is_buy, price, quote):
+    cumulative_volume = 0.0
+    result_price = math.nan
+    for row in entries:
+        if (is_buy and row.price > price) or (not is_buy and row.price < price):
+            break
+        cumulative_volume += row.amount * row.price if quote else row.amount
+        result_price = row.price
+    return result_price, cumulative_volume
+
+
 class OrderBookUnitTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -50,6 +117,147 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def assert_same(self, expected, actual):
+        for expected_value, actual_value in zip(expected, actual):
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value))
+            else:
+                self.assertEqual(expected_value, actual_value)
+
+    def assert_queries_match_book_walk(self, order_book: OrderBook, rng: np.random.Generator):
+        for is_buy in (True, False):
+            entries = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+            total_base = sum(row.amount for row in entries)
+            prices = [row.price for row in entries] or [100.0]
+            for volume in list(rng.uniform(0, total_base * 1.2 + 1, 10)) + [0.0, total_base]:
+                result = order_book.get_price_for_volume(is_buy, volume)
+                self.assert_same(walk_price_for_volume(entries, volume), (result.result_price, result.result_volume))
+                if volume > 0:
+                    result = order_book.get_vwap_for_volume(is_buy, volume)
+                    self.assert_same(walk_vwap_for_volume(entries, volume),
+                                     (result.result_price, result.result_volume))
+                result = order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                self.assert_same((walk_quote_volume_for_base_amount(entries, volume),), (result.result_volume,))
+                quote_volume = volume * prices[0]
+                result = order_book.get_price_for_quote_volume(is_buy, quote_volume)
+                self.assert_same(walk_price_for_quote_volume(entries, quote_volume),
+                                 (result.result_price, result.result_volume))
+            for price in list(rng.uniform(min(prices) - 1, max(prices) + 1, 10)) + prices[:3]:
+                result = order_book.get_volume_for_price(is_buy, price)
+                self.assert_same(walk_volume_for_price(entries, is_buy, price, False),
+                                 (result.result_price, result.result_volume))
+                result = order_book.get_quote_volume_for_price(is_buy, price)
+                self.assert_same(walk_volume_for_price(entries, is_buy, price, True),
+                                 (result.result_price, result.result_volume))
+
+    def test_depth_index_queries_match_book_walk(self):
+        rng = np.random.default_rng(42)
+        order_book = OrderBook()
+        self.assert_queries_match_book_walk(order_book, rng)
+
+        bid_prices = np.round(np.linspace(99.99, 90, 1000), 2)
+        ask_prices = np.round(np.linspace(100.01, 110, 1000), 2)
+        order_book.apply_snapshot(
+            [OrderBookRow(price, amount, 1) for price, amount in zip(bid_prices, rng.uniform(0.001, 5, 1000))],
+            [OrderBookRow(price, amount, 1) for price, amount in zip(ask_prices, rng.uniform(0.001, 5, 1000))],
+            1)
+        self.assert_queries_match_book_walk(order_book, rng)
+
+        for update_id in range(2, 52):
+            bids = [OrderBookRow(round(float(price), 2), float(amount), update_id)
+                    for price, amount in zip(rng.uniform(95, 100.5, 20), rng.choice([0, 0.5, 1.5, 7], 20))]
+            asks = [OrderBookRow(round(float(price), 2), float(amount), update_id)
+                    for price, amount in zip(rng.uniform(99.5, 105, 20), rng.choice([0, 0.5, 1.5, 7], 20))]
+            order_book.apply_diffs(bids, asks, update_id)
+            self.assert_queries_match_book_walk(order_book, rng)
+
+    def test_depth_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(
+            np.array([[1, 1, 1], [2, 1.5, 2], [3, 2, 3]], dtype=np.float64),
+            np.array([[4, 1, 1], [5, 2.5, 2]], dtype=np.float64))
+
+        bids, asks = order_book.depth_arrays(2)
+        self.assertEqual([[3., 2., 3.], [2., 1.5, 2.]], bids.tolist())
+        self.assertEqual([[4., 1., 1.], [5., 2.5, 2.]], asks.tolist())
+
+        bids, asks = order_book.depth_arrays(10)
+        self.assertEqual(3, len(bids))
+        self.assertEqual(2, len(asks))
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(bids.tolist(), bids_df.values.tolist())
+        self.assertEqual([list(row) for row in order_book.ask_entries()], asks_df.values.tolist())
+
+    def test_depth_arrays_reuses_caller_buffers(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2]], dtype=np.float64),
+                                        np.array([[4, 1, 1]], dtype=np.float64))
+        bids_buffer = np.zeros((5, 3), dtype=np.float64)
+        asks_buffer = np.zeros((5, 3), dtype=np.float64)
+
+        bids, asks = order_book.depth_arrays(5, bids_buffer, asks_buffer)
+
+        self.assertTrue(np.shares_memory(bids, bids_buffer))
+        self.assertTrue(np.shares_memory(asks, asks_buffer))
+        self.assertEqual([[2., 1., 2.], [1., 1., 1.]], bids_buffer[:2].tolist())
+        self.assertEqual([[4., 1., 1.]], asks.tolist())
+        with self.assertRaises(ValueError):
+            order_book.depth_arrays(6, bids_buffer, asks_buffer)
+        with self.assertRaises(ValueError):
+            order_book.depth_arrays(-1)
+
+    def test_apply_raw_diffs_matches_apply_diffs(self):
+        snapshot_bids = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        snapshot_asks = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        raw_bids = [["2.5", "0.12345678"], ["2", "0"], ["0.1", "3", "ignored"]]
+        raw_asks = [["4", "2.5"], ["5.75", "0.001"], ["6", "0.0"]]
+        row_order_book = OrderBook()
+        raw_order_book = OrderBook()
+        array_order_book = OrderBook()
+        for order_book in (row_order_book, raw_order_book, array_order_book):
+            order_book.apply_numpy_snapshot(snapshot_bids, snapshot_asks)
+
+        row_order_book.apply_diffs([OrderBookRow(float(price), float(amount), 7) for price, amount, *_ in raw_bids],
+                                   [OrderBookRow(float(price), float(amount), 7) for price, amount, *_ in raw_asks],
+                                   7)
+        raw_order_book.apply_raw_diffs(raw_bids, raw_asks, 7)
+        array_order_book.apply_raw_diffs(np.array([[2.5, 0.12345678], [2, 0], [0.1, 3]]),
+                                         np.array([[4, 2.5], [5.75, 0.001], [6, 0]]),
+                                         7)
+
+        expected_bids = list(row_order_book.bid_entries())
+        expected_asks = list(row_order_book.ask_entries())
+        self.assertEqual(expected_bids, list(raw_order_book.bid_entries()))
+        self.assertEqual(expected_asks, list(raw_order_book.ask_entries()))
+        self.assertEqual(expected_bids, list(array_order_book.bid_entries()))
+        self.assertEqual(expected_asks, list(array_order_book.ask_entries()))
+        self.assertEqual(7, raw_order_book.last_diff_uid)
+        self.assertEqual(3.0, raw_order_book.get_price(False))
+
+    def test_apply_raw_snapshot_matches_apply_numpy_snapshot(self):
+        bids = np.array([[1, 1, 3], [2, 1.5, 3], [3, 1, 3]], dtype=np.float64)
+        asks = np.array([[4, 1, 3], [5, 0.25, 3], [6, 1, 3]], dtype=np.float64)
+        numpy_order_book = OrderBook()
+        raw_order_book = OrderBook()
+        array_order_book = OrderBook()
+        numpy_order_book.apply_numpy_diffs(np.array([[0.5, 1.0, 1.0]]), np.array([[7.0, 1.0, 1.0]]))
+        raw_order_book.apply_raw_diffs([["0.5", "1"]], [["7", "1"]], 1)
+
+        numpy_order_book.apply_numpy_snapshot(bids, asks)
+        raw_order_book.apply_raw_snapshot([[str(price), str(amount)] for price, amount, _ in bids],
+                                          [[str(price), str(amount)] for price, amount, _ in asks],
+                                          3)
+        array_order_book.apply_raw_snapshot(bids[:, :2], asks[:, :2], 3)
+
+        expected_bids = list(numpy_order_book.bid_entries())
+        expected_asks = list(numpy_order_book.ask_entries())
+        self.assertEqual(expected_bids, list(raw_order_book.bid_entries()))
+        self.assertEqual(expected_asks, list(raw_order_book.ask_entries()))
+        self.assertEqual(expected_bids, list(array_order_book.bid_entries()))
+        self.assertEqual(expected_asks, list(array_order_book.ask_entries()))
+        self.assertEqual(3, raw_order_book.snapshot_uid)
+        self.assertEqual((3.0, 4.0), (raw_order_book.get_price(False), raw_order_book.get_price(True)))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,74 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerInitializationTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs: List[str] = [f"COIN{index}-HBOT" for index in range(25)]
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+        self.release_requests = asyncio.Event()
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        if trading_pair != self.trading_pairs[0]:
+            await self.release_requests.wait()
+        self.requests_in_flight -= 1
+        return OrderBook()
+
+    async def test_order_books_initialized_concurrently(self):
+        tracker = OrderBookTracker(data_source=self.data_source,
+                                   trading_pairs=self.trading_pairs,
+                                   concurrent_snapshots=True)
+        tracker._sleep = AsyncMock()
+        tracker._track_single_book = AsyncMock()
+
+        init_task = asyncio.ensure_future(tracker._init_order_books())
+        await tracker.wait_order_book_ready(self.trading_pairs[0])
+
+        self.assertTrue(tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertFalse(tracker.ready)
+        self.assertIn(self.trading_pairs[0], tracker._tracking_tasks)
+
+        self.release_requests.set()
+        await init_task
+
+        self.assertTrue(tracker.ready)
+        self.assertTrue(all(tracker.is_order_book_ready(trading_pair) for trading_pair in self.trading_pairs))
+        self.assertEqual(OrderBookTracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS, self.max_requests_in_flight)
+        self.assertEqual(set(self.trading_pairs), set(tracker.order_books))
+        tracker._sleep.assert_not_called()
+
+        tracker.stop()
+        self.assertFalse(tracker.is_order_book_ready(self.trading_pairs[0]))
+
+    async def test_order_books_initialized_sequentially_by_default(self):
+        self.release_requests.set()
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:3])
+        tracker._sleep = AsyncMock()
+        tracker._track_single_book = AsyncMock()
+
+        await tracker._init_order_books()
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(1, self.max_requests_in_flight)
+        self.assertEqual(3, tracker._sleep.call_count)
+
+    async def test_untracked_order_book_is_not_ready(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs[:1])
+
+        self.assertFalse(tracker.is_order_book_ready("UNTRACKED-HBOT"))
+        with self.assertRaises(ValueError):
+            await tracker.wait_order_book_ready("UNTRACKED-HBOT")
+        self.assertNotIn("UNTRACKED-HBOT", tracker._order_book_ready_events)
@@ -267,6 +267,37 @@ class TokenAmountTests(TestCase):
         self.assertEqual(amount, TokenAmount.from_json(amount.to_json()))
 
 
+class TradeFeeSchemaTests(TestCase):
+
+    def test_json_serialization(self):
+        schema = TradeFeeSchema(
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            taker_fixed_fees=[TokenAmount(token="COINALPHA", amount=Decimal("20.6"))],
+        )
+
+        expected_json = {
+            "percent_fee_token": None,
+            "maker_percent_fee_decimal": "0.001",
+            "taker_percent_fee_decimal": "0.002",
+            "buy_percent_fee_deducted_from_returns": False,
+            "maker_fixed_fees": [],
+            "taker_fixed_fees": [{"token": "COINALPHA", "amount": "20.6"}],
+        }
+
+        self.assertEqual(expected_json, schema.to_json())
+
+    def test_json_deserialization(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.00075"),
+            taker_percent_fee_decimal=Decimal("0.00075"),
+            maker_fixed_fees=[TokenAmount(token="BNB", amount=Decimal("0.1"))],
+        )
+
+        self.assertEqual(schema, TradeFeeSchema.from_json(schema.to_json()))
+
+
 class TradeUpdateTests(TestCase):
 
     def test_json_serialization(self):
@@ -4,8 +4,18 @@ import unittest
 
 import pandas as pd
 
-from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.clock import Clock, ClockMode, TimingHistogram
 from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class SleepingIterator(StrategyPyBase):
+    def __init__(self, duration: float):
+        super().__init__()
+        self.duration = duration
+
+    def tick(self, timestamp: float):
+        time.sleep(self.duration)
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -122,3 +132,68 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_timing_disabled_by_default(self):
+        self.clock_backtest.add_iterator(TimeIterator())
+        self.clock_backtest.backtest()
+
+        self.assertFalse(self.clock_backtest.timing_enabled)
+        self.assertIsNone(self.clock_backtest.timings)
+
+    def test_timing_histogram(self):
+        histogram = TimingHistogram("test", overrun_threshold=0.01)
+        for duration in [0.0000005, 0.000003, 0.000003, 0.001, 0.02]:
+            histogram.add(duration)
+
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(1, histogram.overruns)
+        self.assertAlmostEqual(0.0210065005, histogram.total)
+        self.assertEqual(0.02, histogram.max)
+        self.assertEqual([1, 2], histogram.buckets[:2])
+        self.assertEqual(1, histogram.buckets[9])  # 1000 microseconds
+        self.assertEqual(1, histogram.buckets[14])  # 20000 microseconds
+        self.assertEqual(0.000004, histogram.percentile(50))
+        self.assertEqual(0.001024, histogram.percentile(80))
+        self.assertEqual(0.02, histogram.percentile(100))
+
+    def test_backtest_timings(self):
+        sleeping_iterator = SleepingIterator(0.002)
+        self.clock_backtest.add_iterator(TimeIterator())
+        self.clock_backtest.add_iterator(sleeping_iterator)
+        self.clock_backtest.timing_enabled = True
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10 * self.tick_size)
+        self.clock_backtest.timing_enabled = False
+        self.clock_backtest.backtest()
+
+        timings = self.clock_backtest.timings
+        self.assertEqual(10, timings.ticks.count)
+        self.assertEqual(0, timings.overruns)
+        self.assertEqual(["SleepingIterator", "TimeIterator"], [histogram.name for histogram in timings.iterators])
+        self.assertEqual([10, 10], [histogram.count for histogram in timings.iterators])
+        self.assertGreaterEqual(timings.iterators[0].mean, 0.002)
+        self.assertGreaterEqual(timings.ticks.total, timings.iterators[0].total)
+        self.assertEqual(0, timings.drift.count)
+        timings_dict = timings.to_dict()
+        self.assertEqual("BACKTEST", timings_dict["clock_mode"])
+        self.assertEqual(9 * self.tick_size, timings_dict["simulated_time"])
+        self.assertEqual("SleepingIterator", timings_dict["iterators"][0]["name"])
+        report = timings.report().split("\n")
+        self.assertTrue(report[0].startswith("Clock timings (backtest mode, tick size 1.0 s): 10 ticks in "))
+        self.assertEqual(["tick", "SleepingIterator", "TimeIterator"], [line.split()[0] for line in report[2:]])
+
+    def test_realtime_timings_count_overruns_and_skipped_ticks(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05, timing_enabled=True)
+        clock.add_iterator(SleepingIterator(0.07))
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        timings = clock.timings
+        self.assertGreater(timings.ticks.count, 2)
+        self.assertEqual(timings.ticks.count, timings.overruns)
+        self.assertEqual(timings.ticks.count, timings.iterators[0].overruns)
+        self.assertGreaterEqual(timings.skipped_ticks, timings.ticks.count - 1)
+        self.assertEqual(timings.ticks.count, timings.drift.count)
+        self.assertLess(timings.drift.mean, 0.05)
+        self.assertIn("Tick start delay: mean ", timings.report())
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
+
+
+def block_the_loop():
+    time.sleep(0.2)
+
+
+class EventLoopMonitorTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.monitor = EventLoopMonitor(interval=0.01, slow_callback_threshold=0.05)
+        self.set_loggers([self.monitor.logger()])
+        self.monitor.start()
+
+    async def asyncTearDown(self) -> None:
+        self.monitor.stop()
+        await super().asyncTearDown()
+
+    async def busy_coroutine(self):
+        block_the_loop()
+
+    async def test_lag_percentiles(self):
+        await asyncio.sleep(0.2)
+
+        stats = self.monitor.stats()
+
+        self.assertGreater(stats.samples, 5)
+        self.assertLessEqual(stats.lag_p50, stats.lag_p90)
+        self.assertLessEqual(stats.lag_p90, stats.lag_p99)
+        self.assertLessEqual(stats.lag_p99, stats.lag_max)
+        self.assertLess(stats.lag_p50, 0.05)
+        self.assertEqual(0, stats.slow_callbacks_count)
+
+    async def test_slow_task_is_reported(self):
+        await asyncio.sleep(0.05)
+        await asyncio.get_running_loop().create_task(self.busy_coroutine(), name="busy task")
+        await asyncio.sleep(0.1)
+
+        stats = self.monitor.stats()
+        self.assertEqual(1, stats.slow_callbacks_count)
+        slow_callback = stats.slow_callbacks[0]
+        self.assertEqual("busy task", slow_callback.task_name)
+        self.assertEqual("EventLoopMonitorTests.busy_coroutine", slow_callback.coroutine_name)
+        self.assertGreater(slow_callback.duration, 0.15)
+        self.assertGreaterEqual(slow_callback.checks, 2)
+        self.assertIn("in busy_coroutine", slow_callback.stack[0])
+        self.assertIn("in block_the_loop", slow_callback.stack[-1])
+        self.assertGreater(stats.lag_max, 0.15)
+        self.assertTrue(self.is_partially_logged(
+            "WARNING", "The event loop was blocked by EventLoopMonitorTests.busy_coroutine (task busy task) for "))
+        self.assertIn("1 slow callbacks\n    Last slow callback: EventLoopMonitorTests.busy_coroutine",
+                      self.monitor.format_status())
+
+    async def test_slow_callback_is_reported(self):
+        await asyncio.sleep(0.05)
+        asyncio.get_running_loop().call_soon(block_the_loop)
+        await asyncio.sleep(0.3)
+
+        slow_callback = self.monitor.stats().slow_callbacks[0]
+        self.assertIsNone(slow_callback.task_name)
+        self.assertIsNone(slow_callback.coroutine_name)
+        self.assertEqual(1, len(slow_callback.stack))
+        self.assertIn("in block_the_loop", slow_callback.stack[0])
+        self.assertTrue(self.is_partially_logged("WARNING", "The event loop was blocked by a callback at File "))
+
+    async def test_health_is_logged_periodically(self):
+        self.monitor.STATS_LOG_INTERVAL = 0.05
+        await asyncio.sleep(0.1)
+
+        health_records = [record for record in self.log_records if record.levelname == "EVENT_LOG"]
+        self.assertGreater(len(health_records), 0)
+        self.assertEqual("event_loop_health", health_records[0].dict_msg["event_type"])
+        self.assertIn("lag_p99", health_records[0].dict_msg)
@@ -0,0 +1,121 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.web_assistant.connections.connection_pool import ConnectionPoolProfile, order_requests
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class ConnectionPoolTest(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        app = web.Application()
+        app.router.add_get("/ping", self.ping)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.url = str(self.server.make_url("/ping"))
+        self.throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="ping", limit=100, time_interval=1)])
+        self.factory = None
+
+    async def asyncTearDown(self) -> None:
+        if self.factory is not None:
+            await self.factory._connections_factory.close()
+        await self.server.close()
+        await super().asyncTearDown()
+
+    @staticmethod
+    async def ping(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.05)
+        return web.json_response({"pong": True})
+
+    async def request(self, priority: RequestPriority = RequestPriority.NORMAL):
+        rest_assistant = await self.factory.get_rest_assistant()
+        with request_priority(priority):
+            return await rest_assistant.execute_request(url=self.url, throttler_limit_id="ping")
+
+    async def order_request(self):
+        rest_assistant = await self.factory.get_rest_assistant()
+        with order_requests():
+            return await rest_assistant.execute_request(url=self.url, throttler_limit_id="ping")
+
+    async def test_connections_are_reused(self):
+        self.factory = WebAssistantsFactory(throttler=self.throttler)
+
+        self.assertEqual({"pong": True}, await self.request())
+        await self.request()
+
+        stats = self.factory.connection_pool_stats()
+        self.assertEqual(["shared"], list(stats))
+        self.assertEqual(1, stats["shared"].created)
+        self.assertEqual(1, stats["shared"].reused)
+        self.assertEqual(1, stats["shared"].idle)
+        self.assertEqual(0, stats["shared"].in_use)
+        self.assertEqual(0, stats["shared"].waits)
+
+    async def test_requests_wait_when_the_pool_is_full(self):
+        self.factory = WebAssistantsFactory(throttler=self.throttler, pool_profile=ConnectionPoolProfile(limit=1))
+
+        requests = asyncio.gather(*[self.request() for _ in range(3)])
+        await asyncio.sleep(0.02)
+        stats = self.factory.connection_pool_stats()["shared"]
+        self.assertEqual(1, stats.in_use)
+        self.assertEqual(2, stats.waiting)
+        await requests
+
+        stats = self.factory.connection_pool_stats()["shared"]
+        self.assertEqual(1, stats.created)
+        self.assertEqual(2, stats.waits)
+        self.assertGreater(stats.wait_time, 0.05)
+        self.assertEqual(0, stats.waiting)
+
+    async def test_order_requests_use_their_own_pool(self):
+        self.factory = WebAssistantsFactory(
+            throttler=self.throttler,
+            pool_profile=ConnectionPoolProfile(limit=1),
+            order_pool_profile=ConnectionPoolProfile(limit=1, keepalive_timeout=60),
+        )
+
+        polling_requests = asyncio.gather(*[self.request(RequestPriority.LOW) for _ in range(3)])
+        await asyncio.sleep(0.02)
+        await self.order_request()
+        await polling_requests
+
+        stats = self.factory.connection_pool_stats()
+        self.assertEqual(1, stats["orders"].created)
+        self.assertEqual(0, stats["orders"].waits)
+        self.assertEqual(1, stats["shared"].created)
+        self.assertEqual(2, stats["shared"].waits)
+        self.assertEqual(60, self.factory.order_pool_profile.keepalive_timeout)
+
+    async def test_high_priority_requests_use_the_shared_pool(self):
+        self.factory = WebAssistantsFactory(
+            throttler=self.throttler,
+            order_pool_profile=ConnectionPoolProfile(limit=1),
+        )
+
+        await self.request(RequestPriority.HIGH)
+
+        stats = self.factory.connection_pool_stats()
+        self.assertEqual(1, stats["shared"].created)
+        self.assertEqual(0, stats["orders"].created)
+
+    async def test_cancelled_waiting_requests_are_not_counted(self):
+        self.factory = WebAssistantsFactory(throttler=self.throttler, pool_profile=ConnectionPoolProfile(limit=1))
+
+        request = asyncio.ensure_future(self.request())
+        waiting_request = asyncio.ensure_future(self.request())
+        await asyncio.sleep(0.02)
+        self.assertEqual(1, self.factory.connection_pool_stats()["shared"].waiting)
+        waiting_request.cancel()
+        await request
+
+        stats = self.factory.connection_pool_stats()["shared"]
+        self.assertEqual(0, stats.waiting)
+        self.assertEqual(0, stats.in_use)
+        self.assertEqual(1, stats.idle)
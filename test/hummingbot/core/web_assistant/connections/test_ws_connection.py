@@ -2,7 +2,7 @@ import asyncio
 import json
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from aiohttp import WebSocketError
@@ -118,6 +118,31 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_with_json_codec(self, ws_connect_mock):
+        codec = MagicMock()
+        codec.loads.return_value = {"decoded": True}
+        self.ws_connection = WSConnection(self.client_session, json_codec=codec)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"one": 1}')
+
+        response = await self.ws_connection.receive()
+
+        self.assertEqual({"decoded": True}, response.data)
+        codec.loads.assert_called_once_with('{"one": 1}')
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_raw_messages(self, ws_connect_mock):
+        self.ws_connection = WSConnection(self.client_session, raw_messages=True)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"one": 1}')
+
+        response = await self.ws_connection.receive()
+
+        self.assertEqual('{"one": 1}', response.data)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     async def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
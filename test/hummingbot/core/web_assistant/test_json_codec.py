@@ -0,0 +1,36 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import JSONCodec, OrjsonCodec, fastest_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    message = {"e": "depthUpdate", "b": [["0.0024", "10"]], "u": 157, "ok": True, "none": None, "price": 1.5}
+
+    def test_codecs_round_trip(self):
+        codecs = [JSONCodec()] + ([OrjsonCodec()] if json_codec.orjson is not None else [])
+        for codec in codecs:
+            encoded = codec.dumps(self.message)
+            self.assertIsInstance(encoded, str)
+            self.assertEqual(self.message, codec.loads(encoded))
+            self.assertEqual(self.message, codec.loads(encoded.encode()))
+            with self.assertRaises(json.JSONDecodeError):
+                codec.loads("not json")
+
+    def test_default_codec_encodes_like_the_standard_library(self):
+        self.assertEqual(json.dumps(self.message), JSONCodec().dumps(self.message))
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_fastest_json_codec_with_orjson_installed(self):
+        self.assertIsInstance(fastest_json_codec(), OrjsonCodec)
+
+    def test_fastest_json_codec_without_orjson_installed(self):
+        orjson = json_codec.orjson
+        json_codec.orjson = None
+        try:
+            self.assertIs(type(fastest_json_codec()), JSONCodec)
+            with self.assertRaises(ImportError):
+                OrjsonCodec()
+        finally:
+            json_codec.orjson = orjson
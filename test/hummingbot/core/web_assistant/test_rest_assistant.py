@@ -2,15 +2,17 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -100,3 +102,40 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_rest_assistant_execute_request_with_priority(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode(), repeat=True)
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=10, time_interval=1)])
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop))
+        assistant = RESTAssistant(connection, throttler=throttler)
+
+        with patch.object(throttler, "execute_task", wraps=throttler.execute_task) as execute_task_mock:
+            self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="limit"))
+            ret = self.async_run_with_timeout(assistant.execute_request(
+                url=url, throttler_limit_id="limit", priority=RequestPriority.HIGH))
+
+        self.assertEqual({"one": 1}, ret)
+        self.assertIsNone(execute_task_mock.call_args_list[0].kwargs["priority"])
+        self.assertEqual(RequestPriority.HIGH, execute_task_mock.call_args_list[1].kwargs["priority"])
+        self.assertEqual(1, throttler.wait_time_stats()[RequestPriority.HIGH].count)
+
+    @aioresponses()
+    def test_rest_assistant_uses_json_codec(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.post(url, body=json.dumps({"one": 1}).encode())
+        codec = MagicMock(wraps=JSONCodec())
+        codec.dumps.return_value = '{"two":2}'
+        connection = RESTConnection(aiohttp.ClientSession(loop=self.ev_loop), json_codec=codec)
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit", limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection, throttler=throttler, json_codec=codec)
+
+        ret = self.async_run_with_timeout(assistant.execute_request(
+            url=url, throttler_limit_id="limit", method=RESTMethod.POST, data={"two": 2}))
+
+        self.assertEqual({"one": 1}, ret)
+        codec.dumps.assert_called_once_with({"two": 2})
+        codec.loads.assert_called_once()
+        sent_request = next(iter(mocked_api.requests.values()))[0]
+        self.assertEqual('{"two":2}', sent_request.kwargs["data"])
@@ -83,3 +83,17 @@ class TestBybitSpotCandles(TestCandlesBase):
     @staticmethod
     def _success_subscription_mock():
         return {}
+
+    def test_ws_message_subscription_key(self):
+        message = self.get_candles_ws_data_mock_1()
+        message["topic"] = f"kline.60.{self.ex_trading_pair}"
+        self.assertEqual(self.data_feed._ws_subscription_key(), self.data_feed._ws_message_subscription_key(message))
+        self.assertIsNone(self.data_feed._ws_message_subscription_key({"success": True, "op": "subscribe"}))
+
+    def test_ws_multiplexed_subscription_payloads(self):
+        feeds = [BybitSpotCandles(trading_pair=f"BTC{index}-USDT", interval=self.interval) for index in range(12)]
+
+        payloads = self.data_feed.ws_multiplexed_subscription_payloads(feeds)
+
+        self.assertEqual([10, 2], [len(payload["args"]) for payload in payloads])
+        self.assertEqual("kline.60.BTC11USDT", payloads[1]["args"][1])
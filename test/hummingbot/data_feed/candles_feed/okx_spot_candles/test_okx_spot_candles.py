@@ -122,3 +122,9 @@ class TestOKXSpotCandles(TestCandlesBase):
     @staticmethod
     def _success_subscription_mock():
         return {}
+
+    def test_ws_message_subscription_key(self):
+        self.assertEqual(self.data_feed._ws_subscription_key(),
+                         self.data_feed._ws_message_subscription_key(self.get_candles_ws_data_mock_1()))
+        self.assertIsNone(self.data_feed._ws_message_subscription_key(
+            {"event": "subscribe", "arg": {"channel": "candle1H", "instId": self.ex_trading_pair}}))
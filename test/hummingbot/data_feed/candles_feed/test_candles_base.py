@@ -92,6 +92,29 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_cached_until_a_candle_arrives(self):
+        candles = list(self._candles_data_mock())
+        self.data_feed._candles.extend(candles[:-1])
+        candles_df = self.data_feed.candles_df
+        candles_df["signal"] = 1
+
+        self.assertEqual(self.data_feed.columns, list(self.data_feed.candles_df.columns))
+        cached_df = self.data_feed._candles_df_cache
+        self.data_feed.candles_df
+        self.assertIs(cached_df, self.data_feed._candles_df_cache)
+
+        self.data_feed._candles.append(candles[-1])
+        self.assertEqual(len(candles), len(self.data_feed.candles_df))
+        self.assertIsNot(cached_df, self.data_feed._candles_df_cache)
+
+    def test_candles_array(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+
+        candles_array = self.data_feed.candles_array
+        self.assertEqual((4, len(self.data_feed.columns)), candles_array.shape)
+        self.assertEqual(self._candles_data_mock()[-1][0], candles_array[-1, 0])
+        self.assertFalse(candles_array.flags.writeable)
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -0,0 +1,83 @@
+from collections import deque
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+def row(value: float) -> np.ndarray:
+    return np.array([value, value + 0.5])
+
+
+class CandlesBufferTests(TestCase):
+
+    def assert_same_rows(self, expected: deque, buffer: CandlesBuffer):
+        self.assertEqual(len(expected), len(buffer))
+        np.testing.assert_array_equal(np.array(list(expected)).reshape(-1, 2), buffer.array)
+
+    def test_appends_behave_like_a_bounded_deque(self):
+        expected = deque(maxlen=5)
+        buffer = CandlesBuffer(maxlen=5, columns=2)
+
+        # Enough appends on both ends to move the rows across the buffer several times
+        for value in range(23):
+            expected.append(row(value))
+            buffer.append(row(value))
+            self.assert_same_rows(expected, buffer)
+        for value in range(100, 117):
+            expected.appendleft(row(value))
+            buffer.appendleft(row(value))
+            self.assert_same_rows(expected, buffer)
+        expected.extendleft([row(200), row(201)])
+        buffer.extendleft([row(200), row(201)])
+        self.assert_same_rows(expected, buffer)
+        expected.extend([row(300), row(301), row(302)])
+        buffer.extend([row(300), row(301), row(302)])
+        self.assert_same_rows(expected, buffer)
+
+    def test_indexing(self):
+        buffer = CandlesBuffer(maxlen=3, columns=2)
+        buffer.extend([row(1), row(2), row(3), row(4)])
+
+        np.testing.assert_array_equal(row(2), buffer[0])
+        np.testing.assert_array_equal(row(4), buffer[-1])
+        buffer[-1] = row(5)
+        np.testing.assert_array_equal([row(2), row(3), row(5)], list(buffer))
+        with self.assertRaises(IndexError):
+            buffer[3]
+        with self.assertRaises(IndexError):
+            CandlesBuffer(maxlen=3, columns=2)[-1]
+
+    def test_array_is_a_read_only_view(self):
+        buffer = CandlesBuffer(maxlen=3, columns=2)
+        buffer.extend([row(1), row(2)])
+
+        array = buffer.array
+        self.assertFalse(array.flags.writeable)
+        self.assertFalse(array.flags.owndata)
+        with self.assertRaises(ValueError):
+            array[0, 0] = 10
+
+    def test_version_changes_with_the_rows(self):
+        buffer = CandlesBuffer(maxlen=3, columns=2)
+        versions = [buffer.version]
+
+        buffer.append(row(1))
+        versions.append(buffer.version)
+        buffer[-1] = row(2)
+        versions.append(buffer.version)
+        buffer.clear()
+        versions.append(buffer.version)
+
+        self.assertEqual(4, len(set(versions)))
+        self.assertEqual(0, len(buffer))
+        self.assertEqual(3, buffer.maxlen)
+
+    def test_versions_are_unique_across_buffers(self):
+        buffer = CandlesBuffer(maxlen=3, columns=2)
+        buffer.append(row(1))
+        other_buffer = CandlesBuffer(maxlen=3, columns=2)
+        other_buffer.append(row(1))
+
+        self.assertNotEqual(buffer.version, other_buffer.version)
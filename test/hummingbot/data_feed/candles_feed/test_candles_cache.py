@@ -0,0 +1,130 @@
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Optional, Tuple
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+LISTING_TIME = 1_700_000_040
+INTERVAL = 60
+
+
+class CandlesCacheTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = CandlesCache(cache_dir=self.cache_dir.name)
+        self.fetched_ranges: List[Tuple[int, int]] = []
+        self.data_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.data_feed.fetch_candles = AsyncMock(side_effect=self.fetch_candles)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    async def fetch_candles(self, start_time: Optional[int] = None, end_time: Optional[int] = None,
+                            limit: Optional[int] = None) -> np.ndarray:
+        # The exchange returns at most 100 candles per request, starting at the listing time
+        limit = min(limit or 100, 100)
+        first_timestamp = max(start_time, end_time - limit * INTERVAL, LISTING_TIME)
+        timestamps = np.arange(first_timestamp, end_time + 1, INTERVAL, dtype=np.float64)
+        self.fetched_ranges.append((start_time, end_time))
+        candles = np.zeros((len(timestamps), len(self.data_feed.columns)))
+        candles[:, 0] = timestamps
+        candles[:, 1:5] = (timestamps % 1000)[:, None]
+        return candles
+
+    def historical_config(self, start_time: int, end_time: int) -> HistoricalCandlesConfig:
+        return HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                                       start_time=start_time, end_time=end_time)
+
+    async def test_cached_candles_match_exchange_candles(self):
+        config = self.historical_config(LISTING_TIME + 60 * 10, LISTING_TIME + 60 * 500)
+
+        expected = await self.data_feed.get_historical_candles(config)
+        cached = await self.data_feed.get_historical_candles(config, candles_cache=self.cache)
+        fetches = self.data_feed.fetch_candles.await_count
+        cached_again = await self.data_feed.get_historical_candles(config, candles_cache=self.cache)
+
+        self.assertEqual(491, len(expected))
+        pd.testing.assert_frame_equal(expected.reset_index(drop=True), cached)
+        pd.testing.assert_frame_equal(cached, cached_again)
+        self.assertEqual(fetches, self.data_feed.fetch_candles.await_count)
+
+    async def test_only_missing_ranges_are_fetched(self):
+        await self.data_feed.get_historical_candles(self.historical_config(LISTING_TIME + 60 * 100,
+                                                                           LISTING_TIME + 60 * 200),
+                                                    candles_cache=self.cache)
+        self.fetched_ranges.clear()
+
+        candles = await self.data_feed.get_historical_candles(self.historical_config(LISTING_TIME + 60 * 50,
+                                                                                     LISTING_TIME + 60 * 250),
+                                                              candles_cache=self.cache)
+
+        self.assertEqual(list(range(LISTING_TIME + 60 * 50, LISTING_TIME + 60 * 251, 60)),
+                         candles["timestamp"].astype(int).tolist())
+        self.assertTrue(all(end <= LISTING_TIME + 60 * 100 or start >= LISTING_TIME + 60 * 199
+                            for start, end in self.fetched_ranges))
+        self.assertEqual([], self.cache.missing_ranges("binance", "BTC-USDT", "1m", LISTING_TIME + 60 * 50,
+                                                       LISTING_TIME + 60 * 250, INTERVAL))
+
+    async def test_ranges_without_candles_are_not_fetched_again(self):
+        config = self.historical_config(LISTING_TIME - 60 * 300, LISTING_TIME + 60 * 20)
+
+        candles = await self.data_feed.get_historical_candles(config, candles_cache=self.cache)
+        fetches = self.data_feed.fetch_candles.await_count
+        await self.data_feed.get_historical_candles(config, candles_cache=self.cache)
+
+        self.assertEqual(LISTING_TIME, candles["timestamp"].iloc[0])
+        self.assertEqual(fetches, self.data_feed.fetch_candles.await_count)
+
+    async def test_offline_cache_does_not_fetch(self):
+        config = self.historical_config(LISTING_TIME, LISTING_TIME + 60 * 20)
+        await self.data_feed.get_historical_candles(config, candles_cache=self.cache)
+        fetches = self.data_feed.fetch_candles.await_count
+        offline_cache = CandlesCache(cache_dir=self.cache_dir.name, offline=True)
+
+        cached = await self.data_feed.get_historical_candles(self.historical_config(LISTING_TIME,
+                                                                                    LISTING_TIME + 60 * 40),
+                                                             candles_cache=offline_cache)
+
+        self.assertEqual(21, len(cached))
+        self.assertEqual(fetches, self.data_feed.fetch_candles.await_count)
+        self.assertEqual([(LISTING_TIME + 60 * 21, LISTING_TIME + 60 * 40)],
+                         offline_cache.missing_ranges("binance", "BTC-USDT", "1m", LISTING_TIME,
+                                                      LISTING_TIME + 60 * 40, INTERVAL))
+
+    async def test_stores_are_written_as_chunks_and_compacted(self):
+        self.cache.MAX_CANDLES_CHUNKS = 3
+        chunks_path = self.cache._chunks_path("binance", "BTC-USDT", "1m")
+        candles_path = self.cache._candles_path("binance", "BTC-USDT", "1m")
+
+        for index in range(2):
+            start_time = LISTING_TIME + 60 * 100 * index
+            await self.data_feed.get_historical_candles(self.historical_config(start_time, start_time + 60 * 50),
+                                                        candles_cache=self.cache)
+
+        self.assertEqual(2, len(self.cache._chunk_files(chunks_path)))
+        self.assertFalse(os.path.exists(candles_path))
+        merged = self.cache.get_candles("binance", "BTC-USDT", "1m", LISTING_TIME, LISTING_TIME + 60 * 300,
+                                        self.data_feed.columns)
+        self.assertEqual(102, len(merged))
+        self.assertTrue(merged["timestamp"].is_monotonic_increasing)
+
+        await self.data_feed.get_historical_candles(self.historical_config(LISTING_TIME + 60 * 200,
+                                                                           LISTING_TIME + 60 * 250),
+                                                    candles_cache=self.cache)
+
+        self.assertEqual([], self.cache._chunk_files(chunks_path))
+        self.assertTrue(os.path.exists(candles_path))
+        compacted = self.cache.get_candles("binance", "BTC-USDT", "1m", LISTING_TIME, LISTING_TIME + 60 * 300,
+                                           self.data_feed.columns)
+        self.assertEqual(153, len(compacted))
+        pd.testing.assert_frame_equal(merged, compacted[compacted["timestamp"] < LISTING_TIME + 60 * 200])
@@ -0,0 +1,135 @@
+import asyncio
+import json
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_ws_multiplexer import CandlesWSConnection, CandlesWSMultiplexer
+from hummingbot.data_feed.candles_feed.kraken_spot_candles.kraken_spot_candles import KrakenSpotCandles
+
+
+class CandlesWSMultiplexerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.feeds = [BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m"),
+                      BinanceSpotCandles(trading_pair="ETH-USDT", interval="1m"),
+                      BinanceSpotCandles(trading_pair="ETH-USDT", interval="1h")]
+
+    async def asyncTearDown(self) -> None:
+        for feed in self.feeds:
+            await feed.stop_network()
+        CandlesWSMultiplexer._shared_instances.clear()
+        await super().asyncTearDown()
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str, timestamp: int, close: str) -> str:
+        return json.dumps({
+            "e": "kline", "E": timestamp, "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": interval, "o": "1", "c": close, "h": "2",
+                  "l": "0.5", "v": "10", "n": 5, "x": False, "q": "10", "V": "4", "Q": "4", "B": "0"}
+        })
+
+    async def start_feeds(self):
+        for feed in self.feeds:
+            await feed.start_network()
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_feeds_share_a_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        for symbol, interval, close in (("ETHUSDT", "1h", "3"), ("BTCUSDT", "1m", "2"), ("XRPUSDT", "1m", "9")):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=self.kline_message(symbol, interval, 1718667720000, close))
+
+        await self.start_feeds()
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        ws_connect_mock.assert_called_once()
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m", "ethusdt@kline_1m", "ethusdt@kline_1h"], "id": 1}],
+            sent_messages)
+        self.assertEqual([2.0], self.feeds[0].candles_df["close"].tolist())
+        self.assertEqual(0, len(self.feeds[1].candles_df))
+        self.assertEqual([3.0], self.feeds[2].candles_df["close"].tolist())
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_streams_are_subscribed_again_on_reconnection(self, ws_connect_mock, _):
+        first_ws = self.mocking_assistant.create_websocket_mock()
+        second_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [first_ws, second_ws]
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=first_ws, message=self.kline_message("BTCUSDT", "1m", 1718667720000, "2"))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=first_ws, message="", message_type=aiohttp.WSMsgType.CLOSED)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=second_ws, message=self.kline_message("BTCUSDT", "1m", 1718667780000, "4"))
+
+        await self.start_feeds()
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(second_ws)
+
+        self.assertEqual(2, ws_connect_mock.call_count)
+        self.assertEqual(self.mocking_assistant.json_messages_sent_through_websocket(first_ws),
+                         self.mocking_assistant.json_messages_sent_through_websocket(second_ws))
+        # The candles are cleared when the connection is lost, like with a connection per feed
+        self.assertEqual([1718667780.0], self.feeds[0].candles_df["timestamp"].tolist())
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_feed_subscribed_to_an_open_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.feeds[0].start_network()
+        await asyncio.sleep(0.1)
+
+        await self.feeds[1].start_network()
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([["btcusdt@kline_1m"], ["ethusdt@kline_1m"]], [message["params"] for message in sent_messages])
+
+    async def test_connections_are_split_by_max_subscriptions(self):
+        multiplexer = CandlesWSMultiplexer(max_subscriptions_per_connection=2)
+        with patch("hummingbot.data_feed.candles_feed.candles_ws_multiplexer.CandlesWSConnection."
+                   "listen_for_subscriptions", new_callable=AsyncMock):
+            for feed in self.feeds:
+                await multiplexer.subscribe(feed)
+            # A feed with the same stream as a subscribed one shares its subscription
+            duplicate_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+            await multiplexer.subscribe(duplicate_feed)
+            await asyncio.sleep(0)
+
+            self.assertEqual([2, 1], [connection.subscriptions_count for connection in multiplexer.connections])
+
+            for feed in self.feeds[1:]:
+                await multiplexer.unsubscribe(feed)
+            self.assertEqual(1, len(multiplexer.connections))
+            await multiplexer.unsubscribe(self.feeds[0])
+            await multiplexer.unsubscribe(duplicate_feed)
+            self.assertEqual(0, len(multiplexer.connections))
+
+    async def test_exchange_feed_follows_the_subscribed_feeds(self):
+        connection = CandlesWSConnection()
+        with patch.object(CandlesWSConnection, "listen_for_subscriptions", new_callable=AsyncMock):
+            await connection.subscribe(self.feeds[0])
+            await connection.subscribe(self.feeds[1])
+            self.assertIs(self.feeds[0], connection._exchange_feed)
+
+            await connection.unsubscribe(self.feeds[0])
+            self.assertIs(self.feeds[1], connection._exchange_feed)
+
+            await connection.unsubscribe(self.feeds[1])
+            self.assertIsNone(connection._exchange_feed)
+
+            await connection.subscribe(self.feeds[2])
+            self.assertIs(self.feeds[2], connection._exchange_feed)
+            await connection.unsubscribe(self.feeds[2])
+
+    def test_get_instance(self):
+        self.assertIs(CandlesWSMultiplexer.get_instance(self.feeds[0]), CandlesWSMultiplexer.get_instance(self.feeds[1]))
+        self.assertIsNone(KrakenSpotCandles(trading_pair="BTC-USDT", interval="1m")._ws_subscription_key())
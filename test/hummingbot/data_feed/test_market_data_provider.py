@@ -2,6 +2,7 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
@@ -62,6 +63,17 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_version(self):
+        config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100)
+        self.provider.initialize_candles_feed(config)
+        candles_feed = self.provider.get_candles_feed(config)
+        version = self.provider.get_candles_version("binance", "BTC-USDT", "1m", 100)
+        self.assertEqual(candles_feed.candles_version, version)
+
+        candles_feed._candles.append(np.ones(len(candles_feed.columns)))
+        self.assertNotEqual(version, self.provider.get_candles_version("binance", "BTC-USDT", "1m", 100))
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -82,6 +94,16 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_snapshot_with_depth(self):
+        mock_order_book = MagicMock()
+        mock_order_book.depth_arrays.return_value = (np.array([[99.0, 1.0, 1.0]]), np.array([[101.0, 2.0, 1.0]]))
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        bids_df, asks_df = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT", depth=1)
+        mock_order_book.depth_arrays.assert_called_once_with(1)
+        self.assertEqual(["price", "amount", "update_id"], list(bids_df.columns))
+        self.assertEqual(99.0, bids_df["price"].iloc[0])
+        self.assertEqual(2.0, asks_df["amount"].iloc[0])
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
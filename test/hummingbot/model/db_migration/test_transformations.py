@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model.db_migration.transformations import (
+    AddRecorderQueryIndexes,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +47,43 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddRecorderQueryIndexesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddRecorderQueryIndexes", AddRecorderQueryIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261017, AddRecorderQueryIndexes(self).to_version)
+
+    def test_apply_creates_the_indexes_of_the_existing_tables(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite:///:memory:")
+        db_handle.engine.execute('create table "Order" (id TEXT, config_file_path TEXT, market TEXT, '
+                                 'creation_timestamp BIGINT);')
+
+        AddRecorderQueryIndexes(migrator=self).apply(db_handle)
+        AddRecorderQueryIndexes(migrator=self).apply(db_handle)
+
+        self.assertEqual(["o_config_market_timestamp_index"], [index["name"] for index in
+                                                               inspect(db_handle.engine).get_indexes("Order")])
+        self.assertFalse(inspect(db_handle.engine).has_table("TradeFill"))
+
+    def test_apply_keeps_the_latest_of_duplicated_market_states(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite:///:memory:")
+        db_handle.engine.execute('create table MarketState (id INTEGER PRIMARY KEY, config_file_path TEXT, '
+                                 'market TEXT, timestamp BIGINT, saved_state JSON);')
+        db_handle.engine.execute("insert into MarketState values "
+                                 "(1, 'conf.yml', 'binance', 1000, '{\"old\": 1}'), "
+                                 "(2, 'conf.yml', 'binance', 3000, '{\"latest\": 1}'), "
+                                 "(3, 'conf.yml', 'binance', 2000, '{\"older\": 1}'), "
+                                 "(4, 'conf.yml', 'kucoin', 1000, '{}'), "
+                                 "(5, 'other.yml', 'binance', 1000, '{}');")
+
+        AddRecorderQueryIndexes(migrator=self).apply(db_handle)
+
+        self.assertEqual([(2,), (4,), (5,)], db_handle.engine.execute("select id from MarketState order by id").fetchall())
+        indexes = inspect(db_handle.engine).get_indexes("MarketState")
+        self.assertEqual(["ms_config_market_index"], [index["name"] for index in indexes])
+        self.assertTrue(indexes[0]["unique"])
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temporary_directory.name, "test.sqlite")
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def create_manager(self) -> SQLConnectionManager:
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.addCleanup(manager.engine.dispose)
+        return manager
+
+    def pragma(self, manager: SQLConnectionManager, name: str):
+        with manager.engine.connect() as connection:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_sqlite_performance_profile(self):
+        manager = self.create_manager()
+
+        self.assertEqual("wal", self.pragma(manager, "journal_mode"))
+        self.assertEqual(1, self.pragma(manager, "synchronous"))
+        self.assertEqual(256 * 1024 * 1024, self.pragma(manager, "mmap_size"))
+
+    def test_sqlite_performance_profile_is_configurable(self):
+        self.client_config_map.db_mode = DBSqliteMode(db_wal_mode=False, db_synchronous="full", db_mmap_size_mb=0)
+        manager = self.create_manager()
+
+        self.assertEqual("delete", self.pragma(manager, "journal_mode"))
+        self.assertEqual(2, self.pragma(manager, "synchronous"))
+        self.assertEqual(0, self.pragma(manager, "mmap_size"))
+
+    def test_migration_keeps_the_content_of_the_write_ahead_log(self):
+        manager = self.create_manager()
+        # An open connection keeps the write-ahead log from being checkpointed when the others close
+        reader = sqlite3.connect(self.db_path)
+        self.addCleanup(reader.close)
+        reader.execute("SELECT COUNT(*) FROM Metadata").fetchall()
+        with manager.begin() as session:
+            session.add(Metadata(key="test_key", value="test_value"))
+            session.execute("DROP INDEX tf_order_id_index")
+            manager.get_local_db_version(session).value = "20230516"
+        self.assertGreater(os.path.getsize(self.db_path + "-wal"), 0)
+        manager.engine.dispose()
+
+        manager = self.create_manager()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session).value)
+            self.assertEqual("test_value", session.query(Metadata).filter(Metadata.key == "test_key").one().value)
+        with manager.engine.connect() as connection:
+            indexes = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'").scalars().all()
+        self.assertIn("tf_order_id_index", indexes)
+        self.assertEqual([], [name for name in os.listdir(self.temporary_directory.name) if ".new" in name])
+
+    def test_remove_db_files(self):
+        manager = self.create_manager()
+        with manager.begin() as session:
+            session.add(Metadata(key="test_key", value="test_value"))
+        self.assertTrue(os.path.exists(self.db_path + "-wal"))
+
+        manager.engine.dispose()
+        SQLConnectionManager.remove_db_files(self.db_path)
+
+        self.assertEqual([], os.listdir(self.temporary_directory.name))
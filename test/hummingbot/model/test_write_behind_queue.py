@@ -0,0 +1,115 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+
+class WriteBehindQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(self.temporary_directory.name, "test.sqlite"),
+        )
+        self.transactions = 0
+        self.write_queue = WriteBehindQueue(self.manager, flush_interval=0.1, max_batch_size=10)
+        original_begin = self.manager.begin
+
+        def begin():
+            self.transactions += 1
+            return original_begin()
+
+        self.manager.begin = begin
+
+    def tearDown(self) -> None:
+        self.write_queue.stop()
+        self.manager.engine.dispose()
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def keys(self):
+        with self.manager.get_new_session() as session:
+            return sorted(m.key for m in session.query(Metadata).filter(Metadata.key.like("key_%")))
+
+    @staticmethod
+    def add_key(index: int):
+        return lambda session: session.add(Metadata(key=f"key_{index:02d}", value=str(index)))
+
+    def test_mutations_are_applied_synchronously_when_not_started(self):
+        self.write_queue.put(self.add_key(1))
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(["key_01"], self.keys())
+        self.assertTrue(self.write_queue.flush())
+
+    def test_mutations_are_written_in_batches(self):
+        self.write_queue.start()
+        for i in range(25):
+            self.write_queue.put(self.add_key(i))
+
+        self.assertTrue(self.write_queue.flush(timeout=1))
+
+        self.assertEqual(25, len(self.keys()))
+        self.assertEqual(3, self.transactions)
+        self.assertEqual(0, self.write_queue.pending_count)
+
+    def test_mutations_are_committed_within_the_flush_interval(self):
+        self.write_queue.start()
+        self.write_queue.put(self.add_key(1))
+
+        self.assertEqual([], self.keys())
+        time.sleep(0.3)
+        self.assertEqual(["key_01"], self.keys())
+
+    def test_stop_commits_pending_mutations(self):
+        self.write_queue = WriteBehindQueue(self.manager, flush_interval=10)
+        self.write_queue.start()
+        for i in range(3):
+            self.write_queue.put(self.add_key(i))
+
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(["key_00", "key_01", "key_02"], self.keys())
+
+    def test_failing_mutation_does_not_lose_the_rest_of_the_batch(self):
+        self.write_queue.start()
+        self.write_queue.put(self.add_key(1))
+        self.write_queue.put(self.add_key(1))
+        self.write_queue.put(self.add_key(2))
+
+        with self.assertLogs(WriteBehindQueue.logger().name, level="ERROR"):
+            self.assertTrue(self.write_queue.flush(timeout=1))
+
+        self.assertEqual(["key_01", "key_02"], self.keys())
+
+    def test_mutations_run_on_the_writer_thread(self):
+        threads = []
+        self.write_queue.start()
+        self.write_queue.put(lambda session: threads.append(threading.current_thread()))
+        self.write_queue.flush(timeout=1)
+
+        self.assertEqual(1, len(threads))
+        self.assertNotEqual(threading.main_thread(), threads[0])
+
+    def test_error_callback_of_the_failing_mutation_is_called(self):
+        failed = []
+        self.write_queue.start()
+        self.write_queue.put(self.add_key(1), on_error=lambda: failed.append(1))
+        self.write_queue.put(self.add_key(1), on_error=lambda: failed.append(2))
+        self.write_queue.put(self.add_key(2), on_error=lambda: failed.append(3))
+
+        with self.assertLogs(WriteBehindQueue.logger().name, level="ERROR"):
+            self.assertTrue(self.write_queue.flush(timeout=1))
+
+        self.assertEqual([2], failed)
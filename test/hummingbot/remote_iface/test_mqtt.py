@@ -15,6 +15,7 @@ from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExcha
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
+from hummingbot.core.utils.event_loop_monitor import EventLoopStats
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
@@ -523,6 +524,30 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
         self.hbapp.strategy = None
 
+    @patch("hummingbot.remote_iface.mqtt.EventLoopMonitor.get_instance")
+    @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
+    def test_mqtt_command_status_includes_the_event_loop_health(
+        self,
+        strategy_status_mock: AsyncMock,
+        event_loop_monitor_mock: MagicMock
+    ):
+        strategy_status_mock.side_effect = self._create_exception_and_unlock_test_with_event_async
+        event_loop_stats = EventLoopStats(samples=4, lag_p50=0.001, lag_p90=0.002, lag_p99=0.003, lag_max=0.004,
+                                          slow_callbacks_count=0, slow_callbacks=[])
+        event_loop_monitor_mock.return_value.started = True
+        event_loop_monitor_mock.return_value.stats.return_value = event_loop_stats
+        self.hbapp.strategy = {}
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.STATUS_URI),
+            {'async_backend': 1}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/status"
+        msg = {'status': 200, 'msg': '', 'data': {'event_loop': event_loop_stats.to_dict()}}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        self.hbapp.strategy = None
+
     @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
     def test_mqtt_command_status_failure(
         self,
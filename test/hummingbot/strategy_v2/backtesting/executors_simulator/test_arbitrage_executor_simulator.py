@@ -0,0 +1,52 @@
+from decimal import Decimal
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.backtesting.executors_simulator.arbitrage_executor_simulator import (
+    ArbitrageExecutorSimulator,
+)
+from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class ArbitrageExecutorSimulatorTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = ArbitrageExecutorSimulator()
+        close = np.array([100, 100, 100, 100, 100], dtype=float)
+        self.candles = pd.DataFrame({
+            "timestamp": 60.0 * np.arange(len(close)),
+            "close": close,
+            "close_kucoin_ETH-USDT": close,
+            "close_binance_ETH-USDT": [100.1, 100.3, 100.6, 101, 100],
+        })
+        self.config = ArbitrageExecutorConfig(
+            timestamp=0,
+            buying_market=ConnectorPair(connector_name="kucoin", trading_pair="ETH-USDT"),
+            selling_market=ConnectorPair(connector_name="binance", trading_pair="ETH-USDT"),
+            order_amount=Decimal(2),
+            min_profitability=Decimal("0.003"),
+        )
+
+    def test_arbitrage_on_first_profitable_spread(self):
+        simulation = self.simulator.simulate(self.candles, self.config, trade_cost=0.001)
+        df = simulation.executor_simulation
+
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        # The 0.3% spread of the second candle doesn't cover the trade cost of both legs
+        self.assertEqual(3, len(df))
+        self.assertAlmostEqual(2 * (100 + 100.6), df["filled_amount_quote"].iloc[-1])
+        self.assertAlmostEqual(2 * 0.6 - 0.001 * 2 * 200.6, df["net_pnl_quote"].iloc[-1])
+        self.assertEqual(0, df["net_pnl_quote"].iloc[-2])
+
+    def test_no_arbitrage_without_the_market_candles(self):
+        candles = self.candles[["timestamp", "close"]]
+
+        simulation = self.simulator.simulate(candles, self.config, trade_cost=0.0)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertTrue((simulation.executor_simulation["filled_amount_quote"] == 0).all())
@@ -0,0 +1,134 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import GridExecutorSimulator
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import TripleBarrierConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class GridExecutorSimulatorTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = GridExecutorSimulator()
+
+    @staticmethod
+    def candles(close) -> pd.DataFrame:
+        close = np.array(close, dtype=float)
+        return pd.DataFrame({"timestamp": 60.0 * np.arange(len(close)), "open": close, "high": close, "low": close,
+                             "close": close, "volume": 1.0})
+
+    @staticmethod
+    def grid_config(**kwargs) -> GridExecutorConfig:
+        config = {
+            "timestamp": 0,
+            "connector_name": "binance",
+            "trading_pair": "BTC-USDT",
+            "start_price": Decimal(90),
+            "end_price": Decimal(110),
+            "limit_price": Decimal(80),
+            "total_amount_quote": Decimal(100),
+            "min_spread_between_orders": Decimal("0.05"),
+            "triple_barrier_config": TripleBarrierConfig(take_profit=Decimal("0.02")),
+        }
+        config.update(kwargs)
+        return GridExecutorConfig(**config)
+
+    def test_grid_levels(self):
+        prices, amount_quote, take_profit = GridExecutorSimulator.get_grid_levels(self.grid_config())
+
+        np.testing.assert_allclose([90, 96.666667, 103.333333, 110], prices)
+        self.assertEqual(25, amount_quote)
+        self.assertEqual(0.02, take_profit)
+
+        _, _, take_profit = GridExecutorSimulator.get_grid_levels(self.grid_config(coerce_tp_to_step=True))
+        self.assertAlmostEqual(20 / 90 / 3, take_profit)
+
+    def test_levels_take_profit_and_reopen(self):
+        simulation = self.simulator.simulate(self.candles([100, 98, 96, 99, 100, 97, 96, 99, 99, 99]),
+                                             self.grid_config(), trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(10, len(df))
+        # The two levels above the price are bought at 100 and the 96.67 level completes twice
+        np.testing.assert_allclose([50, 50, 75, 100.5, 100.5, 100.5, 125.5, 151, 151, 201], df["filled_amount_quote"])
+        np.testing.assert_allclose([0, -1, -2.172414, 0, 0.5, -1, -1.672414, 0.5, 0.5, 0.5], df["net_pnl_quote"],
+                                   atol=1e-6)
+        self.assertEqual(100, df["current_position_average_price"].iloc[-1])
+
+    def test_fees_are_charged_on_every_fill(self):
+        candles = self.candles([100, 98, 96, 99, 100, 97, 96, 99, 99, 99])
+        without_fees = self.simulator.simulate(candles, self.grid_config(), trade_cost=0.0).executor_simulation
+        with_fees = self.simulator.simulate(candles, self.grid_config(), trade_cost=0.001).executor_simulation
+
+        np.testing.assert_allclose(0.001 * with_fees["filled_amount_quote"], with_fees["cum_fees_quote"])
+        np.testing.assert_allclose(without_fees["net_pnl_quote"] - with_fees["cum_fees_quote"],
+                                   with_fees["net_pnl_quote"])
+
+    def test_sell_grid(self):
+        simulation = self.simulator.simulate(self.candles([100, 102, 104, 101, 100]),
+                                             self.grid_config(side=TradeType.SELL, limit_price=Decimal(120)),
+                                             trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        # The 90 and 96.67 levels are sold at 100, the 103.33 level is sold at its price and bought back at 101.27
+        np.testing.assert_allclose([50, 50, 75, 99.5, 149.5], df["filled_amount_quote"])
+        np.testing.assert_allclose([0, -1, -2.161290, 0, 0.5], df["net_pnl_quote"], atol=1e-6)
+
+    def test_limit_price_stops_the_grid(self):
+        simulation = self.simulator.simulate(self.candles([100, 95, 85, 79, 75]), self.grid_config(), trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        self.assertEqual(CloseType.STOP_LOSS, simulation.close_type)
+        self.assertEqual(4, len(df))
+        # The four open levels are closed at market
+        self.assertEqual(200, df["filled_amount_quote"].iloc[-1])
+        self.assertAlmostEqual(-25 * (2 * (1 - 79 / 100) + (1 - 79 / (290 / 3)) + (1 - 79 / 90)),
+                               df["net_pnl_quote"].iloc[-1])
+
+    def test_limit_price_keeps_position(self):
+        simulation = self.simulator.simulate(self.candles([100, 95, 85, 79, 75]),
+                                             self.grid_config(keep_position=True), trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        self.assertEqual(CloseType.POSITION_HOLD, simulation.close_type)
+        self.assertEqual(0, df["filled_amount_quote"].iloc[-1])
+        self.assertEqual(0, df["net_pnl_quote"].iloc[-1])
+
+    def test_barriers(self):
+        candles = self.candles([100, 104, 108, 111, 100])
+        simulation = self.simulator.simulate(candles, self.grid_config(), trade_cost=0.0)
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertEqual(4, len(simulation.executor_simulation))
+
+        stop_loss = TripleBarrierConfig(take_profit=Decimal("0.02"), stop_loss=Decimal("0.03"))
+        simulation = self.simulator.simulate(self.candles([100, 98, 96, 95, 90]),
+                                             self.grid_config(triple_barrier_config=stop_loss), trade_cost=0.0)
+        self.assertEqual(CloseType.STOP_LOSS, simulation.close_type)
+        self.assertEqual(4, len(simulation.executor_simulation))
+
+        time_limit = TripleBarrierConfig(take_profit=Decimal("0.02"), time_limit=120)
+        simulation = self.simulator.simulate(candles, self.grid_config(triple_barrier_config=time_limit),
+                                             trade_cost=0.0)
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(3, len(simulation.executor_simulation))
+
+    @patch.object(GatewayHttpClient, "get_instance", MagicMock())
+    def test_backtesting_engine_simulates_grid_executors(self):
+        engine = BacktestingEngineBase()
+        simulation = engine.simulate_executor(self.grid_config(), self.candles([100, 98, 96, 99]), trade_cost=0.0)
+
+        self.assertIsInstance(simulation.config, GridExecutorConfig)
+        executor_info = simulation.get_executor_info_at_timestamp(120)
+        self.assertEqual(TradeType.BUY, executor_info.side)
+        self.assertEqual(75, executor_info.filled_amount_quote)
+        self.assertTrue(executor_info.is_trading)
@@ -0,0 +1,77 @@
+from decimal import Decimal
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.twap_executor_simulator import TWAPExecutorSimulator
+from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig, TWAPMode
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TWAPExecutorSimulatorTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = TWAPExecutorSimulator()
+        close = np.array([100, 98, 96, 99, 100, 97, 96, 99], dtype=float)
+        self.candles = pd.DataFrame({"timestamp": 60.0 * np.arange(len(close)), "open": close, "high": close + 0.5,
+                                     "low": close - 0.5, "close": close, "volume": 1.0})
+
+    @staticmethod
+    def twap_config(**kwargs) -> TWAPExecutorConfig:
+        config = {
+            "timestamp": 0,
+            "connector_name": "binance",
+            "trading_pair": "BTC-USDT",
+            "side": TradeType.BUY,
+            "total_amount_quote": Decimal(100),
+            "total_duration": 180,
+            "order_interval": 60,
+        }
+        config.update(kwargs)
+        return TWAPExecutorConfig(**config)
+
+    def test_taker_orders_are_filled_at_the_close(self):
+        simulation = self.simulator.simulate(self.candles, self.twap_config(), trade_cost=0.001)
+        df = simulation.executor_simulation
+
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(4, len(df))
+        np.testing.assert_allclose([25, 50, 75, 100], df["filled_amount_quote"])
+        average_price = 100 / (25 / 100 + 25 / 98 + 25 / 96 + 25 / 99)
+        self.assertAlmostEqual(average_price, df["current_position_average_price"].iloc[-1])
+        self.assertAlmostEqual(100 * (99 / average_price - 1) - 0.1, df["net_pnl_quote"].iloc[-1])
+        np.testing.assert_allclose(0.001 * df["filled_amount_quote"], df["cum_fees_quote"])
+
+    def test_sell_orders_pnl(self):
+        simulation = self.simulator.simulate(self.candles, self.twap_config(side=TradeType.SELL), trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        average_price = df["current_position_average_price"].iloc[-1]
+        self.assertAlmostEqual(100 * (1 - 99 / average_price), df["net_pnl_quote"].iloc[-1])
+
+    def test_maker_orders_are_filled_when_crossed(self):
+        config = self.twap_config(mode=TWAPMode.MAKER, limit_order_buffer=Decimal("0.01"))
+        simulation = self.simulator.simulate(self.candles, config, trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        # Orders at 99, 97.02, 95.04 and 98.01, the one at 95.04 is never crossed
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(len(self.candles), len(df))
+        np.testing.assert_allclose([0, 25, 50, 50, 50, 75, 75, 75], df["filled_amount_quote"])
+        self.assertAlmostEqual(75 / (25 / 99 + 25 / 97.02 + 25 / 98.01),
+                               df["current_position_average_price"].iloc[-1])
+
+    def test_maker_orders_are_resubmitted(self):
+        config = self.twap_config(mode=TWAPMode.MAKER, limit_order_buffer=Decimal("0.01"), order_resubmission_time=120)
+        simulation = self.simulator.simulate(self.candles, config, trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        # The order at 95.04 is resubmitted at 99 after two minutes and filled
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(6, len(df))
+        np.testing.assert_allclose([0, 25, 50, 50, 50, 100], df["filled_amount_quote"])
+        self.assertAlmostEqual(100 / (25 / 99 + 25 / 97.02 + 25 / 99 + 25 / 98.01),
+                               df["current_position_average_price"].iloc[-1])
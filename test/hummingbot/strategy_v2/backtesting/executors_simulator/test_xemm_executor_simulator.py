@@ -0,0 +1,66 @@
+from decimal import Decimal
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.xemm_executor_simulator import XEMMExecutorSimulator
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+from hummingbot.strategy_v2.executors.xemm_executor.data_types import XEMMExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class XEMMExecutorSimulatorTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.simulator = XEMMExecutorSimulator()
+        close = np.array([100, 100.2, 99.5, 100.1, 100.4], dtype=float)
+        self.candles = pd.DataFrame({"timestamp": 60.0 * np.arange(len(close)), "open": close, "high": close + 0.2,
+                                     "low": close - 0.2, "close": close, "volume": 1.0})
+
+    @staticmethod
+    def xemm_config(maker_side: TradeType) -> XEMMExecutorConfig:
+        return XEMMExecutorConfig(
+            timestamp=0,
+            buying_market=ConnectorPair(connector_name="kucoin", trading_pair="ETH-USDT"),
+            selling_market=ConnectorPair(connector_name="binance", trading_pair="ETH-USDT"),
+            maker_side=maker_side,
+            order_amount=Decimal(2),
+            min_profitability=Decimal("0.002"),
+            target_profitability=Decimal("0.005"),
+            max_profitability=Decimal("0.01"),
+        )
+
+    def test_maker_order_is_hedged_on_fill(self):
+        simulation = self.simulator.simulate(self.candles, self.xemm_config(TradeType.BUY), trade_cost=0.001)
+        df = simulation.executor_simulation
+
+        # The maker order at 100.2 * 0.995 = 99.699 is crossed by the 99.3 low and hedged at 99.5
+        self.assertEqual(CloseType.COMPLETED, simulation.close_type)
+        self.assertEqual(3, len(df))
+        filled_amount_quote = 2 * (99.699 + 99.5)
+        self.assertAlmostEqual(filled_amount_quote, df["filled_amount_quote"].iloc[-1])
+        self.assertAlmostEqual(2 * (99.5 - 99.699) - 0.001 * filled_amount_quote, df["net_pnl_quote"].iloc[-1])
+        self.assertEqual(0, df["filled_amount_quote"].iloc[-2])
+        self.assertEqual(TradeType.BUY, simulation.get_executor_info_at_timestamp(120).side)
+
+    def test_maker_order_uses_the_market_candles(self):
+        candles = self.candles.assign(**{"close_binance_ETH-USDT": self.candles["close"] + 1})
+
+        simulation = self.simulator.simulate(candles, self.xemm_config(TradeType.BUY), trade_cost=0.0)
+        df = simulation.executor_simulation
+
+        # The maker order at 101 * 0.995 = 100.495 is crossed by the 99.8 low of the first candle it rests on
+        self.assertEqual(2, len(df))
+        self.assertAlmostEqual(2 * (101.2 - 100.495), df["net_pnl_quote"].iloc[-1])
+
+    def test_maker_order_not_filled(self):
+        candles = self.candles.assign(close=100.0, high=100.2, low=99.8)
+
+        simulation = self.simulator.simulate(candles, self.xemm_config(TradeType.SELL), trade_cost=0.0)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(len(candles), len(simulation.executor_simulation))
+        self.assertTrue((simulation.executor_simulation["filled_amount_quote"] == 0).all())
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+
+class BacktestingDataProviderTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.trading_rules = {
+            "BTC-USDT": TradingRule(trading_pair="BTC-USDT",
+                                    min_order_size=Decimal("0.00001"),
+                                    min_price_increment=Decimal("0.01"),
+                                    min_base_amount_increment=Decimal("0.00001"),
+                                    min_notional_size=Decimal("5"),
+                                    supports_market_orders=False),
+            "ETH-BTC": TradingRule(trading_pair="ETH-BTC", min_price_increment=Decimal("0.000001")),
+        }
+        self.connector = MagicMock()
+        self.connector.trading_rules = self.trading_rules
+        self.connector._update_trading_rules = AsyncMock()
+        get_connector_patch = patch.object(BacktestingDataProvider, "get_connector", return_value=self.connector)
+        self.get_connector_mock = get_connector_patch.start()
+        self.addCleanup(get_connector_patch.stop)
+        gateway_patch = patch.object(GatewayHttpClient, "get_instance", MagicMock())
+        gateway_patch.start()
+        self.addCleanup(gateway_patch.stop)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def new_provider(self) -> BacktestingDataProvider:
+        return BacktestingDataProvider(connectors={}, trading_rules_cache_dir=self.cache_dir.name)
+
+    def assert_trading_rules_equal(self, expected, actual):
+        self.assertEqual(set(expected), set(actual))
+        for trading_pair, rule in expected.items():
+            for field in BacktestingDataProvider.TRADING_RULES_FIELDS:
+                self.assertEqual(getattr(rule, field), getattr(actual[trading_pair], field))
+
+    def test_connectors_are_not_created_on_init(self):
+        provider = self.new_provider()
+
+        self.assertEqual({}, provider.connectors)
+        self.get_connector_mock.assert_not_called()
+
+    def test_unsupported_connector_is_not_created(self):
+        provider = self.new_provider()
+
+        with self.assertRaises(ValueError):
+            provider.get_backtesting_connector("hyperliquid_perpetual")
+        self.get_connector_mock.assert_not_called()
+
+    async def test_trading_rules_are_fetched_once_and_cached_on_disk(self):
+        provider = self.new_provider()
+        await provider.initialize_trading_rules("binance")
+        await provider.initialize_trading_rules("binance")
+
+        self.get_connector_mock.assert_called_once_with("binance")
+        self.connector._update_trading_rules.assert_awaited_once()
+        self.assertIs(self.connector, provider.connectors["binance"])
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir.name, "binance.json")))
+
+        self.get_connector_mock.reset_mock()
+        cached_provider = self.new_provider()
+        await cached_provider.initialize_trading_rules("binance")
+
+        self.get_connector_mock.assert_not_called()
+        self.assertEqual({}, cached_provider.connectors)
+        self.assert_trading_rules_equal(self.trading_rules, cached_provider.trading_rules["binance"])
+        self.assertEqual(Decimal("0.01"), cached_provider.get_trading_rules("binance", "BTC-USDT").min_price_increment)
+
+    async def test_stale_trading_rules_are_used_when_update_fails(self):
+        await self.new_provider().initialize_trading_rules("binance")
+        cache_path = os.path.join(self.cache_dir.name, "binance.json")
+        stale_time = time.time() - BacktestingDataProvider.TRADING_RULES_CACHE_TTL - 1
+        os.utime(cache_path, (stale_time, stale_time))
+        self.connector._update_trading_rules.side_effect = IOError("No network")
+
+        provider = self.new_provider()
+        await provider.initialize_trading_rules("binance")
+
+        self.assertEqual(2, self.connector._update_trading_rules.await_count)
+        self.assert_trading_rules_equal(self.trading_rules, provider.trading_rules["binance"])
+
+    async def test_update_error_is_raised_without_cached_trading_rules(self):
+        self.connector._update_trading_rules.side_effect = IOError("No network")
+
+        with self.assertRaises(IOError):
+            await self.new_provider().initialize_trading_rules("binance")
@@ -0,0 +1,257 @@
+import json
+import os
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.connector.market_data_sink import MarketDataSink
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy_v2.backtesting.order_book_replay import (
+    OrderBookReplayData,
+    OrderBookReplayFeed,
+    OrderBookReplayMatchingEngine,
+    OrderBookUpdates,
+    PublicTrades,
+)
+
+START = 1_700_000_000
+
+
+def snapshot(timestamp: float, best_bid: float, best_ask: float, levels: int = 3, amount: float = 1.0) -> dict:
+    return {"ts": timestamp,
+            "bids": [[best_bid - level, amount] for level in range(levels)],
+            "asks": [[best_ask + level, amount] for level in range(levels)]}
+
+
+def trade(timestamp: float, price: float, amount: float, side: str) -> dict:
+    return {"ts": timestamp, "price": price, "q_base": amount, "side": side}
+
+
+class OrderBookReplayDataTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.path = self.temporary_directory.name
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    def write_messages(self, source_type: str, date: str, messages):
+        file_path = os.path.join(self.path, f"binance_ETH-USDT_{source_type}_{date}.txt")
+        with open(file_path, "a") as file:
+            # Same layout as download_order_book_and_trades.py, every batch starts with a line break
+            file.write("\n" + "\n".join(json.dumps(message) for message in messages))
+
+    def test_load_download_script_files(self):
+        date = datetime.fromtimestamp(START).strftime("%Y-%m-%d")
+        self.write_messages("order_book_snapshots", date, [snapshot(START + 1, 99, 101), snapshot(START, 98, 100)])
+        self.write_messages("order_book_snapshots", date, [snapshot(START + 2, 100, 102, levels=1)])
+        self.write_messages("trades", date, [trade(START + 1.5, 101, 0.5, "buy"), trade(START + 0.5, 98, 2, "sell")])
+        self.write_messages("order_book_snapshots", "2001-01-01", [snapshot(1, 1, 2)])
+
+        data = OrderBookReplayData.load("binance", "ETH-USDT", START, START + 10, path=self.path)
+
+        np.testing.assert_array_equal([START, START + 1, START + 2], data.snapshots.timestamps)
+        np.testing.assert_array_equal([0, 3, 6, 7], data.snapshots.bid_offsets)
+        np.testing.assert_array_equal([[98, 1], [97, 1], [96, 1]], data.snapshots.bids[:3])
+        np.testing.assert_array_equal([[102, 1]], data.snapshots.asks[6:])
+        self.assertEqual(0, len(data.diffs))
+        self.assertEqual((0, 2), data.diffs.bids.shape)
+        np.testing.assert_array_equal([START + 0.5, START + 1.5], data.trades.timestamps)
+        np.testing.assert_array_equal([98, 101], data.trades.prices)
+        np.testing.assert_array_equal([2, 0.5], data.trades.amounts)
+        np.testing.assert_array_equal([False, True], data.trades.is_buy)
+
+        self.assertEqual(4, len(OrderBookReplayData.load("binance", "ETH-USDT", path=self.path).snapshots))
+
+    def test_load_market_data_sink_files(self):
+        date = datetime.fromtimestamp(START).strftime("%Y-%m-%d")
+        self.write_messages("order_book_snapshots", date, [snapshot(START + 1, 99, 101)])
+        self.write_messages("trades", date, [trade(START + 1.5, 101, 0.5, "buy")])
+        sink = MarketDataSink(path=self.path, flush_size=2)
+        for timestamp, best_bid in ((START, 98), (START + 2, 100), (START + 3, 101)):
+            book = snapshot(timestamp, best_bid, best_bid + 2, levels=2)
+            sink.append_order_book("binance", "ETH-USDT", timestamp, np.array(book["bids"]), np.array(book["asks"]))
+        sink.append_trade("binance", "ETH-USDT", START + 0.5, 98, 2, False)
+        sink.stop()
+
+        data = OrderBookReplayData.load("binance", "ETH-USDT", START, START + 10, path=self.path)
+
+        np.testing.assert_array_equal([START, START + 1, START + 2, START + 3], data.snapshots.timestamps)
+        np.testing.assert_array_equal([0, 2, 5, 7, 9], data.snapshots.bid_offsets)
+        np.testing.assert_array_equal([[98, 1], [97, 1], [99, 1], [98, 1], [97, 1], [100, 1], [99, 1]],
+                                      data.snapshots.bids[:7])
+        np.testing.assert_array_equal([[103, 1], [104, 1]], data.snapshots.asks[7:])
+        np.testing.assert_array_equal([START + 0.5, START + 1.5], data.trades.timestamps)
+        np.testing.assert_array_equal([98, 101], data.trades.prices)
+        np.testing.assert_array_equal([False, True], data.trades.is_buy)
+
+    def test_updates_from_exchange_layout_messages(self):
+        updates = OrderBookUpdates.from_messages([
+            {"ts": 1, "bids": [["10.5", "2", 3], ["10", "1", 1]], "asks": []},
+            {"ts": 2, "bids": [], "asks": [["11", "0"]]},
+        ])
+
+        np.testing.assert_array_equal([[10.5, 2], [10, 1]], updates.bids)
+        np.testing.assert_array_equal([[11, 0]], updates.asks)
+        np.testing.assert_array_equal([0, 2, 2], updates.bid_offsets)
+        np.testing.assert_array_equal([0, 0, 1], updates.ask_offsets)
+
+
+class OrderBookReplayFeedTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.feed = OrderBookReplayFeed()
+        self.feed.add_market("binance", "ETH-USDT", OrderBookReplayData(
+            snapshots=OrderBookUpdates.from_messages([snapshot(START, 99, 101), snapshot(START + 2.5, 95, 96)]),
+            diffs=OrderBookUpdates.from_messages([
+                {"ts": START + 0.5, "bids": [[100, 2]], "asks": []},
+                {"ts": START + 1.2, "bids": [[100, 0]], "asks": [[100.5, 1]]},
+                {"ts": START + 1.7, "bids": [], "asks": [[100.5, 3]]},
+                {"ts": START + 2.2, "bids": [[98.5, 1]], "asks": []},
+                {"ts": START + 2.7, "bids": [[95.5, 1]], "asks": []},
+            ]),
+            trades=PublicTrades.from_messages([trade(START + 0.2, 101, 1, "buy"), trade(START + 1.1, 100, 1, "sell"),
+                                               trade(START + 1.9, 100.5, 2, "buy")]),
+        ))
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=START - 1, end_time=START + 3)
+        self.clock.add_iterator(self.feed)
+        self.order_book = self.feed.get_order_book("binance", "ETH-USDT")
+
+    def test_snapshot_and_diffs_are_applied_up_to_the_tick(self):
+        self.clock.backtest_til(START)
+        self.assertEqual((99, 101), (self.order_book.get_price(False), self.order_book.get_price(True)))
+
+        self.clock.backtest_til(START + 1)
+        self.assertEqual((100, 101), (self.order_book.get_price(False), self.order_book.get_price(True)))
+
+        self.clock.backtest_til(START + 2)
+        self.assertEqual((99, 100.5), (self.order_book.get_price(False), self.order_book.get_price(True)))
+        self.assertEqual([3.0], [row.amount for row in self.order_book.ask_entries() if row.price == 100.5])
+
+    def test_diffs_before_a_snapshot_are_skipped(self):
+        self.clock.backtest_til(START + 3)
+
+        # The 98.5 diff came before the snapshot, only the 95.5 one is applied on top of it, but both are replayed
+        bids = [(row.price, row.amount) for row in self.order_book.bid_entries()]
+        self.assertEqual([(95.5, 1.0), (95, 1.0), (94, 1.0), (93, 1.0)], bids)
+        self.assertEqual(2 + 5 + 3, self.feed.events_processed)
+
+    def test_trades_of_the_tick(self):
+        self.clock.backtest_til(START)
+        self.assertEqual(0, len(self.feed.get_last_trades("binance", "ETH-USDT")))
+
+        self.clock.backtest_til(START + 1)
+        np.testing.assert_array_equal([101], self.feed.get_last_trades("binance", "ETH-USDT").prices)
+
+        self.clock.backtest_til(START + 2)
+        trades = self.feed.get_last_trades("binance", "ETH-USDT")
+        np.testing.assert_array_equal([100, 100.5], trades.prices)
+        np.testing.assert_array_equal([False, True], trades.is_buy)
+        self.assertEqual(100.5, self.order_book.last_trade_price)
+
+
+class OrderBookReplayMatchingEngineTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.snapshots = [snapshot(START, 99, 101, amount=2)]
+        self.diffs = []
+        self.trades = []
+
+    def start_replay(self):
+        self.feed = OrderBookReplayFeed()
+        self.feed.add_market("binance", "ETH-USDT", OrderBookReplayData(
+            snapshots=OrderBookUpdates.from_messages(self.snapshots),
+            diffs=OrderBookUpdates.from_messages(self.diffs),
+            trades=PublicTrades.from_messages(self.trades),
+        ))
+        self.matching_engine = OrderBookReplayMatchingEngine(self.feed)
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=START - 1, end_time=START + 10)
+        self.clock.add_iterator(self.feed)
+        self.clock.add_iterator(self.matching_engine)
+        self.clock.backtest_til(START)
+
+    def test_order_is_filled_when_the_book_crosses_it(self):
+        self.diffs = [{"ts": START + 1, "bids": [], "asks": [[100, 1]]}]
+        self.start_replay()
+        order = self.matching_engine.place_limit_order("binance", "ETH-USDT", True, 100, 3)
+
+        self.clock.backtest_til(START + 1)
+
+        self.assertTrue(order.is_filled)
+        self.assertEqual(100, order.average_executed_price)
+        self.assertEqual([], self.matching_engine.open_orders("binance", "ETH-USDT"))
+
+    def test_order_is_filled_when_a_trade_prints_through_it(self):
+        self.trades = [trade(START + 1, 99.5, 0.1, "buy"), trade(START + 2, 97.5, 0.1, "sell")]
+        self.start_replay()
+        order = self.matching_engine.place_limit_order("binance", "ETH-USDT", True, 98, 3)
+
+        self.clock.backtest_til(START + 1)
+        self.assertEqual(0, order.executed_amount)
+
+        self.clock.backtest_til(START + 2)
+        self.assertTrue(order.is_filled)
+        self.assertEqual(98 * 3, order.executed_amount_quote)
+
+    def test_trades_at_the_order_price_consume_the_queue_first(self):
+        self.trades = [trade(START + 1, 99, 1.5, "sell"), trade(START + 1.5, 99, 1, "buy"),
+                       trade(START + 2, 99, 1, "sell"), trade(START + 3, 99, 5, "sell")]
+        self.start_replay()
+        order = self.matching_engine.place_limit_order("binance", "ETH-USDT", True, 99, 1)
+        self.assertEqual(2, order.queue_ahead)
+
+        # The taker buy at the bid price doesn't trade with the bids
+        self.clock.backtest_til(START + 1)
+        self.assertEqual(0, order.executed_amount)
+        self.assertEqual(0.5, order.queue_ahead)
+
+        self.clock.backtest_til(START + 2)
+        self.assertEqual(0.5, order.executed_amount)
+        self.assertEqual(0, order.queue_ahead)
+
+        self.clock.backtest_til(START + 3)
+        self.assertTrue(order.is_filled)
+
+    def test_cancellations_shrink_the_queue_ahead(self):
+        self.diffs = [{"ts": START + 1, "bids": [], "asks": [[101, 0.5]]},
+                      {"ts": START + 1, "bids": [], "asks": [[100, 0.25]]}]
+        self.trades = [trade(START + 2, 101, 0.5, "buy")]
+        self.start_replay()
+        order = self.matching_engine.place_limit_order("binance", "ETH-USDT", False, 101, 1)
+
+        self.clock.backtest_til(START + 1)
+        self.assertEqual(0.5, order.queue_ahead)
+
+        self.clock.backtest_til(START + 2)
+        self.assertEqual(0, order.executed_amount)
+        self.assertEqual(0, order.queue_ahead)
+
+    def test_cancelled_orders_are_not_filled(self):
+        self.diffs = [{"ts": START + 1, "bids": [], "asks": [[99.5, 1]]}]
+        self.start_replay()
+        order = self.matching_engine.place_limit_order("binance", "ETH-USDT", True, 99.5, 1)
+        self.matching_engine.cancel_order(order)
+
+        self.clock.backtest_til(START + 1)
+
+        self.assertEqual(0, order.executed_amount)
+        self.assertFalse(order.is_open)
+
+    def test_market_orders_walk_the_book(self):
+        self.start_replay()
+
+        buy_order = self.matching_engine.execute_market_order("binance", "ETH-USDT", True, 3)
+        sell_order = self.matching_engine.execute_market_order("binance", "ETH-USDT", False, 10)
+
+        self.assertTrue(buy_order.is_filled)
+        self.assertAlmostEqual((101 * 2 + 102) / 3, buy_order.average_executed_price)
+        # There's only 6 of depth, the whole amount is filled at its average price
+        self.assertTrue(sell_order.is_filled)
+        self.assertAlmostEqual(98, sell_order.average_executed_price)
@@ -0,0 +1,286 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.strategy_v2.backtesting.order_book_replay import (
+    OrderBookReplayData,
+    OrderBookReplayMatchingEngine,
+    OrderBookUpdates,
+    PublicTrades,
+)
+from hummingbot.strategy_v2.backtesting.order_book_replay_backtesting_engine import (
+    OrderBookExecutorSimulation,
+    OrderBookReplayBacktestingEngine,
+)
+from hummingbot.strategy_v2.backtesting.order_book_replay_data_provider import OrderBookReplayDataProvider
+from hummingbot.strategy_v2.controllers.market_making_controller_base import (
+    MarketMakingControllerBase,
+    MarketMakingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+START = 1_700_000_000
+
+
+def replay_data(best_bids, trades=(), spread: float = 1.0, amount: float = 1.0) -> OrderBookReplayData:
+    """
+    One snapshot per second with three levels per side around the given best bids.
+    """
+    return OrderBookReplayData(
+        snapshots=OrderBookUpdates.from_messages([
+            {"ts": START + second,
+             "bids": [[best_bid - level, amount] for level in range(3)],
+             "asks": [[best_bid + spread + level, amount] for level in range(3)]}
+            for second, best_bid in enumerate(best_bids)]),
+        diffs=OrderBookUpdates.empty(),
+        trades=PublicTrades.from_messages([{"ts": START + second, "price": price, "q_base": amount, "side": side}
+                                           for second, price, amount, side in trades]),
+    )
+
+
+class OrderBookExecutorSimulationTests(TestCase):
+
+    def start_replay(self, data: OrderBookReplayData):
+        with patch.object(GatewayHttpClient, "get_instance", MagicMock()):
+            self.data_provider = OrderBookReplayDataProvider(connectors={})
+        self.data_provider.initialize_order_book_replay("binance", "ETH-USDT", data)
+        self.matching_engine = OrderBookReplayMatchingEngine(self.data_provider.order_book_feed)
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=START - 1, end_time=START + 100)
+        self.clock.add_iterator(self.data_provider.order_book_feed)
+        self.clock.add_iterator(self.matching_engine)
+        self.clock.backtest_til(START)
+
+    def simulation(self, config) -> OrderBookExecutorSimulation:
+        return OrderBookExecutorSimulation(config, self.matching_engine, self.data_provider, trade_cost=0.001)
+
+    def run_until(self, simulation: OrderBookExecutorSimulation, timestamp: float):
+        for tick in range(int(self.clock.current_timestamp) + 1, int(timestamp) + 1):
+            self.clock.backtest_til(tick)
+            simulation.update(tick)
+
+    @staticmethod
+    def position_config(**kwargs) -> PositionExecutorConfig:
+        config = {
+            "timestamp": START,
+            "connector_name": "binance",
+            "trading_pair": "ETH-USDT",
+            "side": TradeType.BUY,
+            "entry_price": Decimal(99),
+            "amount": Decimal(1),
+            "triple_barrier_config": TripleBarrierConfig(take_profit=Decimal("0.01"), stop_loss=Decimal("0.02"),
+                                                         take_profit_order_type=OrderType.LIMIT),
+        }
+        config.update(kwargs)
+        return PositionExecutorConfig(**config)
+
+    def test_limit_take_profit(self):
+        # The entry at 99 is filled by a trade through it and the take profit at 99.99 by the book crossing it
+        self.start_replay(replay_data([100, 99, 99, 99, 99.5, 99.5, 99.5, 99.5, 99.5, 99.5, 99.5, 99.5, 99.5, 99.5,
+                                       99.5, 99.5, 99, 100], trades=[(2, 98.5, 1, "sell")]))
+        simulation = self.simulation(self.position_config())
+
+        self.run_until(simulation, START + 2)
+        executor_info = simulation.get_executor_info()
+        self.assertTrue(executor_info.is_trading)
+        self.assertEqual(99, executor_info.custom_info["current_position_average_price"])
+        # Marked to the 99 best bid
+        self.assertAlmostEqual(-0.001 * 99, float(executor_info.net_pnl_quote))
+
+        self.run_until(simulation, START + 16)
+        self.assertFalse(simulation.is_done)
+        self.run_until(simulation, START + 17)
+        executor_info = simulation.get_executor_info()
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(START + 17, executor_info.close_timestamp)
+        self.assertAlmostEqual(99 + 99.99, float(executor_info.filled_amount_quote))
+        self.assertAlmostEqual(0.99 - 0.001 * (99 + 99.99), float(executor_info.net_pnl_quote))
+
+    def test_stop_loss_closes_at_market(self):
+        self.start_replay(replay_data([100, 99, 98, 97, 96, 95]))
+        simulation = self.simulation(self.position_config(amount=Decimal(2)))
+
+        # The whole order is filled once the best ask crosses it, even if the level only has 1
+        self.run_until(simulation, START + 2)
+        self.assertEqual(2, simulation.entry_amount)
+        self.assertFalse(simulation.is_done)
+        self.run_until(simulation, START + 3)
+
+        executor_info = simulation.get_executor_info()
+        self.assertEqual(CloseType.STOP_LOSS, executor_info.close_type)
+        # The 2 are sold at the 97 and 96 levels of the book
+        self.assertAlmostEqual(97 + 96 - 2 * 99 - 0.001 * (2 * 99 + 97 + 96), float(executor_info.net_pnl_quote))
+        self.assertEqual([], self.matching_engine.open_orders("binance", "ETH-USDT"))
+
+    def test_time_limit_without_fills(self):
+        self.start_replay(replay_data([100] * 10))
+        triple_barrier_config = TripleBarrierConfig(take_profit=Decimal("0.01"), stop_loss=Decimal("0.02"),
+                                                    time_limit=5)
+        simulation = self.simulation(self.position_config(triple_barrier_config=triple_barrier_config))
+
+        self.run_until(simulation, START + 5)
+
+        executor_info = simulation.get_executor_info()
+        self.assertEqual(CloseType.TIME_LIMIT, executor_info.close_type)
+        self.assertEqual(0, executor_info.net_pnl_quote)
+        self.assertEqual(0, executor_info.filled_amount_quote)
+        self.assertEqual([], self.matching_engine.open_orders("binance", "ETH-USDT"))
+
+    def test_market_entry_and_take_profit(self):
+        self.start_replay(replay_data([100, 101, 102, 104]))
+        triple_barrier_config = TripleBarrierConfig(take_profit=Decimal("0.02"), stop_loss=Decimal("0.02"),
+                                                    open_order_type=OrderType.MARKET)
+        simulation = self.simulation(self.position_config(triple_barrier_config=triple_barrier_config))
+        self.assertEqual(101, simulation.entry_amount_quote)
+
+        self.run_until(simulation, START + 2)
+        self.assertFalse(simulation.is_done)
+        self.run_until(simulation, START + 3)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertEqual(104, simulation.exit_amount_quote)
+
+    def test_trailing_stop(self):
+        self.start_replay(replay_data([100, 103, 106, 105, 103]))
+        triple_barrier_config = TripleBarrierConfig(
+            take_profit=None, stop_loss=None, open_order_type=OrderType.MARKET,
+            trailing_stop={"activation_price": Decimal("0.02"), "trailing_delta": Decimal("0.02")})
+        simulation = self.simulation(self.position_config(triple_barrier_config=triple_barrier_config))
+
+        self.run_until(simulation, START + 3)
+        self.assertFalse(simulation.is_done)
+        self.run_until(simulation, START + 4)
+
+        # The 106 peak is 4.95% above the 101 entry, so the position is closed at 103, below 2.95%
+        self.assertEqual(CloseType.TRAILING_STOP, simulation.close_type)
+
+    def test_sell_side_early_stop(self):
+        self.start_replay(replay_data([100, 101, 101, 101], trades=[(1, 102, 1, "buy")]))
+        simulation = self.simulation(self.position_config(side=TradeType.SELL, entry_price=Decimal(101.5)))
+
+        self.run_until(simulation, START + 2)
+        simulation.stop(START + 2, CloseType.EARLY_STOP)
+
+        executor_info = simulation.get_executor_info()
+        self.assertEqual(CloseType.EARLY_STOP, executor_info.close_type)
+        self.assertEqual(TradeType.SELL, executor_info.side)
+        self.assertAlmostEqual(101.5 - 102 - 0.001 * (101.5 + 102), float(executor_info.net_pnl_quote))
+
+    def test_dca_maker_levels(self):
+        self.start_replay(replay_data([100, 99, 98, 97, 99.5], trades=[(2, 97.5, 1, "sell")]))
+        config = DCAExecutorConfig(timestamp=START, connector_name="binance", trading_pair="ETH-USDT",
+                                   side=TradeType.BUY, amounts_quote=[Decimal(99), Decimal(98)],
+                                   prices=[Decimal(99), Decimal(98)], take_profit=Decimal("0.01"))
+        simulation = self.simulation(config)
+
+        self.run_until(simulation, START + 3)
+        self.assertEqual(2, simulation.entry_amount)
+        self.assertFalse(simulation.is_done)
+        self.run_until(simulation, START + 4)
+
+        # 99.5 is more than 1% above the 98.5 break even price, the position is sold at the 99.5 and 98.5 levels
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertAlmostEqual(99.5 + 98.5, simulation.exit_amount_quote)
+
+
+class PMMTestControllerConfig(MarketMakingControllerConfigBase):
+    controller_name = "pmm_test_controller"
+
+
+class PMMTestController(MarketMakingControllerBase):
+
+    def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
+        return PositionExecutorConfig(
+            timestamp=self.market_data_provider.time(),
+            level_id=level_id,
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            entry_price=price,
+            amount=amount,
+            triple_barrier_config=self.config.triple_barrier_config,
+            side=self.get_trade_type_from_level_id(level_id),
+        )
+
+
+class OrderBookReplayBacktestingEngineTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller_config = PMMTestControllerConfig(
+            id="pmm_test",
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            total_amount_quote=Decimal(1000),
+            buy_spreads=[0.001],
+            sell_spreads=[0.001],
+            executor_refresh_time=30,
+            stop_loss=Decimal("0.01"),
+            take_profit=Decimal("0.002"),
+            time_limit=120,
+            candles_config=[],
+        )
+        rng = np.random.default_rng(42)
+        seconds = 600
+        best_bids = np.round(2000 + np.cumsum(rng.normal(0, 0.5, seconds)), 2)
+        sides = rng.choice(["buy", "sell"], seconds)
+        trades = [(second, best_bid + (0.1 if side == "buy" else 0) + rng.normal(0, 2), rng.uniform(0.1, 2), side)
+                  for second, (best_bid, side) in enumerate(zip(best_bids, sides))]
+        self.data = replay_data(best_bids, trades=trades, spread=0.1, amount=2)
+
+    async def run_engine(self):
+        with patch.object(GatewayHttpClient, "get_instance", MagicMock()):
+            engine = OrderBookReplayBacktestingEngine()
+        engine.backtesting_data_provider.initialize_trading_rules = AsyncMock()
+        engine.backtesting_data_provider.initialize_order_book_replay("binance", "ETH-USDT", self.data)
+        result = await engine.run_backtesting(self.controller_config, start=START - 5, end=START + 599)
+        return engine, result
+
+    async def test_market_making_backtest(self):
+        engine, result = await self.run_engine()
+        executors = result["executors"]
+
+        self.assertGreater(len(executors), 0)
+        self.assertTrue(all(executor.status == RunnableStatus.TERMINATED for executor in executors))
+        close_types = {executor.close_type for executor in executors}
+        self.assertTrue({CloseType.TAKE_PROFIT, CloseType.EARLY_STOP}.issubset(close_types))
+        self.assertEqual(len(executors), result["results"]["total_executors"])
+        self.assertAlmostEqual(float(sum(executor.net_pnl_quote for executor in executors)),
+                               result["results"]["net_pnl_quote"])
+        # Every executor is created at the reference price spread, the mid price of the replayed book
+        for executor in executors:
+            self.assertIn(executor.custom_info["level_id"], ["buy_0", "sell_0"])
+            self.assertGreaterEqual(executor.timestamp, START)
+        self.assertEqual(600 + 600, engine.backtesting_data_provider.order_book_feed.events_processed)
+
+    async def test_backtest_is_deterministic(self):
+        _, first_result = await self.run_engine()
+        _, second_result = await self.run_engine()
+
+        self.assertEqual(first_result["results"], second_result["results"])
+
+    def test_data_provider_prices_and_candles(self):
+        with patch.object(GatewayHttpClient, "get_instance", MagicMock()):
+            data_provider = OrderBookReplayDataProvider(connectors={})
+        data_provider.initialize_order_book_replay("binance", "ETH-USDT", replay_data([100, 101]))
+        data_provider.order_book_feed.tick(START + 1)
+        data_provider.candles_feeds["binance_ETH-USDT_1m"] = pd.DataFrame(
+            {"timestamp": START + 60 * np.arange(-3, 3), "close": np.arange(6.0)})
+        data_provider._time = START + 60
+
+        self.assertEqual(Decimal(101), data_provider.get_price_by_type("binance", "ETH-USDT", PriceType.BestBid))
+        self.assertEqual(Decimal(102), data_provider.get_price_by_type("binance", "ETH-USDT", PriceType.BestAsk))
+        self.assertEqual(Decimal("101.5"), data_provider.get_price_by_type("binance", "ETH-USDT", PriceType.MidPrice))
+        self.assertEqual(101, data_provider.get_price_for_volume("binance", "ETH-USDT", 1, False).result_price)
+        # The candle opened at the current time isn't closed yet
+        candles = data_provider.get_candles_df("binance", "ETH-USDT", "1m", max_records=2)
+        self.assertEqual([START - 60, START], candles["timestamp"].tolist())
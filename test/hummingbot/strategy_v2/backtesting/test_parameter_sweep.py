@@ -0,0 +1,112 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweep
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+
+START = 1_700_000_000
+CANDLES = 300
+
+
+class SweepTestControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "test_parameter_sweep"
+
+
+class SweepTestController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        rng = np.random.default_rng(3)
+        self.processed_data["features"] = pd.DataFrame({
+            "timestamp": START + 60 * np.arange(CANDLES, dtype=np.int64),
+            "signal": rng.choice([-1, 0, 0, 1], CANDLES),
+        })
+
+
+class ParameterSweepTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.base_config = {
+            "controller_type": "backtesting",
+            "controller_name": "test_parameter_sweep",
+            "connector_name": "binance_perpetual",
+            "trading_pair": "ETH-USDT",
+            "total_amount_quote": Decimal(1000),
+            "candles_config": [],
+            "time_limit": 60 * 60,
+        }
+        rng = np.random.default_rng(42)
+        close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.002, CANDLES)))
+        spread = close * rng.uniform(0, 0.003, CANDLES)
+        self.candles = pd.DataFrame({
+            "timestamp": START + 60 * np.arange(CANDLES, dtype=np.int64),
+            "open": np.concatenate([[close[0]], close[:-1]]),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(1, 100, CANDLES),
+        })
+        self.progress = []
+
+    async def initialize_trading_rules(self, provider: BacktestingDataProvider, connector_name: str):
+        provider.trading_rules[connector_name] = {"ETH-USDT": TradingRule(trading_pair="ETH-USDT")}
+
+    async def run_sweep(self, configs, processes):
+        self.candle_feed = MagicMock()
+        self.candle_feed.get_historical_candles = AsyncMock(return_value=self.candles)
+        with patch.object(GatewayHttpClient, "get_instance", MagicMock()), \
+                patch.object(BacktestingDataProvider, "initialize_rate_sources", MagicMock()), \
+                patch.object(BacktestingDataProvider, "initialize_trading_rules",
+                             side_effect=self.initialize_trading_rules, autospec=True), \
+                patch.object(CandlesFactory, "get_candle", return_value=self.candle_feed):
+            sweep = ParameterSweep(controllers_module="test.hummingbot.strategy_v2")
+            return await sweep.run(configs, start=START, end=START + 60 * (CANDLES - 1), processes=processes,
+                                   progress_callback=lambda done, total: self.progress.append((done, total)))
+
+    def test_grid(self):
+        configs = ParameterSweep.grid(self.base_config, {"stop_loss": [Decimal("0.01"), Decimal("0.02")],
+                                                         "take_profit": [Decimal("0.01"), Decimal("0.03")]})
+
+        self.assertEqual(4, len(configs))
+        self.assertEqual({(Decimal("0.01"), Decimal("0.01")), (Decimal("0.01"), Decimal("0.03")),
+                          (Decimal("0.02"), Decimal("0.01")), (Decimal("0.02"), Decimal("0.03"))},
+                         {(config["stop_loss"], config["take_profit"]) for config in configs})
+        self.assertTrue(all(config["trading_pair"] == "ETH-USDT" for config in configs))
+
+    def test_random_sample_is_deterministic(self):
+        param_space = {"stop_loss": [Decimal("0.01"), Decimal("0.02"), Decimal("0.03")],
+                       "cooldown_time": [60, 300, 900]}
+
+        configs = ParameterSweep.random_sample(self.base_config, param_space, n_samples=10, seed=7)
+
+        self.assertEqual(configs, ParameterSweep.random_sample(self.base_config, param_space, n_samples=10, seed=7))
+        self.assertNotEqual(configs, ParameterSweep.random_sample(self.base_config, param_space, n_samples=10, seed=8))
+        self.assertTrue(all(config["stop_loss"] in param_space["stop_loss"] for config in configs))
+
+    async def test_results_do_not_depend_on_processes(self):
+        configs = ParameterSweep.grid(self.base_config, {"stop_loss": [Decimal("0.005"), Decimal("0.02")],
+                                                         "take_profit": [Decimal("0.01"), Decimal("0.03")]})
+
+        in_process_results = await self.run_sweep(configs, processes=1)
+        self.assertEqual([(done, 4) for done in range(1, 5)], self.progress)
+        self.candle_feed.get_historical_candles.assert_awaited_once()
+        self.progress.clear()
+        pool_results = await self.run_sweep(configs, processes=2)
+
+        self.assertEqual([(done, 4) for done in range(1, 5)], self.progress)
+        self.candle_feed.get_historical_candles.assert_awaited_once()
+        self.assertEqual(["stop_loss", "take_profit"], in_process_results.columns[:2].tolist())
+        self.assertTrue(in_process_results["error"].isna().all())
+        self.assertGreater(in_process_results["total_executors"].min(), 0)
+        self.assertEqual(4, len(in_process_results["net_pnl_quote"].unique()))
+        pd.testing.assert_frame_equal(in_process_results, pool_results)
@@ -0,0 +1,131 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, ExecutorSimulationState
+from hummingbot.strategy_v2.backtesting.vectorized_backtesting_engine import VectorizedBacktestingEngine
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executor_actions import ExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+
+START = 1_700_000_000
+CANDLES = 600
+
+
+class SignalTestControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "signal_test_controller"
+
+
+class SignalTestController(DirectionalTradingControllerBase):
+    """
+    Trades a precomputed pseudo random signal and early stops every executor that has been active for an hour.
+    """
+
+    async def update_processed_data(self):
+        rng = np.random.default_rng(7)
+        self.processed_data["features"] = pd.DataFrame({
+            "timestamp": START + 60 * np.arange(CANDLES, dtype=np.int64),
+            "signal": rng.choice([-1, 0, 0, 0, 1], CANDLES),
+        })
+
+    def stop_actions_proposal(self) -> List[ExecutorAction]:
+        return [StopExecutorAction(controller_id=self.config.id, executor_id=executor.id)
+                for executor in self.executors_info
+                if executor.is_active and self.market_data_provider.time() - executor.timestamp > 60 * 60]
+
+
+class VectorizedBacktestingEngineTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller_config = SignalTestControllerConfig(
+            id="signal_test",
+            connector_name="binance_perpetual",
+            trading_pair="ETH-USDT",
+            total_amount_quote=Decimal(1000),
+            max_executors_per_side=3,
+            cooldown_time=60 * 10,
+            stop_loss=Decimal("0.01"),
+            take_profit=Decimal("0.015"),
+            time_limit=60 * 90,
+            candles_config=[],
+        )
+        rng = np.random.default_rng(42)
+        close = 2000 * np.exp(np.cumsum(rng.normal(0, 0.002, CANDLES)))
+        spread = close * rng.uniform(0, 0.003, CANDLES)
+        self.candles = pd.DataFrame({
+            "timestamp": START + 60 * np.arange(CANDLES, dtype=np.int64),
+            "open": np.concatenate([[close[0]], close[:-1]]),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(1, 100, CANDLES),
+        })
+
+    def build_engine(self, engine_class):
+        with patch.object(GatewayHttpClient, "get_instance", MagicMock()):
+            engine = engine_class()
+        provider = engine.backtesting_data_provider
+        provider.candles_feeds["binance_perpetual_ETH-USDT_1m"] = self.candles
+        provider.trading_rules["binance_perpetual"] = {"ETH-USDT": TradingRule(trading_pair="ETH-USDT")}
+        return engine
+
+    @patch.object(BacktestingDataProvider, "initialize_rate_sources", MagicMock())
+    async def run_engine(self, engine_class):
+        engine = self.build_engine(engine_class)
+        return await engine.run_backtesting(controller_config=self.controller_config,
+                                            start=START, end=START + 60 * (CANDLES - 1))
+
+    @staticmethod
+    def executors_without_ids(executors_info):
+        # Executor ids hash the wall clock time, so they differ between two runs
+        executors = []
+        for executor_info in executors_info:
+            executor = executor_info.to_dict()
+            executor.pop("id")
+            executor["config"].pop("id")
+            executors.append(executor)
+        return executors
+
+    async def test_results_match_row_by_row_engine(self):
+        expected = await self.run_engine(BacktestingEngineBase)
+        result = await self.run_engine(VectorizedBacktestingEngine)
+
+        close_types = {executor.close_type for executor in expected["executors"]}
+        self.assertTrue({CloseType.EARLY_STOP, CloseType.STOP_LOSS}.issubset(close_types))
+        self.assertEqual(self.executors_without_ids(expected["executors"]),
+                         self.executors_without_ids(result["executors"]))
+        self.assertEqual(expected["results"], result["results"])
+        pd.testing.assert_frame_equal(expected["processed_data"]["features"], result["processed_data"]["features"])
+
+    def test_executor_simulation_state_matches_simulation(self):
+        config = PositionExecutorConfig(timestamp=float(START), connector_name="binance_perpetual",
+                                        trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(2000),
+                                        amount=Decimal(1))
+        frame = self.candles.iloc[:10].copy()
+        frame["net_pnl_pct"] = np.linspace(0, 0.01, 10)
+        frame["net_pnl_quote"] = frame["net_pnl_pct"] * 2000
+        frame["cum_fees_quote"] = 1.2
+        frame["filled_amount_quote"] = 2000.0
+        simulation = ExecutorSimulation(config=config, executor_simulation=frame, close_type=CloseType.TAKE_PROFIT)
+        state = ExecutorSimulationState(simulation)
+
+        for timestamp in [START - 1, START, START + 30, START + 60 * 4, START + 60 * 9, START + 60 * 20]:
+            self.assertEqual(simulation.get_executor_info_at_timestamp(timestamp),
+                             state.get_executor_info_at_timestamp(timestamp))
+        self.assertEqual(RunnableStatus.TERMINATED, state.get_executor_info_at_timestamp(START + 60 * 9).status)
+        self.assertIsNone(state.get_executor_info_at_timestamp(START).custom_info["current_position_average_price"])
@@ -114,3 +114,30 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
     def test_balance_requirements(self):
         # Test the balance_required method
         self.assertEqual(self.controller.get_balance_requirements(), [])
+
+    async def test_processed_data_not_updated_while_the_candles_version_is_unchanged(self):
+        computations = []
+
+        class CandlesController(ControllerBase):
+            async def update_processed_data(self):
+                if not self.candles_changed("binance_perpetual", "ETH-USDT", "1m"):
+                    return
+                computations.append(self.market_data_provider.get_candles_df("binance_perpetual", "ETH-USDT", "1m"))
+
+        controller = CandlesController(config=self.mock_controller_config,
+                                       market_data_provider=self.mock_market_data_provider,
+                                       actions_queue=self.mock_actions_queue)
+        self.mock_market_data_provider.get_candles_version.return_value = 1
+        await controller.update_processed_data()
+        await controller.update_processed_data()
+        self.assertEqual(1, len(computations))
+        self.mock_market_data_provider.get_candles_df.assert_called_once()
+
+        self.mock_market_data_provider.get_candles_version.return_value = 2
+        await controller.update_processed_data()
+        self.assertEqual(2, len(computations))
+
+    def test_candles_always_changed_without_a_candles_version(self):
+        self.mock_market_data_provider.get_candles_version.return_value = None
+        self.assertTrue(self.controller.candles_changed("binance_perpetual", "ETH-USDT", "1m"))
+        self.assertTrue(self.controller.candles_changed("binance_perpetual", "ETH-USDT", "1m"))
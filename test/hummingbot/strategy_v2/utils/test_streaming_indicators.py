@@ -0,0 +1,121 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta  # noqa: F401
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles.binance_spot_candles import BinanceSpotCandles
+from hummingbot.strategy_v2.utils.streaming_indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    SMA,
+    BollingerBands,
+    StreamingIndicators,
+    Supertrend,
+)
+
+
+class StreamingIndicatorsTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(1)
+        close = 100 + np.cumsum(rng.normal(0, 1, 300))
+        cls.df = pd.DataFrame({"high": close + rng.random(300), "low": close - rng.random(300), "close": close})
+
+    def stream(self, indicator, *attributes: str) -> pd.DataFrame:
+        # Every candle is first received with other values, then updated, like the open candles of the feeds
+        values = {attribute: [] for attribute in attributes}
+        for _, candle in self.df[list(indicator.inputs)].iterrows():
+            indicator.add(*(candle.values * 1.01))
+            indicator.replace(*candle.values)
+            for attribute in attributes:
+                values[attribute].append(getattr(indicator, attribute))
+        return pd.DataFrame(values, dtype=float)
+
+    def assert_matches(self, expected: pd.DataFrame, streamed: pd.DataFrame):
+        np.testing.assert_allclose(expected.astype(float).values, streamed.values, rtol=1e-9, atol=1e-9)
+
+    def test_moving_averages(self):
+        self.assert_matches(self.df.ta.sma(length=10).to_frame(), self.stream(SMA(10), "value"))
+        self.assert_matches(self.df.ta.ema(length=10).to_frame(), self.stream(EMA(10), "value"))
+
+    def test_bollinger_bands(self):
+        for ddof in (0, 1):
+            expected = self.df.ta.bbands(length=20, std=2, ddof=ddof)
+            streamed = self.stream(BollingerBands(20, 2, ddof=ddof), "lower", "mid", "upper", "bandwidth", "percent")
+            self.assert_matches(expected, streamed)
+
+    def test_macd(self):
+        expected = self.df.ta.macd(fast=12, slow=26, signal=9)
+        self.assert_matches(expected, self.stream(MACD(12, 26, 9), "macd", "histogram", "signal_value"))
+
+    def test_rsi(self):
+        self.assert_matches(self.df.ta.rsi(length=14).to_frame(), self.stream(RSI(14), "value"))
+
+    def test_average_true_range(self):
+        self.assert_matches(self.df.ta.atr(length=14).to_frame(), self.stream(ATR(14), "value"))
+        self.assert_matches(self.df.ta.atr(length=14, mamode="ema", percent=True).to_frame(),
+                            self.stream(ATR(14, mamode="ema", percent=True), "value"))
+        self.assert_matches(self.df.ta.natr(length=14).to_frame(), self.stream(NATR(14), "value"))
+        with self.assertRaises(ValueError):
+            ATR(14, mamode="sma")
+
+    def test_supertrend(self):
+        expected = self.df.ta.supertrend(length=10, multiplier=2)
+        self.assert_matches(expected, self.stream(Supertrend(10, 2), "trend", "direction", "long", "short"))
+
+    def test_reset_starts_over(self):
+        ema = EMA(3)
+        for close in (1, 2, 3):
+            ema.add(close)
+        self.assertEqual(2, ema.value)
+
+        ema.reset()
+        self.assertTrue(np.isnan(ema.value))
+        for close in (4, 5, 6):
+            ema.add(close)
+        self.assertEqual(5, ema.value)
+
+
+class StreamingIndicatorsFeedTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=50)
+        self.indicators = StreamingIndicators(self.feed, {"ema": EMA(3), "atr": ATR(3)})
+
+    def candle(self, timestamp: float, close: float) -> np.ndarray:
+        return np.array([timestamp, close, close + 1, close - 1, close, 10, 1000, 50, 5, 500], dtype=np.float64)
+
+    def test_update_only_processes_new_candles(self):
+        self.feed._candles.extend(self.candle(60 * index, 10 + index) for index in range(5))
+
+        self.assertTrue(self.indicators.update())
+        self.assertEqual(240, self.indicators.last_timestamp)
+        self.assertAlmostEqual(13.0, self.indicators["ema"].value)
+        self.assertAlmostEqual(2.0, self.indicators["atr"].value)
+        self.assertFalse(self.indicators.update())
+
+        # The last candle is updated, then a new one is received
+        self.feed._candles[-1] = self.candle(240, 18)
+        self.feed._candles.append(self.candle(300, 18))
+        self.assertTrue(self.indicators.update())
+        self.assertEqual(300, self.indicators.last_timestamp)
+        expected = EMA(3)
+        for close in (10, 11, 12, 13, 18, 18):
+            expected.add(close)
+        self.assertAlmostEqual(expected.value, self.indicators["ema"].value)
+
+    def test_update_starts_over_when_candles_are_reset(self):
+        self.feed._candles.extend(self.candle(60 * index, 10 + index) for index in range(5))
+        self.indicators.update()
+
+        self.feed._candles.clear()
+        self.feed._candles.extend(self.candle(6000 + 60 * index, 100) for index in range(3))
+        self.assertTrue(self.indicators.update())
+
+        self.assertEqual(6120, self.indicators.last_timestamp)
+        self.assertAlmostEqual(100.0, self.indicators["ema"].value)